@@ -0,0 +1,63 @@
+"""Add composite indexes for keyset (cursor) pagination.
+
+Revision ID: 025
+Revises: 024
+Create Date: 2026-10-16
+
+WHAT: Adds (org_id, created_at, id) indexes to the large, newest-first lists.
+
+WHY: List endpoints now paginate with opaque cursors over (created_at, id)
+instead of OFFSET. A composite index matching that order lets PostgreSQL
+answer any page with an index range scan, so deep pages cost the same
+as the first one.
+
+HOW: Creates indexes on audit_logs, tickets and activity_events.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "025"
+down_revision = "024"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Create keyset pagination indexes.
+
+    WHAT: Composite indexes matching ORDER BY created_at DESC, id DESC.
+
+    WHY: Enables constant-cost cursor pagination for audit logs,
+    tickets and the activity feed.
+    """
+    op.create_index(
+        "ix_audit_logs_created_id",
+        "audit_logs",
+        ["created_at", "id"],
+    )
+    op.create_index(
+        "ix_audit_logs_org_created_id",
+        "audit_logs",
+        ["org_id", "created_at", "id"],
+    )
+    op.create_index(
+        "ix_tickets_org_created_id",
+        "tickets",
+        ["org_id", "created_at", "id"],
+    )
+    op.create_index(
+        "ix_activity_events_org_created_id",
+        "activity_events",
+        ["org_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    """Remove keyset pagination indexes."""
+    op.drop_index("ix_activity_events_org_created_id", table_name="activity_events")
+    op.drop_index("ix_tickets_org_created_id", table_name="tickets")
+    op.drop_index("ix_audit_logs_org_created_id", table_name="audit_logs")
+    op.drop_index("ix_audit_logs_created_id", table_name="audit_logs")
@@ -0,0 +1,57 @@
+"""Add partial indexes for SLA due-at scans.
+
+Revision ID: 026
+Revises: 025
+Create Date: 2026-10-16
+
+WHAT: Adds partial indexes on tickets.sla_response_due_at and
+tickets.sla_resolution_due_at covering only tickets whose breach
+notification has not been sent.
+
+WHY: The SLA checker now selects tickets by due-at range instead of
+loading every open ticket. Restricting the indexes to un-notified tickets
+keeps them small - resolved history never enters them.
+
+HOW: One partial index per SLA type, matching the checker's predicates.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "026"
+down_revision = "025"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Create SLA due-at partial indexes.
+
+    WHAT: Range-scannable indexes for the SLA background job.
+
+    WHY: Keeps each SLA check proportional to the tickets that crossed a
+    threshold rather than to all open tickets.
+    """
+    op.create_index(
+        "ix_tickets_sla_response_due_pending",
+        "tickets",
+        ["sla_response_due_at"],
+        postgresql_where=sa.text(
+            "first_response_at IS NULL AND sla_response_breach_sent_at IS NULL"
+        ),
+    )
+    op.create_index(
+        "ix_tickets_sla_resolution_due_pending",
+        "tickets",
+        ["sla_resolution_due_at"],
+        postgresql_where=sa.text("sla_resolution_breach_sent_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Remove SLA due-at partial indexes."""
+    op.drop_index("ix_tickets_sla_resolution_due_pending", table_name="tickets")
+    op.drop_index("ix_tickets_sla_response_due_pending", table_name="tickets")
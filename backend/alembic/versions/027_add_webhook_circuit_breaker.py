@@ -0,0 +1,42 @@
+"""Add consecutive failure streak to webhook endpoints.
+
+Revision ID: 027
+Revises: 026
+Create Date: 2026-10-16
+
+WHAT: Adds webhook_endpoints.consecutive_failures.
+
+WHY: Webhook fan-out now runs a circuit breaker per endpoint. Total
+failure counts can't tell a URL that is failing right now from one that
+failed last month; the streak (reset on success) can.
+
+HOW: Non-null integer defaulting to 0 for existing rows.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "027"
+down_revision = "026"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add consecutive_failures column."""
+    op.add_column(
+        "webhook_endpoints",
+        sa.Column(
+            "consecutive_failures",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Remove consecutive_failures column."""
+    op.drop_column("webhook_endpoints", "consecutive_failures")
@@ -0,0 +1,71 @@
+"""Add webhook outbox table.
+
+Revision ID: 028
+Revises: 027
+Create Date: 2026-10-16
+
+WHAT: Creates webhook_outbox_events.
+
+WHY: Webhook events are now written to an outbox in the same transaction
+as the change that caused them and delivered afterwards by a dispatcher,
+instead of over HTTP from inside the request's transaction.
+
+HOW: BIGSERIAL id for ordering, a partial index over undispatched rows for
+the dispatcher, and a dispatched_at index for retention cleanup.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "028"
+down_revision = "027"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create webhook_outbox_events table and indexes."""
+    op.create_table(
+        "webhook_outbox_events",
+        sa.Column("id", sa.BigInteger(), primary_key=True),
+        sa.Column(
+            "org_id",
+            sa.Integer(),
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("event_type", sa.String(100), nullable=False),
+        sa.Column("event_id", sa.String(100), nullable=False),
+        sa.Column("data", postgresql.JSONB(), nullable=False),
+        sa.Column("event_metadata", postgresql.JSONB(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column("dispatched_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index(
+        "ix_webhook_outbox_events_pending",
+        "webhook_outbox_events",
+        ["id"],
+        postgresql_where=sa.text("dispatched_at IS NULL"),
+    )
+    op.create_index(
+        "ix_webhook_outbox_events_dispatched_at",
+        "webhook_outbox_events",
+        ["dispatched_at"],
+    )
+
+
+def downgrade() -> None:
+    """Drop webhook_outbox_events table."""
+    op.drop_index(
+        "ix_webhook_outbox_events_dispatched_at", table_name="webhook_outbox_events"
+    )
+    op.drop_index("ix_webhook_outbox_events_pending", table_name="webhook_outbox_events")
+    op.drop_table("webhook_outbox_events")
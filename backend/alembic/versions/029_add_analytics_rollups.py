@@ -0,0 +1,98 @@
+"""Add analytics monthly rollups.
+
+Revision ID: 029
+Revises: 028
+Create Date: 2026-10-16
+
+WHAT: Creates analytics_monthly_rollups and backfills it from projects,
+users and paid invoices.
+
+WHY: The analytics time series and revenue-by-organization ranking now
+read per-organization monthly rollups, maintained incrementally on write,
+instead of aggregating the full history on every refresh.
+
+HOW: Composite primary key (org_id, metric, period) as the upsert target,
+a (metric, period) index for cross-organization range reads, indexes on
+the source timestamps for the exact current-month recompute, and one
+INSERT ... SELECT per metric for history. The same backfill can be re-run
+at any time with `python -m app.services.analytics_service rebuild-rollups`.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "029"
+down_revision = "028"
+branch_labels = None
+depends_on = None
+
+
+BACKFILL = (
+    """
+    INSERT INTO analytics_monthly_rollups (org_id, metric, period, value, updated_at)
+    SELECT org_id, 'projects_created', date_trunc('month', created_at)::date, count(*), now()
+    FROM projects
+    GROUP BY 1, 3
+    """,
+    """
+    INSERT INTO analytics_monthly_rollups (org_id, metric, period, value, updated_at)
+    SELECT org_id, 'users_registered', date_trunc('month', created_at)::date, count(*), now()
+    FROM users
+    GROUP BY 1, 3
+    """,
+    """
+    INSERT INTO analytics_monthly_rollups (org_id, metric, period, value, updated_at)
+    SELECT org_id, 'revenue', date_trunc('month', paid_at)::date, sum(amount_paid), now()
+    FROM invoices
+    WHERE status = 'paid' AND paid_at IS NOT NULL
+    GROUP BY 1, 3
+    """,
+)
+
+
+def upgrade() -> None:
+    """Create analytics_monthly_rollups and backfill it."""
+    op.create_table(
+        "analytics_monthly_rollups",
+        sa.Column(
+            "org_id",
+            sa.Integer(),
+            sa.ForeignKey("organizations.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("metric", sa.String(50), primary_key=True),
+        sa.Column("period", sa.Date(), primary_key=True, comment="First day of the month"),
+        sa.Column("value", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_analytics_monthly_rollups_metric_period",
+        "analytics_monthly_rollups",
+        ["metric", "period"],
+    )
+
+    op.create_index("ix_projects_created_at", "projects", ["created_at"])
+    op.create_index("ix_users_created_at", "users", ["created_at"])
+    op.create_index("ix_invoices_paid_at", "invoices", ["paid_at"])
+
+    for statement in BACKFILL:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Drop analytics_monthly_rollups table and source indexes."""
+    op.drop_index("ix_invoices_paid_at", table_name="invoices")
+    op.drop_index("ix_users_created_at", table_name="users")
+    op.drop_index("ix_projects_created_at", table_name="projects")
+    op.drop_index(
+        "ix_analytics_monthly_rollups_metric_period",
+        table_name="analytics_monthly_rollups",
+    )
+    op.drop_table("analytics_monthly_rollups")
@@ -19,6 +19,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import get_db, get_current_user, require_admin
+from app.db.session import read_db
 from app.models.user import User, UserRole
 from app.services.activity_service import ActivityService
 from app.schemas.activity import (
@@ -109,15 +110,19 @@ async def get_organization_feed(
     until: Optional[datetime] = Query(None, description="End time"),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None, description="Cursor from a previous page's next_cursor (overrides skip)"
+    ),
     current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(read_db()),
 ):
     """
     Get organization activity feed.
 
     WHAT: Lists recent activities in the organization.
 
-    WHY: Provides visibility into what's happening.
+    WHY: Provides visibility into what's happening. Deep scrolling should
+    use cursor/next_cursor, which stays fast regardless of page depth.
     """
     service = ActivityService(session)
     is_admin = current_user.role == UserRole.ADMIN
@@ -135,6 +140,7 @@ async def get_organization_feed(
         include_private=is_admin,
         skip=skip,
         limit=limit,
+        cursor=cursor,
     )
 
     return ActivityFeedResponse(
@@ -143,6 +149,7 @@ async def get_organization_feed(
         skip=result["skip"],
         limit=result["limit"],
         has_more=result["has_more"],
+        next_cursor=result["next_cursor"],
     )
 
 
@@ -152,7 +159,7 @@ async def get_my_feed(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(read_db()),
 ):
     """
     Get personalized activity feed.
@@ -188,7 +195,7 @@ async def get_entity_feed(
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(read_db()),
 ):
     """
     Get activity feed for a specific entity.
@@ -335,7 +342,7 @@ async def unsubscribe_from_entity(
 async def get_activity_summary(
     days: int = Query(7, ge=1, le=90, description="Period in days"),
     current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(read_db()),
 ):
     """
     Get activity summary statistics.
@@ -365,7 +372,7 @@ async def get_active_users(
     entity_id: Optional[int] = Query(None, description="Filter by entity ID"),
     limit: int = Query(10, ge=1, le=50),
     current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_db),
+    session: AsyncSession = Depends(read_db()),
 ):
     """
     Get most active users.
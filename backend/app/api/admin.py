@@ -21,15 +21,17 @@ from sqlalchemy import select, func
 from pydantic import BaseModel, EmailStr, Field
 
 from app.core.deps import require_role
-from app.core.auth import hash_password
+from app.core.auth import hash_password, blacklist_user_tokens
+from app.core.principal_cache import get_principal_cache
 from app.core.exceptions import (
     ResourceNotFoundError,
     ResourceAlreadyExistsError,
     ValidationError,
 )
-from app.db.session import get_db
+from app.db.session import get_db, read_db
 from app.dao.user import UserDAO
-from app.dao.audit_log import AuditLogDAO
+from app.dao.base import keyset_paginate, next_page_cursor
+from app.dao.audit_log import AuditLogDAO, AUDIT_LOG_CURSOR_COLUMNS
 from app.models.user import User, UserRole
 from app.models.organization import Organization
 from app.models.audit_log import AuditLog, AuditAction
@@ -38,6 +40,10 @@ from app.services.audit import AuditService
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
+# WHY: Investigators often browse audit logs right after acting on an account;
+# keep the tolerance tight so their own actions are visible.
+AUDIT_LOG_MAX_STALENESS_SECONDS = 2.0
+
 
 # ============================================================================
 # Schemas
@@ -170,6 +176,7 @@ class AuditLogListResponse(BaseModel):
     total: int
     skip: int
     limit: int
+    next_cursor: Optional[str] = None
 
 
 # ============================================================================
@@ -475,6 +482,10 @@ async def update_user(
             changes=changes,
         )
 
+        # WHY: Role and active status are authorization inputs; the user's
+        # next request must see them
+        await get_principal_cache().invalidate(user_id)
+
     org = await db.get(Organization, user.org_id)
 
     return UserDetailResponse(
@@ -536,6 +547,9 @@ async def deactivate_user(
     user.updated_at = datetime.utcnow()
     await db.flush()
 
+    # WHY: Drops the cached principal so the user is rejected immediately
+    await blacklist_user_tokens(user_id)
+
     # Audit log
     audit_service = AuditService(db)
     await audit_service.log_delete(
@@ -891,6 +905,7 @@ async def suspend_organization(
         user.updated_at = datetime.utcnow()
 
     await db.flush()
+    await get_principal_cache().invalidate_many(user.id for user in users)
 
     # Audit log
     audit_service = AuditService(db)
@@ -988,8 +1003,12 @@ async def list_audit_logs(
     start_date: Optional[datetime] = Query(default=None, description="Filter from date"),
     end_date: Optional[datetime] = Query(default=None, description="Filter to date"),
     ip_address: Optional[str] = Query(default=None, description="Filter by IP address"),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Cursor from a previous page's next_cursor (overrides skip)",
+    ),
     current_user: User = Depends(require_role("ADMIN")),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(read_db(AUDIT_LOG_MAX_STALENESS_SECONDS)),
 ) -> AuditLogListResponse:
     """
     List audit logs with filtering.
@@ -1008,6 +1027,7 @@ async def list_audit_logs(
         start_date: Filter from date
         end_date: Filter to date
         ip_address: Filter by IP
+        cursor: Keyset cursor for constant-cost deep pagination
         current_user: Current authenticated admin
         db: Database session
 
@@ -1055,7 +1075,10 @@ async def list_audit_logs(
     total = total_result.scalar_one()
 
     # Get paginated results
-    query = query.order_by(AuditLog.created_at.desc()).offset(skip).limit(limit)
+    # WHY: Keyset pagination keeps deep audit-log pages as cheap as the first
+    query = keyset_paginate(
+        query, AUDIT_LOG_CURSOR_COLUMNS, skip=skip, limit=limit, cursor=cursor
+    )
     result = await db.execute(query)
     logs = result.scalars().all()
 
@@ -1092,4 +1115,10 @@ async def list_audit_logs(
             )
         )
 
-    return AuditLogListResponse(items=items, total=total, skip=skip, limit=limit)
+    return AuditLogListResponse(
+        items=items,
+        total=total,
+        skip=skip,
+        limit=limit,
+        next_cursor=next_page_cursor(logs, limit, AUDIT_LOG_CURSOR_COLUMNS),
+    )
@@ -9,23 +9,26 @@ WHY: Administrators need data-driven insights into:
 3. User activity and engagement metrics
 
 HOW: FastAPI router with ADMIN role requirement on all endpoints.
-Queries aggregate data across all organizations for platform-wide metrics.
+Metrics aggregate data across all organizations and are served from
+analytics_service's snapshot cache (see that module for the queries).
 """
 
-from datetime import datetime, timedelta
 from typing import Optional, List
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, extract
 from pydantic import BaseModel, Field
 
 from app.core.deps import require_role
-from app.db.session import get_db
+from app.db.session import read_db
 from app.models.user import User
-from app.models.organization import Organization
-from app.models.project import Project, ProjectStatus
-from app.models.invoice import Invoice, InvoiceStatus
-from app.models.ticket import Ticket
+from app.services.analytics_service import (
+    ANALYTICS_MAX_STALENESS_SECONDS,
+    get_analytics_cache,
+    load_dashboard_summary,
+    load_project_metrics,
+    load_revenue_metrics,
+    load_user_activity_metrics,
+)
 
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
@@ -158,7 +161,7 @@ class DashboardSummaryResponse(BaseModel):
 async def get_project_metrics(
     months: int = Query(default=12, ge=1, le=24, description="Months of history"),
     current_user: User = Depends(require_role("ADMIN")),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(read_db(ANALYTICS_MAX_STALENESS_SECONDS)),
 ) -> ProjectMetricsResponse:
     """
     Get project analytics.
@@ -175,104 +178,12 @@ async def get_project_metrics(
     Returns:
         Project metrics including status distribution, trends, averages
     """
-    # Total projects
-    total_result = await db.execute(select(func.count(Project.id)))
-    total_projects = total_result.scalar_one()
-
-    # Active projects (not completed or cancelled)
-    active_result = await db.execute(
-        select(func.count(Project.id)).where(
-            ~Project.status.in_([ProjectStatus.COMPLETED, ProjectStatus.CANCELLED])
-        )
-    )
-    active_projects = active_result.scalar_one()
-
-    # Overdue projects (past due date and not completed)
-    overdue_result = await db.execute(
-        select(func.count(Project.id)).where(
-            and_(
-                Project.due_date < datetime.utcnow(),
-                ~Project.status.in_([ProjectStatus.COMPLETED, ProjectStatus.CANCELLED]),
-            )
-        )
-    )
-    overdue_projects = overdue_result.scalar_one()
-
-    # Projects by status
-    status_result = await db.execute(
-        select(Project.status, func.count(Project.id))
-        .group_by(Project.status)
-    )
-    by_status = [
-        StatusCount(status=status.value, count=count)
-        for status, count in status_result.all()
-    ]
-
-    # Projects created over time (monthly)
-    start_date = datetime.utcnow() - timedelta(days=months * 30)
-    created_result = await db.execute(
-        select(
-            extract("year", Project.created_at).label("year"),
-            extract("month", Project.created_at).label("month"),
-            func.count(Project.id).label("count"),
-        )
-        .where(Project.created_at >= start_date)
-        .group_by("year", "month")
-        .order_by("year", "month")
-    )
-    created_over_time = [
-        TimeSeriesPoint(
-            date=f"{int(row.year)}-{int(row.month):02d}",
-            value=float(row.count),
-        )
-        for row in created_result.all()
-    ]
-
-    # Average project duration (for completed projects)
-    duration_result = await db.execute(
-        select(
-            func.avg(
-                extract("epoch", Project.completed_at) - extract("epoch", Project.start_date)
-            )
-        ).where(
-            and_(
-                Project.status == ProjectStatus.COMPLETED,
-                Project.completed_at.isnot(None),
-                Project.start_date.isnot(None),
-            )
-        )
-    )
-    avg_duration_seconds = duration_result.scalar_one()
-    average_duration_days = (
-        float(avg_duration_seconds) / 86400 if avg_duration_seconds else None
-    )
-
-    # Projects by organization
-    org_result = await db.execute(
-        select(
-            Organization.id,
-            Organization.name,
-            func.count(Project.id).label("count"),
-        )
-        .join(Project, Project.org_id == Organization.id)
-        .group_by(Organization.id, Organization.name)
-        .order_by(func.count(Project.id).desc())
-        .limit(10)
-    )
-    projects_by_organization = [
-        OrganizationMetric(org_id=row.id, org_name=row.name, value=float(row.count))
-        for row in org_result.all()
-    ]
-
-    return ProjectMetricsResponse(
-        total_projects=total_projects,
-        by_status=by_status,
-        created_over_time=created_over_time,
-        average_duration_days=average_duration_days,
-        projects_by_organization=projects_by_organization,
-        active_projects=active_projects,
-        overdue_projects=overdue_projects,
+    snapshot = await get_analytics_cache().get(
+        ("projects", months),
+        lambda session: load_project_metrics(session, months),
+        db,
     )
+    return ProjectMetricsResponse(**snapshot)
 
 
 # ============================================================================
@@ -290,7 +201,7 @@ async def get_project_metrics(
 async def get_revenue_metrics(
     months: int = Query(default=12, ge=1, le=24, description="Months of history"),
     current_user: User = Depends(require_role("ADMIN")),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(read_db(ANALYTICS_MAX_STALENESS_SECONDS)),
 ) -> RevenueMetricsResponse:
     """
     Get revenue analytics.
@@ -307,130 +218,12 @@ async def get_revenue_metrics(
     Returns:
         Revenue metrics including totals, trends, breakdowns
     """
-    now = datetime.utcnow()
-    start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    start_of_year = now.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
-
-    # Total revenue (all-time from paid invoices)
-    total_result = await db.execute(
-        select(func.coalesce(func.sum(Invoice.amount_paid), 0.0)).where(
-            Invoice.status == InvoiceStatus.PAID
-        )
-    )
-    total_revenue = float(total_result.scalar_one() or 0.0)
-
-    # Revenue MTD (Month to Date)
-    mtd_result = await db.execute(
-        select(func.coalesce(func.sum(Invoice.amount_paid), 0.0)).where(
-            and_(
-                Invoice.status == InvoiceStatus.PAID,
-                Invoice.paid_at >= start_of_month,
-            )
-        )
-    )
-    revenue_mtd = float(mtd_result.scalar_one() or 0.0)
-
-    # Revenue YTD (Year to Date)
-    ytd_result = await db.execute(
-        select(func.coalesce(func.sum(Invoice.amount_paid), 0.0)).where(
-            and_(
-                Invoice.status == InvoiceStatus.PAID,
-                Invoice.paid_at >= start_of_year,
-            )
-        )
-    )
-    revenue_ytd = float(ytd_result.scalar_one() or 0.0)
-
-    # Outstanding amount (sent but not paid)
-    outstanding_result = await db.execute(
-        select(func.coalesce(func.sum(Invoice.total - Invoice.amount_paid), 0.0)).where(
-            Invoice.status.in_([InvoiceStatus.SENT, InvoiceStatus.PARTIALLY_PAID])
-        )
-    )
-    outstanding_amount = float(outstanding_result.scalar_one() or 0.0)
-
-    # Overdue amount
-    overdue_result = await db.execute(
-        select(func.coalesce(func.sum(Invoice.total - Invoice.amount_paid), 0.0)).where(
-            Invoice.status == InvoiceStatus.OVERDUE
-        )
-    )
-    overdue_amount = float(overdue_result.scalar_one() or 0.0)
-
-    # Revenue by organization
-    org_result = await db.execute(
-        select(
-            Organization.id,
-            Organization.name,
-            func.coalesce(func.sum(Invoice.amount_paid), 0.0).label("revenue"),
-        )
-        .join(Invoice, Invoice.org_id == Organization.id)
-        .where(Invoice.status == InvoiceStatus.PAID)
-        .group_by(Organization.id, Organization.name)
-        .order_by(func.sum(Invoice.amount_paid).desc())
-        .limit(10)
-    )
-    revenue_by_organization = [
-        OrganizationMetric(org_id=row.id, org_name=row.name, value=float(row.revenue))
-        for row in org_result.all()
-    ]
-
-    # Revenue over time (monthly)
-    start_date = now - timedelta(days=months * 30)
-    time_result = await db.execute(
-        select(
-            extract("year", Invoice.paid_at).label("year"),
-            extract("month", Invoice.paid_at).label("month"),
-            func.coalesce(func.sum(Invoice.amount_paid), 0.0).label("revenue"),
-        )
-        .where(
-            and_(
-                Invoice.status == InvoiceStatus.PAID,
-                Invoice.paid_at >= start_date,
-            )
-        )
-        .group_by("year", "month")
-        .order_by("year", "month")
-    )
-    revenue_over_time = [
-        TimeSeriesPoint(
-            date=f"{int(row.year)}-{int(row.month):02d}",
-            value=float(row.revenue),
-        )
-        for row in time_result.all()
-    ]
-
-    # Average deal size
-    avg_result = await db.execute(
-        select(func.avg(Invoice.total)).where(Invoice.status == InvoiceStatus.PAID)
-    )
-    average_deal_size = float(avg_result.scalar_one() or 0.0)
-
-    # Payment method breakdown
-    payment_result = await db.execute(
-        select(
-            func.coalesce(Invoice.payment_method, "unknown").label("method"),
-            func.count(Invoice.id).label("count"),
-        )
-        .where(Invoice.status == InvoiceStatus.PAID)
-        .group_by(Invoice.payment_method)
-    )
-    payment_method_breakdown = [
-        StatusCount(status=row.method or "unknown", count=row.count)
-        for row in payment_result.all()
-    ]
-
-    return RevenueMetricsResponse(
-        total_revenue=total_revenue,
-        revenue_mtd=revenue_mtd,
-        revenue_ytd=revenue_ytd,
-        revenue_by_organization=revenue_by_organization,
-        revenue_over_time=revenue_over_time,
-        average_deal_size=average_deal_size,
-        payment_method_breakdown=payment_method_breakdown,
-        outstanding_amount=outstanding_amount,
-        overdue_amount=overdue_amount,
+    snapshot = await get_analytics_cache().get(
+        ("revenue", months),
+        lambda session: load_revenue_metrics(session, months),
+        db,
     )
+    return RevenueMetricsResponse(**snapshot)
 
 
 # ============================================================================
@@ -448,7 +241,7 @@ async def get_revenue_metrics(
 async def get_user_activity_metrics(
     months: int = Query(default=12, ge=1, le=24, description="Months of history"),
     current_user: User = Depends(require_role("ADMIN")),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(read_db(ANALYTICS_MAX_STALENESS_SECONDS)),
 ) -> UserActivityMetricsResponse:
     """
     Get user activity analytics.
@@ -465,96 +258,12 @@ async def get_user_activity_metrics(
     Returns:
         User metrics including activity, registrations, distribution
     """
-    now = datetime.utcnow()
-    thirty_days_ago = now - timedelta(days=30)
-    seven_days_ago = now - timedelta(days=7)
-
-    # Total users
-    total_result = await db.execute(select(func.count(User.id)))
-    total_users = total_result.scalar_one()
-
-    # Active users (accounts that are active, created in last 30 days as proxy)
-    # Note: Without last_login_at tracking, we use account creation as proxy for activity
-    active_result = await db.execute(
-        select(func.count(User.id)).where(
-            User.is_active == True
-        )
-    )
-    active_users = active_result.scalar_one()
-
-    # Recent active users (accounts created in last 7 days as proxy)
-    recent_result = await db.execute(
-        select(func.count(User.id)).where(
-            and_(
-                User.is_active == True,
-                User.created_at >= seven_days_ago,
-            )
-        )
-    )
-    recent_active_users = recent_result.scalar_one()
-
-    # Verified vs unverified users
-    verified_result = await db.execute(
-        select(func.count(User.id)).where(User.email_verified == True)
-    )
-    verified_users = verified_result.scalar_one()
-    unverified_users = total_users - verified_users
-
-    # New users over time (monthly)
-    start_date = now - timedelta(days=months * 30)
-    new_users_result = await db.execute(
-        select(
-            extract("year", User.created_at).label("year"),
-            extract("month", User.created_at).label("month"),
-            func.count(User.id).label("count"),
-        )
-        .where(User.created_at >= start_date)
-        .group_by("year", "month")
-        .order_by("year", "month")
-    )
-    new_users_over_time = [
-        TimeSeriesPoint(
-            date=f"{int(row.year)}-{int(row.month):02d}",
-            value=float(row.count),
-        )
-        for row in new_users_result.all()
-    ]
-
-    # Users by organization
-    org_result = await db.execute(
-        select(
-            Organization.id,
-            Organization.name,
-            func.count(User.id).label("count"),
-        )
-        .join(User, User.org_id == Organization.id)
-        .group_by(Organization.id, Organization.name)
-        .order_by(func.count(User.id).desc())
-        .limit(10)
-    )
-    users_by_organization = [
-        OrganizationMetric(org_id=row.id, org_name=row.name, value=float(row.count))
-        for row in org_result.all()
-    ]
-
-    # Users by role
-    role_result = await db.execute(
-        select(User.role, func.count(User.id)).group_by(User.role)
-    )
-    users_by_role = [
-        StatusCount(status=role, count=count) for role, count in role_result.all()
-    ]
-
-    return UserActivityMetricsResponse(
-        total_users=total_users,
-        active_users=active_users,
-        recent_active_users=recent_active_users,
-        new_users_over_time=new_users_over_time,
-        users_by_organization=users_by_organization,
-        users_by_role=users_by_role,
-        verified_users=verified_users,
-        unverified_users=unverified_users,
+    snapshot = await get_analytics_cache().get(
+        ("users", months),
+        lambda session: load_user_activity_metrics(session, months),
+        db,
     )
+    return UserActivityMetricsResponse(**snapshot)
 
 
 # ============================================================================
@@ -571,7 +280,7 @@ async def get_user_activity_metrics(
 )
 async def get_dashboard_summary(
     current_user: User = Depends(require_role("ADMIN")),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(read_db(ANALYTICS_MAX_STALENESS_SECONDS)),
 ) -> DashboardSummaryResponse:
     """
     Get dashboard summary metrics.
@@ -587,86 +296,5 @@ async def get_dashboard_summary(
     Returns:
         Summary metrics for dashboard display
     """
-    now = datetime.utcnow()
-    start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    from app.models.ticket import TicketStatus
-
-    # Total users
-    total_users_result = await db.execute(select(func.count(User.id)))
-    total_users = total_users_result.scalar_one()
-
-    # Total organizations
-    total_orgs_result = await db.execute(select(func.count(Organization.id)))
-    total_organizations = total_orgs_result.scalar_one()
-
-    # Active organizations
-    active_orgs_result = await db.execute(
-        select(func.count(Organization.id)).where(Organization.is_active == True)
-    )
-    active_organizations = active_orgs_result.scalar_one()
-
-    # Total projects
-    total_projects_result = await db.execute(select(func.count(Project.id)))
-    total_projects = total_projects_result.scalar_one()
-
-    # Active projects
-    active_projects_result = await db.execute(
-        select(func.count(Project.id)).where(
-            ~Project.status.in_([ProjectStatus.COMPLETED, ProjectStatus.CANCELLED])
-        )
-    )
-    active_projects = active_projects_result.scalar_one()
-
-    # Total revenue
-    total_revenue_result = await db.execute(
-        select(func.coalesce(func.sum(Invoice.amount_paid), 0.0)).where(
-            Invoice.status == InvoiceStatus.PAID
-        )
-    )
-    total_revenue = float(total_revenue_result.scalar_one() or 0.0)
-
-    # Revenue MTD
-    revenue_mtd_result = await db.execute(
-        select(func.coalesce(func.sum(Invoice.amount_paid), 0.0)).where(
-            and_(
-                Invoice.status == InvoiceStatus.PAID,
-                Invoice.paid_at >= start_of_month,
-            )
-        )
-    )
-    revenue_mtd = float(revenue_mtd_result.scalar_one() or 0.0)
-
-    # Open tickets
-    open_tickets_result = await db.execute(
-        select(func.count(Ticket.id)).where(
-            Ticket.status.in_([TicketStatus.OPEN, TicketStatus.IN_PROGRESS])
-        )
-    )
-    open_tickets = open_tickets_result.scalar_one()
-
-    # Overdue tickets (SLA breached - either response or resolution SLA)
-    # Check tickets where either sla_response_due_at or sla_resolution_due_at is past
-    overdue_tickets_result = await db.execute(
-        select(func.count(Ticket.id)).where(
-            and_(
-                ~Ticket.status.in_([TicketStatus.CLOSED, TicketStatus.RESOLVED]),
-                (
-                    (Ticket.sla_response_due_at < now) |
-                    (Ticket.sla_resolution_due_at < now)
-                ),
-            )
-        )
-    )
-    overdue_tickets = overdue_tickets_result.scalar_one()
-
-    return DashboardSummaryResponse(
-        total_users=total_users,
-        total_organizations=total_organizations,
-        active_organizations=active_organizations,
-        total_projects=total_projects,
-        active_projects=active_projects,
-        total_revenue=total_revenue,
-        revenue_mtd=revenue_mtd,
-        open_tickets=open_tickets,
-        overdue_tickets=overdue_tickets,
-    )
+    snapshot = await get_analytics_cache().get("dashboard", load_dashboard_summary, db)
+    return DashboardSummaryResponse(**snapshot)
@@ -20,9 +20,11 @@ from app.core.auth import (
     verify_password,
     create_access_token,
     blacklist_token,
+    blacklist_user_tokens,
     hash_password,
 )
 from app.core.deps import get_current_user, security
+from app.core.principal_cache import get_principal_cache
 from app.core.exceptions import (
     AuthenticationError,
     ValidationError,
@@ -609,6 +611,7 @@ async def verify_email(
     # Update user's email_verified status
     user.email_verified = True
     await db.flush()
+    await get_principal_cache().invalidate(user.id)
 
     # Audit log
     await audit.log_email_verified(
@@ -811,8 +814,10 @@ async def reset_password(
         user_name=user.name,
     )
 
-    # TODO: Invalidate all existing sessions for this user
-    # This would require implementing session tracking
+    # Invalidate cached principal and existing sessions
+    # WHY: Full session revocation still requires token tracking (see
+    # blacklist_user_tokens), but the principal cache is dropped now
+    await blacklist_user_tokens(user.id)
 
     return ResetPasswordResponse(
         message="Password reset successfully. You can now log in with your new password."
@@ -40,6 +40,7 @@ from app.schemas.integration import (
     WebhookDeliveryResponse,
     WebhookDeliveryList,
     WebhookDeliveryStats,
+    WebhookRetryQueueStats,
 )
 
 # ============================================================================
@@ -629,6 +630,29 @@ async def get_webhook_delivery_stats(
     return WebhookDeliveryStats(**stats)
 
 
+@webhook_router.get(
+    "/retries/queue",
+    response_model=WebhookRetryQueueStats,
+    summary="Get webhook retry queue status",
+)
+async def get_webhook_retry_queue(
+    current_user: User = Depends(get_current_admin_user),
+    session: AsyncSession = Depends(get_db),
+) -> WebhookRetryQueueStats:
+    """
+    Get the retry queue for the organization's webhooks.
+
+    WHAT: Returns queue depth, due count and oldest-due age.
+
+    WHY: Shows whether failed deliveries are being retried on time.
+
+    Requires ADMIN role.
+    """
+    service = WebhookService(session)
+    stats = await service.get_retry_queue_stats(org_id=current_user.org_id)
+    return WebhookRetryQueueStats(**stats)
+
+
 # ============================================================================
 # Available Events Reference
 # ============================================================================
@@ -49,7 +49,7 @@ from app.schemas.invoice import (
 )
 from app.services.audit import AuditService
 from app.services.stripe_service import StripeService, get_stripe_service
-from app.services.pdf_service import PDFService, get_pdf_service
+from app.services.pdf_renderer import PDFRenderer, get_pdf_renderer
 
 
 router = APIRouter(prefix="/invoices", tags=["invoices"])
@@ -213,6 +213,10 @@ async def list_invoices(
         default=False,
         description="Only return unpaid invoices",
     ),
+    estimate_total: bool = Query(
+        default=False,
+        description="Return an approximate total (faster on very large organizations)",
+    ),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> InvoiceListResponse:
@@ -231,6 +235,7 @@ async def list_invoices(
         limit: Maximum items per page
         status_filter: Optional status filter
         unpaid_only: If True, only unpaid invoices
+        estimate_total: If True, total may be approximate (see BaseDAO.count_estimated)
         current_user: Current authenticated user
         db: Database session
 
@@ -242,9 +247,7 @@ async def list_invoices(
 
     if unpaid_only:
         invoices = await invoice_dao.get_unpaid(org_id, skip=skip, limit=limit)
-        # Get total count of unpaid
-        all_unpaid = await invoice_dao.get_unpaid(org_id, limit=10000)
-        total = len(all_unpaid)
+        total = await invoice_dao.count_unpaid(org_id)
     elif status_filter:
         status_enum = InvoiceStatusModel(status_filter.value)
         invoices = await invoice_dao.get_by_status(org_id, status_enum, skip=skip, limit=limit)
@@ -252,7 +255,10 @@ async def list_invoices(
         total = counts.get(status_filter.value, 0)
     else:
         invoices = await invoice_dao.get_by_org(org_id, skip=skip, limit=limit)
-        total = await invoice_dao.count(org_id=org_id)
+        if estimate_total:
+            total = await invoice_dao.count_estimated(org_id=org_id)
+        else:
+            total = await invoice_dao.count(org_id=org_id)
 
     return InvoiceListResponse(
         items=[_invoice_to_response(inv) for inv in invoices],
@@ -365,7 +371,7 @@ async def download_invoice_pdf(
     invoice_id: int,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-    pdf_service: PDFService = Depends(get_pdf_service),
+    pdf_renderer: PDFRenderer = Depends(get_pdf_renderer),
 ) -> Response:
     """
     Download invoice as PDF.
@@ -378,11 +384,14 @@ async def download_invoice_pdf(
     - Email attachments
     - Record keeping
 
+    HOW: Rendered off the event loop and cached by content, so repeat
+    downloads of an unchanged invoice are served without rendering.
+
     Args:
         invoice_id: Invoice ID
         current_user: Current authenticated user
         db: Database session
-        pdf_service: PDF service instance
+        pdf_renderer: PDF renderer instance
 
     Returns:
         PDF file as downloadable response
@@ -411,7 +420,7 @@ async def download_invoice_pdf(
         line_items = invoice.proposal.line_items
 
     # Generate PDF
-    pdf_bytes = pdf_service.generate_invoice_pdf(
+    pdf_bytes = await pdf_renderer.render_invoice_pdf(
         invoice=invoice,
         client_name=org.name,
         line_items=line_items,
@@ -164,6 +164,10 @@ async def list_projects(
         default=False,
         description="Only return active projects (not completed/cancelled)",
     ),
+    estimate_total: bool = Query(
+        default=False,
+        description="Return an approximate total (faster on very large organizations)",
+    ),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> ProjectListResponse:
@@ -183,6 +187,7 @@ async def list_projects(
         status_filter: Optional status filter
         priority_filter: Optional priority filter
         active_only: If True, exclude completed/cancelled
+        estimate_total: If True, total may be approximate (see BaseDAO.count_estimated)
         current_user: Current authenticated user
         db: Database session
 
@@ -205,12 +210,13 @@ async def list_projects(
     elif priority_filter:
         priority_enum = ProjectPriorityModel(priority_filter.value)
         projects = await project_dao.get_by_priority(org_id, priority_enum, skip=skip, limit=limit)
-        # For priority filter, we need total count (not built into DAO)
-        all_projects = await project_dao.get_by_org(org_id)
-        total = len([p for p in all_projects if p.priority == priority_enum])
+        total = await project_dao.count(org_id=org_id, priority=priority_enum)
     else:
         projects = await project_dao.get_by_org(org_id, skip=skip, limit=limit)
-        total = await project_dao.count(org_id=org_id)
+        if estimate_total:
+            total = await project_dao.count_estimated(org_id=org_id)
+        else:
+            total = await project_dao.count(org_id=org_id)
 
     return ProjectListResponse(
         items=[_project_to_response(p) for p in projects],
@@ -262,6 +262,10 @@ async def list_proposals(
         default=False,
         description="Only return pending proposals (sent or viewed)",
     ),
+    estimate_total: bool = Query(
+        default=False,
+        description="Return an approximate total (faster on very large organizations)",
+    ),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> ProposalListResponse:
@@ -281,6 +285,7 @@ async def list_proposals(
         status_filter: Optional status filter
         project_id: Optional project filter
         pending_only: If True, only sent/viewed proposals
+        estimate_total: If True, total may be approximate (see BaseDAO.count_estimated)
         current_user: Current authenticated user
         db: Database session
 
@@ -298,7 +303,7 @@ async def list_proposals(
         total = status_counts.get('sent', 0) + status_counts.get('viewed', 0)
     elif project_id:
         proposals = await proposal_dao.get_by_project(project_id, org_id, skip=skip, limit=limit)
-        total = len(await proposal_dao.get_by_project(project_id, org_id, limit=1000))
+        total = await proposal_dao.count(org_id=org_id, project_id=project_id)
     elif status_filter:
         status_enum = ProposalStatusModel(status_filter.value)
         proposals = await proposal_dao.get_by_status(org_id, status_enum, skip=skip, limit=limit)
@@ -306,7 +311,10 @@ async def list_proposals(
         total = status_counts.get(status_filter.value, 0)
     else:
         proposals = await proposal_dao.get_by_org(org_id, skip=skip, limit=limit)
-        total = await proposal_dao.count(org_id=org_id)
+        if estimate_total:
+            total = await proposal_dao.count_estimated(org_id=org_id)
+        else:
+            total = await proposal_dao.count(org_id=org_id)
 
     return ProposalListResponse(
         items=[_proposal_to_response(p, include_notes) for p in proposals],
@@ -18,6 +18,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.deps import get_db, get_current_user, require_admin
+from app.jobs.reports import enqueue_report_execution
 from app.models.user import User
 from app.services.report_service import ReportService
 from app.services.audit import AuditService
@@ -208,6 +209,9 @@ async def generate_report(
     WHAT: Starts immediate report generation.
 
     WHY: Generate reports on demand.
+
+    HOW: The file is generated by the report worker; poll the execution
+    for its status and download URL.
     """
     service = ReportService(session)
 
@@ -234,6 +238,9 @@ async def generate_report(
     )
 
     await session.commit()
+    # WHY: Enqueued after commit so the worker always finds the execution;
+    # if queueing fails the execution is marked FAILED and the error raised
+    await enqueue_report_execution(execution.id)
 
     return ReportGenerateResponse(
         execution_id=execution.id,
@@ -467,6 +474,7 @@ async def run_scheduled_report(
     )
 
     await session.commit()
+    await enqueue_report_execution(execution.id)
 
     return ReportGenerateResponse(
         execution_id=execution.id,
@@ -29,7 +29,13 @@ from app.core.exceptions import (
     AuthorizationError,
 )
 from app.db.session import get_db
-from app.dao.ticket import TicketDAO, TicketCommentDAO, TicketAttachmentDAO
+from app.dao.base import next_page_cursor
+from app.dao.ticket import (
+    TicketDAO,
+    TicketCommentDAO,
+    TicketAttachmentDAO,
+    TICKET_CURSOR_COLUMNS,
+)
 from app.models.user import User, UserRole
 from app.models.ticket import (
     TicketStatus as TicketStatusModel,
@@ -352,6 +358,10 @@ async def list_tickets(
         default=False,
         description="Only show tickets created by current user",
     ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Cursor from a previous page's next_cursor (overrides skip)",
+    ),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ) -> TicketListResponse:
@@ -374,6 +384,7 @@ async def list_tickets(
         project_id: Optional project filter
         assigned_to_me: Filter to assigned tickets
         created_by_me: Filter to created tickets
+        cursor: Keyset cursor for constant-cost deep pagination
         current_user: Current authenticated user
         db: Database session
 
@@ -395,6 +406,7 @@ async def list_tickets(
         project_id=project_id,
         assigned_to_user_id=current_user.id if assigned_to_me else None,
         created_by_user_id=current_user.id if created_by_me else None,
+        cursor=cursor,
     )
 
     return TicketListResponse(
@@ -402,6 +414,7 @@ async def list_tickets(
         total=total,
         skip=skip,
         limit=limit,
+        next_cursor=next_page_cursor(tickets, limit, TICKET_CURSOR_COLUMNS),
     )
 
 
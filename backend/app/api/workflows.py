@@ -23,9 +23,11 @@ Security Considerations:
 
 from datetime import datetime
 from typing import Optional
-from fastapi import APIRouter, Depends, Query, status, HTTPException
+from fastapi import APIRouter, Depends, Query, Request, status, HTTPException
+from pydantic import ValidationError as PydanticValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.deps import get_current_user, require_role
 from app.core.exceptions import (
     ResourceNotFoundError,
@@ -68,12 +70,24 @@ from app.schemas.workflow import (
     ExecutionLogListResponse,
     ExecutionStats,
     ExecutionStatus,
+    # Webhooks
+    N8nWebhookPayload,
 )
 from app.services.audit import AuditService
-from app.services.n8n_client import create_n8n_client
+from app.services.n8n_callback_service import (
+    CALLBACK_SIGNATURE_HEADER,
+    get_n8n_callback_buffer,
+    n8n_callback_secret,
+)
+from app.services.n8n_client import (
+    get_n8n_client,
+    get_n8n_client_cache,
+    validate_webhook_signature,
+)
 
 
 router = APIRouter(prefix="/workflows", tags=["workflows"])
+webhooks_router = APIRouter(prefix="/webhooks/n8n", tags=["webhooks"])
 
 
 # ============================================================================
@@ -301,6 +315,8 @@ async def update_environment(
             resource_id=environment_id,
         )
 
+    get_n8n_client_cache().invalidate(env.id)
+
     # Audit log
     audit_service = AuditService(db)
     await audit_service.log_update(
@@ -348,6 +364,7 @@ async def delete_environment(
     )
 
     await env_dao.delete(environment_id)
+    get_n8n_client_cache().invalidate(environment_id)
 
 
 @router.get(
@@ -373,11 +390,8 @@ async def check_environment_health(
             resource_id=environment_id,
         )
 
-    # Create client and test connectivity
-    client = create_n8n_client(
-        base_url=env.base_url,
-        api_key_encrypted=env.api_key_encrypted,
-    )
+    # Get client and test connectivity
+    client = get_n8n_client(env)
     is_healthy = await client.health_check()
 
     return N8nHealthCheckResponse(
@@ -464,6 +478,46 @@ async def get_environment_editor_url(
     }
 
 
+@router.get(
+    "/environments/{environment_id}/callback",
+    status_code=status.HTTP_200_OK,
+    summary="Get execution callback settings",
+    description="Get the URL and secret n8n uses to report finished executions (ADMIN only)",
+)
+async def get_environment_callback(
+    environment_id: int,
+    current_user: User = Depends(require_role("ADMIN")),
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """
+    Get execution callback settings for an environment.
+
+    WHAT: Returns the callback URL, signature header and signing secret.
+
+    WHY: n8n workflows report completion by POSTing to the callback URL
+    with an HMAC-SHA256 signature of the body, so statuses arrive right
+    away instead of on the next status sync.
+    """
+    env_dao = N8nEnvironmentDAO(db)
+    env = await env_dao.get_by_id_and_org(environment_id, current_user.org_id)
+
+    if not env:
+        raise ResourceNotFoundError(
+            message="N8n environment not found",
+            resource_type="n8n_environment",
+            resource_id=environment_id,
+        )
+
+    return {
+        "callback_url": (
+            f"{settings.BACKEND_URL.rstrip('/')}{settings.API_V1_PREFIX}"
+            f"/webhooks/n8n/environments/{environment_id}/executions"
+        ),
+        "signature_header": CALLBACK_SIGNATURE_HEADER,
+        "secret": n8n_callback_secret(environment_id),
+    }
+
+
 # ============================================================================
 # Workflow Template Endpoints
 # ============================================================================
@@ -970,10 +1024,7 @@ async def trigger_execution(
 
     # Trigger execution in n8n
     try:
-        client = create_n8n_client(
-            base_url=env.base_url,
-            api_key_encrypted=env.api_key_encrypted,
-        )
+        client = get_n8n_client(env)
         result = await client.trigger_workflow(
             workflow_id=instance.n8n_workflow_id,
             input_data=data.input_data,
@@ -1436,3 +1487,66 @@ async def compare_versions(
         version_a=comparison["version_a"],
         version_b=comparison["version_b"],
     ).model_dump()
+
+
+# ============================================================================
+# Execution Callback Webhook
+# ============================================================================
+
+
+@webhooks_router.post(
+    "/environments/{environment_id}/executions",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="n8n execution callback",
+    description="Receive execution-finished events from n8n (no auth required)",
+)
+async def receive_execution_callback(
+    environment_id: int,
+    request: Request,
+) -> dict:
+    """
+    Receive an execution-finished event from n8n.
+
+    WHAT: Verifies the signature and buffers the event.
+
+    WHY: Busy n8n instances report thousands of executions per second.
+    The event is acknowledged without touching the database and written
+    later in a batch (see app.services.n8n_callback_service).
+
+    Note: No authentication required - uses signature verification.
+
+    Args:
+        environment_id: Environment the callback is signed for
+        request: Raw request with callback payload
+
+    Returns:
+        Acknowledgment
+
+    Raises:
+        HTTPException: 400 on a bad signature, 503 when the buffer is full
+        ValidationError: If the payload is malformed
+    """
+    payload = await request.body()
+    signature = request.headers.get(CALLBACK_SIGNATURE_HEADER, "")
+
+    if not validate_webhook_signature(
+        payload, signature, n8n_callback_secret(environment_id)
+    ):
+        raise HTTPException(status_code=400, detail="Invalid webhook signature")
+
+    try:
+        event = N8nWebhookPayload.model_validate_json(payload)
+    except PydanticValidationError as e:
+        raise ValidationError(
+            message="Invalid execution callback payload",
+            errors=e.errors(include_url=False, include_context=False),
+        ) from e
+
+    if not get_n8n_callback_buffer().add(environment_id, event):
+        raise HTTPException(
+            status_code=503,
+            detail="Execution callbacks are backed up, retry shortly",
+            headers={"Retry-After": "1"},
+        )
+
+    return {"received": True}
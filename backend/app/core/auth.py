@@ -8,6 +8,8 @@ WHY: This module provides secure authentication functionality:
 4. Protection against common auth vulnerabilities
 """
 
+import logging
+import time
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 from jose import jwt, JWTError
@@ -15,10 +17,21 @@ from passlib.context import CryptContext
 import redis.asyncio as aioredis
 
 from app.core.config import settings
+from app.core.redis_manager import get_redis_client
 from app.core.exceptions import (
     TokenExpiredError,
     TokenInvalidError,
 )
+from app.core.revocation import (
+    TOKEN_BLACKLIST_PREFIX,
+    USER_REVOCATION_PREFIX,
+    get_revocation_filter,
+    publish_token_revocation,
+    publish_user_revocation,
+)
+
+
+logger = logging.getLogger(__name__)
 
 
 # Password hashing context
@@ -28,30 +41,17 @@ from app.core.exceptions import (
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
-# Redis connection for token blacklist
-# WHY: Redis provides fast in-memory storage for blacklisted tokens,
-# allowing sub-millisecond lookups on every request without database load.
-_redis_client: Optional[aioredis.Redis] = None
-
-
 async def get_redis() -> aioredis.Redis:
     """
     Get Redis client for token blacklist.
 
-    WHY: Lazy initialization ensures Redis is only connected when needed,
-    and connection is reused across requests for performance.
+    WHY: Uses the shared pool from the Redis manager so auth traffic is
+    bounded and visible in pool metrics alongside other subsystems.
 
     Returns:
         Redis client instance
     """
-    global _redis_client
-    if _redis_client is None:
-        _redis_client = await aioredis.from_url(
-            settings.REDIS_URL,
-            encoding="utf-8",
-            decode_responses=True,
-        )
-    return _redis_client
+    return get_redis_client("auth")
 
 
 # ============================================================================
@@ -272,7 +272,7 @@ async def blacklist_token(
             exp_timestamp = payload.get("exp")
             if exp_timestamp:
                 ttl_seconds = max(
-                    int(exp_timestamp - datetime.utcnow().timestamp()),
+                    int(exp_timestamp - time.time()),
                     0,
                 )
             else:
@@ -285,26 +285,39 @@ async def blacklist_token(
     # Store in Redis with TTL
     # WHY: Redis automatically removes expired entries, preventing
     # unbounded memory growth
-    blacklist_key = f"blacklist:token:{token}"
+    blacklist_key = f"{TOKEN_BLACKLIST_PREFIX}{token}"
     await redis.setex(
         blacklist_key,
         ttl_seconds,
         str(user_id),  # Store user_id for audit/analytics
     )
 
+    # Announce to every process's local revocation filter
+    # WHY: Written after the key so a subscriber confirming the hit in
+    # Redis always finds it
+    await publish_token_revocation(
+        redis, token, time.time() + ttl_seconds
+    )
+
 
-async def is_token_blacklisted(token: str) -> bool:
+async def is_token_blacklisted(
+    token: str,
+    claims: Optional[Dict[str, Any]] = None,
+) -> bool:
     """
     Check if a token is blacklisted.
 
-    WHY: Fast Redis lookup (sub-millisecond) checks token validity
-    on every request without impacting performance.
+    WHY: Revocations are rare, so the process-local revocation filter
+    answers the common "not revoked" case without a network call. Only
+    probable hits (or every check, while the filter isn't synced) are
+    confirmed against Redis, which remains the source of truth.
 
     Args:
         token: JWT token to check
+        claims: Verified token claims; decoded without verification if omitted
 
     Returns:
-        True if token is blacklisted, False otherwise
+        True if the token, or all of its user's tokens, were revoked
 
     Example:
         >>> token = create_access_token({"user_id": 1})
@@ -314,36 +327,75 @@ async def is_token_blacklisted(token: str) -> bool:
         >>> await is_token_blacklisted(token)
         True
     """
+    if claims is None:
+        try:
+            claims = jwt.get_unverified_claims(token)
+        except JWTError:
+            claims = {}
+
+    if not get_revocation_filter().might_be_revoked(token, claims):
+        return False
+
     redis = await get_redis()
-    blacklist_key = f"blacklist:token:{token}"
+    user_id = claims.get("user_id")
+
+    # WHY: One pipelined round trip covers both the per-token and the
+    # per-user revocation
+    pipe = redis.pipeline(transaction=False)
+    pipe.exists(f"{TOKEN_BLACKLIST_PREFIX}{token}")
+    if user_id is not None:
+        pipe.get(f"{USER_REVOCATION_PREFIX}{user_id}")
+    results = await pipe.execute()
+
+    if results[0] > 0:
+        return True
 
-    # Check if key exists
-    # WHY: EXISTS is O(1) operation in Redis, extremely fast
-    exists = await redis.exists(blacklist_key)
-    return exists > 0
+    if user_id is not None and results[1] is not None:
+        issued_at = claims.get("iat")
+        return issued_at is None or int(issued_at) <= int(results[1])
+
+    return False
 
 
 async def blacklist_user_tokens(user_id: int) -> None:
     """
     Blacklist all tokens for a user (force logout all sessions).
 
-    WHY: When an account is compromised or user changes password,
-    all existing sessions should be invalidated immediately.
+    WHY: When an account is compromised, deactivated, or the user changes
+    password, all existing sessions should be invalidated immediately.
+
+    HOW: Records a per-user cutoff in Redis - every token issued at or
+    before this second is revoked - and announces it to every process's
+    revocation filter. The entry lives as long as the longest-lived token.
+    Because iat has one-second resolution, a login in the same second as
+    the revocation must be retried.
+
+    The user's cached principal is also dropped, so the change is
+    re-checked against the database on the next request.
 
-    Note: This is a placeholder. Full implementation would require
-    tracking all user tokens, which adds complexity. Consider:
-    1. Adding token_id to JWT and tracking in database
-    2. Using refresh tokens with database storage
-    3. Implementing "issued_before" timestamp in user record
+    Revocation is best-effort: if Redis is unavailable the error is logged
+    and the caller's password reset or deactivation still goes through
+    (a deactivated user is rejected by the database check regardless).
 
     Args:
         user_id: User ID to force logout
-
-    TODO: Implement proper multi-session invalidation
     """
-    # TODO: Implement token tracking for multi-session logout
-    # For now, this is a placeholder
-    pass
+    # WHY: Imported lazily - principal_cache depends on this module
+    from app.core.principal_cache import get_principal_cache
+
+    # WHY: time.time() is real UTC like the iat claim; utcnow().timestamp()
+    # reads the naive UTC time as local time and skews by the UTC offset
+    revoked_at = int(time.time())
+    ttl_seconds = settings.JWT_EXPIRATION_MINUTES * 60
+
+    try:
+        redis = await get_redis()
+        await redis.setex(f"{USER_REVOCATION_PREFIX}{user_id}", ttl_seconds, str(revoked_at))
+        await publish_user_revocation(redis, user_id, revoked_at, revoked_at + ttl_seconds)
+    except Exception as e:
+        logger.error(f"Failed to revoke tokens of user {user_id}: {e}")
+
+    await get_principal_cache().invalidate(user_id)
 
 
 # ============================================================================
@@ -1,6 +1,6 @@
 """Application configuration"""
 
-from typing import Optional
+from typing import Dict, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -24,6 +24,75 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
 
+    # Read replica
+    # WHY: Analytics, activity feeds and audit log browsing are read-heavy and
+    # compete with writes for the primary's pool. When a replica URL is set,
+    # routes that opt in read from it; otherwise they fall back to the primary.
+    # Replica lag is sampled at most once per REPLICA_LAG_CHECK_INTERVAL_SECONDS
+    # and compared against each route's declared staleness tolerance.
+    DATABASE_REPLICA_URL: Optional[str] = None
+    REPLICA_DEFAULT_MAX_STALENESS_SECONDS: float = 5.0
+    REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = 5.0
+
+    # Pagination counts
+    # WHY: Estimated totals let list endpoints skip a full count(*) on very
+    # large tables. Below COUNT_ESTIMATE_MIN_ROWS an exact count is cheap
+    # enough that estimating isn't worth the inaccuracy.
+    COUNT_ESTIMATE_TTL_SECONDS: int = 60
+    COUNT_ESTIMATE_MIN_ROWS: int = 10000
+
+    # Admin analytics snapshots
+    # WHY: Dashboard figures are cached for ANALYTICS_CACHE_TTL_SECONDS;
+    # snapshots up to ANALYTICS_CACHE_STALE_SECONDS old are served while a
+    # background refresh recomputes them, so polling never waits on scans.
+    ANALYTICS_CACHE_TTL_SECONDS: int = 60
+    ANALYTICS_CACHE_STALE_SECONDS: int = 600
+
+    # Report generation (worker, "reports" queue)
+    # WHY: Rows are fetched through a server-side cursor
+    # REPORT_STREAM_BATCH_SIZE at a time and uploaded to S3 in
+    # REPORT_UPLOAD_PART_SIZE_BYTES parts (S3 minimum: 5 MiB), so memory
+    # stays flat however large the export. ReportLab holds a whole PDF in
+    # memory until it is saved, so PDFs stop at REPORT_PDF_MAX_ROWS rows.
+    # Data may come from a replica up to REPORT_MAX_STALENESS_SECONDS behind.
+    REPORT_STREAM_BATCH_SIZE: int = 2000
+    REPORT_UPLOAD_PART_SIZE_BYTES: int = 8 * 1024 * 1024
+    REPORT_PDF_MAX_ROWS: int = 20000
+    REPORT_MAX_STALENESS_SECONDS: float = 300.0
+    REPORT_TIME_LIMIT_SECONDS: float = 3600.0
+
+    # Scheduled report dispatch (leader-only scheduler job)
+    # WHY: Every REPORT_DISPATCH_INTERVAL_SECONDS the dispatcher claims up
+    # to REPORT_DISPATCH_BATCH_SIZE due reports. It keeps at most
+    # REPORT_MAX_CONCURRENT executions in flight overall and
+    # REPORT_MAX_CONCURRENT_PER_ORG per organization, so one tenant with
+    # many schedules can't occupy the whole report queue; reports over
+    # the limit stay due and run on a later tick. Executions still PENDING
+    # after REPORT_PENDING_TIMEOUT_SECONDS were never picked up (their job
+    # was lost) and are marked FAILED by the same tick.
+    REPORT_DISPATCH_INTERVAL_SECONDS: int = 30
+    REPORT_DISPATCH_BATCH_SIZE: int = 100
+    REPORT_MAX_CONCURRENT: int = 8
+    REPORT_MAX_CONCURRENT_PER_ORG: int = 2
+    REPORT_PENDING_TIMEOUT_SECONDS: float = 3600.0
+
+    # Invoice/proposal PDF rendering
+    # WHY: ReportLab is CPU-bound and synchronous, so documents render in
+    # PDF_RENDER_WORKERS processes (0 renders on a thread instead). Output
+    # is cached by a hash of everything that goes into the document: up to
+    # PDF_CACHE_MEMORY_BYTES in memory (LRU), with entries evicted from
+    # memory spilled to PDF_CACHE_DIR up to PDF_CACHE_DISK_BYTES (an empty
+    # PDF_CACHE_DIR disables the spill).
+    PDF_RENDER_WORKERS: int = 2
+    PDF_CACHE_MEMORY_BYTES: int = 32 * 1024 * 1024
+    PDF_CACHE_DISK_BYTES: int = 512 * 1024 * 1024
+    PDF_CACHE_DIR: str = "/tmp/automate-pdf-cache"
+
+    # SLA monitoring
+    # WHY: Each check claims at most SLA_CHECK_BATCH_SIZE tickets per
+    # threshold so a backlog after downtime spreads over several runs.
+    SLA_CHECK_BATCH_SIZE: int = 1000
+
     # URLs
     FRONTEND_URL: str = "http://localhost:3000"
     BACKEND_URL: str = "http://localhost:8000"
@@ -57,17 +126,166 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    # Redis connection pool
+    # WHY: One pool is shared by auth, rate limiting, OAuth state and caches.
+    # Callers wait up to REDIS_POOL_TIMEOUT_SECONDS for a free connection
+    # instead of opening new ones, bounding connection churn under load.
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_POOL_TIMEOUT_SECONDS: float = 2.0
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 5.0
+
+    # Principal cache
+    # WHY: get_current_user runs on every authenticated request. Caching the
+    # user's columns skips a Postgres round trip per call. The in-process TTL
+    # is kept short because other workers' invalidations only reach it by
+    # expiry; the tombstone window blocks re-caching pre-update rows.
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_LOCAL_TTL_SECONDS: float = 5.0
+    PRINCIPAL_CACHE_TOMBSTONE_SECONDS: int = 5
+
+    # Token revocation filter
+    # WHY: Each process keeps revoked tokens in memory (synced over Redis
+    # pub/sub) so non-revoked tokens skip the Redis blacklist lookup.
+    # Disable to check Redis on every request.
+    REVOCATION_FILTER_ENABLED: bool = True
+
+    # Scheduler leader election
+    # WHY: Every app process starts the scheduler; a Redis lease makes sure
+    # only one of them (the leader) actually runs scheduled jobs. Followers
+    # take over within roughly one TTL if the leader dies. Disable for a
+    # single-process deployment without Redis.
+    SCHEDULER_LEADER_ELECTION_ENABLED: bool = True
+    SCHEDULER_LEASE_TTL_SECONDS: float = 15.0
+    SCHEDULER_LEASE_RENEW_INTERVAL_SECONDS: float = 5.0
+
+    # Outbound HTTP client pools (app.core.http_client)
+    # WHY: Keep-alive pools shared per upstream (n8n, email, webhooks,
+    # Slack, OAuth providers) avoid a TCP + TLS handshake on every call.
+    # Per-host limits stop one slow receiver from taking the whole pool.
+    # HTTP/2 needs the optional `h2` package (httpx[http2]).
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100
+    HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST: int = 20
+    HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    HTTP_CLIENT_TIMEOUT_SECONDS: float = 30.0
+    HTTP_CLIENT_HTTP2: bool = False
+
+    # Webhook delivery
+    # WHY: Events fan out to endpoints concurrently, capped globally and
+    # per organization. An endpoint that fails BREAKER_FAILURE_THRESHOLD
+    # times in a row is skipped (circuit open) until COOLDOWN has passed,
+    # then a single probe decides whether it recovers.
+    WEBHOOK_MAX_CONCURRENCY: int = 50
+    WEBHOOK_MAX_CONCURRENCY_PER_ORG: int = 10
+    WEBHOOK_BREAKER_FAILURE_THRESHOLD: int = 5
+    WEBHOOK_BREAKER_COOLDOWN_SECONDS: float = 60.0
+
+    # Webhook outbox
+    # WHY: Events are written to an outbox in the caller's transaction and
+    # delivered by the scheduler leader every POLL_INTERVAL, so request
+    # latency no longer depends on subscribers. Dispatched rows are kept for
+    # RETENTION_HOURS for debugging; delivery records keep the history.
+    WEBHOOK_OUTBOX_POLL_INTERVAL_SECONDS: float = 2.0
+    WEBHOOK_OUTBOX_BATCH_SIZE: int = 100
+    WEBHOOK_OUTBOX_RETENTION_HOURS: int = 24
+
+    # Webhook retries
+    # WHY: Failed deliveries are rescheduled by next_retry_at with
+    # exponential backoff (BASE_DELAY doubling, capped at MAX_DELAY) plus
+    # jitter, up to each endpoint's max_retries. The leader picks up due
+    # retries every POLL_INTERVAL in batches of BATCH_SIZE.
+    WEBHOOK_RETRY_POLL_INTERVAL_SECONDS: float = 15.0
+    WEBHOOK_RETRY_BATCH_SIZE: int = 100
+    WEBHOOK_RETRY_BASE_DELAY_SECONDS: float = 60.0
+    WEBHOOK_RETRY_MAX_DELAY_SECONDS: float = 3600.0
+
+    # Background jobs (app.jobs)
+    # WHY: Slow I/O (email, webhooks, PDFs, reports) runs in the worker
+    # process instead of request handlers. "redis" is the durable broker;
+    # "stub" keeps messages in memory for tests and local scripts.
+    # Each queue gets its own worker threads so a flood of one kind of job
+    # can't starve the others. Messages that exhaust their retries are
+    # dead-lettered and kept for JOB_DEAD_LETTER_TTL_SECONDS.
+    JOB_BROKER: str = "redis"
+    JOB_MAX_RETRIES: int = 5
+    JOB_MIN_BACKOFF_SECONDS: float = 5.0
+    JOB_MAX_BACKOFF_SECONDS: float = 600.0
+    JOB_DEAD_LETTER_TTL_SECONDS: int = 7 * 24 * 3600
+    JOB_QUEUE_CONCURRENCY: Dict[str, int] = {
+        "default": 4,
+        "email": 8,
+        "webhooks": 16,
+        "pdf": 2,
+        "reports": 2,
+    }
+
     # Email
     RESEND_API_KEY: Optional[str] = None
     POSTMARK_TOKEN: Optional[str] = None
+    # WHY: Bulk sends use the provider's batch endpoint where it has one;
+    # otherwise at most EMAIL_BULK_CONCURRENCY sends run at once. Either
+    # way requests are spaced to the provider's API limit (Resend: 2/s).
+    EMAIL_BULK_CONCURRENCY: int = 10
+    RESEND_REQUESTS_PER_SECOND: float = 2.0
 
     # n8n
     N8N_DEFAULT_BASE_URL: str = "http://localhost:5678"
     N8N_DEFAULT_API_KEY: str = ""
 
+    # n8n execution status sync
+    # WHY: Executions triggered from the platform are reconciled with n8n
+    # every SYNC_INTERVAL by paging its execution list (PAGE_SIZE per page,
+    # at most MAX_PAGES per environment per run). Environments sync
+    # concurrently (up to MAX_CONCURRENT_ENVIRONMENTS), each limited to
+    # REQUESTS_PER_SECOND so a sync never floods a customer's instance.
+    # Running executions missing from the list are looked up one by one,
+    # at most MAX_LOOKUPS per environment per run. INCLUDE_DATA fetches run
+    # data so output and error details are stored.
+    N8N_SYNC_INTERVAL_SECONDS: int = 60
+    N8N_SYNC_PAGE_SIZE: int = 100
+    N8N_SYNC_MAX_PAGES: int = 20
+    N8N_SYNC_MAX_LOOKUPS: int = 20
+    N8N_SYNC_REQUESTS_PER_SECOND: float = 5.0
+    N8N_SYNC_MAX_CONCURRENT_ENVIRONMENTS: int = 8
+    N8N_SYNC_INCLUDE_DATA: bool = True
+
+    # n8n execution callbacks
+    # WHY: Callbacks are acknowledged as soon as they are buffered and
+    # written every FLUSH_INTERVAL (or once BATCH_SIZE are waiting) in
+    # batched statements. Past MAX_BUFFERED the endpoint answers 503 so n8n
+    # retries later. A callback can arrive before the trigger request has
+    # stored n8n's execution ID, so unmatched events are retried on the next
+    # MATCH_ATTEMPTS flushes before being left to the status sync.
+    N8N_CALLBACK_FLUSH_INTERVAL_SECONDS: float = 0.5
+    N8N_CALLBACK_BATCH_SIZE: int = 1000
+    N8N_CALLBACK_MAX_BUFFERED: int = 50000
+    N8N_CALLBACK_MATCH_ATTEMPTS: int = 10
+
+    # Web Push
+    # WHY: Encryption and VAPID signing run on PUSH_MAX_WORKERS threads so
+    # they never block the event loop; sends go out concurrently, at most
+    # PUSH_MAX_CONCURRENCY per fan-out. One VAPID token per push service is
+    # reused for PUSH_VAPID_TOKEN_TTL_SECONDS (push services accept <= 24h).
+    VAPID_PRIVATE_KEY: Optional[str] = None
+    VAPID_PUBLIC_KEY: Optional[str] = None
+    VAPID_MAILTO: str = "admin@example.com"
+    PUSH_MAX_WORKERS: int = 4
+    PUSH_MAX_CONCURRENCY: int = 50
+    PUSH_VAPID_TOKEN_TTL_SECONDS: int = 43200
+    PUSH_TIMEOUT_SECONDS: float = 10.0
+
     # Slack Notifications
     SLACK_WEBHOOK_URL: Optional[str] = None
     SLACK_WEBHOOK_ENABLED: bool = False
+    # WHY: Notifications are queued and posted in the background. Messages
+    # for a channel within SLACK_DISPATCH_WINDOW_SECONDS go out as one
+    # digest, posts are spaced to Slack's ~1/s webhook limit, and failed
+    # posts are retried up to SLACK_DISPATCH_MAX_ATTEMPTS times.
+    SLACK_DISPATCH_WINDOW_SECONDS: float = 2.0
+    SLACK_DISPATCH_MIN_INTERVAL_SECONDS: float = 1.0
+    SLACK_DISPATCH_MAX_QUEUED: int = 5000
+    SLACK_DISPATCH_MAX_ATTEMPTS: int = 5
 
     # OpenAI API (for natural language workflow generation)
     # WHY: GPT is used to convert plain text workflow descriptions to n8n JSON
@@ -117,5 +335,12 @@ class Settings(BaseSettings):
         """Get async database URL"""
         return self.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
 
+    @property
+    def async_database_replica_url(self) -> Optional[str]:
+        """Get async read-replica URL, or None when no replica is configured"""
+        if not self.DATABASE_REPLICA_URL:
+            return None
+        return self.DATABASE_REPLICA_URL.replace("postgresql://", "postgresql+asyncpg://")
+
 
 settings = Settings()
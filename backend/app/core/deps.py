@@ -12,6 +12,7 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import verify_token, is_token_blacklisted
+from app.core.principal_cache import get_principal_cache
 from app.core.exceptions import (
     AuthenticationError,
     AuthorizationError,
@@ -31,6 +32,34 @@ security = HTTPBearer()
 security_optional = HTTPBearer(auto_error=False)
 
 
+async def _load_principal(user_id: int, db: AsyncSession) -> Optional[User]:
+    """
+    Load the authenticated user, preferring the principal cache.
+
+    WHY: A cache hit authorizes the request without touching Postgres.
+    Only active users are cached, so deactivated accounts always re-check
+    the database.
+
+    Args:
+        user_id: User ID from the verified token
+        db: Database session
+
+    Returns:
+        User instance, or None if the user doesn't exist
+    """
+    cache = get_principal_cache()
+
+    user = await cache.resolve(user_id, db)
+    if user is not None:
+        return user
+
+    user_dao = UserDAO(User, db)
+    user = await user_dao.get_by_id(user_id)
+    if user is not None and user.is_active:
+        await cache.set(user)
+    return user
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
@@ -42,7 +71,7 @@ async def get_current_user(
     1. Extracts token from Authorization header
     2. Verifies token signature and expiration
     3. Checks if token is blacklisted (logged out)
-    4. Fetches user from database
+    4. Fetches user from the principal cache, falling back to the database
     5. Ensures user still exists and is active
 
     Usage:
@@ -74,7 +103,7 @@ async def get_current_user(
 
     # Check if token is blacklisted (user logged out)
     # WHY: Even valid tokens should be rejected if user logged out
-    if await is_token_blacklisted(token):
+    if await is_token_blacklisted(token, payload):
         raise AuthenticationError(
             message="Token has been revoked",
             reason="logged_out",
@@ -87,10 +116,10 @@ async def get_current_user(
             message="Invalid token: missing user_id",
         )
 
-    # Fetch user from database
-    # WHY: User data in token might be stale; always fetch current data
-    user_dao = UserDAO(User, db)
-    user = await user_dao.get_by_id(user_id)
+    # Fetch user (principal cache, then database)
+    # WHY: User data in token might be stale; the cache is invalidated on
+    # deactivation, role and password changes
+    user = await _load_principal(user_id, db)
 
     if not user:
         # WHY: User might have been deleted after token was issued
@@ -137,15 +166,14 @@ async def get_current_user_optional(
     except (TokenExpiredError, TokenInvalidError):
         return None
 
-    if await is_token_blacklisted(token):
+    if await is_token_blacklisted(token, payload):
         return None
 
     user_id: int = payload.get("user_id")
     if not user_id:
         return None
 
-    user_dao = UserDAO(User, db)
-    user = await user_dao.get_by_id(user_id)
+    user = await _load_principal(user_id, db)
 
     if not user or not user.is_active:
         return None
@@ -334,7 +362,7 @@ async def get_optional_user(
         payload = verify_token(token)
 
         # Check blacklist
-        if await is_token_blacklisted(token):
+        if await is_token_blacklisted(token, payload):
             return None
 
         # Get user
@@ -342,8 +370,7 @@ async def get_optional_user(
         if not user_id:
             return None
 
-        user_dao = UserDAO(User, db)
-        user = await user_dao.get_by_id(user_id)
+        user = await _load_principal(user_id, db)
 
         if user and user.is_active:
             return user
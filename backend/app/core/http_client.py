@@ -0,0 +1,259 @@
+"""
+Shared outbound HTTP client registry.
+
+WHAT: Owns long-lived httpx.AsyncClient instances, one per upstream
+(n8n, email, webhooks, Slack, integrations, OAuth), with tuned keep-alive
+pools, per-host connection limits, optional HTTP/2 and a default timeout
+policy.
+
+WHY: Services used to open a new AsyncClient per call, paying a TCP and
+TLS handshake for every n8n request, email and webhook delivery. A shared
+client reuses warm connections.
+
+HOW:
+1. Named clients are created lazily and live until shutdown()
+2. Each wraps an AsyncHTTPTransport in a per-host semaphore, so a slow
+   host can hold at most HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST connections;
+   waiting for a slot is bounded by the pool timeout
+3. Redirects are never followed (callers send credentials; following
+   redirects would also re-open SSRF holes closed by URL validation)
+4. Callers keep passing their own per-request `timeout=` where they had one
+
+Clients are bound to the event loop that first uses them; the API and the
+job worker each run a single loop.
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+def _http2_available() -> bool:
+    """Check whether the optional h2 package is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response stream that frees its host slot once closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release: Optional[Callable[[], None]] = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class _HostSlots:
+    """Semaphore of one host and the number of requests holding or awaiting it."""
+
+    def __init__(self, limit: int):
+        self.semaphore = asyncio.Semaphore(limit)
+        self.users = 0
+
+
+class _HostLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    Transport that caps concurrent requests per host.
+
+    WHY: httpx limits connections per client, not per host. Webhook
+    deliveries fan out to many receivers through one client; without a
+    per-host cap, a single slow receiver could hold every connection.
+
+    HOW: A host's entry is dropped as soon as no request holds or awaits
+    it, so webhook fan-out to many receivers doesn't grow the table for
+    good. Waiting for a slot raises httpx.PoolTimeout after the request's
+    pool timeout, like waiting for a connection in httpx's own pool.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_per_host: int):
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._hosts: Dict[str, _HostSlots] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.netloc.decode("ascii")
+        slots = self._hosts.get(host)
+        if slots is None:
+            slots = self._hosts[host] = _HostSlots(self._max_per_host)
+        slots.users += 1
+
+        pool_timeout = request.extensions.get("timeout", {}).get("pool")
+        try:
+            await asyncio.wait_for(slots.semaphore.acquire(), timeout=pool_timeout)
+        except asyncio.TimeoutError:
+            self._leave(host, slots)
+            raise httpx.PoolTimeout(
+                f"Timed out waiting for a connection slot to {host}", request=request
+            ) from None
+        except BaseException:
+            self._leave(host, slots)
+            raise
+
+        def release() -> None:
+            slots.semaphore.release()
+            self._leave(host, slots)
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        response.stream = _ReleasingStream(response.stream, release)
+        return response
+
+    def _leave(self, host: str, slots: _HostSlots) -> None:
+        """Stop using a host's slots, dropping its entry once unused."""
+        slots.users -= 1
+        if slots.users == 0 and self._hosts.get(host) is slots:
+            del self._hosts[host]
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class HttpClientRegistry:
+    """
+    Process-wide owner of outbound HTTP clients.
+
+    WHAT: Hands out one pooled client per upstream name.
+
+    WHY: See module docstring. Separate clients per upstream keep one
+    integration's traffic from exhausting another's pool.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = settings.HTTP_CLIENT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = settings.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS,
+        max_connections_per_host: int = settings.HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST,
+        keepalive_expiry: float = settings.HTTP_CLIENT_KEEPALIVE_EXPIRY_SECONDS,
+        connect_timeout: float = settings.HTTP_CLIENT_CONNECT_TIMEOUT_SECONDS,
+        timeout: float = settings.HTTP_CLIENT_TIMEOUT_SECONDS,
+        http2: bool = settings.HTTP_CLIENT_HTTP2,
+    ):
+        """
+        Initialize registry (clients are created on first use).
+
+        Args:
+            max_connections: Connections per upstream client
+            max_keepalive_connections: Idle connections kept per client
+            max_connections_per_host: Concurrent requests per host
+            keepalive_expiry: Seconds an idle connection is kept
+            connect_timeout: Connect timeout in seconds
+            timeout: Default read/write/pool timeout in seconds
+            http2: Negotiate HTTP/2 where the server supports it
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.http2 = http2 and _http2_available()
+        if http2 and not self.http2:
+            logger.warning("HTTP_CLIENT_HTTP2 is set but h2 is not installed; using HTTP/1.1")
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+
+    def client(self, name: str = "default") -> httpx.AsyncClient:
+        """
+        Get the pooled client for an upstream.
+
+        Args:
+            name: Upstream name (e.g. "n8n", "webhooks")
+
+        Returns:
+            Shared AsyncClient; do not close it or use it as a context manager
+        """
+        client = self._clients.get(name)
+        if client is None or client.is_closed:
+            transport = _HostLimitedTransport(
+                httpx.AsyncHTTPTransport(limits=self.limits, http2=self.http2),
+                self.max_connections_per_host,
+            )
+            client = httpx.AsyncClient(
+                transport=transport,
+                timeout=self.timeout,
+                follow_redirects=False,
+            )
+            self._clients[name] = client
+        return client
+
+    async def shutdown(self) -> None:
+        """Close every client and its connections."""
+        for name, client in self._clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"Error closing HTTP client {name!r}: {e}")
+        self._clients.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get registry info for health checks.
+
+        Returns:
+            Open client names and pool settings
+        """
+        return {
+            "clients": sorted(self._clients),
+            "max_connections": self.limits.max_connections,
+            "max_connections_per_host": self.max_connections_per_host,
+            "http2": self.http2,
+        }
+
+
+# Global HTTP client registry instance
+_http_client_registry: Optional[HttpClientRegistry] = None
+
+
+def get_http_client_registry() -> HttpClientRegistry:
+    """
+    Get global HTTP client registry instance.
+
+    Returns:
+        HttpClientRegistry singleton
+    """
+    global _http_client_registry
+    if _http_client_registry is None:
+        _http_client_registry = HttpClientRegistry()
+    return _http_client_registry
+
+
+def get_http_client(name: str = "default") -> httpx.AsyncClient:
+    """
+    Get the pooled HTTP client for an upstream.
+
+    Usage:
+        client = get_http_client("slack")
+        response = await client.post(url, json=payload, timeout=10.0)
+
+    Args:
+        name: Upstream name
+
+    Returns:
+        Shared AsyncClient
+    """
+    return get_http_client_registry().client(name)
@@ -0,0 +1,200 @@
+"""
+Redis lease-based leader election.
+
+WHAT: Lets exactly one process in the cluster hold a named lease at a time
+and reports who currently holds it.
+
+WHY: Every uvicorn worker in every pod starts the same background
+scheduler. Without coordination, each periodic job runs once per process
+and the database sees N x M copies of the same work.
+
+HOW:
+1. A background loop runs one Lua script per renew interval: renew the
+   lease if we hold it, else take it if it's free, and return the holder
+2. The lease key expires after its TTL, so a crashed leader is replaced
+   within roughly one TTL; a clean shutdown releases it immediately
+3. is_leader only trusts the lease until TTL after the last successful
+   renewal was *sent*, so a leader cut off from Redis stops acting as
+   leader before anyone else can take over
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Any, Dict, Optional
+
+from app.core.redis_manager import get_redis_client
+
+
+logger = logging.getLogger(__name__)
+
+# Redis key prefix for leases
+LEASE_KEY_PREFIX = "lease:"
+
+# Renew-or-acquire in one round trip. Returns the holder after the call.
+_ACQUIRE_SCRIPT = """
+local holder = redis.call('GET', KEYS[1])
+if holder == ARGV[1] then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    return holder
+end
+if not holder then
+    redis.call('SET', KEYS[1], ARGV[1], 'PX', ARGV[2])
+    return ARGV[1]
+end
+return holder
+"""
+
+# Delete the lease only if we still hold it
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def _default_identity() -> str:
+    """Build a cluster-unique identity for this process."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaderLease:
+    """
+    One named, renewable lease in Redis.
+
+    WHAT: Tracks whether this process is the leader for `name`.
+
+    WHY: See module docstring.
+
+    Example:
+        lease = LeaderLease("scheduler", ttl_seconds=15, renew_interval_seconds=5)
+        await lease.start()
+        if lease.is_leader:
+            ...
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: float,
+        renew_interval_seconds: float,
+        identity: Optional[str] = None,
+    ):
+        """
+        Initialize lease (not acquired until start()/try_acquire()).
+
+        Args:
+            name: Lease name, shared by every contender
+            ttl_seconds: Lease lifetime without renewal
+            renew_interval_seconds: Seconds between renew/acquire attempts;
+                must be well below ttl_seconds
+            identity: Holder identity (defaults to host:pid:random)
+        """
+        self.name = name
+        self.key = f"{LEASE_KEY_PREFIX}{name}"
+        self.ttl_seconds = ttl_seconds
+        self.renew_interval_seconds = renew_interval_seconds
+        self.identity = identity or _default_identity()
+        self._valid_until = 0.0
+        self._leader: Optional[str] = None
+        self._last_renewed: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_leader(self) -> bool:
+        """Whether this process may act as leader right now."""
+        return time.monotonic() < self._valid_until
+
+    async def try_acquire(self) -> bool:
+        """
+        Renew the lease if held, else try to take it.
+
+        Returns:
+            True if this process holds the lease afterwards
+        """
+        # WHY: Measured before the call - the lease can't outlive a TTL from
+        # when Redis received it, which is no earlier than now
+        sent_at = time.monotonic()
+        try:
+            redis = get_redis_client("leases")
+            holder = await redis.eval(
+                _ACQUIRE_SCRIPT, 1, self.key, self.identity, int(self.ttl_seconds * 1000)
+            )
+        except Exception as e:
+            if self.is_leader:
+                logger.warning(f"Could not renew lease {self.name!r}: {e}")
+            return self.is_leader
+
+        was_leader = self.is_leader
+        self._leader = holder
+        if holder == self.identity:
+            self._valid_until = sent_at + self.ttl_seconds
+            self._last_renewed = sent_at
+            if not was_leader:
+                logger.info(f"Acquired lease {self.name!r} as {self.identity}")
+            return True
+
+        if was_leader:
+            logger.warning(f"Lost lease {self.name!r} to {holder}")
+        self._valid_until = 0.0
+        return False
+
+    async def release(self) -> None:
+        """Give the lease up so another process can take over at once."""
+        was_leader = self.is_leader
+        self._valid_until = 0.0
+        if not was_leader:
+            return
+        try:
+            redis = get_redis_client("leases")
+            await redis.eval(_RELEASE_SCRIPT, 1, self.key, self.identity)
+            self._leader = None
+            logger.info(f"Released lease {self.name!r}")
+        except Exception as e:
+            logger.warning(f"Could not release lease {self.name!r}: {e}")
+
+    async def _run(self) -> None:
+        """Renew/acquire loop until cancelled."""
+        while True:
+            await self.try_acquire()
+            await asyncio.sleep(self.renew_interval_seconds)
+
+    async def start(self) -> None:
+        """Start contending for the lease in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop contending and release the lease if held."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.release()
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get lease status for health checks.
+
+        Returns:
+            Dict with this process's identity, leadership and last seen holder
+        """
+        return {
+            "name": self.name,
+            "identity": self.identity,
+            "is_leader": self.is_leader,
+            "leader": self._leader,
+            "ttl_seconds": self.ttl_seconds,
+            "last_renewed_seconds_ago": (
+                round(time.monotonic() - self._last_renewed, 1)
+                if self._last_renewed is not None
+                else None
+            ),
+        }
@@ -0,0 +1,309 @@
+"""
+Principal cache for authenticated request resolution.
+
+WHAT: Caches the columns get_current_user needs to authorize a request,
+keyed by user_id, in a short-lived in-process layer backed by Redis.
+
+WHY: Every authenticated request used to load the full User row from
+Postgres. Roles and active status change rarely, so a cache hit lets the
+request authorize without a database round trip.
+
+HOW:
+1. In-process dict with a few seconds' TTL absorbs bursts from one client
+2. Redis layer (longer TTL) is shared by every worker process
+3. invalidate() writes a short-lived tombstone; fills use SET NX so a
+   request that read the row just before an update can't re-cache stale data
+4. Redis failures degrade to a database load, never to an auth failure
+
+Credentials are never cached: a cached principal's hashed_password is left
+unloaded. Load users through UserDAO when verifying passwords.
+"""
+
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.config import settings
+from app.core.redis_manager import get_redis_client
+from app.models.user import User, UserRole
+
+
+logger = logging.getLogger(__name__)
+
+# Redis key prefix for cached principals
+PRINCIPAL_KEY_PREFIX = "principal:user:"
+
+# Marker stored by invalidate() to block re-fills for a short window
+_TOMBSTONE = "__invalidated__"
+
+# Columns that must never leave the database
+_EXCLUDED_COLUMNS = frozenset({"hashed_password"})
+
+# Upper bound on in-process entries per worker
+_LOCAL_MAX_ENTRIES = 10000
+
+
+def _principal_key(user_id: int) -> str:
+    """Build the Redis key for a user's cached principal."""
+    return f"{PRINCIPAL_KEY_PREFIX}{user_id}"
+
+
+def _serialize_user(user: User) -> Dict[str, Any]:
+    """
+    Snapshot a User's column values into a JSON-safe dict.
+
+    Args:
+        user: Loaded User instance
+
+    Returns:
+        Column name -> JSON-safe value (excluding credentials)
+    """
+    data: Dict[str, Any] = {}
+    for attr in sa_inspect(User).column_attrs:
+        if attr.key in _EXCLUDED_COLUMNS:
+            continue
+        value = getattr(user, attr.key)
+        if isinstance(value, datetime):
+            value = {"dt": value.isoformat()}
+        elif isinstance(value, UserRole):
+            value = value.value
+        data[attr.key] = value
+    return data
+
+
+def _deserialize_user(data: Dict[str, Any]) -> User:
+    """
+    Rebuild a detached User from a cached snapshot.
+
+    WHY: Detached-with-identity lets the session adopt the instance via
+    merge(load=False) without a SELECT, and attribute history is clean so
+    nothing is flushed unless a handler actually modifies the user.
+
+    Args:
+        data: Output of _serialize_user
+
+    Returns:
+        Detached User instance
+    """
+    values = {}
+    for key, value in data.items():
+        if isinstance(value, dict) and "dt" in value:
+            value = datetime.fromisoformat(value["dt"])
+        elif key == "role" and value is not None:
+            value = UserRole(value)
+        values[key] = value
+
+    user = User(**values)
+    make_transient_to_detached(user)
+    return user
+
+
+class PrincipalCache:
+    """
+    Two-level (in-process + Redis) cache of authenticated principals.
+
+    WHAT: Maps user_id to a snapshot of the user's columns.
+
+    WHY: Removes the per-request Postgres lookup from get_current_user.
+
+    HOW: See module docstring. The in-process layer is intentionally much
+    shorter-lived than Redis because other workers' invalidations only
+    reach it by expiry.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = settings.PRINCIPAL_CACHE_TTL_SECONDS,
+        local_ttl_seconds: float = settings.PRINCIPAL_CACHE_LOCAL_TTL_SECONDS,
+    ):
+        """
+        Initialize principal cache.
+
+        Args:
+            ttl_seconds: Redis entry lifetime
+            local_ttl_seconds: In-process entry lifetime
+        """
+        self.ttl_seconds = ttl_seconds
+        self.local_ttl_seconds = local_ttl_seconds
+        # user_id -> (expires_at monotonic, snapshot or None for tombstone)
+        self._local: Dict[int, tuple[float, Optional[Dict[str, Any]]]] = {}
+
+    def _local_get(self, user_id: int) -> tuple[bool, Optional[Dict[str, Any]]]:
+        """Return (found, snapshot); a found tombstone has snapshot None."""
+        entry = self._local.get(user_id)
+        if entry is None:
+            return False, None
+        if entry[0] <= time.monotonic():
+            self._local.pop(user_id, None)
+            return False, None
+        return True, entry[1]
+
+    def _local_put(
+        self, user_id: int, snapshot: Optional[Dict[str, Any]], ttl: float
+    ) -> None:
+        """Store an in-process entry, evicting the oldest when full."""
+        if len(self._local) >= _LOCAL_MAX_ENTRIES and user_id not in self._local:
+            # WHY: dicts preserve insertion order, so the first key is oldest
+            self._local.pop(next(iter(self._local)), None)
+        self._local[user_id] = (time.monotonic() + ttl, snapshot)
+
+    async def get(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached principal snapshot.
+
+        Args:
+            user_id: User ID from the token
+
+        Returns:
+            Snapshot dict, or None on miss/tombstone/Redis error
+        """
+        found, snapshot = self._local_get(user_id)
+        if found:
+            return snapshot
+
+        try:
+            redis = get_redis_client("principal_cache")
+            raw = await redis.get(_principal_key(user_id))
+        except Exception as e:
+            logger.warning(f"Principal cache read failed for user {user_id}: {e}")
+            return None
+
+        if raw is None or raw == _TOMBSTONE:
+            return None
+
+        snapshot = json.loads(raw)
+        self._local_put(user_id, snapshot, self.local_ttl_seconds)
+        return snapshot
+
+    async def set(self, user: User) -> None:
+        """
+        Cache a freshly loaded user.
+
+        WHY: SET NX means an invalidation tombstone wins over a concurrent
+        fill carrying pre-update data.
+
+        Args:
+            user: User loaded from the database
+        """
+        found, snapshot = self._local_get(user.id)
+        if found and snapshot is None:
+            # Locally invalidated moments ago; don't re-cache
+            return
+
+        snapshot = _serialize_user(user)
+        try:
+            redis = get_redis_client("principal_cache")
+            stored = await redis.set(
+                _principal_key(user.id),
+                json.dumps(snapshot),
+                ex=self.ttl_seconds,
+                nx=True,
+            )
+        except Exception as e:
+            logger.warning(f"Principal cache write failed for user {user.id}: {e}")
+            return
+
+        if stored:
+            self._local_put(user.id, snapshot, self.local_ttl_seconds)
+
+    async def invalidate(self, user_id: int) -> None:
+        """
+        Drop a user's cached principal everywhere.
+
+        WHAT: Replaces the entry with a tombstone in both layers.
+
+        WHY: Deactivation, role changes and password changes must take
+        effect on the user's next request, not after the TTL.
+
+        Args:
+            user_id: User whose principal changed
+        """
+        await self.invalidate_many([user_id])
+
+    async def invalidate_many(self, user_ids: Iterable[int]) -> None:
+        """
+        Drop several cached principals in one Redis round trip.
+
+        WHY: Suspending an organization deactivates all of its users at once.
+
+        Args:
+            user_ids: Users whose principals changed
+        """
+        user_ids = list(user_ids)
+        if not user_ids:
+            return
+
+        tombstone_seconds = settings.PRINCIPAL_CACHE_TOMBSTONE_SECONDS
+        for user_id in user_ids:
+            self._local_put(user_id, None, tombstone_seconds)
+
+        try:
+            redis = get_redis_client("principal_cache")
+            pipe = redis.pipeline(transaction=False)
+            for user_id in user_ids:
+                pipe.set(_principal_key(user_id), _TOMBSTONE, ex=tombstone_seconds)
+            await pipe.execute()
+        except Exception as e:
+            # WHY: Surface loudly - other workers may serve the stale
+            # principal until its TTL expires
+            logger.error(f"Principal cache invalidation failed for users {user_ids}: {e}")
+
+    def drop_local(self, user_id: int) -> None:
+        """
+        Forget a user's in-process entry without touching Redis.
+
+        WHY: Called when another worker announces a revocation; that worker
+        has already written the Redis tombstone.
+
+        Args:
+            user_id: User whose principal changed
+        """
+        self._local.pop(user_id, None)
+
+    def clear_local(self) -> None:
+        """Clear the in-process layer (tests and shutdown)."""
+        self._local.clear()
+
+    async def resolve(self, user_id: int, db: AsyncSession) -> Optional[User]:
+        """
+        Get a session-attached User from cache, if present.
+
+        WHAT: Rebuilds the cached user and attaches it to the request session.
+
+        WHY: Route handlers expect a persistent User they can read and,
+        occasionally, modify; merge(load=False) attaches it without a SELECT.
+
+        Args:
+            user_id: User ID from the token
+            db: Request database session
+
+        Returns:
+            Attached User, or None on cache miss
+        """
+        snapshot = await self.get(user_id)
+        if snapshot is None:
+            return None
+        return await db.merge(_deserialize_user(snapshot), load=False)
+
+
+# Global principal cache instance
+_principal_cache: Optional[PrincipalCache] = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    """
+    Get global principal cache instance.
+
+    Returns:
+        PrincipalCache singleton
+    """
+    global _principal_cache
+    if _principal_cache is None:
+        _principal_cache = PrincipalCache()
+    return _principal_cache
@@ -0,0 +1,230 @@
+"""
+Shared Redis connection manager.
+
+WHAT: Owns the single tuned Redis connection pool used by auth, rate
+limiting, OAuth state, caches and any future Redis consumer.
+
+WHY: Subsystems used to call aioredis.from_url with their own globals, so
+each had an untuned private pool. Under load that meant connection churn
+and no way to tell which subsystem was exhausting Redis connections.
+
+HOW:
+1. One BlockingConnectionPool - callers wait (up to a timeout) for a free
+   connection instead of opening unbounded new ones
+2. Each subsystem gets a named client over the shared pool; a thin proxy
+   counts in-use and waiting connections per name
+3. startup()/shutdown() are tied to the FastAPI app lifecycle; the pool is
+   also created lazily so scripts and tests work without startup
+"""
+
+import logging
+from typing import Any, Dict, Optional, cast
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class _ClientStats:
+    """Connection counters for one named client."""
+
+    __slots__ = ("in_use", "waiting", "acquired_total", "errors")
+
+    def __init__(self) -> None:
+        self.in_use = 0
+        self.waiting = 0
+        self.acquired_total = 0
+        self.errors = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "in_use": self.in_use,
+            "waiting": self.waiting,
+            "acquired_total": self.acquired_total,
+            "errors": self.errors,
+        }
+
+
+class _CountingPool:
+    """
+    Per-client view of the shared pool that counts connection usage.
+
+    WHY: redis-py doesn't tell a pool which client asked for a connection,
+    so attribution happens here, in front of the shared pool. Everything
+    except get_connection/release is delegated unchanged.
+    """
+
+    def __init__(self, pool: aioredis.BlockingConnectionPool, stats: _ClientStats):
+        self._pool = pool
+        self._stats = stats
+
+    async def get_connection(self, *args: Any, **kwargs: Any) -> Any:
+        self._stats.waiting += 1
+        try:
+            connection = await self._pool.get_connection(*args, **kwargs)
+        except aioredis.ConnectionError:
+            self._stats.errors += 1
+            raise
+        finally:
+            self._stats.waiting -= 1
+        self._stats.in_use += 1
+        self._stats.acquired_total += 1
+        return connection
+
+    async def release(self, connection: Any) -> None:
+        self._stats.in_use -= 1
+        await self._pool.release(connection)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pool, name)
+
+
+class RedisManager:
+    """
+    Process-wide owner of the Redis connection pool.
+
+    WHAT: Hands out named clients that share one pool and reports pool
+    metrics.
+
+    WHY: See module docstring.
+    """
+
+    def __init__(
+        self,
+        url: str = settings.REDIS_URL,
+        max_connections: int = settings.REDIS_MAX_CONNECTIONS,
+        pool_timeout: float = settings.REDIS_POOL_TIMEOUT_SECONDS,
+        socket_timeout: float = settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+    ):
+        """
+        Initialize manager (the pool is created on first use).
+
+        Args:
+            url: Redis URL
+            max_connections: Pool size shared by every subsystem
+            pool_timeout: Seconds to wait for a free connection
+            socket_timeout: Seconds to wait on a socket read/connect
+        """
+        self.url = url
+        self.max_connections = max_connections
+        self.pool_timeout = pool_timeout
+        self.socket_timeout = socket_timeout
+        self._pool: Optional[aioredis.BlockingConnectionPool] = None
+        self._clients: Dict[str, aioredis.Redis] = {}
+        self._stats: Dict[str, _ClientStats] = {}
+
+    def _get_pool(self) -> aioredis.BlockingConnectionPool:
+        """Create the shared pool on first use."""
+        if self._pool is None:
+            self._pool = aioredis.BlockingConnectionPool.from_url(
+                self.url,
+                max_connections=self.max_connections,
+                timeout=self.pool_timeout,
+                socket_timeout=self.socket_timeout,
+                socket_connect_timeout=self.socket_timeout,
+                health_check_interval=30,
+                encoding="utf-8",
+                decode_responses=True,
+            )
+        return self._pool
+
+    def client(self, name: str = "default") -> aioredis.Redis:
+        """
+        Get the named client for a subsystem.
+
+        WHY: Named clients let pool metrics attribute connection usage.
+
+        Args:
+            name: Subsystem name (e.g. "auth", "rate_limiter")
+
+        Returns:
+            Redis client backed by the shared pool
+        """
+        client = self._clients.get(name)
+        if client is None:
+            stats = self._stats.setdefault(name, _ClientStats())
+            # WHY: _CountingPool stands in for the pool it wraps (see class)
+            client = aioredis.Redis(
+                connection_pool=cast(
+                    aioredis.ConnectionPool, _CountingPool(self._get_pool(), stats)
+                )
+            )
+            self._clients[name] = client
+        return client
+
+    async def startup(self) -> None:
+        """
+        Create the pool and verify connectivity.
+
+        WHY: Failing fast in the logs beats discovering a bad REDIS_URL on
+        the first login. Not fatal - Redis-backed features degrade on their own.
+        """
+        try:
+            await self.client("default").ping()
+            logger.info(f"Redis pool ready (max {self.max_connections} connections)")
+        except Exception as e:
+            logger.warning(f"Redis not reachable at startup: {e}")
+
+    async def shutdown(self) -> None:
+        """Close every client and disconnect the shared pool."""
+        for client in self._clients.values():
+            try:
+                await client.aclose(close_connection_pool=False)
+            except Exception as e:
+                logger.warning(f"Error closing Redis client: {e}")
+        self._clients.clear()
+        if self._pool is not None:
+            await self._pool.disconnect()
+            self._pool = None
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Get pool metrics for health checks and monitoring.
+
+        Returns:
+            Totals plus per-client in-use/waiting/acquired/error counters
+        """
+        by_client = {name: stats.as_dict() for name, stats in self._stats.items()}
+        return {
+            "max_connections": self.max_connections,
+            "in_use": sum(s["in_use"] for s in by_client.values()),
+            "waiting": sum(s["waiting"] for s in by_client.values()),
+            "clients": by_client,
+        }
+
+
+# Global Redis manager instance
+_redis_manager: Optional[RedisManager] = None
+
+
+def get_redis_manager() -> RedisManager:
+    """
+    Get global Redis manager instance.
+
+    Returns:
+        RedisManager singleton
+    """
+    global _redis_manager
+    if _redis_manager is None:
+        _redis_manager = RedisManager()
+    return _redis_manager
+
+
+def get_redis_client(name: str = "default") -> aioredis.Redis:
+    """
+    Get a named Redis client backed by the shared pool.
+
+    Usage:
+        redis = get_redis_client("oauth_state")
+        await redis.setex(key, ttl, value)
+
+    Args:
+        name: Subsystem name for pool metrics
+
+    Returns:
+        Redis client
+    """
+    return get_redis_manager().client(name)
@@ -0,0 +1,46 @@
+"""
+Request spacing for outbound APIs.
+
+WHAT: Enforces a minimum interval between requests to one remote API.
+
+WHY: Bulk work (email fan-outs, n8n execution syncs) would otherwise hit
+a provider or a customer's instance as a burst, earning 429s or looking
+like abuse. Spacing requests keeps them under the remote rate limit.
+
+HOW: Each caller reserves the next free slot under a lock and sleeps
+until it arrives, so concurrent callers queue up one interval apart.
+"""
+
+import asyncio
+import time
+
+
+class RequestSpacer:
+    """
+    Minimum spacing between requests to one remote API.
+
+    Example:
+        spacer = RequestSpacer(requests_per_second=2)
+        await spacer.wait()
+        await client.post(...)
+    """
+
+    def __init__(self, requests_per_second: float):
+        """
+        Initialize spacer.
+
+        Args:
+            requests_per_second: Allowed request rate (0 = unlimited)
+        """
+        self._interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        """Wait until the next request is allowed."""
+        async with self._lock:
+            now = time.monotonic()
+            if self._next_at > now:
+                await asyncio.sleep(self._next_at - now)
+                now = self._next_at
+            self._next_at = now + self._interval
@@ -0,0 +1,353 @@
+"""
+Local revocation filter for token blacklist checks.
+
+WHAT: Keeps an in-memory set of revoked token fingerprints and per-user
+revocation cutoffs in every app process, kept current over Redis pub/sub.
+
+WHY: Revocations (logout, deactivation, password reset) are rare, yet every
+authenticated request used to pay a Redis round trip to learn that its token
+was not revoked. With a synced local filter, the common negative answer is
+local; only probable hits are confirmed against Redis. Redis hiccups no
+longer show up as auth latency on every request.
+
+HOW:
+1. start() runs a background listener that subscribes to the revocation
+   channel, then loads a snapshot of existing blacklist keys
+2. Only once both succeed is the filter marked synced
+3. Until synced (startup, tests, scripts, or after a dropped subscription)
+   might_be_revoked() answers True, so every check goes to Redis as before
+4. Redis remains the source of truth; the filter only decides whether
+   asking Redis is necessary
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Dict, Optional
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.core.redis_manager import get_redis_client
+
+
+logger = logging.getLogger(__name__)
+
+# Pub/sub channel carrying revocation events
+REVOCATION_CHANNEL = "auth:revocations"
+
+# Redis key prefixes (authoritative blacklist storage)
+TOKEN_BLACKLIST_PREFIX = "blacklist:token:"
+USER_REVOCATION_PREFIX = "blacklist:user:"
+
+# WHY: 16 bytes of SHA-256 keeps each entry compact; a collision only costs
+# one extra Redis confirmation, never a false rejection
+_FINGERPRINT_BYTES = 16
+
+# Seconds between sweeps of expired entries
+_PRUNE_INTERVAL_SECONDS = 60.0
+
+# Reconnect backoff bounds for the listener
+_RECONNECT_MIN_SECONDS = 0.5
+_RECONNECT_MAX_SECONDS = 30.0
+
+
+def token_fingerprint(token: str) -> bytes:
+    """
+    Compute the compact fingerprint used by the local filter.
+
+    Args:
+        token: Raw JWT
+
+    Returns:
+        Truncated SHA-256 digest
+    """
+    return hashlib.sha256(token.encode()).digest()[:_FINGERPRINT_BYTES]
+
+
+class RevocationFilter:
+    """
+    Process-local view of revoked tokens and users.
+
+    WHAT: Answers "might this token be revoked?" without a network call.
+
+    WHY: See module docstring.
+
+    HOW: Two dicts with expiry times - token fingerprints, and user_id to
+    "tokens issued at or before this second are revoked". Both are pruned
+    once their entries can no longer match a live token.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty, unsynced filter."""
+        self._tokens: Dict[bytes, float] = {}
+        self._users: Dict[int, tuple[int, float]] = {}
+        self._synced = False
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def synced(self) -> bool:
+        """Whether negative answers can be trusted without asking Redis."""
+        return self._synced
+
+    def add_token(self, token: str, expires_at: float) -> None:
+        """
+        Record a revoked token.
+
+        Args:
+            token: Raw JWT
+            expires_at: Unix time after which the token is invalid anyway
+        """
+        self._add_fingerprint(token_fingerprint(token), expires_at)
+
+    def _add_fingerprint(self, fingerprint: bytes, expires_at: float) -> None:
+        """Record a revoked token fingerprint."""
+        self._tokens[fingerprint] = max(expires_at, self._tokens.get(fingerprint, 0.0))
+
+    def add_user(self, user_id: int, revoked_at: int, expires_at: float) -> None:
+        """
+        Record a user-wide revocation.
+
+        Args:
+            user_id: User whose tokens are revoked
+            revoked_at: Tokens with iat <= this Unix second are revoked
+            expires_at: Unix time after which no affected token can be live
+        """
+        current = self._users.get(user_id)
+        if current is None or revoked_at >= current[0]:
+            self._users[user_id] = (revoked_at, expires_at)
+
+    def might_be_revoked(self, token: str, claims: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Check whether a token needs a Redis confirmation.
+
+        Args:
+            token: Raw JWT
+            claims: Decoded token claims (user_id, iat), if available
+
+        Returns:
+            False only when the filter is synced and has no matching entry
+        """
+        if not self._synced:
+            return True
+
+        now = time.time()
+        expires_at = self._tokens.get(token_fingerprint(token))
+        if expires_at is not None and expires_at > now:
+            return True
+
+        if claims and "user_id" in claims:
+            user_entry = self._users.get(claims["user_id"])
+            if user_entry is not None and user_entry[1] > now:
+                issued_at = claims.get("iat")
+                if issued_at is None or issued_at <= user_entry[0]:
+                    return True
+
+        return False
+
+    def prune(self) -> None:
+        """Drop entries that can no longer match a live token."""
+        now = time.time()
+        self._tokens = {fp: exp for fp, exp in self._tokens.items() if exp > now}
+        self._users = {uid: entry for uid, entry in self._users.items() if entry[1] > now}
+
+    def apply_event(self, raw: str) -> None:
+        """
+        Apply a revocation event received over pub/sub.
+
+        Args:
+            raw: JSON event published by publish_token_revocation or
+                publish_user_revocation
+        """
+        try:
+            event = json.loads(raw)
+            if event["type"] == "token":
+                self._add_fingerprint(bytes.fromhex(event["fp"]), float(event["exp"]))
+            elif event["type"] == "user":
+                user_id = int(event["user_id"])
+                self.add_user(user_id, int(event["revoked_at"]), float(event["exp"]))
+                # WHY: Lets other workers drop their in-process principal
+                # immediately instead of waiting for its local TTL
+                from app.core.principal_cache import get_principal_cache
+
+                get_principal_cache().drop_local(user_id)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring malformed revocation event {raw!r}: {e}")
+
+    async def _load_snapshot(self, redis: aioredis.Redis) -> None:
+        """
+        Load existing blacklist entries from Redis.
+
+        WHY: Revocations published before this process subscribed would
+        otherwise be missed until they expire.
+
+        Args:
+            redis: Redis client
+        """
+        now = time.time()
+
+        batch: list[str] = []
+
+        async def flush_batch() -> None:
+            pipe = redis.pipeline(transaction=False)
+            for key in batch:
+                pipe.ttl(key)
+            for key, ttl in zip(batch, await pipe.execute()):
+                if ttl and ttl > 0:
+                    self.add_token(key[len(TOKEN_BLACKLIST_PREFIX):], now + ttl)
+            batch.clear()
+
+        async for key in redis.scan_iter(match=f"{TOKEN_BLACKLIST_PREFIX}*", count=1000):
+            batch.append(key)
+            if len(batch) >= 1000:
+                await flush_batch()
+        if batch:
+            await flush_batch()
+
+        async for key in redis.scan_iter(match=f"{USER_REVOCATION_PREFIX}*", count=1000):
+            revoked_at = await redis.get(key)
+            ttl = await redis.ttl(key)
+            if revoked_at is not None and ttl and ttl > 0:
+                user_id = int(key[len(USER_REVOCATION_PREFIX):])
+                self.add_user(user_id, int(revoked_at), now + ttl)
+
+    async def _run(self) -> None:
+        """
+        Listener loop: subscribe, snapshot, then apply events until cancelled.
+
+        HOW: Any connection error marks the filter unsynced (so checks fall
+        back to Redis) and reconnects with exponential backoff.
+        """
+        backoff = _RECONNECT_MIN_SECONDS
+        while True:
+            pubsub = None
+            try:
+                redis = get_redis_client("revocation")
+                pubsub = redis.pubsub()
+                # Subscribe before the snapshot so nothing falls in between
+                await pubsub.subscribe(REVOCATION_CHANNEL)
+                await self._load_snapshot(redis)
+                self._synced = True
+                backoff = _RECONNECT_MIN_SECONDS
+                logger.info("Token revocation filter synced")
+
+                next_prune = time.monotonic() + _PRUNE_INTERVAL_SECONDS
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    if message and message.get("type") == "message":
+                        self.apply_event(message["data"])
+                    if time.monotonic() >= next_prune:
+                        self.prune()
+                        next_prune = time.monotonic() + _PRUNE_INTERVAL_SECONDS
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._synced = False
+                logger.warning(
+                    f"Token revocation listener disconnected, checking Redis directly: {e}"
+                )
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, _RECONNECT_MAX_SECONDS)
+            finally:
+                self._synced = False
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+
+    async def start(self) -> None:
+        """
+        Start the background listener.
+
+        WHY: Called from app startup; processes that never call it (tests,
+        scripts) keep the old always-ask-Redis behavior.
+        """
+        if not settings.REVOCATION_FILTER_ENABLED:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background listener."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._synced = False
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get filter status for health checks.
+
+        Returns:
+            Dict with sync state and entry counts
+        """
+        return {
+            "synced": self._synced,
+            "revoked_tokens": len(self._tokens),
+            "revoked_users": len(self._users),
+        }
+
+
+# Global revocation filter instance
+_revocation_filter: Optional[RevocationFilter] = None
+
+
+def get_revocation_filter() -> RevocationFilter:
+    """
+    Get global revocation filter instance.
+
+    Returns:
+        RevocationFilter singleton
+    """
+    global _revocation_filter
+    if _revocation_filter is None:
+        _revocation_filter = RevocationFilter()
+    return _revocation_filter
+
+
+async def publish_token_revocation(
+    redis: aioredis.Redis, token: str, expires_at: float
+) -> None:
+    """
+    Announce a revoked token to every process.
+
+    Args:
+        redis: Redis client
+        token: Raw JWT
+        expires_at: Unix time after which the token is invalid anyway
+    """
+    get_revocation_filter().add_token(token, expires_at)
+    await redis.publish(
+        REVOCATION_CHANNEL,
+        json.dumps({"type": "token", "fp": token_fingerprint(token).hex(), "exp": expires_at}),
+    )
+
+
+async def publish_user_revocation(
+    redis: aioredis.Redis, user_id: int, revoked_at: int, expires_at: float
+) -> None:
+    """
+    Announce a user-wide revocation to every process.
+
+    Args:
+        redis: Redis client
+        user_id: User whose tokens are revoked
+        revoked_at: Tokens with iat <= this Unix second are revoked
+        expires_at: Unix time after which no affected token can be live
+    """
+    get_revocation_filter().add_user(user_id, revoked_at, expires_at)
+    await redis.publish(
+        REVOCATION_CHANNEL,
+        json.dumps(
+            {"type": "user", "user_id": user_id, "revoked_at": revoked_at, "exp": expires_at}
+        ),
+    )
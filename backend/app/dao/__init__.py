@@ -52,6 +52,7 @@ from app.dao.integration import (
     CalendarIntegrationDAO,
     WebhookEndpointDAO,
     WebhookDeliveryDAO,
+    WebhookOutboxDAO,
 )
 
 __all__ = [
@@ -101,4 +102,5 @@ __all__ = [
     "CalendarIntegrationDAO",
     "WebhookEndpointDAO",
     "WebhookDeliveryDAO",
+    "WebhookOutboxDAO",
 ]
@@ -107,6 +107,7 @@ class ActivityEventDAO(BaseDAO[ActivityEvent]):
         include_private: bool = False,
         skip: int = 0,
         limit: int = 50,
+        cursor: Optional[str] = None,
     ) -> List[ActivityEvent]:
         """
         Get activity feed for an organization.
@@ -124,8 +125,9 @@ class ActivityEventDAO(BaseDAO[ActivityEvent]):
             since: Optional start time
             until: Optional end time
             include_private: Include private events
-            skip: Pagination offset
+            skip: Pagination offset (ignored when cursor is given)
             limit: Pagination limit
+            cursor: Keyset cursor over (created_at, id) from a previous page
 
         Returns:
             List of activities
@@ -157,9 +159,9 @@ class ActivityEventDAO(BaseDAO[ActivityEvent]):
         if not include_private:
             query = query.where(ActivityEvent.is_public == True)
 
-        query = query.order_by(ActivityEvent.created_at.desc())
+        query = self.paginate(query, skip=skip, limit=limit, cursor=cursor)
 
-        result = await self.session.execute(query.offset(skip).limit(limit))
+        result = await self.session.execute(query)
         return list(result.scalars().all())
 
     async def get_entity_feed(
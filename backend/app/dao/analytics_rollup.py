@@ -0,0 +1,276 @@
+"""
+Analytics Rollup Data Access Object.
+
+WHAT: Reads and rebuilds the monthly analytics rollups.
+
+WHY: Series and rankings over the rollups cost the same however many
+years of projects, users and invoices exist. The current month is still
+changing, so it is always recomputed exactly from the source table and
+combined with the closed months from the rollups in the same statement.
+
+HOW: Each metric's source (table, timestamp column, aggregate, filter) is
+declared once in ROLLUP_SOURCES and used by rebuild and by the reads.
+Incremental maintenance lives with the model (app.models.analytics_rollup).
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import (
+    Date,
+    Select,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    select,
+    union_all,
+)
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.dao.base import BaseDAO
+from app.models.analytics_rollup import (
+    AnalyticsMonthlyRollup,
+    AnalyticsRollupMetric,
+    rollup_period,
+    rollup_upsert,
+)
+from app.models.invoice import Invoice, InvoiceStatus
+from app.models.organization import Organization
+from app.models.project import Project
+from app.models.user import User
+
+
+@dataclass(frozen=True)
+class RollupSource:
+    """
+    Where a rollup metric comes from.
+
+    Attributes:
+        model: Source model (must have org_id)
+        timestamp: Column that places a row in a month
+        value: Aggregate expression per organization-month
+        conditions: Rows that count towards the metric
+    """
+
+    model: Any
+    timestamp: Any
+    value: Any
+    conditions: Tuple[Any, ...] = ()
+
+
+ROLLUP_SOURCES: Dict[AnalyticsRollupMetric, RollupSource] = {
+    AnalyticsRollupMetric.PROJECTS_CREATED: RollupSource(
+        Project, Project.created_at, func.count(Project.id)
+    ),
+    AnalyticsRollupMetric.USERS_REGISTERED: RollupSource(
+        User, User.created_at, func.count(User.id)
+    ),
+    AnalyticsRollupMetric.REVENUE: RollupSource(
+        Invoice,
+        Invoice.paid_at,
+        func.sum(Invoice.amount_paid),
+        (Invoice.status == InvoiceStatus.PAID, Invoice.paid_at.isnot(None)),
+    ),
+}
+
+
+def _as_datetime(period: date) -> datetime:
+    """Get the timestamp a rollup period starts at."""
+    return datetime(period.year, period.month, 1)
+
+
+class AnalyticsRollupDAO(BaseDAO[AnalyticsMonthlyRollup]):
+    """
+    Data Access Object for AnalyticsMonthlyRollup.
+
+    WHAT: Range reads over the rollups and their rebuild.
+
+    WHY: See module docstring.
+
+    HOW: Reads union the rollup rows before the current period with a
+    live aggregate of the source table from the current period onwards.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize AnalyticsRollupDAO."""
+        super().__init__(AnalyticsMonthlyRollup, session)
+
+    def _current_rows(self, metric: AnalyticsRollupMetric, current: date) -> Select[Any]:
+        """Select (org_id, value) of the current period from the source table."""
+        source = ROLLUP_SOURCES[metric]
+        return (
+            select(source.model.org_id.label("org_id"), source.value.label("value"))
+            .where(*source.conditions, source.timestamp >= _as_datetime(current))
+            .group_by(source.model.org_id)
+        )
+
+    async def monthly_series(
+        self,
+        metric: AnalyticsRollupMetric,
+        start: date,
+        current: Optional[date] = None,
+    ) -> List[Tuple[date, Decimal]]:
+        """
+        Get a metric's platform-wide total per month.
+
+        Args:
+            metric: Rollup metric
+            start: First period to include
+            current: Period recomputed from the source table (defaults to
+                     the current month)
+
+        Returns:
+            (period, total) pairs, oldest first; months without data are
+            omitted
+        """
+        current = current or rollup_period(datetime.utcnow())
+        source = ROLLUP_SOURCES[metric]
+
+        closed = (
+            select(
+                AnalyticsMonthlyRollup.period.label("period"),
+                AnalyticsMonthlyRollup.value.label("value"),
+            )
+            .where(
+                AnalyticsMonthlyRollup.metric == metric.value,
+                AnalyticsMonthlyRollup.period >= start,
+                AnalyticsMonthlyRollup.period < current,
+            )
+        )
+        live = select(
+            cast(literal(current), Date).label("period"), source.value.label("value")
+        ).where(*source.conditions, source.timestamp >= _as_datetime(current))
+        rows = union_all(closed, live).subquery()
+
+        result = await self.session.execute(
+            select(rows.c.period, func.sum(rows.c.value).label("value"))
+            .group_by(rows.c.period)
+            .having(func.sum(rows.c.value) != 0)
+            .order_by(rows.c.period)
+        )
+        return [(row.period, row.value) for row in result.all()]
+
+    async def top_organizations(
+        self,
+        metric: AnalyticsRollupMetric,
+        limit: int = 10,
+        current: Optional[date] = None,
+    ) -> List[Tuple[int, str, Decimal]]:
+        """
+        Rank organizations by a metric's all-time total.
+
+        Args:
+            metric: Rollup metric
+            limit: Organizations to return
+            current: Period recomputed from the source table (defaults to
+                     the current month)
+
+        Returns:
+            (org_id, org_name, total) tuples, highest first
+        """
+        current = current or rollup_period(datetime.utcnow())
+
+        closed = (
+            select(
+                AnalyticsMonthlyRollup.org_id.label("org_id"),
+                func.sum(AnalyticsMonthlyRollup.value).label("value"),
+            )
+            .where(
+                AnalyticsMonthlyRollup.metric == metric.value,
+                AnalyticsMonthlyRollup.period < current,
+            )
+            .group_by(AnalyticsMonthlyRollup.org_id)
+        )
+        rows = union_all(closed, self._current_rows(metric, current)).subquery()
+        total = func.sum(rows.c.value)
+
+        result = await self.session.execute(
+            select(Organization.id, Organization.name, total.label("value"))
+            .join(rows, rows.c.org_id == Organization.id)
+            .group_by(Organization.id, Organization.name)
+            .order_by(total.desc())
+            .limit(limit)
+        )
+        return [(row.id, row.name, row.value) for row in result.all()]
+
+    async def apply_deltas(self, deltas: Dict[Tuple[int, str, date], Decimal]) -> None:
+        """
+        Add deltas to rollup rows.
+
+        WHAT: For writes that bypass the unit of work (Core UPDATE/DELETE),
+        which the after_flush hook can't see.
+
+        Args:
+            deltas: (org_id, metric, period) -> amount to add
+        """
+        stmt = rollup_upsert(deltas)
+        if stmt is not None:
+            await self.session.execute(stmt)
+
+    async def rebuild(
+        self,
+        metrics: Optional[Iterable[AnalyticsRollupMetric]] = None,
+        since: Optional[date] = None,
+    ) -> int:
+        """
+        Recompute rollups from the source tables.
+
+        WHAT: Replaces the rollup rows of the given metrics from period
+        `since` onwards (all history when None) with fresh aggregates.
+
+        WHY: Backfills history and repairs drift from writes that skipped
+        the incremental path (raw SQL, restores, Core bulk statements).
+
+        HOW: DELETE then INSERT ... SELECT per metric, in the caller's
+        transaction, so readers see either the old or the rebuilt rows.
+
+        Args:
+            metrics: Metrics to rebuild (default: all)
+            since: First period to rebuild (default: all history)
+
+        Returns:
+            Number of rollup rows written
+        """
+        written = 0
+        for metric in metrics or list(AnalyticsRollupMetric):
+            source = ROLLUP_SOURCES[metric]
+            # WHY: An inline 'month' keeps the GROUP BY expression identical
+            # to the selected one (bound parameters would differ)
+            period = cast(func.date_trunc(literal_column("'month'"), source.timestamp), Date)
+
+            clear = delete(AnalyticsMonthlyRollup).where(
+                AnalyticsMonthlyRollup.metric == metric.value
+            )
+            conditions = list(source.conditions)
+            if since is not None:
+                clear = clear.where(AnalyticsMonthlyRollup.period >= since)
+                conditions.append(source.timestamp >= _as_datetime(since))
+            await self.session.execute(clear)
+
+            aggregated = (
+                select(
+                    source.model.org_id,
+                    literal(metric.value),
+                    period,
+                    source.value,
+                    func.now(),
+                )
+                .where(*conditions)
+                .group_by(source.model.org_id, period)
+            )
+            result = await self.session.execute(
+                insert(AnalyticsMonthlyRollup.__table__).from_select(
+                    ["org_id", "metric", "period", "value", "updated_at"], aggregated
+                )
+            )
+            # WHY: DML returns a CursorResult; session.execute() is typed as
+            # the plain Result, which has no rowcount
+            assert isinstance(result, CursorResult)
+            written += result.rowcount
+        return written
@@ -19,10 +19,15 @@ from typing import Optional, List, Dict, Any
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.dao.base import keyset_paginate
 from app.models.audit_log import AuditLog, AuditAction
 from app.core.exceptions import AuditLogImmutableError
 
 
+# Keyset order for audit log browsing (newest first)
+AUDIT_LOG_CURSOR_COLUMNS = (AuditLog.created_at, AuditLog.id)
+
+
 class AuditLogDAO:
     """
     Data Access Object for audit log operations.
@@ -326,6 +331,7 @@ class AuditLogDAO:
         org_id: int,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = None,
     ) -> List[AuditLog]:
         """
         Retrieve audit logs for a specific organization.
@@ -336,18 +342,21 @@ class AuditLogDAO:
 
         Args:
             org_id: Organization ID
-            skip: Pagination offset
+            skip: Pagination offset (ignored when cursor is given)
             limit: Maximum records to return
+            cursor: Keyset cursor over (created_at, id) from a previous page
 
         Returns:
             List of AuditLog entries for the organization
         """
         result = await self.session.execute(
-            select(AuditLog)
-            .where(AuditLog.org_id == org_id)
-            .order_by(AuditLog.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+            keyset_paginate(
+                select(AuditLog).where(AuditLog.org_id == org_id),
+                AUDIT_LOG_CURSOR_COLUMNS,
+                skip=skip,
+                limit=limit,
+                cursor=cursor,
+            )
         )
         return list(result.scalars().all())
 
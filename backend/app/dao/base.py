@@ -6,16 +6,181 @@ making the codebase more testable, maintainable, and allowing easier
 database technology changes in the future.
 """
 
-from typing import Generic, TypeVar, Type, Optional, List, Any
-from sqlalchemy import select, update, delete
+import base64
+import binascii
+import json
+import time
+from datetime import datetime
+from typing import Generic, TypeVar, Type, Optional, List, Any, Dict, Tuple, Sequence
+from sqlalchemy import select, insert, update, delete, func, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.core.exceptions import ValidationError
 from app.models.base import Base
 
 # Type variable for model class
 ModelType = TypeVar("ModelType", bound=Base)
 
 
+# Process-local cache for estimated counts
+# WHY: Filtered estimates (e.g. org_id=...) cannot be answered from planner
+# statistics, so the exact count is cached for a short TTL instead. Keyed by
+# (table name, sorted filter items) -> (expires_at monotonic, count).
+_count_cache: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Tuple[float, int]] = {}
+
+# Rows per multi-row INSERT in bulk_create
+# WHY: Keeps each statement well under PostgreSQL's 32767 bind-parameter
+# limit for wide tables while still amortizing round trips.
+BULK_BATCH_SIZE = 500
+
+# Upper bound on cached count entries
+# WHY: Keys include filter values (org_id etc.), so the cache must not grow
+# without limit in a long-running worker.
+_COUNT_CACHE_MAX_ENTRIES = 10000
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode keyset values into an opaque cursor string.
+
+    WHY: Clients should treat cursors as opaque tokens. Base64-encoded JSON
+    keeps them URL-safe while letting the server round-trip datetimes.
+
+    Args:
+        values: Key values of the last row on the page (e.g. created_at, id)
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = [
+        {"dt": v.isoformat()} if isinstance(v, datetime) else v
+        for v in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, key_count: int) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    WHY: Cursors arrive from untrusted query strings, so malformed input
+    must surface as a 400 rather than a 500.
+
+    Args:
+        cursor: Cursor string from the client
+        key_count: Number of key values expected
+
+    Returns:
+        List of decoded key values
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(payload, list) or len(payload) != key_count:
+            raise ValueError("unexpected cursor shape")
+        return [
+            datetime.fromisoformat(v["dt"]) if isinstance(v, dict) else v
+            for v in payload
+        ]
+    except (ValueError, KeyError, TypeError, binascii.Error) as e:
+        raise ValidationError(message="Invalid pagination cursor", cursor=cursor) from e
+
+
+def keyset_paginate(
+    query: Any,
+    columns: Sequence[Any],
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+) -> Any:
+    """
+    Order a query newest-first and apply cursor or offset pagination.
+
+    WHAT: Shared pagination for list queries, including DAOs that don't
+    extend BaseDAO (TicketDAO, AuditLogDAO).
+
+    WHY: OFFSET makes the database walk and discard every skipped row,
+    so deep pages get linearly slower. A keyset cursor turns page N into
+    an index range scan that costs the same as page 1. Offset is kept for
+    clients that still send skip.
+
+    HOW: When a cursor is given, rows strictly after the cursor's key
+    (in descending order) are selected and skip is ignored.
+
+    Args:
+        query: SQLAlchemy select
+        columns: Key columns, most significant first (e.g. created_at, id)
+        skip: Offset (used only when no cursor is given)
+        limit: Maximum rows to return
+        cursor: Opaque cursor from a previous page's next_cursor
+
+    Returns:
+        The ordered, paginated query
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    query = query.order_by(*[c.desc() for c in columns])
+
+    if cursor:
+        values = decode_cursor(cursor, len(columns))
+        if len(columns) == 1:
+            query = query.where(columns[0] < values[0])
+        else:
+            query = query.where(tuple_(*columns) < tuple_(*values))
+        return query.limit(limit)
+
+    return query.offset(skip).limit(limit)
+
+
+def next_page_cursor(
+    items: Sequence[Any],
+    limit: int,
+    columns: Sequence[Any],
+) -> Optional[str]:
+    """
+    Cursor for the page after items, or None if this was the last page.
+
+    WHY: A short page means there is nothing further to fetch. A full page
+    may be followed by an empty one, which is the usual keyset trade-off
+    for not issuing an extra count query.
+
+    Args:
+        items: Items returned for the current page
+        limit: Page size that was requested
+        columns: Key columns used by keyset_paginate
+
+    Returns:
+        Opaque cursor string, or None
+    """
+    if not items or len(items) < limit:
+        return None
+    return encode_cursor([getattr(items[-1], c.key) for c in columns])
+
+
+def clear_count_cache(table_name: Optional[str] = None) -> None:
+    """
+    Drop cached estimated counts.
+
+    WHY: Tests and bulk maintenance jobs need a way to force fresh totals
+    instead of waiting for the TTL to expire.
+
+    Args:
+        table_name: Only drop entries for this table (all tables if None)
+    """
+    if table_name is None:
+        _count_cache.clear()
+        return
+
+    for key in [k for k in _count_cache if k[0] == table_name]:
+        _count_cache.pop(key, None)
+
+
 class BaseDAO(Generic[ModelType]):
     """
     Base Data Access Object providing CRUD operations for all models.
@@ -42,6 +207,112 @@ class BaseDAO(Generic[ModelType]):
         self.model = model
         self.session = session
 
+    def _apply_filters(self, query: Any, filters: Dict[str, Any]) -> Any:
+        """
+        Apply keyword equality filters to a query.
+
+        WHY: get_all, count and exists must share the same filter semantics
+        (unknown field names are ignored) so totals always match the pages.
+
+        Args:
+            query: SQLAlchemy select to filter
+            filters: Field name to value filters
+
+        Returns:
+            The filtered query
+        """
+        for field, value in filters.items():
+            if hasattr(self.model, field):
+                query = query.where(getattr(self.model, field) == value)
+        return query
+
+    def _cursor_columns(self) -> List[Any]:
+        """
+        Columns that define keyset order for this model.
+
+        WHY: (created_at, id) gives newest-first order with a unique
+        tie-breaker; models without created_at fall back to (id).
+
+        Returns:
+            Ordered list of key columns
+        """
+        if hasattr(self.model, "created_at"):
+            return [self.model.created_at, self.model.id]
+        return [self.model.id]
+
+    def paginate(
+        self,
+        query: Any,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Any:
+        """
+        Order a query by this model's keyset and paginate it.
+
+        WHY: Lets subclasses paginate custom queries with the same cursor
+        format as get_page() (see keyset_paginate()).
+
+        Args:
+            query: SQLAlchemy select over this DAO's model
+            skip: Offset (used only when no cursor is given)
+            limit: Maximum rows to return
+            cursor: Opaque cursor from a previous page's next_cursor
+
+        Returns:
+            The ordered, paginated query
+        """
+        return keyset_paginate(query, self._cursor_columns(), skip, limit, cursor)
+
+    def next_cursor(self, items: Sequence[ModelType], limit: int) -> Optional[str]:
+        """
+        Cursor for the page after items, or None if this was the last page.
+
+        Args:
+            items: Items returned for the current page
+            limit: Page size that was requested
+
+        Returns:
+            Opaque cursor string, or None
+        """
+        return next_page_cursor(items, limit, self._cursor_columns())
+
+    async def get_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        **filters: Any,
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """
+        Retrieve one keyset page of records.
+
+        WHY: Constant-cost pagination for large tables (see paginate()).
+        One extra row is fetched so next_cursor is None exactly on the
+        last page.
+
+        Args:
+            cursor: Cursor from a previous call (None for the first page)
+            limit: Maximum number of records to return
+            **filters: Field name to value filters (e.g., org_id=1)
+
+        Returns:
+            Tuple of (records, next_cursor)
+        """
+        query = self.paginate(
+            self._apply_filters(select(self.model), filters),
+            limit=limit + 1,
+            cursor=cursor,
+        )
+        result = await self.session.execute(query)
+        items = list(result.scalars().all())
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = next_page_cursor(items, limit, self._cursor_columns())
+
+        return items, next_cursor
+
     async def create(self, **kwargs: Any) -> ModelType:
         """
         Create a new record.
@@ -81,7 +352,13 @@ class BaseDAO(Generic[ModelType]):
         result = await self.session.execute(select(self.model).where(self.model.id == id))
         return result.scalar_one_or_none()
 
-    async def get_all(self, skip: int = 0, limit: int = 100, **filters: Any) -> List[ModelType]:
+    async def get_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        **filters: Any,
+    ) -> List[ModelType]:
         """
         Retrieve multiple records with optional pagination and filtering.
 
@@ -91,20 +368,20 @@ class BaseDAO(Generic[ModelType]):
         Args:
             skip: Number of records to skip (for pagination)
             limit: Maximum number of records to return
+            cursor: Keyset cursor; when given, skip is ignored (see paginate())
             **filters: Field name to value filters (e.g., org_id=1)
 
         Returns:
             List of model instances matching the filters
         """
-        query = select(self.model)
-
-        # Apply filters
-        for field, value in filters.items():
-            if hasattr(self.model, field):
-                query = query.where(getattr(self.model, field) == value)
-
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
+        # WHY: Offset pages use the same keyset order as cursor pages, so a
+        # client can move from the first page to cursor pages
+        query = self.paginate(
+            self._apply_filters(select(self.model), filters),
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
+        )
 
         result = await self.session.execute(query)
         return list(result.scalars().all())
@@ -172,12 +449,171 @@ class BaseDAO(Generic[ModelType]):
         result = await self.session.execute(delete(self.model).where(self.model.id == id))
         return result.rowcount > 0
 
+    def _org_scope(self, org_id: Optional[int]) -> List[Any]:
+        """
+        Build the org-scoping condition for bulk operations.
+
+        WHY: Bulk statements touch many rows at once, so a missing org filter
+        on a multi-tenant model would be a cross-organization write
+        (A01: Broken Access Control). Requiring org_id makes scoping explicit.
+
+        Args:
+            org_id: Organization ID the operation is restricted to
+
+        Returns:
+            List with the org_id condition (empty for non-tenant models)
+
+        Raises:
+            ValidationError: If the model is multi-tenant and org_id is None
+        """
+        if not hasattr(self.model, "org_id"):
+            return []
+        if org_id is None:
+            raise ValidationError(
+                message=f"org_id is required for bulk operations on {self.model.__name__}",
+                model=self.model.__name__,
+            )
+        return [self.model.org_id == org_id]
+
+    async def bulk_create(
+        self,
+        rows: Sequence[Dict[str, Any]],
+        org_id: Optional[int] = None,
+    ) -> List[ModelType]:
+        """
+        Create many records with multi-row INSERT ... RETURNING.
+
+        WHAT: Batch counterpart of create().
+
+        WHY: create() does a flush plus a refresh per row (two round trips
+        each). Inserting in batches returns every generated field in one
+        statement per BULK_BATCH_SIZE rows.
+
+        Args:
+            rows: Field values for each new record
+            org_id: Organization that owns every row (required for
+                multi-tenant models; stamped onto each row)
+
+        Returns:
+            Created model instances, in input order
+
+        Raises:
+            ValidationError: If org_id is missing for a multi-tenant model,
+                or a row names a different org_id
+        """
+        if not rows:
+            return []
+
+        if self._org_scope(org_id):
+            scoped_rows = []
+            for row in rows:
+                if row.get("org_id", org_id) != org_id:
+                    raise ValidationError(
+                        message="Bulk insert rows must belong to the scoped organization",
+                        model=self.model.__name__,
+                        org_id=org_id,
+                    )
+                scoped_rows.append({**row, "org_id": org_id})
+            rows = scoped_rows
+
+        created: List[ModelType] = []
+        for start in range(0, len(rows), BULK_BATCH_SIZE):
+            batch = list(rows[start:start + BULK_BATCH_SIZE])
+            result = await self.session.scalars(
+                insert(self.model).returning(self.model, sort_by_parameter_order=True),
+                batch,
+            )
+            created.extend(result.all())
+
+        return created
+
+    async def bulk_update_where(
+        self,
+        values: Dict[str, Any],
+        *conditions: Any,
+        org_id: Optional[int] = None,
+        **filters: Any,
+    ) -> List[int]:
+        """
+        Update every record matching the conditions in one UPDATE.
+
+        WHAT: Set-based counterpart of update().
+
+        WHY: Loading rows and mutating ORM objects issues one UPDATE per row
+        and keeps the transaction open for the whole loop.
+
+        Args:
+            values: Columns to set
+            *conditions: SQLAlchemy WHERE expressions
+            org_id: Organization scope (required for multi-tenant models)
+            **filters: Field name to value equality filters
+
+        Returns:
+            IDs of the updated records
+
+        Raises:
+            ValidationError: If org_id is missing for a multi-tenant model,
+                or no condition at all is given
+        """
+        where = [*self._org_scope(org_id), *conditions]
+        query = self._apply_filters(update(self.model), filters).where(*where)
+        if query.whereclause is None:
+            raise ValidationError(
+                message="Refusing unconditional bulk update",
+                model=self.model.__name__,
+            )
+
+        result = await self.session.execute(
+            query.values(**values).returning(self.model.id)
+        )
+        return list(result.scalars().all())
+
+    async def bulk_delete_where(
+        self,
+        *conditions: Any,
+        org_id: Optional[int] = None,
+        **filters: Any,
+    ) -> int:
+        """
+        Delete every record matching the conditions in one DELETE.
+
+        WHAT: Set-based counterpart of delete().
+
+        WHY: Deleting IDs one by one costs a round trip per row.
+
+        Args:
+            *conditions: SQLAlchemy WHERE expressions
+            org_id: Organization scope (required for multi-tenant models)
+            **filters: Field name to value equality filters
+
+        Returns:
+            Number of records deleted
+
+        Raises:
+            ValidationError: If org_id is missing for a multi-tenant model,
+                or no condition at all is given
+        """
+        where = [*self._org_scope(org_id), *conditions]
+        query = self._apply_filters(delete(self.model), filters).where(*where)
+        if query.whereclause is None:
+            raise ValidationError(
+                message="Refusing unconditional bulk delete",
+                model=self.model.__name__,
+            )
+
+        result = await self.session.execute(
+            query.execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
     async def count(self, **filters: Any) -> int:
         """
         Count records matching filters.
 
         WHY: Useful for pagination metadata and analytics without
-        loading full records into memory.
+        loading full records into memory. The count runs as
+        SELECT count(*) in the database so only a single integer
+        crosses the wire, regardless of table size.
 
         Args:
             **filters: Field name to value filters
@@ -185,15 +621,83 @@ class BaseDAO(Generic[ModelType]):
         Returns:
             Number of records matching the filters
         """
-        query = select(self.model)
-
-        # Apply filters
-        for field, value in filters.items():
-            if hasattr(self.model, field):
-                query = query.where(getattr(self.model, field) == value)
+        query = self._apply_filters(select(func.count()).select_from(self.model), filters)
 
         result = await self.session.execute(query)
-        return len(list(result.scalars().all()))
+        return result.scalar_one()
+
+    async def count_estimated(self, **filters: Any) -> int:
+        """
+        Approximate count of records matching filters.
+
+        WHAT: Cheap total for list endpoints that don't need an exact number.
+
+        WHY: An exact count(*) still scans every matching row. For very large
+        tables a slightly stale or approximate total is good enough for
+        "page X of ~Y" UIs and saves a full index/heap scan per request.
+
+        HOW:
+        1. Read the planner's row estimate (pg_class.reltuples) for the table
+        2. Small or never-analyzed tables: fall back to an exact count
+        3. Unfiltered: return the planner estimate directly
+        4. Filtered: return an exact count cached for COUNT_ESTIMATE_TTL_SECONDS
+
+        Args:
+            **filters: Field name to value filters
+
+        Returns:
+            Approximate number of records matching the filters
+        """
+        table_name = self.model.__tablename__
+        table_rows = await self._get_planner_row_estimate()
+
+        # WHY: reltuples is -1 (or 0) until the table has been analyzed, and
+        # exact counts on small tables are already cheap.
+        if table_rows is None or table_rows < settings.COUNT_ESTIMATE_MIN_ROWS:
+            return await self.count(**filters)
+
+        applied = tuple(
+            sorted((k, v) for k, v in filters.items() if hasattr(self.model, k))
+        )
+        if not applied:
+            return table_rows
+
+        cache_key = (table_name, applied)
+        now = time.monotonic()
+        cached = _count_cache.get(cache_key)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        total = await self.count(**filters)
+
+        if len(_count_cache) >= _COUNT_CACHE_MAX_ENTRIES:
+            # Evict expired entries first, then arbitrary ones if still full
+            for key in [k for k, (exp, _) in _count_cache.items() if exp <= now]:
+                _count_cache.pop(key, None)
+            while len(_count_cache) >= _COUNT_CACHE_MAX_ENTRIES:
+                _count_cache.pop(next(iter(_count_cache)))
+
+        _count_cache[cache_key] = (now + settings.COUNT_ESTIMATE_TTL_SECONDS, total)
+        return total
+
+    async def _get_planner_row_estimate(self) -> Optional[int]:
+        """
+        Read PostgreSQL's row estimate for this model's table.
+
+        WHY: pg_class.reltuples is maintained by VACUUM/ANALYZE and is
+        available in O(1) without touching the table itself.
+
+        Returns:
+            Estimated row count, or None if statistics are unavailable
+        """
+        result = await self.session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+            {"table_name": self.model.__tablename__},
+        )
+        estimate = result.scalar_one_or_none()
+        if estimate is None or estimate < 0:
+            return None
+        return int(estimate)
 
     async def exists(self, **filters: Any) -> bool:
         """
@@ -208,18 +712,17 @@ class BaseDAO(Generic[ModelType]):
         Returns:
             True if at least one matching record exists
         """
-        query = select(self.model)
-
-        # Apply filters
-        for field, value in filters.items():
-            if hasattr(self.model, field):
-                query = query.where(getattr(self.model, field) == value)
-
-        query = query.limit(1)
+        query = self._apply_filters(select(self.model.id), filters).limit(1)
         result = await self.session.execute(query)
-        return result.scalar_one_or_none() is not None
-
-    async def get_by_org(self, org_id: int, skip: int = 0, limit: int = 100) -> List[ModelType]:
+        return result.first() is not None
+
+    async def get_by_org(
+        self,
+        org_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> List[ModelType]:
         """
         Retrieve records for a specific organization (multi-tenant support).
 
@@ -230,6 +733,7 @@ class BaseDAO(Generic[ModelType]):
             org_id: Organization ID to filter by
             skip: Number of records to skip (for pagination)
             limit: Maximum number of records to return
+            cursor: Keyset cursor; when given, skip is ignored
 
         Returns:
             List of model instances for the organization
@@ -242,7 +746,7 @@ class BaseDAO(Generic[ModelType]):
                 f"{self.model.__name__} is not a multi-tenant model (no org_id field)"
             )
 
-        return await self.get_all(skip=skip, limit=limit, org_id=org_id)
+        return await self.get_all(skip=skip, limit=limit, cursor=cursor, org_id=org_id)
 
     async def get_by_id_and_org(self, id: int, org_id: int) -> Optional[ModelType]:
         """
@@ -273,3 +777,35 @@ class BaseDAO(Generic[ModelType]):
             )
         )
         return result.scalar_one_or_none()
+
+    async def get_by_ids_and_org(self, ids: Sequence[int], org_id: int) -> List[ModelType]:
+        """
+        Retrieve several records by ID, restricted to one organization.
+
+        WHY: Batch counterpart of get_by_id_and_org() so callers that
+        validate a list of IDs issue one query instead of one per ID.
+
+        Args:
+            ids: Primary key values
+            org_id: Organization ID that must own the records
+
+        Returns:
+            Records that exist and belong to the org (missing IDs are omitted)
+
+        Raises:
+            AttributeError: If the model doesn't have an org_id field
+        """
+        if not hasattr(self.model, "org_id"):
+            raise AttributeError(
+                f"{self.model.__name__} is not a multi-tenant model (no org_id field)"
+            )
+        if not ids:
+            return []
+
+        result = await self.session.execute(
+            select(self.model).where(
+                self.model.id.in_(ids),
+                self.model.org_id == org_id,
+            )
+        )
+        return list(result.scalars().all())
@@ -111,6 +111,7 @@ class DocumentDAO(BaseDAO[Document]):
         org_id: int,
         skip: int = 0,
         limit: int = 100,
+        cursor: Optional[str] = None,
         include_deleted: bool = False,
     ) -> List[Document]:
         """
@@ -124,6 +125,7 @@ class DocumentDAO(BaseDAO[Document]):
             org_id: Organization ID
             skip: Pagination offset
             limit: Pagination limit
+            cursor: Keyset cursor; when given, skip is ignored
             include_deleted: Whether to include soft-deleted documents
 
         Returns:
@@ -134,11 +136,7 @@ class DocumentDAO(BaseDAO[Document]):
         if not include_deleted:
             query = query.where(Document.deleted_at.is_(None))
 
-        query = (
-            query.order_by(Document.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-        )
+        query = self.paginate(query, skip=skip, limit=limit, cursor=cursor)
 
         result = await self.session.execute(query)
         return list(result.scalars().all())
@@ -17,7 +17,7 @@ HOW: Extends BaseDAO with template-specific queries:
 
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
-from sqlalchemy import select, func, and_, or_, update
+from sqlalchemy import select, func, and_, or_, update, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -357,6 +357,26 @@ class SentEmailDAO(BaseDAO[SentEmail]):
         await self.session.refresh(sent_email)
         return sent_email
 
+    async def log_emails(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Log many sent emails.
+
+        WHAT: Inserts SentEmail rows for a bulk send.
+
+        WHY: One multi-row INSERT instead of a flush and refresh per email.
+
+        Args:
+            rows: SentEmail column values, one dict per email
+
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+
+        await self.session.execute(insert(SentEmail), rows)
+        return len(rows)
+
     async def update_status(
         self,
         email_id: int,
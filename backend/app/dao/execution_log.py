@@ -14,18 +14,19 @@ HOW: Extends BaseDAO with log-specific queries:
 - Time-based queries
 - Aggregation for metrics
 - Append-only operations (logs are immutable)
+- Bulk completion of running executions reported by n8n
 
 Security Considerations (OWASP):
 - A09: Logs are append-only for audit integrity
 """
 
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
-from sqlalchemy import select, func, and_
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy import bindparam, select, func, and_, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dao.base import BaseDAO
-from app.models.workflow import ExecutionLog, ExecutionStatus
+from app.models.workflow import ExecutionLog, ExecutionStatus, WorkflowInstance
 
 
 class ExecutionLogDAO(BaseDAO[ExecutionLog]):
@@ -238,6 +239,141 @@ class ExecutionLogDAO(BaseDAO[ExecutionLog]):
             status=ExecutionStatus.RUNNING,
         )
 
+    async def get_running_by_environment(self) -> Dict[int, Dict[str, int]]:
+        """
+        Get every running execution that n8n knows about, by environment.
+
+        WHAT: Maps n8n environment ID to {n8n execution ID: log ID}.
+
+        WHY: The status sync reconciles all running executions against each
+        environment's execution list; one query replaces a
+        get_running_executions call per workflow instance.
+
+        Returns:
+            Nested dict of running executions
+        """
+        result = await self.session.execute(
+            select(
+                WorkflowInstance.n8n_environment_id,
+                ExecutionLog.n8n_execution_id,
+                ExecutionLog.id,
+            )
+            .join(WorkflowInstance, ExecutionLog.workflow_instance_id == WorkflowInstance.id)
+            .where(
+                ExecutionLog.status == ExecutionStatus.RUNNING,
+                ExecutionLog.n8n_execution_id.is_not(None),
+                WorkflowInstance.n8n_environment_id.is_not(None),
+            )
+        )
+        running: Dict[int, Dict[str, int]] = {}
+        for environment_id, n8n_execution_id, log_id in result.all():
+            running.setdefault(environment_id, {})[n8n_execution_id] = log_id
+        return running
+
+    async def get_running_by_n8n_ids(
+        self, keys: List[Tuple[int, str]]
+    ) -> Dict[Tuple[int, str], int]:
+        """
+        Look up running executions by environment and n8n execution ID.
+
+        WHAT: Maps (environment ID, n8n execution ID) to log ID.
+
+        WHY: Execution callbacks identify runs by n8n's ID, which is only
+        unique within one environment; a batch of callbacks resolves in
+        one query.
+
+        Args:
+            keys: (environment ID, n8n execution ID) pairs
+
+        Returns:
+            Matches among executions still RUNNING
+        """
+        if not keys:
+            return {}
+
+        result = await self.session.execute(
+            select(
+                WorkflowInstance.n8n_environment_id,
+                ExecutionLog.n8n_execution_id,
+                ExecutionLog.id,
+            )
+            .join(WorkflowInstance, ExecutionLog.workflow_instance_id == WorkflowInstance.id)
+            .where(
+                tuple_(
+                    WorkflowInstance.n8n_environment_id,
+                    ExecutionLog.n8n_execution_id,
+                ).in_(keys),
+                ExecutionLog.status == ExecutionStatus.RUNNING,
+            )
+        )
+        return {
+            (environment_id, n8n_execution_id): log_id
+            for environment_id, n8n_execution_id, log_id in result.all()
+        }
+
+    async def complete_executions(self, results: List[Dict[str, Any]]) -> Dict[int, int]:
+        """
+        Record final status for many executions at once.
+
+        WHAT: Bulk counterpart of complete_execution().
+
+        WHY: A sync or a burst of callbacks can finish thousands of
+        executions at once; one locking SELECT plus one executemany UPDATE
+        replace a load-modify-flush round trip per row.
+
+        HOW: Only logs still RUNNING are updated (locked first), so
+        whichever of polling and callbacks reports an execution first wins
+        and the other is a no-op.
+
+        Args:
+            results: Dicts with log_id, status, finished_at, output_data
+                and error_message
+
+        Returns:
+            {log_id: workflow_instance_id} for the logs that were updated
+        """
+        if not results:
+            return {}
+
+        locked = await self.session.execute(
+            select(ExecutionLog.id, ExecutionLog.workflow_instance_id)
+            .where(
+                ExecutionLog.id.in_([item["log_id"] for item in results]),
+                ExecutionLog.status == ExecutionStatus.RUNNING,
+            )
+            .with_for_update()
+        )
+        updated = dict(locked.all())
+        if not updated:
+            return {}
+
+        table = ExecutionLog.__table__
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("b_log_id"))
+            .values(
+                status=bindparam("b_status"),
+                finished_at=bindparam("b_finished_at"),
+                output_data=bindparam("b_output_data"),
+                error_message=bindparam("b_error_message"),
+            )
+        )
+        await self.session.execute(
+            stmt,
+            [
+                {
+                    "b_log_id": item["log_id"],
+                    "b_status": item["status"],
+                    "b_finished_at": item["finished_at"],
+                    "b_output_data": item.get("output_data"),
+                    "b_error_message": item.get("error_message"),
+                }
+                for item in results
+                if item["log_id"] in updated
+            ],
+        )
+        return updated
+
     async def get_failed_executions(
         self,
         workflow_instance_id: int,
@@ -497,20 +633,8 @@ class ExecutionLogDAO(BaseDAO[ExecutionLog]):
         """
         cutoff = datetime.utcnow() - timedelta(days=days)
 
-        # Get IDs to delete
-        result = await self.session.execute(
-            select(ExecutionLog.id)
-            .where(
-                ExecutionLog.workflow_instance_id == workflow_instance_id,
-                ExecutionLog.created_at < cutoff,
-            )
+        # WHY: One set-based DELETE instead of a round trip per log row
+        return await self.bulk_delete_where(
+            ExecutionLog.workflow_instance_id == workflow_instance_id,
+            ExecutionLog.created_at < cutoff,
         )
-        ids_to_delete = [row[0] for row in result.all()]
-
-        # Delete each log
-        deleted = 0
-        for log_id in ids_to_delete:
-            if await self.delete(log_id):
-                deleted += 1
-
-        return deleted
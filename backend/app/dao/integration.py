@@ -13,22 +13,56 @@ HOW: Uses BaseDAO pattern with specialized queries for:
 - Calendar sync state management
 - Webhook event filtering
 - Delivery retry scheduling
+- Webhook outbox claiming
 """
 
+import random
 from datetime import datetime, timedelta
-from typing import Optional, List, Sequence
-from sqlalchemy import select, update, and_, or_, func
+from typing import Any, Dict, Optional, List, Sequence
+from sqlalchemy import select, update, delete, and_, or_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.dao.base import BaseDAO
 from app.models.integration import (
     CalendarIntegration,
     WebhookEndpoint,
     WebhookDelivery,
+    WebhookOutboxEvent,
     CalendarProvider,
 )
 
 
+# Attempt limit when the caller doesn't pass the endpoint's policy
+# (first attempt plus the default of 3 retries)
+DEFAULT_MAX_DELIVERY_ATTEMPTS = 4
+
+
+def webhook_retry_delay(attempts: int) -> float:
+    """
+    Backoff before the next delivery attempt.
+
+    WHAT: Exponential backoff from WEBHOOK_RETRY_BASE_DELAY_SECONDS, capped
+    at WEBHOOK_RETRY_MAX_DELAY_SECONDS, with "equal jitter" (a random point
+    in the upper half of the window).
+
+    WHY: When a receiver comes back after an outage, jitter spreads the
+    deliveries that failed together instead of retrying them in one burst;
+    keeping the lower half fixed still guarantees growing gaps.
+
+    Args:
+        attempts: Attempts made so far (>= 1)
+
+    Returns:
+        Delay in seconds
+    """
+    window = min(
+        settings.WEBHOOK_RETRY_MAX_DELAY_SECONDS,
+        settings.WEBHOOK_RETRY_BASE_DELAY_SECONDS * 2 ** max(attempts - 1, 0),
+    )
+    return window / 2 + random.uniform(0, window / 2)
+
+
 class CalendarIntegrationDAO(BaseDAO[CalendarIntegration]):
     """
     DAO for calendar integration management.
@@ -305,7 +339,7 @@ class WebhookEndpointDAO(BaseDAO[WebhookEndpoint]):
         """
         super().__init__(WebhookEndpoint, session)
 
-    async def get_by_org(
+    async def get_endpoints_by_org(
         self,
         org_id: int,
         include_inactive: bool = False,
@@ -313,10 +347,11 @@ class WebhookEndpointDAO(BaseDAO[WebhookEndpoint]):
         """
         Get all webhook endpoints for an organization.
 
-        WHAT: Retrieves webhook endpoints for an org.
+        WHAT: Retrieves webhook endpoints for an org, by name, unpaginated.
 
         WHY: Organizations need to see and manage their
-        configured webhook endpoints.
+        configured webhook endpoints. Named apart from BaseDAO.get_by_org,
+        which pages by keyset.
 
         Args:
             org_id: Organization ID
@@ -376,10 +411,13 @@ class WebhookEndpointDAO(BaseDAO[WebhookEndpoint]):
         """
         Update delivery statistics for an endpoint.
 
-        WHAT: Increments delivery counters.
+        WHAT: Increments delivery counters and the consecutive-failure
+        streak used by the circuit breaker.
 
         WHY: Tracking delivery success/failure rates helps
         users identify problematic webhook configurations.
+        Counters are incremented in SQL so concurrent deliveries to the
+        same endpoint don't overwrite each other's counts.
 
         Args:
             endpoint_id: Endpoint ID
@@ -388,20 +426,19 @@ class WebhookEndpointDAO(BaseDAO[WebhookEndpoint]):
         Returns:
             Updated endpoint
         """
-        endpoint = await self.get_by_id(endpoint_id)
-        if not endpoint:
-            return None
-
+        now = datetime.utcnow()
         update_data = {
-            "delivery_count": endpoint.delivery_count + 1,
-            "last_triggered_at": datetime.utcnow(),
+            "delivery_count": WebhookEndpoint.delivery_count + 1,
+            "last_triggered_at": now,
         }
         if delivered:
-            update_data["success_count"] = endpoint.success_count + 1
-            update_data["last_success_at"] = datetime.utcnow()
+            update_data["success_count"] = WebhookEndpoint.success_count + 1
+            update_data["last_success_at"] = now
+            update_data["consecutive_failures"] = 0
         else:
-            update_data["failure_count"] = endpoint.failure_count + 1
-            update_data["last_failure_at"] = datetime.utcnow()
+            update_data["failure_count"] = WebhookEndpoint.failure_count + 1
+            update_data["last_failure_at"] = now
+            update_data["consecutive_failures"] = WebhookEndpoint.consecutive_failures + 1
 
         stmt = (
             update(WebhookEndpoint)
@@ -412,6 +449,60 @@ class WebhookEndpointDAO(BaseDAO[WebhookEndpoint]):
         await self.session.flush()
         return await self.get_by_id(endpoint_id)
 
+    async def get_by_ids(self, endpoint_ids: Sequence[int]) -> Sequence[WebhookEndpoint]:
+        """
+        Get several endpoints in one query.
+
+        WHY: Cross-organization background jobs (webhook retries) need the
+        endpoints for a whole batch of deliveries at once.
+
+        Args:
+            endpoint_ids: Endpoint IDs
+
+        Returns:
+            Endpoints that exist (missing IDs are omitted)
+        """
+        if not endpoint_ids:
+            return []
+        query = select(WebhookEndpoint).where(WebhookEndpoint.id.in_(endpoint_ids))
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def claim_probe(
+        self,
+        endpoint_id: int,
+        seen_failure_at: Optional[datetime],
+    ) -> bool:
+        """
+        Claim the half-open probe for an endpoint whose circuit is open.
+
+        WHAT: Moves last_failure_at to now, but only if nobody else has
+        since the caller read it.
+
+        WHY: After the cooldown exactly one delivery should test a failing
+        URL. The conditional UPDATE makes that claim atomic across
+        processes; losers see a fresh last_failure_at and keep the circuit
+        open for another cooldown.
+
+        Args:
+            endpoint_id: Endpoint ID
+            seen_failure_at: last_failure_at as read by the caller
+
+        Returns:
+            True if this caller may send the probe
+        """
+        stmt = (
+            update(WebhookEndpoint)
+            .where(
+                WebhookEndpoint.id == endpoint_id,
+                WebhookEndpoint.last_failure_at == seen_failure_at,
+            )
+            .values(last_failure_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount == 1
+
     async def deactivate(
         self,
         endpoint_id: int,
@@ -552,6 +643,139 @@ class WebhookDeliveryDAO(BaseDAO[WebhookDelivery]):
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    async def claim_due_retries(self, limit: int = 100) -> Sequence[WebhookDelivery]:
+        """
+        Lock a batch of deliveries whose retry is due.
+
+        WHAT: Oldest-due first, skipping rows another runner has locked.
+
+        WHY: Reads only the ix_webhook_deliveries_pending_retry partial
+        index (undelivered rows with a retry time), so pickup cost tracks
+        the retry queue rather than the delivery history. Attempt limits
+        are enforced when scheduling (record_attempt clears next_retry_at
+        once exhausted), so exhausted rows never appear here.
+
+        The caller must move next_retry_at forward before committing the
+        claim, or the rows become claimable again.
+
+        Args:
+            limit: Maximum deliveries to claim
+
+        Returns:
+            Claimed deliveries, oldest due first
+        """
+        query = (
+            select(WebhookDelivery)
+            .where(
+                and_(
+                    WebhookDelivery.delivered == False,
+                    WebhookDelivery.next_retry_at != None,
+                    WebhookDelivery.next_retry_at <= datetime.utcnow(),
+                )
+            )
+            .order_by(WebhookDelivery.next_retry_at, WebhookDelivery.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def abandon_retries(self, delivery_ids: List[int]) -> None:
+        """
+        Stop retrying deliveries.
+
+        WHY: Used when the endpoint was deleted, deactivated or had retries
+        turned off after the failure was scheduled.
+
+        Args:
+            delivery_ids: Delivery IDs
+        """
+        if not delivery_ids:
+            return
+        stmt = (
+            update(WebhookDelivery)
+            .where(WebhookDelivery.id.in_(delivery_ids))
+            .values(next_retry_at=None)
+        )
+        await self.session.execute(stmt)
+
+    async def get_retry_queue_stats(self, org_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Summarize the retry queue.
+
+        WHAT: Scheduled retries, how many are due, and the oldest due time.
+
+        WHY: A growing due count or an old oldest-due time means the retry
+        job is falling behind (or not running).
+
+        Args:
+            org_id: Restrict to one organization's endpoints
+
+        Returns:
+            Dict with depth, due, oldest_due_at and oldest_due_age_seconds
+        """
+        now = datetime.utcnow()
+        is_due = WebhookDelivery.next_retry_at <= now
+        query = select(
+            func.count(),
+            func.count().filter(is_due),
+            func.min(WebhookDelivery.next_retry_at).filter(is_due),
+        ).select_from(WebhookDelivery).where(
+            and_(
+                WebhookDelivery.delivered == False,
+                WebhookDelivery.next_retry_at != None,
+            )
+        )
+        if org_id is not None:
+            query = query.join(WebhookEndpoint).where(WebhookEndpoint.org_id == org_id)
+
+        depth, due, oldest_due_at = (await self.session.execute(query)).one()
+        return {
+            "depth": depth,
+            "due": due,
+            "oldest_due_at": oldest_due_at,
+            "oldest_due_age_seconds": (
+                (now - oldest_due_at).total_seconds() if oldest_due_at else None
+            ),
+        }
+
+    async def get_endpoints_with_pending(
+        self,
+        endpoint_ids: Sequence[int],
+        before_id: int,
+    ) -> set[int]:
+        """
+        Find endpoints with undelivered deliveries still awaiting an attempt.
+
+        WHAT: Endpoints among endpoint_ids with an undelivered delivery
+        created before before_id that is still scheduled (next_retry_at
+        set, i.e. failed, held back or mid-send, but not exhausted).
+
+        WHY: An outbox event must not reach an endpoint before an earlier
+        event that is still waiting there, including events held back in
+        a previous dispatch batch.
+
+        Args:
+            endpoint_ids: Endpoints to check
+            before_id: Only deliveries with a lower ID count
+
+        Returns:
+            IDs of endpoints with earlier pending deliveries
+        """
+        if not endpoint_ids:
+            return set()
+        result = await self.session.execute(
+            select(WebhookDelivery.endpoint_id)
+            .where(
+                WebhookDelivery.endpoint_id.in_(endpoint_ids),
+                WebhookDelivery.id < before_id,
+                WebhookDelivery.delivered.is_(False),
+                WebhookDelivery.next_retry_at.is_not(None),
+            )
+            .distinct()
+        )
+        return set(result.scalars().all())
+
     async def record_attempt(
         self,
         delivery_id: int,
@@ -561,11 +785,15 @@ class WebhookDeliveryDAO(BaseDAO[WebhookDelivery]):
         delivered: bool,
         duration_ms: int,
         error_message: Optional[str] = None,
+        max_attempts: int = DEFAULT_MAX_DELIVERY_ATTEMPTS,
+        count_attempt: bool = True,
     ) -> Optional[WebhookDelivery]:
         """
         Record a delivery attempt result.
 
-        WHAT: Updates delivery with attempt results.
+        WHAT: Updates delivery with attempt results and schedules the next
+        attempt (webhook_retry_delay), or clears next_retry_at once
+        max_attempts is reached.
 
         WHY: Each attempt's details are needed for:
         - Debugging failed deliveries
@@ -580,6 +808,10 @@ class WebhookDeliveryDAO(BaseDAO[WebhookDelivery]):
             delivered: Whether delivery succeeded
             duration_ms: Request duration in milliseconds
             error_message: Error if failed
+            max_attempts: Attempts allowed by the endpoint's retry policy
+            count_attempt: False when no request was made (circuit open,
+                held behind an earlier failure) - reschedules without using
+                up an attempt
 
         Returns:
             Updated delivery
@@ -595,22 +827,19 @@ class WebhookDeliveryDAO(BaseDAO[WebhookDelivery]):
             "delivered": delivered,
             "duration_ms": duration_ms,
             "error_message": error_message,
-            "attempt_count": delivery.attempt_count + 1,
         }
+        attempts = delivery.attempt_count + (1 if count_attempt else 0)
+        update_data["attempt_count"] = attempts
 
         if delivered:
             update_data["delivered_at"] = datetime.utcnow()
             update_data["next_retry_at"] = None
+        elif attempts < max_attempts:
+            update_data["next_retry_at"] = datetime.utcnow() + timedelta(
+                seconds=webhook_retry_delay(max(attempts, 1))
+            )
         else:
-            # Exponential backoff: 1min, 5min, 15min
-            backoff_minutes = [1, 5, 15]
-            attempt = delivery.attempt_count
-            if attempt < len(backoff_minutes):
-                update_data["next_retry_at"] = datetime.utcnow() + timedelta(
-                    minutes=backoff_minutes[attempt]
-                )
-            else:
-                update_data["next_retry_at"] = None
+            update_data["next_retry_at"] = None
 
         stmt = (
             update(WebhookDelivery)
@@ -712,3 +941,101 @@ class WebhookDeliveryDAO(BaseDAO[WebhookDelivery]):
 
         await self.session.flush()
         return count
+
+
+class WebhookOutboxDAO(BaseDAO[WebhookOutboxEvent]):
+    """
+    DAO for the webhook outbox.
+
+    WHAT: Claims undispatched events in creation order and marks them done.
+
+    WHY: The outbox decouples webhook delivery from the transaction that
+    produced the event; the dispatcher needs ordered, exclusive batches.
+
+    HOW: Extends BaseDAO with claim/mark/purge queries over the pending
+    partial index.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize WebhookOutboxDAO.
+
+        Args:
+            session: SQLAlchemy async session
+        """
+        super().__init__(WebhookOutboxEvent, session)
+
+    async def claim_pending(self, limit: int = 100) -> Sequence[WebhookOutboxEvent]:
+        """
+        Lock the oldest undispatched events.
+
+        WHAT: SELECT ... FOR UPDATE over pending events in id order.
+
+        WHY: Plain FOR UPDATE rather than SKIP LOCKED - a second dispatcher
+        (e.g. during leader failover) waits for the first batch instead of
+        jumping ahead of it, which would reorder deliveries per endpoint.
+        Locks are held only until the caller commits the claim.
+
+        Args:
+            limit: Maximum events to claim
+
+        Returns:
+            Claimed events, oldest first
+        """
+        query = (
+            select(WebhookOutboxEvent)
+            .where(WebhookOutboxEvent.dispatched_at == None)
+            .order_by(WebhookOutboxEvent.id)
+            .limit(limit)
+            .with_for_update()
+        )
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def mark_dispatched(self, event_ids: List[int]) -> None:
+        """
+        Mark events as turned into delivery records.
+
+        Args:
+            event_ids: Outbox event IDs
+        """
+        if not event_ids:
+            return
+        stmt = (
+            update(WebhookOutboxEvent)
+            .where(WebhookOutboxEvent.id.in_(event_ids))
+            .values(dispatched_at=datetime.utcnow())
+        )
+        await self.session.execute(stmt)
+
+    async def count_pending(self) -> int:
+        """
+        Count undispatched events.
+
+        Returns:
+            Outbox backlog size
+        """
+        query = select(func.count()).select_from(WebhookOutboxEvent).where(
+            WebhookOutboxEvent.dispatched_at == None
+        )
+        result = await self.session.execute(query)
+        return result.scalar() or 0
+
+    async def purge_dispatched(self, older_than: datetime) -> int:
+        """
+        Delete dispatched events past retention.
+
+        WHY: Delivery records keep the history; the outbox row is only
+        needed until it has been dispatched.
+
+        Args:
+            older_than: Delete events dispatched before this time
+
+        Returns:
+            Number of deleted events
+        """
+        stmt = delete(WebhookOutboxEvent).where(
+            WebhookOutboxEvent.dispatched_at < older_than
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount or 0
@@ -243,6 +243,33 @@ class InvoiceDAO(BaseDAO[Invoice]):
         )
         return list(result.scalars().all())
 
+    async def count_unpaid(self, org_id: int) -> int:
+        """
+        Count unpaid invoices (sent, partially paid, overdue).
+
+        WHAT: Total for the unpaid invoice list.
+
+        WHY: Pagination metadata without loading every unpaid invoice.
+
+        Args:
+            org_id: Organization ID
+
+        Returns:
+            Number of unpaid invoices
+        """
+        result = await self.session.execute(
+            select(func.count(Invoice.id))
+            .where(
+                Invoice.org_id == org_id,
+                Invoice.status.in_([
+                    InvoiceStatus.SENT,
+                    InvoiceStatus.PARTIALLY_PAID,
+                    InvoiceStatus.OVERDUE,
+                ]),
+            )
+        )
+        return result.scalar_one()
+
     async def get_overdue(
         self,
         org_id: int,
@@ -803,26 +830,17 @@ class InvoiceDAO(BaseDAO[Invoice]):
         """
         today = date.today()
 
-        # Get invoices that are past due
-        result = await self.session.execute(
-            select(Invoice)
-            .where(
-                Invoice.org_id == org_id,
-                Invoice.due_date < today,
-                Invoice.status.in_([
-                    InvoiceStatus.SENT,
-                    InvoiceStatus.PARTIALLY_PAID,
-                ]),
-            )
+        # WHY: Single UPDATE instead of loading and mutating each invoice
+        updated_ids = await self.bulk_update_where(
+            {"status": InvoiceStatus.OVERDUE},
+            Invoice.due_date < today,
+            Invoice.status.in_([
+                InvoiceStatus.SENT,
+                InvoiceStatus.PARTIALLY_PAID,
+            ]),
+            org_id=org_id,
         )
-        invoices = list(result.scalars().all())
-
-        # Update each to overdue
-        for invoice in invoices:
-            invoice.status = InvoiceStatus.OVERDUE
-
-        await self.session.flush()
-        return len(invoices)
+        return len(updated_ids)
 
     async def get_due_soon(
         self,
@@ -188,6 +188,32 @@ class N8nEnvironmentDAO(BaseDAO[N8nEnvironment]):
         )
         return list(result.scalars().all())
 
+    async def get_active_by_ids(self, environment_ids: List[int]) -> List[N8nEnvironment]:
+        """
+        Get several active environments across organizations.
+
+        WHAT: Unscoped batch lookup for background jobs.
+
+        WHY: The execution status sync works on every organization's
+        environments at once; callers acting for a user must keep using
+        the org-scoped lookups.
+
+        Args:
+            environment_ids: Environment IDs
+
+        Returns:
+            Active environments among the given IDs
+        """
+        if not environment_ids:
+            return []
+        result = await self.session.execute(
+            select(N8nEnvironment).where(
+                N8nEnvironment.id.in_(environment_ids),
+                N8nEnvironment.is_active == True,
+            )
+        )
+        return list(result.scalars().all())
+
     async def get_by_name(
         self,
         org_id: int,
@@ -18,11 +18,13 @@ HOW: Extends BaseDAO with project-specific queries:
 
 from datetime import datetime
 from typing import List, Optional
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, func, and_, or_, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.dao.analytics_rollup import AnalyticsRollupDAO
 from app.dao.base import BaseDAO
+from app.models.analytics_rollup import AnalyticsRollupMetric, rollup_period
 from app.models.project import Project, ProjectStatus, ProjectPriority
 
 
@@ -49,6 +51,34 @@ class ProjectDAO(BaseDAO[Project]):
         """
         super().__init__(Project, session)
 
+    async def delete(self, id: int) -> bool:
+        """
+        Delete a project and take it out of the analytics rollups.
+
+        WHY: The Core DELETE in BaseDAO.delete bypasses the unit of work, so
+        the rollup after_flush hook never sees it.
+
+        Args:
+            id: Project ID
+
+        Returns:
+            True if a project was deleted, False if not found
+        """
+        result = await self.session.execute(
+            delete(Project)
+            .where(Project.id == id)
+            .returning(Project.org_id, Project.created_at)
+        )
+        row = result.first()
+        if row is None:
+            return False
+
+        metric = AnalyticsRollupMetric.PROJECTS_CREATED.value
+        await AnalyticsRollupDAO(self.session).apply_deltas(
+            {(row.org_id, metric, rollup_period(row.created_at)): -1}
+        )
+        return True
+
     async def get_by_status(
         self,
         org_id: int,
@@ -17,7 +17,7 @@ HOW: Extends BaseDAO with subscription-specific queries:
 
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from sqlalchemy import select, update, delete, and_
+from sqlalchemy import case, select, update, delete, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dao.base import BaseDAO
@@ -94,6 +94,39 @@ class PushSubscriptionDAO(BaseDAO[PushSubscription]):
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_users_subscriptions(
+        self,
+        user_ids: List[int],
+        active_only: bool = True,
+    ) -> List[PushSubscription]:
+        """
+        Get all subscriptions for several users.
+
+        WHAT: Lists every listed user's push subscriptions in one query.
+
+        WHY: Group notifications fan out to all devices at once instead of
+        querying and sending user by user.
+
+        Args:
+            user_ids: User IDs
+            active_only: Only return active subscriptions
+
+        Returns:
+            List of subscriptions
+        """
+        if not user_ids:
+            return []
+
+        query = select(PushSubscription).where(
+            PushSubscription.user_id.in_(user_ids),
+        )
+
+        if active_only:
+            query = query.where(PushSubscription.is_active == True)
+
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
     async def get_org_subscriptions(
         self,
         org_id: int,
@@ -309,6 +342,65 @@ class PushSubscriptionDAO(BaseDAO[PushSubscription]):
         await self.session.flush()
         return sub.failed_count
 
+    async def record_successes(
+        self,
+        subscription_ids: List[int],
+    ) -> None:
+        """
+        Record successful delivery for many subscriptions.
+
+        WHAT: Bulk counterpart of record_success().
+
+        WHY: A fan-out records every outcome in one statement.
+
+        Args:
+            subscription_ids: Subscription IDs
+        """
+        if not subscription_ids:
+            return
+        await self.session.execute(
+            update(PushSubscription)
+            .where(PushSubscription.id.in_(subscription_ids))
+            .values(
+                last_used_at=datetime.utcnow(),
+                failed_count=0,
+            )
+        )
+        await self.session.flush()
+
+    async def record_failures(
+        self,
+        subscription_ids: List[int],
+    ) -> None:
+        """
+        Record failed delivery for many subscriptions.
+
+        WHAT: Bulk counterpart of record_failure().
+
+        WHY: A fan-out records every outcome in one statement.
+
+        HOW: Same rule as record_failure() - deactivate after 3
+        consecutive failures - evaluated in SQL.
+
+        Args:
+            subscription_ids: Subscription IDs
+        """
+        if not subscription_ids:
+            return
+        await self.session.execute(
+            update(PushSubscription)
+            .where(PushSubscription.id.in_(subscription_ids))
+            .values(
+                failed_count=PushSubscription.failed_count + 1,
+                is_active=case(
+                    (PushSubscription.failed_count + 1 >= 3, False),
+                    else_=PushSubscription.is_active,
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.flush()
+
     async def cleanup_inactive(
         self,
         days_inactive: int = 30,
@@ -16,7 +16,7 @@ HOW: Extends BaseDAO with report-specific queries:
 """
 
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy import select, func, and_, or_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -152,6 +152,71 @@ class ScheduledReportDAO(BaseDAO[ScheduledReport]):
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def claim_due_reports(
+        self,
+        now: datetime,
+        limit: int,
+    ) -> List[ScheduledReport]:
+        """
+        Lock due reports for dispatch.
+
+        WHAT: Returns up to `limit` due reports, oldest due first, locked
+        FOR UPDATE SKIP LOCKED.
+
+        WHY: Rows another dispatcher has locked are skipped instead of
+        waited on; the claimer advances next_run_at before committing, so
+        once the lock is released the run is no longer due.
+
+        HOW: Range scan on ix_scheduled_reports_next_run_at.
+
+        Args:
+            now: Reports due at or before this time are returned
+            limit: Maximum reports to claim
+
+        Returns:
+            Locked due reports
+        """
+        query = (
+            select(ScheduledReport)
+            .where(
+                ScheduledReport.is_active == True,
+                ScheduledReport.next_run_at.isnot(None),
+                ScheduledReport.next_run_at <= now,
+            )
+            .order_by(ScheduledReport.next_run_at.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def get_due_backlog(self, now: datetime) -> Tuple[int, Optional[datetime]]:
+        """
+        Measure the reports waiting to be dispatched.
+
+        WHAT: Counts due reports and finds the oldest due time.
+
+        WHY: Scheduler monitoring (queue depth and dispatch lag).
+
+        Args:
+            now: Reports due at or before this time count
+
+        Returns:
+            (number of due reports, earliest next_run_at or None)
+        """
+        result = await self.session.execute(
+            select(
+                func.count(ScheduledReport.id), func.min(ScheduledReport.next_run_at)
+            ).where(
+                ScheduledReport.is_active == True,
+                ScheduledReport.next_run_at.isnot(None),
+                ScheduledReport.next_run_at <= now,
+            )
+        )
+        count, oldest = result.one()
+        return count or 0, oldest
+
     async def update_next_run(
         self,
         report_id: int,
@@ -464,6 +529,67 @@ class ReportExecutionDAO(BaseDAO[ReportExecution]):
         result = await self.session.execute(query.offset(skip).limit(limit))
         return list(result.scalars().all())
 
+    async def count_in_flight_by_org(self, since: datetime) -> Dict[int, int]:
+        """
+        Count unfinished executions per organization.
+
+        WHAT: Counts PENDING and RUNNING executions created since `since`.
+
+        WHY: Report concurrency limits. Older unfinished executions are
+        ignored: their job has been lost or has exceeded its time limit,
+        and counting them would block the organization's reports for good.
+
+        Args:
+            since: Only count executions created after this time
+
+        Returns:
+            Mapping of org ID to unfinished execution count
+        """
+        result = await self.session.execute(
+            select(ReportExecution.org_id, func.count(ReportExecution.id))
+            .where(
+                ReportExecution.status.in_(
+                    [ExecutionStatus.PENDING.value, ExecutionStatus.RUNNING.value]
+                ),
+                ReportExecution.created_at >= since,
+            )
+            .group_by(ReportExecution.org_id)
+        )
+        return {org_id: count for org_id, count in result.all()}
+
+    async def fail_stale_pending(self, before: datetime, error_message: str) -> List[int]:
+        """
+        Fail executions that have been PENDING since before `before`.
+
+        WHAT: Bulk-marks old PENDING executions as FAILED.
+
+        WHY: An execution whose job was never queued (or was lost by the
+        broker) would otherwise stay PENDING for good and look like a
+        report that is still on its way.
+
+        Args:
+            before: Executions created before this time are failed
+            error_message: Error recorded on each execution
+
+        Returns:
+            IDs of the failed executions
+        """
+        result = await self.session.execute(
+            update(ReportExecution)
+            .where(
+                ReportExecution.status == ExecutionStatus.PENDING.value,
+                ReportExecution.created_at < before,
+            )
+            .values(
+                status=ExecutionStatus.FAILED.value,
+                completed_at=datetime.utcnow(),
+                error_message=error_message,
+            )
+            .returning(ReportExecution.id)
+            .execution_options(synchronize_session=False)
+        )
+        return list(result.scalars().all())
+
     async def get_recent_failures(
         self,
         org_id: int,
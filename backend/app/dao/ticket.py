@@ -29,6 +29,7 @@ from app.models.ticket import (
     TicketAttachment,
     SLA_CONFIG,
 )
+from app.dao.base import keyset_paginate
 from app.core.exceptions import (
     TicketNotFoundError,
     ValidationError,
@@ -50,6 +51,10 @@ VALID_STATUS_TRANSITIONS = {
 }
 
 
+# Keyset order for ticket lists (newest first)
+TICKET_CURSOR_COLUMNS = (Ticket.created_at, Ticket.id)
+
+
 class TicketDAO:
     """
     Data Access Object for Ticket operations.
@@ -203,13 +208,14 @@ class TicketDAO:
         created_by_user_id: Optional[int] = None,
         search: Optional[str] = None,
         include_closed: bool = True,
+        cursor: Optional[str] = None,
     ) -> Tuple[List[Ticket], int]:
         """
         List tickets with filtering and pagination.
 
         Args:
             org_id: Organization ID for scoping
-            skip: Number of records to skip
+            skip: Number of records to skip (ignored when cursor is given)
             limit: Maximum records to return
             status: Filter by status
             priority: Filter by priority
@@ -219,6 +225,7 @@ class TicketDAO:
             created_by_user_id: Filter by creator
             search: Search in subject and description
             include_closed: Whether to include closed tickets
+            cursor: Keyset cursor over (created_at, id) from a previous page
 
         Returns:
             Tuple of (tickets list, total count)
@@ -268,16 +275,17 @@ class TicketDAO:
         # Get paginated results with eager loading for relationships
         # WHY: Eager loading prevents N+1 queries and allows accessing
         # relationships without lazy loading in async context.
-        list_query = (
+        list_query = keyset_paginate(
             base_query.options(
                 selectinload(Ticket.created_by),
                 selectinload(Ticket.assigned_to),
                 selectinload(Ticket.comments),
                 selectinload(Ticket.attachments),
-            )
-            .order_by(Ticket.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+            ),
+            TICKET_CURSOR_COLUMNS,
+            skip=skip,
+            limit=limit,
+            cursor=cursor,
         )
         result = await self.session.execute(list_query)
         tickets = list(result.scalars().all())
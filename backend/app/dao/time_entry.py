@@ -436,6 +436,42 @@ class TimeEntryDAO(BaseDAO[TimeEntry]):
         await self.session.refresh(entry)
         return entry
 
+    async def bulk_approve_entries(
+        self,
+        entry_ids: List[int],
+        org_id: int,
+        approver_id: int,
+    ) -> List[int]:
+        """
+        Approve many submitted entries in one statement.
+
+        WHAT: Changes SUBMITTED entries to APPROVED.
+
+        WHY: Approving a week of timesheets one entry at a time costs
+        several round trips per entry.
+
+        Args:
+            entry_ids: Time entry IDs
+            org_id: Organization ID
+            approver_id: User who approved
+
+        Returns:
+            IDs of entries that were approved
+        """
+        if not entry_ids:
+            return []
+
+        return await self.bulk_update_where(
+            {
+                "status": TimeEntryStatus.APPROVED.value,
+                "approved_at": datetime.utcnow(),
+                "approved_by": approver_id,
+            },
+            TimeEntry.id.in_(entry_ids),
+            TimeEntry.status == TimeEntryStatus.SUBMITTED.value,
+            org_id=org_id,
+        )
+
     async def reject_entry(
         self,
         entry_id: int,
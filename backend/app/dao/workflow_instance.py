@@ -18,7 +18,7 @@ HOW: Extends BaseDAO with instance-specific queries:
 
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from sqlalchemy import select, func, and_
+from sqlalchemy import DateTime, bindparam, select, func, and_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -472,6 +472,44 @@ class WorkflowInstanceDAO(BaseDAO[WorkflowInstance]):
         await self.session.refresh(instance)
         return instance
 
+    async def record_executions(self, executed_at: Dict[int, datetime]) -> None:
+        """
+        Advance last_execution_at for many instances at once.
+
+        WHAT: Bulk counterpart of update_last_execution().
+
+        WHY: Completed executions arrive in batches from n8n callbacks and
+        the status sync; one executemany UPDATE replaces a load-modify-flush
+        round trip per instance.
+
+        HOW: GREATEST keeps the timestamp from moving backwards when an
+        older execution finishes after a newer one started.
+
+        Args:
+            executed_at: {instance_id: execution time}
+        """
+        if not executed_at:
+            return
+
+        table = WorkflowInstance.__table__
+        executed = bindparam("b_executed_at", type_=DateTime)
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("b_instance_id"))
+            .values(
+                last_execution_at=func.greatest(
+                    func.coalesce(table.c.last_execution_at, executed), executed
+                )
+            )
+        )
+        await self.session.execute(
+            stmt,
+            [
+                {"b_instance_id": instance_id, "b_executed_at": at}
+                for instance_id, at in executed_at.items()
+            ],
+        )
+
     async def count_by_status(self, org_id: int) -> Dict[str, int]:
         """
         Get count of instances by status.
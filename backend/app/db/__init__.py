@@ -1,6 +1,25 @@
 """Database package"""
 
-from app.db.session import AsyncSessionLocal, engine, get_db
+from app.db.session import (
+    AsyncReadSessionLocal,
+    AsyncSessionLocal,
+    engine,
+    get_db,
+    get_read_db,
+    read_db,
+    read_session,
+    replica_engine,
+)
 from app.models.base import Base
 
-__all__ = ["Base", "AsyncSessionLocal", "engine", "get_db"]
+__all__ = [
+    "Base",
+    "AsyncSessionLocal",
+    "AsyncReadSessionLocal",
+    "engine",
+    "replica_engine",
+    "get_db",
+    "get_read_db",
+    "read_db",
+    "read_session",
+]
@@ -3,14 +3,28 @@ Database session management.
 
 WHY: Async database sessions are required for FastAPI's async/await pattern.
 Using a context manager ensures proper connection cleanup and transaction management.
+
+Read-heavy routes and background readers can opt in to an optional read
+replica via get_read_db / read_db() / read_session(). When no replica is
+configured, or the replica lags further behind than the caller tolerates,
+reads fall back to the primary.
 """
 
-from typing import AsyncGenerator
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Callable, Optional
+
+from fastapi import Depends
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from app.core.config import settings
 
 
+logger = logging.getLogger(__name__)
+
+
 # Create async engine
 # WHY: pool_pre_ping ensures stale connections are recycled, preventing
 # "server has gone away" errors in long-running applications.
@@ -35,6 +49,111 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# Optional read-replica engine
+# WHY: A separate pool means dashboard refreshes and feed browsing can't
+# exhaust the connections writes depend on. None when no replica is set.
+replica_engine = (
+    create_async_engine(
+        settings.async_database_replica_url,
+        echo=settings.DEBUG,
+        pool_pre_ping=True,
+        pool_size=10,
+        max_overflow=20,
+    )
+    if settings.async_database_replica_url
+    else None
+)
+
+# Read session factory
+# WHY: Bound to the replica when configured, otherwise to the primary, so
+# callers never need to branch on deployment topology.
+AsyncReadSessionLocal = (
+    async_sessionmaker(
+        replica_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+    if replica_engine is not None
+    else AsyncSessionLocal
+)
+
+# Replication lag on a streaming replica. Zero when fully replayed, so an
+# idle primary doesn't make the replica look stale.
+_REPLICA_LAG_SQL = text(
+    "SELECT CASE "
+    "WHEN NOT pg_is_in_recovery() THEN 0 "
+    "WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) "
+    "END"
+)
+
+# Last sampled replica lag: (monotonic sample time, lag seconds or None if
+# the replica was unreachable).
+_replica_lag_sample: Optional[tuple[float, Optional[float]]] = None
+
+
+def replica_configured() -> bool:
+    """
+    Check whether a read replica is configured.
+
+    Returns:
+        True if DATABASE_REPLICA_URL is set
+    """
+    return replica_engine is not None
+
+
+async def get_replica_lag_seconds() -> Optional[float]:
+    """
+    Get the replica's replication lag, sampled at most once per interval.
+
+    WHAT: Returns how many seconds the replica is behind the primary.
+
+    WHY: Querying lag on every request would add a round trip to each read;
+    a short-lived sample is accurate enough for staleness tolerances measured
+    in seconds.
+
+    HOW: Caches the last sample for REPLICA_LAG_CHECK_INTERVAL_SECONDS.
+    Connection errors are cached too, so an unreachable replica doesn't add
+    a timeout to every request until the next sample.
+
+    Returns:
+        Lag in seconds (0.0 without a replica), or None if the replica
+        could not be reached
+    """
+    global _replica_lag_sample
+
+    if replica_engine is None:
+        return 0.0
+
+    now = time.monotonic()
+    if (
+        _replica_lag_sample is not None
+        and now - _replica_lag_sample[0] < settings.REPLICA_LAG_CHECK_INTERVAL_SECONDS
+    ):
+        return _replica_lag_sample[1]
+
+    lag: Optional[float]
+    try:
+        async with replica_engine.connect() as conn:
+            lag = float((await conn.execute(_REPLICA_LAG_SQL)).scalar() or 0.0)
+    except Exception as e:
+        # WHY: A replica outage must degrade to primary reads, not 500s
+        logger.warning(f"Read replica unavailable, routing reads to primary: {e}")
+        lag = None
+
+    _replica_lag_sample = (now, lag)
+    return lag
+
+
+async def _replica_is_usable(max_staleness_seconds: float) -> bool:
+    """Check that the replica is configured, reachable and fresh enough."""
+    if replica_engine is None:
+        return False
+    lag = await get_replica_lag_seconds()
+    return lag is not None and lag <= max_staleness_seconds
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -56,3 +175,99 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency to get a read-only database session.
+
+    WHAT: Yields a session bound to the read replica, or to the primary when
+    no replica is configured.
+
+    WHY: Read-heavy routes shouldn't hold primary connections. The session
+    is never committed - anything written through it is rolled back.
+
+    Use read_db() instead when the route needs to declare how stale its
+    data may be.
+
+    Yields:
+        AsyncSession: Read session for the request
+    """
+    async with AsyncReadSessionLocal() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+            await session.close()
+
+
+def read_db(
+    max_staleness_seconds: float = settings.REPLICA_DEFAULT_MAX_STALENESS_SECONDS,
+) -> Callable:
+    """
+    Create a read-session dependency with a declared staleness tolerance.
+
+    WHAT: Returns a dependency yielding the replica session when the
+    replica's lag is within max_staleness_seconds, else the primary session.
+
+    WHY: Tolerance differs per route - a dashboard is fine a minute behind,
+    an audit log browser after a security action is not. Declaring it at the
+    route keeps the decision next to the data it governs.
+
+    HOW: Depends on both get_read_db and get_db. Sessions don't check out a
+    connection until first use, and get_db is usually already resolved for
+    authentication, so the unused one costs nothing.
+
+    Args:
+        max_staleness_seconds: Maximum acceptable replica lag
+
+    Returns:
+        FastAPI dependency function
+
+    Example:
+        @router.get("/dashboard")
+        async def dashboard(db: AsyncSession = Depends(read_db(max_staleness_seconds=60))):
+            ...
+    """
+    async def dependency(
+        read_session: AsyncSession = Depends(get_read_db),
+        primary_session: AsyncSession = Depends(get_db),
+    ) -> AsyncSession:
+        if await _replica_is_usable(max_staleness_seconds):
+            return read_session
+        return primary_session
+
+    return dependency
+
+
+@asynccontextmanager
+async def read_session(
+    max_staleness_seconds: float = settings.REPLICA_DEFAULT_MAX_STALENESS_SECONDS,
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Open a read-only session for background readers.
+
+    WHAT: Context manager yielding a replica session when it is fresh
+    enough, else a primary session.
+
+    WHY: Scheduled jobs and report generation run outside FastAPI's
+    dependency injection but have the same need to keep bulk reads off the
+    primary.
+
+    Args:
+        max_staleness_seconds: Maximum acceptable replica lag
+
+    Yields:
+        AsyncSession: Read session, rolled back on exit
+    """
+    factory = (
+        AsyncReadSessionLocal
+        if await _replica_is_usable(max_staleness_seconds)
+        else AsyncSessionLocal
+    )
+    async with factory() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+            await session.close()
@@ -3,4 +3,8 @@ Background jobs package (Dramatiq).
 
 WHY: Background jobs handle long-running tasks asynchronously (emails, SLA checks,
 PDF generation) without blocking API requests.
+
+Declare jobs with `app.jobs.queue.job`, schedule them with
+`app.jobs.queue.enqueue`, and list new job modules in
+`app.jobs.worker.JOB_MODULES`.
 """
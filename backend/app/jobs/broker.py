@@ -0,0 +1,120 @@
+"""
+Job broker configuration.
+
+WHAT: Creates the Dramatiq broker shared by the API (which enqueues jobs)
+and the worker process (which runs them), and defines the named queues.
+
+WHY: One place decides where messages live and how failures are handled,
+so every job gets the same durability, retry and dead-letter behavior.
+
+HOW:
+1. RedisBroker for durable queues (JOB_BROKER="redis"), StubBroker as an
+   in-memory stand-in (JOB_BROKER="stub") for tests and scripts
+2. Retries middleware with exponential backoff; messages that exhaust
+   their retries are moved to the queue's dead-letter set
+3. AsyncIO middleware so jobs can be `async def` and reuse the app's
+   async services and database engine
+"""
+
+import logging
+import threading
+from typing import Optional
+
+import dramatiq
+from dramatiq.brokers.redis import RedisBroker
+from dramatiq.brokers.stub import StubBroker
+from dramatiq.middleware import AsyncIO, Retries, default_middleware
+
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+# Named queues. Concurrency per queue is set in JOB_QUEUE_CONCURRENCY.
+QUEUE_DEFAULT = "default"
+QUEUE_EMAIL = "email"
+QUEUE_WEBHOOKS = "webhooks"
+QUEUE_PDF = "pdf"
+QUEUE_REPORTS = "reports"
+
+
+class _SharedAsyncIO(AsyncIO):
+    """
+    AsyncIO middleware that shares one event loop across workers.
+
+    WHY: The worker process runs one dramatiq Worker per queue (so each
+    queue has its own concurrency limit). The stock middleware starts a
+    loop per worker boot and would replace the previous one; async
+    database connections are bound to the loop that created them, so all
+    jobs must share a single loop.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._workers = 0
+        self._lock = threading.Lock()
+
+    def before_worker_boot(self, broker: dramatiq.Broker, worker: dramatiq.Worker) -> None:
+        with self._lock:
+            self._workers += 1
+            if self._workers == 1:
+                super().before_worker_boot(broker, worker)
+
+    def after_worker_shutdown(self, broker: dramatiq.Broker, worker: dramatiq.Worker) -> None:
+        with self._lock:
+            self._workers -= 1
+            if self._workers == 0:
+                super().after_worker_shutdown(broker, worker)
+
+
+def create_broker() -> dramatiq.Broker:
+    """
+    Create a broker from settings.
+
+    Returns:
+        RedisBroker, or StubBroker when JOB_BROKER is "stub"
+
+    Raises:
+        ValueError: If JOB_BROKER names an unknown broker
+    """
+    middleware = [m() for m in default_middleware if m is not Retries]
+    middleware.append(
+        Retries(
+            max_retries=settings.JOB_MAX_RETRIES,
+            min_backoff=int(settings.JOB_MIN_BACKOFF_SECONDS * 1000),
+            max_backoff=int(settings.JOB_MAX_BACKOFF_SECONDS * 1000),
+        )
+    )
+    middleware.append(_SharedAsyncIO())
+
+    if settings.JOB_BROKER == "stub":
+        return StubBroker(middleware=middleware)
+    if settings.JOB_BROKER == "redis":
+        return RedisBroker(
+            url=settings.REDIS_URL,
+            middleware=middleware,
+            dead_message_ttl=settings.JOB_DEAD_LETTER_TTL_SECONDS * 1000,
+        )
+    raise ValueError(f"Unknown JOB_BROKER {settings.JOB_BROKER!r}")
+
+
+# Global broker instance
+_broker: Optional[dramatiq.Broker] = None
+
+
+def get_broker() -> dramatiq.Broker:
+    """
+    Get global broker instance, installing it as Dramatiq's default.
+
+    WHY: Actors bind to a broker when they are declared. The @job decorator
+    calls this as the actor modules (app.jobs.emails, app.jobs.reports) are
+    imported, so the broker is configured before the first actor exists.
+
+    Returns:
+        Broker singleton
+    """
+    global _broker
+    if _broker is None:
+        _broker = create_broker()
+        dramatiq.set_broker(_broker)
+    return _broker
@@ -0,0 +1,56 @@
+"""
+Email background jobs.
+
+WHAT: Sends transactional email from the worker.
+
+WHY: Email providers add hundreds of milliseconds (and occasional
+timeouts) to a request. Queued sends return immediately and are retried
+if the provider fails.
+"""
+
+import dataclasses
+import logging
+from typing import Any, Dict
+
+from app.jobs.broker import QUEUE_EMAIL
+from app.jobs.queue import job
+from app.services.email import EmailMessage, EmailType, get_email_service
+
+
+logger = logging.getLogger(__name__)
+
+
+class EmailSendFailed(Exception):
+    """Raised so the worker retries a send the provider rejected."""
+
+
+def email_message_to_dict(message: EmailMessage) -> Dict[str, Any]:
+    """
+    Serialize an EmailMessage as job arguments.
+
+    Args:
+        message: Email to send
+
+    Returns:
+        JSON-serializable dict
+    """
+    data = dataclasses.asdict(message)
+    data["email_type"] = message.email_type.value
+    return data
+
+
+@job(queue=QUEUE_EMAIL)
+async def send_email(message: Dict[str, Any]) -> None:
+    """
+    Send one email.
+
+    Args:
+        message: Output of email_message_to_dict
+
+    Raises:
+        EmailSendFailed: If the provider reported a failure (triggers retry)
+    """
+    email = EmailMessage(**{**message, "email_type": EmailType(message["email_type"])})
+    result = await get_email_service().send_email(email)
+    if not result.success:
+        raise EmailSendFailed(result.error or "Email provider reported failure")
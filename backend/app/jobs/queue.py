@@ -0,0 +1,97 @@
+"""
+Job declaration and enqueue API.
+
+WHAT: `@job(...)` declares an async function as a background job on a
+named queue; `await enqueue(job_fn, ...)` schedules it.
+
+WHY: Request handlers should answer as soon as the database work is
+committed. Anything that waits on a third party (email provider, webhook
+receiver, PDF rendering, report generation) is handed to the worker, which
+retries it with backoff and dead-letters it if it keeps failing.
+
+HOW: Thin wrappers over Dramatiq actors so services don't depend on
+Dramatiq directly. Job arguments must be JSON-serializable - pass ids and
+plain dicts, not ORM objects or sessions.
+
+Example:
+    @job(queue=QUEUE_EMAIL, max_retries=8)
+    async def send_email(message: dict) -> None:
+        ...
+
+    await enqueue(send_email, message_dict)
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Optional
+
+import dramatiq
+
+from app.jobs.broker import QUEUE_DEFAULT, get_broker
+
+
+logger = logging.getLogger(__name__)
+
+
+def job(
+    queue: str = QUEUE_DEFAULT,
+    max_retries: Optional[int] = None,
+    time_limit_seconds: Optional[float] = None,
+) -> Callable[[Callable], dramatiq.Actor]:
+    """
+    Declare a background job.
+
+    Args:
+        queue: Named queue the job runs on
+        max_retries: Override JOB_MAX_RETRIES for this job
+        time_limit_seconds: Abort runs that take longer than this
+
+    Returns:
+        Decorator turning the function into a job
+    """
+    def decorator(fn: Callable) -> dramatiq.Actor:
+        options: dict = {"queue_name": queue}
+        if max_retries is not None:
+            options["max_retries"] = max_retries
+        if time_limit_seconds is not None:
+            options["time_limit"] = int(time_limit_seconds * 1000)
+
+        # WHY: Qualified names keep jobs with the same function name in
+        # different modules from colliding in the broker's registry
+        return dramatiq.actor(
+            fn,
+            actor_name=f"{fn.__module__}.{fn.__name__}",
+            broker=get_broker(),
+            **options,
+        )
+
+    return decorator
+
+
+async def enqueue(
+    job_fn: dramatiq.Actor,
+    *args: Any,
+    delay_seconds: Optional[float] = None,
+    **kwargs: Any,
+) -> str:
+    """
+    Schedule a job to run in the worker.
+
+    WHY: The broker client is synchronous; sending from a thread keeps the
+    event loop free while the message is written to Redis.
+
+    Args:
+        job_fn: Function declared with @job
+        *args: Positional job arguments (JSON-serializable)
+        delay_seconds: Run no earlier than this many seconds from now
+        **kwargs: Keyword job arguments (JSON-serializable)
+
+    Returns:
+        Message ID of the enqueued job
+    """
+    delay = int(delay_seconds * 1000) if delay_seconds else None
+    message = await asyncio.to_thread(
+        job_fn.send_with_options, args=args, kwargs=kwargs, delay=delay
+    )
+    logger.debug(f"Enqueued {job_fn.actor_name} on {job_fn.queue_name}: {message.message_id}")
+    return message.message_id
@@ -0,0 +1,67 @@
+"""
+Report background jobs.
+
+WHAT: Generates report files in the worker.
+
+WHY: Large exports take minutes and stream hundreds of thousands of rows;
+running them in a request would hold an API worker (and its memory) for
+the whole time. The "reports" queue has its own small thread budget so a
+burst of exports can't delay other jobs.
+"""
+
+import logging
+
+from app.core.config import settings
+from app.core.exceptions import ReportGenerationError
+from app.db.session import AsyncSessionLocal
+from app.jobs.broker import QUEUE_REPORTS
+from app.jobs.queue import enqueue, job
+from app.services.report_engine import get_report_engine
+from app.services.report_service import ReportService
+
+
+logger = logging.getLogger(__name__)
+
+
+@job(queue=QUEUE_REPORTS, time_limit_seconds=settings.REPORT_TIME_LIMIT_SECONDS)
+async def run_report_execution(execution_id: int) -> None:
+    """
+    Generate the file for one report execution.
+
+    WHY: Generation failures are recorded on the execution (FAILED with the
+    error) rather than retried; only errors before the execution is
+    started (e.g. the database being unreachable) trigger a retry.
+
+    Args:
+        execution_id: ReportExecution ID
+    """
+    await get_report_engine().run(execution_id)
+
+
+async def enqueue_report_execution(execution_id: int) -> None:
+    """
+    Queue generation of a committed execution.
+
+    WHY: Executions are committed before they are queued so the worker
+    always finds them. If queueing then fails nothing would ever run the
+    execution, so it is marked FAILED instead of staying PENDING.
+
+    Args:
+        execution_id: ReportExecution ID
+
+    Raises:
+        ReportGenerationError: If the job could not be queued
+    """
+    try:
+        await enqueue(run_report_execution, execution_id)
+    except Exception as e:
+        logger.error(f"Failed to enqueue report execution {execution_id}: {e}")
+        async with AsyncSessionLocal() as session:
+            await ReportService(session).fail_report_generation(
+                execution_id, "Report generation could not be queued"
+            )
+            await session.commit()
+        raise ReportGenerationError(
+            message="Report generation could not be started",
+            details={"execution_id": execution_id},
+        ) from e
@@ -0,0 +1,134 @@
+"""
+Background job worker.
+
+WHAT: Entry point for the worker container (`python -m app.jobs.worker`).
+Consumes the named queues and runs their jobs.
+
+WHY: Keeps slow I/O out of API processes. Running each queue with its own
+thread budget means a burst of report generation can't delay password
+reset emails.
+
+HOW:
+1. Imports every job module so their jobs are declared on the broker
+2. Starts one Dramatiq Worker per queue, sized by JOB_QUEUE_CONCURRENCY
+3. Runs until SIGTERM/SIGINT, then lets in-flight jobs finish; anything
+   still prefetched is returned to the queue
+
+Usage:
+    python -m app.jobs.worker                    # all queues
+    python -m app.jobs.worker --queues email pdf # only these queues
+"""
+
+import argparse
+import logging
+import signal
+import sys
+import threading
+from typing import Dict, List, Optional
+
+from dramatiq import Worker
+
+from app.core.config import settings
+from app.jobs.broker import get_broker
+
+
+logger = logging.getLogger(__name__)
+
+# Modules declaring jobs; importing them registers the jobs with the broker
+JOB_MODULES = (
+    "app.jobs.emails",
+    "app.jobs.reports",
+)
+
+# Milliseconds to wait for in-flight jobs on shutdown
+_SHUTDOWN_TIMEOUT_MS = 30000
+
+
+def load_job_modules() -> None:
+    """Import every job module."""
+    import importlib
+
+    for module in JOB_MODULES:
+        importlib.import_module(module)
+
+
+def start_workers(queue_concurrency: Dict[str, int]) -> List[Worker]:
+    """
+    Start one worker per queue.
+
+    Args:
+        queue_concurrency: Queue name -> worker threads
+
+    Returns:
+        Started workers
+    """
+    broker = get_broker()
+    load_job_modules()
+    broker.emit_after("process_boot")
+
+    workers = []
+    for queue, threads in queue_concurrency.items():
+        worker = Worker(broker, queues={queue}, worker_threads=threads)
+        worker.start()
+        workers.append(worker)
+        logger.info(f"Consuming queue {queue!r} with {threads} threads")
+    return workers
+
+
+def stop_workers(workers: List[Worker]) -> None:
+    """
+    Stop workers, letting in-flight jobs finish.
+
+    Args:
+        workers: Workers returned by start_workers
+    """
+    for worker in workers:
+        worker.stop(timeout=_SHUTDOWN_TIMEOUT_MS)
+    get_broker().close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the worker until terminated.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(description="Run background job workers")
+    parser.add_argument(
+        "--queues",
+        nargs="+",
+        default=list(settings.JOB_QUEUE_CONCURRENCY),
+        help="Queues to consume (default: all configured queues)",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.DEBUG if settings.DEBUG else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    unknown = set(args.queues) - set(settings.JOB_QUEUE_CONCURRENCY)
+    if unknown:
+        parser.error(f"Unknown queues: {', '.join(sorted(unknown))}")
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+
+    workers = start_workers(
+        {queue: settings.JOB_QUEUE_CONCURRENCY[queue] for queue in args.queues}
+    )
+    logger.info("Worker ready")
+
+    stop.wait()
+    logger.info("Shutting down worker...")
+    stop_workers(workers)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -21,6 +21,13 @@ from app.core.exception_handlers import (
 from app.middleware import SecurityHeadersMiddleware, RequestContextMiddleware, RateLimitMiddleware
 from app.api import auth, organizations, projects, proposals, invoices, workflows, tickets, admin, analytics, notification_preferences, oauth, subscriptions, workflow_ai, documents, time_entries, messages, activity, announcements, reports, onboarding, surveys, email_templates, push, integrations
 from app.services.scheduler import start_scheduler, shutdown_scheduler, get_scheduler_status
+from app.core.redis_manager import get_redis_manager
+from app.core.http_client import get_http_client_registry
+from app.core.revocation import get_revocation_filter
+from app.services.n8n_callback_service import get_n8n_callback_buffer
+from app.services.pdf_renderer import get_pdf_renderer
+from app.services.slack_dispatcher import get_slack_dispatcher
+from app.services.web_push import get_web_push_sender
 
 
 def create_app() -> FastAPI:
@@ -96,6 +103,12 @@ def create_app() -> FastAPI:
             "status": "healthy",
             "version": "0.1.0",
             "scheduler": scheduler_status,
+            "revocation_filter": get_revocation_filter().get_status(),
+            "redis_pool": get_redis_manager().get_pool_stats(),
+            "http_clients": get_http_client_registry().get_stats(),
+            "n8n_callbacks": get_n8n_callback_buffer().get_status(),
+            "slack_dispatch": get_slack_dispatcher().get_status(),
+            "pdf_rendering": get_pdf_renderer().get_status(),
         }
 
     # Startup/shutdown events for background job scheduler
@@ -107,17 +120,34 @@ def create_app() -> FastAPI:
         WHY: Starts background job scheduler for:
         - SLA breach monitoring
         - Future scheduled tasks
+
+        Also opens the shared Redis pool, starts the token revocation
+        listener so auth checks can skip Redis for tokens never revoked,
+        and starts the n8n execution callback flusher and the Slack
+        dispatch queue.
         """
+        await get_redis_manager().startup()
         await start_scheduler()
+        await get_revocation_filter().start()
+        await get_n8n_callback_buffer().start()
+        await get_slack_dispatcher().start()
 
     @app.on_event("shutdown")
     async def shutdown_event():
         """
         Application shutdown event handler.
 
-        WHY: Gracefully stops background jobs to prevent data loss.
+        WHY: Gracefully stops background jobs to prevent data loss, then
+        closes pooled outbound HTTP connections and worker pools.
         """
+        await get_revocation_filter().stop()
+        await get_n8n_callback_buffer().stop()
+        await get_slack_dispatcher().stop()
         await shutdown_scheduler()
+        await get_http_client_registry().shutdown()
+        get_web_push_sender().shutdown()
+        get_pdf_renderer().shutdown()
+        await get_redis_manager().shutdown()
 
     # Root endpoint
     @app.get("/", tags=["root"])
@@ -139,6 +169,7 @@ def create_app() -> FastAPI:
     app.include_router(invoices.payments_router, prefix="/api")
     app.include_router(invoices.webhooks_router, prefix="/api")
     app.include_router(workflows.router, prefix="/api")
+    app.include_router(workflows.webhooks_router, prefix="/api")
     app.include_router(tickets.router, prefix="/api")
     app.include_router(admin.router, prefix="/api")
     app.include_router(analytics.router, prefix="/api")
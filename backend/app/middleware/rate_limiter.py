@@ -30,8 +30,8 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
-from app.core.config import settings
 from app.core.exceptions import RateLimitExceeded
+from app.core.redis_manager import get_redis_client
 
 
 logger = logging.getLogger(__name__)
@@ -303,7 +303,7 @@ async def get_rate_limiter() -> RateLimiter:
     WHAT: Lazy initialization of rate limiter with Redis connection.
 
     WHY: Singleton pattern ensures:
-    - Single Redis connection for rate limiting
+    - Rate limiting shares the process-wide Redis pool
     - Consistent configuration across requests
     - Easy testing through mock injection
 
@@ -315,12 +315,7 @@ async def get_rate_limiter() -> RateLimiter:
     global _rate_limiter
 
     if _rate_limiter is None:
-        redis_client = await aioredis.from_url(
-            settings.REDIS_URL,
-            encoding="utf-8",
-            decode_responses=True,
-        )
-        _rate_limiter = RateLimiter(redis_client=redis_client)
+        _rate_limiter = RateLimiter(redis_client=get_redis_client("rate_limiter"))
 
     return _rate_limiter
 
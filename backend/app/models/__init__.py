@@ -112,7 +112,9 @@ from app.models.integration import (
     WebhookEndpoint,
     WebhookDelivery,
     WebhookEventType,
+    WebhookOutboxEvent,
 )
+from app.models.analytics_rollup import AnalyticsMonthlyRollup, AnalyticsRollupMetric
 
 __all__ = [
     "Base",
@@ -205,4 +207,7 @@ __all__ = [
     "WebhookEndpoint",
     "WebhookDelivery",
     "WebhookEventType",
+    "WebhookOutboxEvent",
+    "AnalyticsMonthlyRollup",
+    "AnalyticsRollupMetric",
 ]
@@ -175,6 +175,8 @@ class ActivityEvent(Base):
         Index("ix_activity_events_event_type", "event_type"),
         Index("ix_activity_events_created_at", "created_at"),
         Index("ix_activity_events_org_created", "org_id", "created_at"),
+        # WHY: Keyset pagination of the org feed over (created_at, id)
+        Index("ix_activity_events_org_created_id", "org_id", "created_at", "id"),
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,262 @@
+"""
+Analytics rollup model.
+
+WHAT: Per-organization monthly totals for the analytics time series
+(projects created, users registered, revenue collected).
+
+WHY: The admin analytics series and the revenue-by-organization ranking
+used to GROUP BY over the whole projects, users and invoices tables on
+every refresh, so their cost grew with history. Monthly rollups keep it
+proportional to the number of months and organizations shown.
+
+HOW:
+1. One row per (org_id, metric, period), period being the first day of
+   the month
+2. A Session after_flush hook turns the flush's inserts, deletes and
+   invoice payment transitions into deltas and upserts them in the same
+   transaction (value = value + delta), so rollups commit or roll back
+   together with the change
+3. Writes that bypass the unit of work (Core UPDATE/DELETE) must apply
+   their own deltas via rollup_upsert(); AnalyticsRollupDAO.rebuild()
+   recomputes any range from the source tables
+"""
+
+import enum
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    event,
+    inspect,
+)
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.orm import Session
+
+from app.models.base import Base
+from app.models.invoice import Invoice, InvoiceStatus
+from app.models.project import Project
+from app.models.user import User
+
+
+class AnalyticsRollupMetric(str, enum.Enum):
+    """
+    Metrics kept as monthly rollups.
+
+    WHY: Each maps to one source table and the column that places a row
+    in a month (see AnalyticsRollupDAO.rebuild).
+    """
+
+    PROJECTS_CREATED = "projects_created"  # Project.created_at, count
+    USERS_REGISTERED = "users_registered"  # User.created_at, count
+    REVENUE = "revenue"  # Invoice.paid_at, sum(amount_paid) of PAID invoices
+
+
+RollupKey = Tuple[int, str, date]
+
+
+class AnalyticsMonthlyRollup(Base):
+    """
+    Monthly metric total for one organization.
+
+    WHAT: value is the metric's total for org_id over the calendar month
+    starting at period.
+
+    WHY: See module docstring.
+
+    HOW: Composite primary key (org_id, metric, period) is the upsert
+    target; the (metric, period) index serves cross-organization range
+    reads for the platform-wide series.
+    """
+
+    __tablename__ = "analytics_monthly_rollups"
+
+    org_id = Column(
+        Integer,
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    metric = Column(String(50), primary_key=True)
+    period = Column(Date, primary_key=True, comment="First day of the month")
+    value = Column(Numeric(14, 2), nullable=False, default=0)
+    updated_at = Column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
+
+    __table_args__ = (
+        Index("ix_analytics_monthly_rollups_metric_period", "metric", "period"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<AnalyticsMonthlyRollup(org_id={self.org_id}, metric={self.metric}, "
+            f"period={self.period}, value={self.value})>"
+        )
+
+
+# WHY: The current month is always recomputed exactly from the source
+# tables (see AnalyticsRollupDAO); these keep that recompute a range scan
+Index("ix_projects_created_at", Project.__table__.c.created_at)
+Index("ix_users_created_at", User.__table__.c.created_at)
+Index("ix_invoices_paid_at", Invoice.__table__.c.paid_at)
+
+
+def rollup_period(timestamp: datetime) -> date:
+    """Get the rollup period (first day of the month) of a timestamp."""
+    return date(timestamp.year, timestamp.month, 1)
+
+
+def rollup_upsert(deltas: Dict[RollupKey, Decimal]) -> Optional[Insert]:
+    """
+    Build the statement that adds deltas to their rollup rows.
+
+    WHY: Additive upserts commute, so concurrent transactions touching the
+    same organization-month serialize on the row lock instead of losing
+    each other's increments.
+
+    Args:
+        deltas: (org_id, metric, period) -> amount to add (may be negative)
+
+    Returns:
+        INSERT ... ON CONFLICT DO UPDATE statement, or None if every delta
+        is zero
+    """
+    rows = [
+        {
+            "org_id": org_id,
+            "metric": metric,
+            "period": period,
+            "value": amount,
+            "updated_at": datetime.utcnow(),
+        }
+        # WHY: Sorted keys make concurrent flushes lock rows in one order
+        for (org_id, metric, period), amount in sorted(deltas.items())
+        if amount
+    ]
+    if not rows:
+        return None
+
+    stmt = insert(AnalyticsMonthlyRollup.__table__).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=["org_id", "metric", "period"],
+        set_={
+            "value": AnalyticsMonthlyRollup.__table__.c.value + stmt.excluded.value,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+
+
+# ============================================================================
+# Incremental maintenance (Session after_flush hook)
+# ============================================================================
+
+
+_INVOICE_REVENUE_FIELDS = ("org_id", "status", "amount_paid", "paid_at")
+
+
+def _value_before_flush(state: Any, key: str) -> Any:
+    """Get an attribute's value as of the start of the flush."""
+    history = state.attrs[key].history
+    if history.deleted:
+        return history.deleted[0]
+    if history.unchanged:
+        return history.unchanged[0]
+    if history.added or state.deleted:
+        # Never loaded: set blind, or the row is already gone
+        return None
+    return getattr(state.obj(), key)
+
+
+def _value_after_flush(state: Any, key: str) -> Any:
+    """Get an attribute's value as written by the flush."""
+    history = state.attrs[key].history
+    if history.added:
+        return history.added[0]
+    if history.unchanged:
+        return history.unchanged[0]
+    return getattr(state.obj(), key)
+
+
+def _invoice_revenue(values: Dict[str, Any]) -> Optional[Tuple[RollupKey, Decimal]]:
+    """Get an invoice's revenue rollup contribution, if it counts as revenue."""
+    if values["status"] != InvoiceStatus.PAID or values["paid_at"] is None:
+        return None
+    metric = AnalyticsRollupMetric.REVENUE.value
+    key = (values["org_id"], metric, rollup_period(values["paid_at"]))
+    return key, Decimal(values["amount_paid"] or 0)
+
+
+def _collect_deltas(session: Session) -> Dict[RollupKey, Decimal]:
+    """
+    Turn the objects in a flush into rollup deltas.
+
+    HOW: New and deleted projects and users count +1/-1 in their creation
+    month. For invoices, the revenue contribution before the flush is
+    subtracted and the one after it added, which covers payment, refund,
+    amount corrections and deletes alike.
+    """
+    deltas: Dict[RollupKey, Decimal] = defaultdict(Decimal)
+    counted = {
+        Project: AnalyticsRollupMetric.PROJECTS_CREATED.value,
+        User: AnalyticsRollupMetric.USERS_REGISTERED.value,
+    }
+
+    new, deleted = session.new, session.deleted
+
+    for sign, objects in ((1, new), (-1, deleted)):
+        for obj in objects:
+            metric = counted.get(type(obj))
+            if metric is None:
+                continue
+            loaded = inspect(obj).dict
+            created_at = loaded.get("created_at") or (datetime.utcnow() if sign > 0 else None)
+            if loaded.get("org_id") is not None and created_at is not None:
+                deltas[(loaded["org_id"], metric, rollup_period(created_at))] += sign
+
+    for obj in (*new, *session.dirty, *deleted):
+        if not isinstance(obj, Invoice):
+            continue
+        is_new, is_deleted = obj in new, obj in deleted
+        state = inspect(obj)
+        if not (is_new or is_deleted) and not any(
+            state.attrs[key].history.has_changes() for key in _INVOICE_REVENUE_FIELDS
+        ):
+            continue
+
+        if not is_new:
+            before = _invoice_revenue(
+                {key: _value_before_flush(state, key) for key in _INVOICE_REVENUE_FIELDS}
+            )
+            if before is not None:
+                deltas[before[0]] -= before[1]
+        if not is_deleted:
+            after = _invoice_revenue(
+                {key: _value_after_flush(state, key) for key in _INVOICE_REVENUE_FIELDS}
+            )
+            if after is not None:
+                deltas[after[0]] += after[1]
+
+    return deltas
+
+
+@event.listens_for(Session, "after_flush")
+def _maintain_rollups(session: Session, flush_context: Any) -> None:
+    """
+    Apply a flush's rollup deltas in the flush's transaction.
+
+    WHY: after_flush still sees the flush's pending/deleted sets and
+    attribute history, and anything executed here commits or rolls back
+    with the change itself.
+    """
+    stmt = rollup_upsert(_collect_deltas(session))
+    if stmt is not None:
+        session.connection().execute(stmt)
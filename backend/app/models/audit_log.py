@@ -17,7 +17,7 @@ Uses JSON for flexible storage of changes and metadata.
 """
 
 import enum
-from sqlalchemy import Column, Integer, String, Enum, ForeignKey, Text, JSON
+from sqlalchemy import Column, Integer, String, Enum, ForeignKey, Text, JSON, Index
 from sqlalchemy.orm import relationship
 
 from app.models.base import Base, TimestampMixin, PrimaryKeyMixin
@@ -158,6 +158,14 @@ class AuditLog(Base, PrimaryKeyMixin, TimestampMixin):
     actor = relationship("User", foreign_keys=[actor_user_id])
     organization = relationship("Organization", foreign_keys=[org_id])
 
+    # Keyset pagination indexes
+    # WHY: Audit log browsing pages newest-first over (created_at, id);
+    # these let deep pages be served by an index range scan.
+    __table_args__ = (
+        Index("ix_audit_logs_created_id", "created_at", "id"),
+        Index("ix_audit_logs_org_created_id", "org_id", "created_at", "id"),
+    )
+
     def __repr__(self) -> str:
         return (
             f"<AuditLog(id={self.id}, action={self.action.value}, "
@@ -20,6 +20,7 @@ from enum import Enum
 from typing import Optional, List, Dict, Any, TYPE_CHECKING
 
 from sqlalchemy import (
+    BigInteger,
     Integer,
     String,
     Text,
@@ -27,6 +28,7 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     Index,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, ARRAY
 from sqlalchemy.orm import relationship, Mapped, mapped_column
@@ -209,6 +211,10 @@ class WebhookEndpoint(Base):
     last_triggered_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     last_success_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     last_failure_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # WHY: Drives the per-endpoint circuit breaker - reset on success
+    consecutive_failures: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
 
     # Creator
     created_by_id: Mapped[Optional[int]] = mapped_column(
@@ -315,7 +321,68 @@ class WebhookDelivery(Base):
         Index("ix_webhook_deliveries_event_type", "event_type"),
         Index("ix_webhook_deliveries_delivered", "delivered"),
         Index("ix_webhook_deliveries_triggered_at", "triggered_at"),
+        # WHY: The retry job scans only scheduled, undelivered rows in
+        # next_retry_at order
+        Index(
+            "ix_webhook_deliveries_pending_retry",
+            "delivered",
+            "next_retry_at",
+            postgresql_where=text("delivered = false AND next_retry_at IS NOT NULL"),
+        ),
     )
 
     def __repr__(self) -> str:
         return f"<WebhookDelivery(id={self.id}, event='{self.event_type}')>"
+
+
+class WebhookOutboxEvent(Base):
+    """
+    Transactional outbox for webhook events.
+
+    WHAT: One row per platform event that webhook subscribers should
+    receive, written by the code that caused the event.
+
+    WHY: Delivering webhooks inline held the request's transaction (and its
+    pooled connection) open while waiting on subscribers, and a rollback
+    after delivery left receivers with events that never happened. Writing
+    the event in the same transaction as the change makes both commit or
+    neither does; the dispatcher delivers afterwards.
+
+    HOW: dispatched_at stays NULL until the dispatcher has turned the event
+    into WebhookDelivery records. The id (BIGSERIAL) gives commit-independent
+    creation order, which the dispatcher preserves per endpoint.
+    """
+
+    __tablename__ = "webhook_outbox_events"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    org_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False
+    )
+
+    # Event info
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    event_id: Mapped[str] = mapped_column(String(100), nullable=False)
+    data: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    event_metadata: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)
+
+    # Dispatch state
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, server_default=func.now(), nullable=False
+    )
+    dispatched_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    # Indexes
+    __table_args__ = (
+        # WHY: The dispatcher only ever scans undispatched rows in id order;
+        # the partial index stays as small as the backlog
+        Index(
+            "ix_webhook_outbox_events_pending",
+            "id",
+            postgresql_where=text("dispatched_at IS NULL"),
+        ),
+        Index("ix_webhook_outbox_events_dispatched_at", "dispatched_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<WebhookOutboxEvent(id={self.id}, event='{self.event_type}')>"
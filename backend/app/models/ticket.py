@@ -31,6 +31,7 @@ from sqlalchemy import (
     ForeignKey,
     Enum as SQLEnum,
     Index,
+    text,
 )
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.sql import func
@@ -266,6 +267,21 @@ class Ticket(Base):
         Index("ix_tickets_priority", "priority"),
         Index("ix_tickets_assigned_to", "assigned_to_user_id"),
         Index("ix_tickets_created_at", "created_at"),
+        # WHY: Keyset pagination of org ticket lists over (created_at, id)
+        Index("ix_tickets_org_created_id", "org_id", "created_at", "id"),
+        # WHY: SLA checker range-scans due-at over tickets not yet notified
+        Index(
+            "ix_tickets_sla_response_due_pending",
+            "sla_response_due_at",
+            postgresql_where=text(
+                "first_response_at IS NULL AND sla_response_breach_sent_at IS NULL"
+            ),
+        ),
+        Index(
+            "ix_tickets_sla_resolution_due_pending",
+            "sla_resolution_due_at",
+            postgresql_where=text("sla_resolution_breach_sent_at IS NULL"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -212,6 +212,9 @@ class ActivityFeedResponse(BaseModel):
     skip: int = Field(..., description="Offset used")
     limit: int = Field(..., description="Limit used")
     has_more: bool = Field(..., description="More items available")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page (pass as ?cursor=)"
+    )
 
 
 class SubscriptionResponse(BaseModel):
@@ -361,6 +361,7 @@ class WebhookEndpointResponse(BaseModel):
     last_triggered_at: Optional[datetime] = None
     last_success_at: Optional[datetime] = None
     last_failure_at: Optional[datetime] = None
+    consecutive_failures: int = 0
     created_by_id: Optional[int] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
@@ -456,6 +457,27 @@ class WebhookDeliveryStats(BaseModel):
     period_end: datetime
 
 
+class WebhookRetryQueueStats(BaseModel):
+    """
+    Schema for the webhook retry queue.
+
+    WHAT: Scheduled retries for an organization's endpoints and how far
+    behind the retry job is.
+
+    WHY: A growing due count or oldest-due age shows deliveries waiting
+    longer than their backoff.
+    """
+
+    depth: int = Field(..., description="Deliveries scheduled for retry")
+    due: int = Field(..., description="Scheduled retries whose time has passed")
+    oldest_due_at: Optional[datetime] = Field(
+        None, description="Retry time of the longest-waiting due delivery"
+    )
+    oldest_due_age_seconds: Optional[float] = Field(
+        None, description="Seconds the longest-waiting due delivery is overdue"
+    )
+
+
 class WebhookPayload(BaseModel):
     """
     Schema for outgoing webhook payload.
@@ -570,6 +570,9 @@ class TicketListResponse(BaseModel):
     total: int = Field(..., description="Total tickets matching filters")
     skip: int = Field(..., description="Number of items skipped")
     limit: int = Field(..., description="Maximum items per page")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page (pass as ?cursor=)"
+    )
 
 
 # ============================================================================
@@ -251,6 +251,7 @@ class ActivityService:
         include_private: bool = False,
         skip: int = 0,
         limit: int = 50,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Get organization activity feed.
@@ -268,8 +269,9 @@ class ActivityService:
             since: Optional start time
             until: Optional end time
             include_private: Include private events
-            skip: Pagination offset
+            skip: Pagination offset (ignored when cursor is given)
             limit: Pagination limit
+            cursor: Keyset cursor from a previous page's next_cursor
 
         Returns:
             Dict with activities and pagination
@@ -285,6 +287,7 @@ class ActivityService:
             include_private=include_private,
             skip=skip,
             limit=limit + 1,  # Get one extra to check for more
+            cursor=cursor,
         )
 
         has_more = len(activities) > limit
@@ -297,6 +300,7 @@ class ActivityService:
             "skip": skip,
             "limit": limit,
             "has_more": has_more,
+            "next_cursor": self.event_dao.next_cursor(activities, limit) if has_more else None,
         }
 
     async def get_entity_feed(
@@ -0,0 +1,578 @@
+"""
+Analytics Service.
+
+WHAT: Computes the platform-wide admin analytics (dashboard summary,
+project, revenue and user metrics) and caches them as snapshots.
+
+WHY: The admin dashboard is the slowest page and it polls. Each load used
+to issue a dozen or more sequential COUNT/SUM queries, one round trip and
+one table scan each, although the numbers barely move between polls.
+
+HOW:
+1. Aggregates per table are combined with FILTER clauses, so one scan
+   produces every count/sum over that table; the dashboard summary joins
+   five single-row CTEs into one statement
+2. Results are cached in process as snapshots for
+   ANALYTICS_CACHE_TTL_SECONDS
+3. Up to ANALYTICS_CACHE_STALE_SECONDS old, a snapshot is still served
+   immediately while one background task recomputes it on its own read
+   session (stale-while-revalidate), so pollers never wait on the queries
+4. Monthly series and the revenue ranking read the monthly rollups
+   (app.dao.analytics_rollup) for closed months plus an exact aggregate of
+   the current month, so their cost doesn't grow with history
+
+Usage (rebuild the rollups after raw-SQL fixes or restores):
+    python -m app.services.analytics_service rebuild-rollups
+    python -m app.services.analytics_service rebuild-rollups --since 2026-01 --metric revenue
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple, Type, Union
+
+from sqlalchemy import ColumnElement, and_, extract, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.dao.analytics_rollup import AnalyticsRollupDAO
+from app.db.session import AsyncSessionLocal, read_session
+from app.models.analytics_rollup import AnalyticsRollupMetric, rollup_period
+from app.models.invoice import Invoice, InvoiceStatus
+from app.models.organization import Organization
+from app.models.project import Project, ProjectStatus
+from app.models.ticket import Ticket, TicketStatus
+from app.models.user import User
+
+
+logger = logging.getLogger(__name__)
+
+# WHY: Dashboards aggregate months of history and refresh on a timer, so a
+# replica up to a minute behind is indistinguishable to the reader while
+# keeping these scans off the primary.
+ANALYTICS_MAX_STALENESS_SECONDS = 60.0
+
+_TERMINAL_PROJECT_STATUSES = (ProjectStatus.COMPLETED, ProjectStatus.CANCELLED)
+
+Loader = Callable[[AsyncSession], Awaitable[Dict[str, Any]]]
+
+
+# ============================================================================
+# Snapshot Cache
+# ============================================================================
+
+
+class AnalyticsSnapshotCache:
+    """
+    In-process TTL cache with stale-while-revalidate refresh.
+
+    WHAT: Maps a metrics key (e.g. ("revenue", 12)) to its last computed
+    snapshot.
+
+    WHY: See module docstring.
+
+    HOW: A miss (or a snapshot past the stale window) is computed inline
+    on the caller's session. A stale hit returns the old snapshot and
+    starts at most one refresh task per key, which opens its own read
+    session since the request's session closes with the request.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = settings.ANALYTICS_CACHE_TTL_SECONDS,
+        stale_seconds: float = settings.ANALYTICS_CACHE_STALE_SECONDS,
+    ):
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttl_seconds: How long a snapshot is served without refreshing
+            stale_seconds: How long a snapshot may be served while refreshing
+        """
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        # key -> (computed_at monotonic, snapshot)
+        self._snapshots: Dict[Hashable, Tuple[float, Dict[str, Any]]] = {}
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+
+    async def get(self, key: Hashable, loader: Loader, session: AsyncSession) -> Dict[str, Any]:
+        """
+        Get a snapshot, computing or refreshing it as needed.
+
+        Args:
+            key: Metrics key
+            loader: Computes the snapshot on a session
+            session: Caller's session, used only when nothing servable is cached
+
+        Returns:
+            Snapshot dict
+        """
+        cached = self._snapshots.get(key)
+        if cached is not None:
+            age = time.monotonic() - cached[0]
+            if age < self.ttl_seconds:
+                return cached[1]
+            if age < self.stale_seconds:
+                self._refresh_in_background(key, loader)
+                return cached[1]
+
+        snapshot = await loader(session)
+        self._snapshots[key] = (time.monotonic(), snapshot)
+        return snapshot
+
+    def _refresh_in_background(self, key: Hashable, loader: Loader) -> None:
+        """Start a refresh for key unless one is already running."""
+        if key in self._refreshing:
+            return
+        task = asyncio.create_task(self._refresh(key, loader))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    async def _refresh(self, key: Hashable, loader: Loader) -> None:
+        """Recompute one snapshot on a background read session."""
+        try:
+            async with read_session(ANALYTICS_MAX_STALENESS_SECONDS) as session:
+                snapshot = await loader(session)
+            self._snapshots[key] = (time.monotonic(), snapshot)
+        except Exception as e:
+            # WHY: The stale snapshot keeps being served; the next request
+            # after this failure tries again
+            logger.warning(f"Analytics snapshot refresh for {key} failed: {e}")
+
+    def clear(self) -> None:
+        """Drop every snapshot (tests, or after bulk data changes)."""
+        self._snapshots.clear()
+
+
+# Global snapshot cache instance
+_analytics_cache: Optional[AnalyticsSnapshotCache] = None
+
+
+def get_analytics_cache() -> AnalyticsSnapshotCache:
+    """
+    Get global analytics snapshot cache instance.
+
+    Returns:
+        AnalyticsSnapshotCache singleton
+    """
+    global _analytics_cache
+    if _analytics_cache is None:
+        _analytics_cache = AnalyticsSnapshotCache()
+    return _analytics_cache
+
+
+# ============================================================================
+# Shared Query Helpers
+# ============================================================================
+
+
+async def _rollup_series(
+    session: AsyncSession,
+    metric: AnalyticsRollupMetric,
+    months: int,
+) -> List[Dict[str, Any]]:
+    """
+    Get a metric's monthly series from the rollups.
+
+    Args:
+        session: Database session
+        metric: Rollup metric
+        months: Months of history (the window starts at the beginning of
+                the month containing now - months * 30 days)
+
+    Returns:
+        Time series points ({"date": "YYYY-MM", "value": float}), oldest first
+    """
+    start = rollup_period(datetime.utcnow() - timedelta(days=months * 30))
+    rows = await AnalyticsRollupDAO(session).monthly_series(metric, start)
+    return [
+        {"date": period.strftime("%Y-%m"), "value": float(value)} for period, value in rows
+    ]
+
+
+async def _top_organizations(
+    session: AsyncSession,
+    model: Type[Any],
+    value: ColumnElement[Any],
+    *conditions: ColumnElement[bool],
+    limit: int = 10,
+) -> List[Dict[str, Any]]:
+    """
+    Rank organizations by an aggregate over one of their child tables.
+
+    Args:
+        session: Database session
+        model: Child model with an org_id column (e.g. Project)
+        value: Aggregate expression over the child table
+        *conditions: WHERE conditions on the child table
+        limit: Organizations to return
+
+    Returns:
+        Organization metrics ({"org_id", "org_name", "value"}), highest first
+    """
+    result = await session.execute(
+        select(Organization.id, Organization.name, value.label("value"))
+        .join(model, model.org_id == Organization.id)
+        .where(*conditions)
+        .group_by(Organization.id, Organization.name)
+        .order_by(value.desc())
+        .limit(limit)
+    )
+    return [
+        {"org_id": row.id, "org_name": row.name, "value": float(row.value or 0)}
+        for row in result.all()
+    ]
+
+
+def _money(value: Optional[Union[Decimal, float]]) -> float:
+    """Convert a SUM/AVG result (Decimal or None) to float."""
+    return float(value or 0.0)
+
+
+# ============================================================================
+# Metric Loaders
+# ============================================================================
+
+
+async def load_dashboard_summary(session: AsyncSession) -> Dict[str, Any]:
+    """
+    Compute the admin dashboard summary in one statement.
+
+    WHAT: Counts and sums for the dashboard cards.
+
+    HOW: One single-row CTE per table, each computing all of that table's
+    figures with FILTER clauses, cross-joined into one result row.
+
+    Args:
+        session: Database session
+
+    Returns:
+        Summary fields of DashboardSummaryResponse
+    """
+    now = datetime.utcnow()
+    start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    paid = Invoice.status == InvoiceStatus.PAID
+
+    users = select(func.count().label("total_users")).select_from(User).cte("user_totals")
+    organizations = (
+        select(
+            func.count().label("total_organizations"),
+            func.count().filter(Organization.is_active.is_(True)).label("active_organizations"),
+        )
+        .select_from(Organization)
+        .cte("organization_totals")
+    )
+    projects = (
+        select(
+            func.count().label("total_projects"),
+            func.count()
+            .filter(Project.status.notin_(_TERMINAL_PROJECT_STATUSES))
+            .label("active_projects"),
+        )
+        .select_from(Project)
+        .cte("project_totals")
+    )
+    invoices = (
+        select(
+            func.sum(Invoice.amount_paid).filter(paid).label("total_revenue"),
+            func.sum(Invoice.amount_paid)
+            .filter(and_(paid, Invoice.paid_at >= start_of_month))
+            .label("revenue_mtd"),
+        )
+        .select_from(Invoice)
+        .cte("invoice_totals")
+    )
+    tickets = (
+        select(
+            func.count()
+            .filter(Ticket.status.in_([TicketStatus.OPEN, TicketStatus.IN_PROGRESS]))
+            .label("open_tickets"),
+            func.count()
+            .filter(
+                and_(
+                    Ticket.status.notin_([TicketStatus.CLOSED, TicketStatus.RESOLVED]),
+                    or_(Ticket.sla_response_due_at < now, Ticket.sla_resolution_due_at < now),
+                )
+            )
+            .label("overdue_tickets"),
+        )
+        .select_from(Ticket)
+        .cte("ticket_totals")
+    )
+
+    row = (
+        await session.execute(
+            select(
+                users.c.total_users,
+                organizations.c.total_organizations,
+                organizations.c.active_organizations,
+                projects.c.total_projects,
+                projects.c.active_projects,
+                invoices.c.total_revenue,
+                invoices.c.revenue_mtd,
+                tickets.c.open_tickets,
+                tickets.c.overdue_tickets,
+            )
+        )
+    ).one()
+
+    return {
+        "total_users": row.total_users,
+        "total_organizations": row.total_organizations,
+        "active_organizations": row.active_organizations,
+        "total_projects": row.total_projects,
+        "active_projects": row.active_projects,
+        "total_revenue": _money(row.total_revenue),
+        "revenue_mtd": _money(row.revenue_mtd),
+        "open_tickets": row.open_tickets,
+        "overdue_tickets": row.overdue_tickets,
+    }
+
+
+async def load_project_metrics(session: AsyncSession, months: int) -> Dict[str, Any]:
+    """
+    Compute project metrics in three queries.
+
+    HOW: One GROUP BY status pass yields the status breakdown, totals,
+    overdue counts and completed-project durations; the monthly series
+    (from the rollups) and the organization ranking take one query each.
+
+    Args:
+        session: Database session
+        months: Months of history for the time series
+
+    Returns:
+        Fields of ProjectMetricsResponse
+    """
+    now = datetime.utcnow()
+    duration = extract("epoch", Project.completed_at) - extract("epoch", Project.start_date)
+
+    result = await session.execute(
+        select(
+            Project.status,
+            func.count().label("count"),
+            func.count().filter(Project.due_date < now).label("past_due"),
+            func.avg(duration)
+            .filter(and_(Project.completed_at.isnot(None), Project.start_date.isnot(None)))
+            .label("avg_duration"),
+        ).group_by(Project.status)
+    )
+    rows = result.all()
+
+    open_rows = [row for row in rows if row.status not in _TERMINAL_PROJECT_STATUSES]
+    avg_duration_seconds = next(
+        (row.avg_duration for row in rows if row.status == ProjectStatus.COMPLETED), None
+    )
+
+    return {
+        "total_projects": sum(row.count for row in rows),
+        "by_status": [{"status": row.status.value, "count": row.count} for row in rows],
+        "created_over_time": await _rollup_series(
+            session, AnalyticsRollupMetric.PROJECTS_CREATED, months
+        ),
+        "average_duration_days": (
+            float(avg_duration_seconds) / 86400 if avg_duration_seconds else None
+        ),
+        "projects_by_organization": await _top_organizations(
+            session, Project, func.count(Project.id)
+        ),
+        "active_projects": sum(row.count for row in open_rows),
+        "overdue_projects": sum(row.past_due for row in open_rows),
+    }
+
+
+async def load_revenue_metrics(session: AsyncSession, months: int) -> Dict[str, Any]:
+    """
+    Compute revenue metrics in four queries.
+
+    HOW: Every invoice total (all-time, MTD, YTD, outstanding, overdue,
+    average deal size) comes from one FILTER pass; the organization
+    ranking and monthly series (both from the rollups) and payment
+    methods take one query each.
+
+    Args:
+        session: Database session
+        months: Months of history for the time series
+
+    Returns:
+        Fields of RevenueMetricsResponse
+    """
+    now = datetime.utcnow()
+    start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    start_of_year = start_of_month.replace(month=1)
+    paid = Invoice.status == InvoiceStatus.PAID
+    balance = Invoice.total - Invoice.amount_paid
+
+    totals = (
+        await session.execute(
+            select(
+                func.sum(Invoice.amount_paid).filter(paid).label("total_revenue"),
+                func.sum(Invoice.amount_paid)
+                .filter(and_(paid, Invoice.paid_at >= start_of_month))
+                .label("revenue_mtd"),
+                func.sum(Invoice.amount_paid)
+                .filter(and_(paid, Invoice.paid_at >= start_of_year))
+                .label("revenue_ytd"),
+                func.sum(balance)
+                .filter(Invoice.status.in_([InvoiceStatus.SENT, InvoiceStatus.PARTIALLY_PAID]))
+                .label("outstanding_amount"),
+                func.sum(balance)
+                .filter(Invoice.status == InvoiceStatus.OVERDUE)
+                .label("overdue_amount"),
+                func.avg(Invoice.total).filter(paid).label("average_deal_size"),
+            )
+        )
+    ).one()
+
+    method = func.coalesce(Invoice.payment_method, "unknown")
+    payment_result = await session.execute(
+        select(method.label("method"), func.count(Invoice.id).label("count"))
+        .where(paid)
+        .group_by(method)
+    )
+
+    return {
+        "total_revenue": _money(totals.total_revenue),
+        "revenue_mtd": _money(totals.revenue_mtd),
+        "revenue_ytd": _money(totals.revenue_ytd),
+        "revenue_by_organization": [
+            {"org_id": org_id, "org_name": org_name, "value": _money(value)}
+            for org_id, org_name, value in await AnalyticsRollupDAO(session).top_organizations(
+                AnalyticsRollupMetric.REVENUE
+            )
+        ],
+        "revenue_over_time": await _rollup_series(
+            session, AnalyticsRollupMetric.REVENUE, months
+        ),
+        "average_deal_size": _money(totals.average_deal_size),
+        "payment_method_breakdown": [
+            {"status": row.method, "count": row.count} for row in payment_result.all()
+        ],
+        "outstanding_amount": _money(totals.outstanding_amount),
+        "overdue_amount": _money(totals.overdue_amount),
+    }
+
+
+async def load_user_activity_metrics(session: AsyncSession, months: int) -> Dict[str, Any]:
+    """
+    Compute user activity metrics in three queries.
+
+    HOW: One GROUP BY role pass with FILTER counts yields the role
+    breakdown and every total; the monthly series (from the rollups) and
+    the organization ranking take one query each.
+
+    Args:
+        session: Database session
+        months: Months of history for the time series
+
+    Returns:
+        Fields of UserActivityMetricsResponse
+    """
+    now = datetime.utcnow()
+    active = User.is_active.is_(True)
+
+    # Note: Without last_login_at tracking, account creation within the
+    # last 7 days is the proxy for recent activity
+    result = await session.execute(
+        select(
+            User.role,
+            func.count().label("count"),
+            func.count().filter(active).label("active"),
+            func.count()
+            .filter(and_(active, User.created_at >= now - timedelta(days=7)))
+            .label("recent"),
+            func.count().filter(User.email_verified.is_(True)).label("verified"),
+        ).group_by(User.role)
+    )
+    rows = result.all()
+
+    total_users = sum(row.count for row in rows)
+    verified_users = sum(row.verified for row in rows)
+
+    return {
+        "total_users": total_users,
+        "active_users": sum(row.active for row in rows),
+        "recent_active_users": sum(row.recent for row in rows),
+        "new_users_over_time": await _rollup_series(
+            session, AnalyticsRollupMetric.USERS_REGISTERED, months
+        ),
+        "users_by_organization": await _top_organizations(
+            session, User, func.count(User.id)
+        ),
+        "users_by_role": [{"status": row.role, "count": row.count} for row in rows],
+        "verified_users": verified_users,
+        "unverified_users": total_users - verified_users,
+    }
+
+
+# ============================================================================
+# Rollup Rebuild Command
+# ============================================================================
+
+
+async def rebuild_rollups(
+    metrics: Optional[List[AnalyticsRollupMetric]] = None,
+    since: Optional[date] = None,
+) -> int:
+    """
+    Rebuild the analytics rollups on the primary in one transaction.
+
+    Args:
+        metrics: Metrics to rebuild (default: all)
+        since: First period to rebuild (default: all history)
+
+    Returns:
+        Number of rollup rows written
+    """
+    async with AsyncSessionLocal() as session:
+        written = await AnalyticsRollupDAO(session).rebuild(metrics, since)
+        await session.commit()
+    get_analytics_cache().clear()
+    return written
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the rollup rebuild command.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv)
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(description="Analytics maintenance")
+    commands = parser.add_subparsers(dest="command", required=True)
+    rebuild = commands.add_parser(
+        "rebuild-rollups", help="Recompute monthly rollups from the source tables"
+    )
+    rebuild.add_argument(
+        "--metric",
+        action="append",
+        choices=[metric.value for metric in AnalyticsRollupMetric],
+        help="Metric to rebuild (repeatable; default: all)",
+    )
+    rebuild.add_argument(
+        "--since",
+        type=lambda value: datetime.strptime(value, "%Y-%m").date(),
+        help="First month to rebuild, YYYY-MM (default: all history)",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.DEBUG if settings.DEBUG else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    metrics = [AnalyticsRollupMetric(value) for value in args.metric] if args.metric else None
+    written = asyncio.run(rebuild_rollups(metrics, args.since))
+    logger.info(f"Rebuilt analytics rollups: {written} rows written")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
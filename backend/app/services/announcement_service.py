@@ -132,10 +132,14 @@ class AnnouncementService:
             )
 
         # Validate target user IDs exist
+        # WHY: One query for the whole target list instead of one per user
         if target_user_ids:
+            found = {
+                user.id
+                for user in await self.user_dao.get_by_ids_and_org(target_user_ids, org_id)
+            }
             for uid in target_user_ids:
-                user = await self.user_dao.get_by_id_and_org(uid, org_id)
-                if not user:
+                if uid not in found:
                     raise ValidationError(
                         message=f"User {uid} not found in organization",
                         details={"user_id": uid},
@@ -24,15 +24,22 @@ Design decisions:
 - Rate limiting: Prevent email spam abuse
 """
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from email.utils import parseaddr
 from enum import Enum
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Sequence
 from datetime import datetime
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.core.config import settings
 from app.core.exceptions import EmailServiceError
+from app.core.http_client import get_http_client
+from app.core.request_spacer import RequestSpacer
+from app.dao.email_template import SentEmailDAO
 from app.services.email_template_service import get_email_template_service, EmailTemplateService
 
 logger = logging.getLogger(__name__)
@@ -119,6 +126,9 @@ class EmailMessage:
     metadata: Optional[Dict[str, Any]] = None
     """Additional metadata for tracking."""
 
+    org_id: Optional[int] = None
+    """Organization the email is sent for (bulk sends log a SentEmail row)."""
+
 
 @dataclass
 class EmailResult:
@@ -149,6 +159,10 @@ class EmailResult:
 # ============================================================================
 
 
+# Most emails Resend accepts in one batch request
+RESEND_BATCH_MAX_EMAILS = 100
+
+
 class EmailProvider(ABC):
     """
     Abstract base class for email providers.
@@ -159,6 +173,17 @@ class EmailProvider(ABC):
     - Testing with mock providers
     """
 
+    name: str = "unknown"
+    """Provider name recorded in results."""
+
+    default_from: str = "Automation Platform <noreply@localhost>"
+    """Sender used when a message doesn't set one."""
+
+    requests_per_second: float = 0.0
+    """Provider API rate limit for bulk sends (0 = unlimited)."""
+
+    _rate_limiter: Optional[RequestSpacer] = None
+
     @abstractmethod
     async def send(self, message: EmailMessage) -> EmailResult:
         """
@@ -182,6 +207,46 @@ class EmailProvider(ABC):
         """
         pass
 
+    def _get_rate_limiter(self) -> RequestSpacer:
+        """Get this provider's rate limiter (created on first use)."""
+        if self._rate_limiter is None:
+            self._rate_limiter = RequestSpacer(self.requests_per_second)
+        return self._rate_limiter
+
+    async def send_batch(self, messages: Sequence[EmailMessage]) -> List[EmailResult]:
+        """
+        Send many email messages.
+
+        WHAT: Fallback for providers without a batch endpoint.
+
+        WHY: Awaiting one send at a time made fan-outs take a provider
+        round trip per recipient.
+
+        HOW: Concurrent sends (at most EMAIL_BULK_CONCURRENCY in flight),
+        spaced by the provider's rate limiter. Providers with a batch API
+        override this.
+
+        Args:
+            messages: Email messages to send
+
+        Returns:
+            EmailResult per message, in the same order
+        """
+        limiter = self._get_rate_limiter()
+        semaphore = asyncio.Semaphore(settings.EMAIL_BULK_CONCURRENCY)
+
+        async def send_one(message: EmailMessage) -> EmailResult:
+            async with semaphore:
+                await limiter.wait()
+                try:
+                    return await self.send(message)
+                except Exception as e:
+                    # WHY: One bad message mustn't fail the rest of the batch
+                    logger.error(f"{self.name} send error: {e}")
+                    return EmailResult(success=False, error=str(e), provider=self.name)
+
+        return list(await asyncio.gather(*[send_one(message) for message in messages]))
+
 
 class ResendProvider(EmailProvider):
     """
@@ -192,8 +257,11 @@ class ResendProvider(EmailProvider):
     - Good deliverability
     - Reasonable pricing
     - Webhook support for delivery tracking
+    - A batch endpoint (up to 100 emails per request)
     """
 
+    name = "resend"
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize Resend provider.
@@ -202,7 +270,8 @@ class ResendProvider(EmailProvider):
             api_key: Resend API key (defaults to settings)
         """
         self._api_key = api_key or settings.RESEND_API_KEY
-        self._default_from = f"Automation Platform <noreply@{self._get_domain()}>"
+        self.default_from = f"Automation Platform <noreply@{self._get_domain()}>"
+        self.requests_per_second = settings.RESEND_REQUESTS_PER_SECOND
 
     def _get_domain(self) -> str:
         """Get domain from FRONTEND_URL for default sender."""
@@ -215,6 +284,24 @@ class ResendProvider(EmailProvider):
         """Check if Resend API key is configured."""
         return bool(self._api_key)
 
+    def _headers(self) -> Dict[str, str]:
+        """Request headers for the Resend API."""
+        return {
+            "Authorization": f"Bearer {self._api_key}",
+            "Content-Type": "application/json",
+        }
+
+    def _payload(self, message: EmailMessage) -> Dict[str, Any]:
+        """Build the Resend request body for one message."""
+        return {
+            "from": message.from_email or self.default_from,
+            "to": [message.to_email],
+            "subject": message.subject,
+            "html": message.html_content,
+            "text": message.text_content,
+            "reply_to": message.reply_to,
+        }
+
     async def send(self, message: EmailMessage) -> EmailResult:
         """
         Send email via Resend API.
@@ -239,40 +326,28 @@ class ResendProvider(EmailProvider):
                 provider="resend",
             )
 
-        import httpx
-
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.resend.com/emails",
-                    headers={
-                        "Authorization": f"Bearer {self._api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "from": message.from_email or self._default_from,
-                        "to": [message.to_email],
-                        "subject": message.subject,
-                        "html": message.html_content,
-                        "text": message.text_content,
-                        "reply_to": message.reply_to,
-                    },
-                    timeout=30.0,
-                )
+            client = get_http_client("email")
+            response = await client.post(
+                "https://api.resend.com/emails",
+                headers=self._headers(),
+                json=self._payload(message),
+                timeout=30.0,
+            )
 
-                if response.status_code in (200, 201):
-                    data = response.json()
-                    return EmailResult(
-                        success=True,
-                        message_id=data.get("id"),
-                        provider="resend",
-                    )
-                else:
-                    return EmailResult(
-                        success=False,
-                        error=f"Resend API error: {response.status_code} - {response.text}",
-                        provider="resend",
-                    )
+            if response.status_code in (200, 201):
+                data = response.json()
+                return EmailResult(
+                    success=True,
+                    message_id=data.get("id"),
+                    provider="resend",
+                )
+            else:
+                return EmailResult(
+                    success=False,
+                    error=f"Resend API error: {response.status_code} - {response.text}",
+                    provider="resend",
+                )
 
         except Exception as e:
             logger.error(f"Resend send error: {e}")
@@ -282,6 +357,80 @@ class ResendProvider(EmailProvider):
                 provider="resend",
             )
 
+    async def send_batch(self, messages: Sequence[EmailMessage]) -> List[EmailResult]:
+        """
+        Send many emails via Resend's batch endpoint.
+
+        WHAT: Posts messages in chunks of RESEND_BATCH_MAX_EMAILS.
+
+        WHY: One request per hundred emails instead of one per email keeps
+        large fan-outs well inside Resend's request rate limit.
+
+        HOW: Chunks are posted concurrently, spaced by the rate limiter.
+        Resend accepts or rejects a batch as a whole, so a failed request
+        fails every message in its chunk.
+
+        Args:
+            messages: Email messages to send
+
+        Returns:
+            EmailResult per message, in the same order
+        """
+        if not self.is_configured():
+            return [
+                EmailResult(success=False, error="Resend API key not configured", provider="resend")
+                for _ in messages
+            ]
+
+        limiter = self._get_rate_limiter()
+
+        async def send_chunk(chunk: Sequence[EmailMessage]) -> List[EmailResult]:
+            await limiter.wait()
+            return await self._send_chunk(chunk)
+
+        chunks = [
+            messages[i:i + RESEND_BATCH_MAX_EMAILS]
+            for i in range(0, len(messages), RESEND_BATCH_MAX_EMAILS)
+        ]
+        chunk_results = await asyncio.gather(*[send_chunk(chunk) for chunk in chunks])
+        return [result for results in chunk_results for result in results]
+
+    async def _send_chunk(self, chunk: Sequence[EmailMessage]) -> List[EmailResult]:
+        """
+        Post one batch request.
+
+        Args:
+            chunk: At most RESEND_BATCH_MAX_EMAILS messages
+
+        Returns:
+            EmailResult per message
+        """
+        try:
+            client = get_http_client("email")
+            response = await client.post(
+                "https://api.resend.com/emails/batch",
+                headers=self._headers(),
+                json=[self._payload(message) for message in chunk],
+                timeout=30.0,
+            )
+
+            if response.status_code in (200, 201):
+                data = response.json().get("data") or []
+                if len(data) == len(chunk):
+                    return [
+                        EmailResult(success=True, message_id=item.get("id"), provider="resend")
+                        for item in data
+                    ]
+                error = f"Resend batch returned {len(data)} IDs for {len(chunk)} emails"
+            else:
+                error = f"Resend API error: {response.status_code} - {response.text}"
+
+        except Exception as e:
+            logger.error(f"Resend batch send error: {e}")
+            error = str(e)
+
+        return [EmailResult(success=False, error=error, provider="resend") for _ in chunk]
+
 
 class MockEmailProvider(EmailProvider):
     """
@@ -291,9 +440,14 @@ class MockEmailProvider(EmailProvider):
     Logs emails instead of sending them.
     """
 
+    name = "mock"
+
     sent_emails: List[EmailMessage] = []
     """Class-level list to track sent emails for testing."""
 
+    batch_sizes: List[int] = []
+    """Class-level list of send_batch sizes for testing."""
+
     def is_configured(self) -> bool:
         """Mock provider is always configured."""
         return True
@@ -323,10 +477,32 @@ class MockEmailProvider(EmailProvider):
             provider="mock",
         )
 
+    async def send_batch(self, messages: Sequence[EmailMessage]) -> List[EmailResult]:
+        """
+        Mock batch send - logs and records the batch instead of sending.
+
+        Args:
+            messages: Email messages to "send"
+
+        Returns:
+            A successful result per message
+        """
+        logger.info(f"[MOCK EMAIL] Batch of {len(messages)} emails")
+
+        MockEmailProvider.sent_emails.extend(messages)
+        MockEmailProvider.batch_sizes.append(len(messages))
+
+        timestamp = datetime.utcnow().timestamp()
+        return [
+            EmailResult(success=True, message_id=f"mock-{timestamp}-{i}", provider="mock")
+            for i in range(len(messages))
+        ]
+
     @classmethod
     def clear_sent_emails(cls):
         """Clear sent emails list (for test cleanup)."""
         cls.sent_emails = []
+        cls.batch_sizes = []
 
 
 # ============================================================================
@@ -727,6 +903,107 @@ class EmailService:
 
         return result
 
+    async def send_bulk(
+        self,
+        messages: Sequence[EmailMessage],
+        session: Optional[AsyncSession] = None,
+    ) -> List[EmailResult]:
+        """
+        Send many email messages at once.
+
+        WHAT: Sends a fan-out (escalations, announcements, invitations) in
+        one call and logs every outcome.
+
+        WHY: Awaiting send_email per recipient took one provider round trip
+        each, and logging each send would take a write each.
+
+        HOW: The provider's send_batch uses its batch endpoint where it has
+        one, otherwise rate-limited concurrent sends. Afterwards, messages
+        with an org_id get SentEmail rows in one multi-row INSERT on the
+        given session (the caller commits). The session is only used after
+        every send has finished.
+
+        Args:
+            messages: Email messages to send
+            session: Optional session to log SentEmail rows on
+
+        Returns:
+            EmailResult per message, in the same order
+        """
+        if not messages:
+            return []
+
+        logger.info(f"Sending {len(messages)} emails in bulk")
+        results = await self._provider.send_batch(messages)
+
+        failures = [result for result in results if not result.success]
+        if failures:
+            logger.error(
+                f"{len(failures)} of {len(messages)} bulk emails failed: {failures[0].error}",
+                extra={"failed": len(failures), "provider": failures[0].provider},
+            )
+
+        if session is not None:
+            await self._log_sent_emails(session, messages, results)
+
+        return results
+
+    async def _log_sent_emails(
+        self,
+        session: AsyncSession,
+        messages: Sequence[EmailMessage],
+        results: Sequence[EmailResult],
+    ) -> None:
+        """
+        Record bulk send outcomes as SentEmail rows.
+
+        Args:
+            session: Database session
+            messages: Messages that were sent
+            results: Provider result per message
+        """
+        now = datetime.utcnow()
+        rows = []
+        for message, result in zip(messages, results):
+            if message.org_id is None:
+                continue
+            from_name, from_email = parseaddr(message.from_email or self._provider.default_from)
+            rows.append({
+                "org_id": message.org_id,
+                "to_email": message.to_email,
+                "from_email": from_email,
+                "from_name": message.from_name or from_name or None,
+                "subject": message.subject[:500],
+                "variables_used": message.metadata,
+                "status": "sent" if result.success else "failed",
+                "message_id": result.message_id,
+                "provider": result.provider,
+                "error_message": result.error,
+                "sent_at": now if result.success else None,
+            })
+
+        await SentEmailDAO(session).log_emails(rows)
+
+    async def queue_email(self, message: EmailMessage) -> str:
+        """
+        Queue an email for the background worker.
+
+        WHAT: Enqueues the message instead of sending it inline.
+
+        WHY: The caller doesn't wait on the provider, and failed sends are
+        retried with backoff (then dead-lettered) by the worker.
+
+        Args:
+            message: Email message to send
+
+        Returns:
+            Job message ID
+        """
+        from app.jobs.emails import email_message_to_dict, send_email
+        from app.jobs.queue import enqueue
+
+        return await enqueue(send_email, email_message_to_dict(message))
+
     async def send_verification_email(
         self,
         to_email: str,
@@ -1405,6 +1682,7 @@ class EmailService:
         organization_name: Optional[str] = None,
         assigned_to: Optional[str] = None,
         time_remaining: Optional[str] = None,
+        org_id: Optional[int] = None,
     ) -> EmailResult:
         """
         Send SLA warning or breach notification.
@@ -1413,7 +1691,7 @@ class EmailService:
 
         WHY: Enables proactive SLA management and escalation.
 
-        HOW: Renders Jinja2 template with SLA details and sends via provider.
+        HOW: Builds the message with build_sla_warning_email and sends via provider.
 
         Args:
             to_email: Recipient email address (agent/admin)
@@ -1428,10 +1706,73 @@ class EmailService:
             organization_name: Customer's organization
             assigned_to: Currently assigned agent
             time_remaining: Time remaining (formatted)
+            org_id: Ticket's organization (for SentEmail logging)
 
         Returns:
             EmailResult with send status
         """
+        return await self.send_email(
+            self.build_sla_warning_email(
+                to_email=to_email,
+                user_name=user_name,
+                ticket_id=ticket_id,
+                ticket_subject=ticket_subject,
+                ticket_priority=ticket_priority,
+                sla_type=sla_type,
+                sla_status=sla_status,
+                due_at=due_at,
+                customer_name=customer_name,
+                organization_name=organization_name,
+                assigned_to=assigned_to,
+                time_remaining=time_remaining,
+                org_id=org_id,
+            )
+        )
+
+    def build_sla_warning_email(
+        self,
+        to_email: str,
+        user_name: str,
+        ticket_id: int,
+        ticket_subject: str,
+        ticket_priority: str,
+        sla_type: str,
+        sla_status: str,
+        due_at: str,
+        customer_name: str,
+        organization_name: Optional[str] = None,
+        assigned_to: Optional[str] = None,
+        time_remaining: Optional[str] = None,
+        org_id: Optional[int] = None,
+    ) -> EmailMessage:
+        """
+        Build an SLA warning or breach notification.
+
+        WHAT: Renders the SLA email for one recipient without sending it.
+
+        WHY: The SLA job collects every escalation of a run and sends them
+        together with send_bulk.
+
+        HOW: Renders Jinja2 template with SLA details.
+
+        Args:
+            to_email: Recipient email address (agent/admin)
+            user_name: Recipient's display name
+            ticket_id: Ticket ID
+            ticket_subject: Ticket subject
+            ticket_priority: Priority level
+            sla_type: "response" or "resolution"
+            sla_status: "warning" or "breached"
+            due_at: SLA due date/time
+            customer_name: Customer who created ticket
+            organization_name: Customer's organization
+            assigned_to: Currently assigned agent
+            time_remaining: Time remaining (formatted)
+            org_id: Ticket's organization (for SentEmail logging)
+
+        Returns:
+            EmailMessage ready to send
+        """
         subject, html_content, text_content = self._template_service.render_sla_warning_email(
             user_name=user_name,
             ticket_id=ticket_id,
@@ -1446,7 +1787,7 @@ class EmailService:
             time_remaining=time_remaining,
         )
 
-        message = EmailMessage(
+        return EmailMessage(
             to_email=to_email,
             subject=subject,
             html_content=html_content,
@@ -1457,10 +1798,9 @@ class EmailService:
                 "sla_type": sla_type,
                 "sla_status": sla_status,
             },
+            org_id=org_id,
         )
 
-        return await self.send_email(message)
-
 
 # ============================================================================
 # Module-level convenience functions
@@ -13,14 +13,19 @@ HOW: Implements:
 - OAuth token exchange and refresh
 - Calendar sync with external APIs
 - Webhook payload signing and delivery
+- Transactional outbox for webhook events
 - Background job support for retries
 """
 
+import asyncio
 import uuid
 import hmac
 import hashlib
 import json
 import logging
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any, TYPE_CHECKING
 
@@ -28,6 +33,8 @@ import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.http_client import get_http_client
+from app.db.session import AsyncSessionLocal
 from app.core.exceptions import (
     AppException,
     NotFoundError,
@@ -38,11 +45,13 @@ from app.dao.integration import (
     CalendarIntegrationDAO,
     WebhookEndpointDAO,
     WebhookDeliveryDAO,
+    WebhookOutboxDAO,
 )
 from app.models.integration import (
     CalendarIntegration,
     WebhookEndpoint,
     WebhookDelivery,
+    WebhookOutboxEvent,
     CalendarProvider,
     WebhookEventType,
 )
@@ -322,19 +331,19 @@ class CalendarIntegrationService:
 
         # Exchange code for tokens
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    config["token_url"],
-                    data={
-                        "client_id": client_id,
-                        "client_secret": client_secret,
-                        "code": code,
-                        "redirect_uri": redirect_uri,
-                        "grant_type": "authorization_code",
-                    },
-                )
-                response.raise_for_status()
-                tokens = response.json()
+            client = get_http_client("integrations")
+            response = await client.post(
+                config["token_url"],
+                data={
+                    "client_id": client_id,
+                    "client_secret": client_secret,
+                    "code": code,
+                    "redirect_uri": redirect_uri,
+                    "grant_type": "authorization_code",
+                },
+            )
+            response.raise_for_status()
+            tokens = response.json()
         except httpx.HTTPStatusError as e:
             raise OAuthError(
                 message="Failed to exchange authorization code",
@@ -371,7 +380,7 @@ class CalendarIntegrationService:
             )
         else:
             # Create new integration
-            integration = CalendarIntegration(
+            return await self.dao.create(
                 user_id=user_id,
                 org_id=org_id,
                 provider=provider,
@@ -382,7 +391,6 @@ class CalendarIntegrationService:
                 is_active=True,
                 sync_enabled=True,
             )
-            return await self.dao.create(integration)
 
     async def refresh_token(
         self,
@@ -425,18 +433,18 @@ class CalendarIntegrationService:
         )
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    config["token_url"],
-                    data={
-                        "client_id": client_id,
-                        "client_secret": client_secret,
-                        "refresh_token": integration.refresh_token,
-                        "grant_type": "refresh_token",
-                    },
-                )
-                response.raise_for_status()
-                tokens = response.json()
+            client = get_http_client("integrations")
+            response = await client.post(
+                config["token_url"],
+                data={
+                    "client_id": client_id,
+                    "client_secret": client_secret,
+                    "refresh_token": integration.refresh_token,
+                    "grant_type": "refresh_token",
+                },
+            )
+            response.raise_for_status()
+            tokens = response.json()
         except httpx.HTTPStatusError as e:
             # Mark integration as inactive if refresh fails
             await self.dao.deactivate(
@@ -619,26 +627,166 @@ class CalendarIntegrationService:
     async def _get_provider_email(self, provider: str, access_token: str) -> str:
         """Get user email from calendar provider."""
         try:
-            async with httpx.AsyncClient() as client:
-                if provider == CalendarProvider.GOOGLE.value:
-                    response = await client.get(
-                        "https://www.googleapis.com/oauth2/v2/userinfo",
-                        headers={"Authorization": f"Bearer {access_token}"},
-                    )
-                    response.raise_for_status()
-                    return response.json().get("email", "")
-                elif provider == CalendarProvider.OUTLOOK.value:
-                    response = await client.get(
-                        "https://graph.microsoft.com/v1.0/me",
-                        headers={"Authorization": f"Bearer {access_token}"},
-                    )
-                    response.raise_for_status()
-                    return response.json().get("mail", "")
+            client = get_http_client("integrations")
+            if provider == CalendarProvider.GOOGLE.value:
+                response = await client.get(
+                    "https://www.googleapis.com/oauth2/v2/userinfo",
+                    headers={"Authorization": f"Bearer {access_token}"},
+                )
+                response.raise_for_status()
+                return response.json().get("email", "")
+            elif provider == CalendarProvider.OUTLOOK.value:
+                response = await client.get(
+                    "https://graph.microsoft.com/v1.0/me",
+                    headers={"Authorization": f"Bearer {access_token}"},
+                )
+                response.raise_for_status()
+                return response.json().get("mail", "")
         except Exception as e:
             logger.warning(f"Failed to get provider email: {e}")
         return ""
 
 
+# ============================================================================
+# Webhook Dispatch: concurrency caps and circuit breaker
+# ============================================================================
+
+# Circuit breaker states
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+def get_circuit_state(
+    endpoint: WebhookEndpoint,
+    now: Optional[datetime] = None,
+) -> str:
+    """
+    Derive an endpoint's circuit state from its delivery stats.
+
+    WHAT: Open after WEBHOOK_BREAKER_FAILURE_THRESHOLD consecutive
+    failures; half-open once WEBHOOK_BREAKER_COOLDOWN_SECONDS have passed
+    since the last failure; closed again after a successful delivery.
+
+    WHY: Keeping the breaker in the stats that update_stats already
+    maintains means every process (API workers, job workers) sees the same
+    state without another shared store.
+
+    Args:
+        endpoint: Webhook endpoint
+        now: Evaluation time (defaults to utcnow)
+
+    Returns:
+        CIRCUIT_CLOSED, CIRCUIT_OPEN or CIRCUIT_HALF_OPEN
+    """
+    if (endpoint.consecutive_failures or 0) < settings.WEBHOOK_BREAKER_FAILURE_THRESHOLD:
+        return CIRCUIT_CLOSED
+    if endpoint.last_failure_at is None:
+        return CIRCUIT_HALF_OPEN
+
+    now = now or datetime.utcnow()
+    cooldown = timedelta(seconds=settings.WEBHOOK_BREAKER_COOLDOWN_SECONDS)
+    if now - endpoint.last_failure_at >= cooldown:
+        return CIRCUIT_HALF_OPEN
+    return CIRCUIT_OPEN
+
+
+@dataclass
+class _DeliveryOutcome:
+    """Result of one HTTP delivery attempt (or a skipped one)."""
+
+    status_code: Optional[int] = None
+    headers: Optional[Dict[str, str]] = None
+    body: Optional[str] = None
+    duration_ms: int = 0
+    error: Optional[str] = None
+    attempted: bool = True
+
+    @property
+    def delivered(self) -> bool:
+        """2xx responses count as delivered."""
+        return self.status_code is not None and 200 <= self.status_code < 300
+
+
+async def _short_circuited() -> _DeliveryOutcome:
+    """Outcome for a delivery skipped because the circuit is open."""
+    return _DeliveryOutcome(error="Circuit open - endpoint failing", attempted=False)
+
+
+def _held_back() -> _DeliveryOutcome:
+    """Outcome for an outbox delivery queued behind a failed one."""
+    return _DeliveryOutcome(
+        error="Held behind an earlier failed delivery", attempted=False
+    )
+
+
+def _elapsed_ms(start_time: datetime) -> int:
+    """Milliseconds since start_time."""
+    return int((datetime.utcnow() - start_time).total_seconds() * 1000)
+
+
+class WebhookDispatchLimits:
+    """
+    Process-wide caps on concurrent webhook requests.
+
+    WHAT: A global semaphore plus one semaphore per organization.
+
+    WHY: Concurrent fan-out must not let one event (or one busy tenant)
+    open unbounded outbound connections or crowd out other organizations.
+
+    HOW: The org slot is taken before the global one, so requests queued
+    behind their own org's cap don't hold global capacity.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = settings.WEBHOOK_MAX_CONCURRENCY,
+        max_concurrency_per_org: int = settings.WEBHOOK_MAX_CONCURRENCY_PER_ORG,
+    ):
+        """
+        Initialize limits.
+
+        Args:
+            max_concurrency: Concurrent requests across all organizations
+            max_concurrency_per_org: Concurrent requests per organization
+        """
+        self.max_concurrency_per_org = max_concurrency_per_org
+        self._global = asyncio.Semaphore(max_concurrency)
+        # WHY: Weak values - an org's semaphore lives only while in use
+        self._per_org: "weakref.WeakValueDictionary[int, asyncio.Semaphore]" = (
+            weakref.WeakValueDictionary()
+        )
+
+    @asynccontextmanager
+    async def slot(self, org_id: int):
+        """Hold one per-org and one global slot for a request."""
+        org_semaphore = self._per_org.get(org_id)
+        if org_semaphore is None:
+            org_semaphore = asyncio.Semaphore(self.max_concurrency_per_org)
+            self._per_org[org_id] = org_semaphore
+
+        async with org_semaphore:
+            async with self._global:
+                yield
+
+
+# Global dispatch limits instance
+_webhook_dispatch_limits: Optional[WebhookDispatchLimits] = None
+
+
+def get_webhook_dispatch_limits() -> WebhookDispatchLimits:
+    """
+    Get global webhook dispatch limits instance.
+
+    Returns:
+        WebhookDispatchLimits singleton
+    """
+    global _webhook_dispatch_limits
+    if _webhook_dispatch_limits is None:
+        _webhook_dispatch_limits = WebhookDispatchLimits()
+    return _webhook_dispatch_limits
+
+
 # ============================================================================
 # Webhook Service
 # ============================================================================
@@ -672,6 +820,7 @@ class WebhookService:
         self.session = session
         self.endpoint_dao = WebhookEndpointDAO(session)
         self.delivery_dao = WebhookDeliveryDAO(session)
+        self.outbox_dao = WebhookOutboxDAO(session)
 
     async def create_endpoint(
         self,
@@ -698,7 +847,7 @@ class WebhookService:
         # Generate signing secret
         secret = self._generate_secret()
 
-        endpoint = WebhookEndpoint(
+        return await self.endpoint_dao.create(
             org_id=org_id,
             name=data.name,
             description=data.description,
@@ -712,8 +861,6 @@ class WebhookService:
             is_active=True,
         )
 
-        return await self.endpoint_dao.create(endpoint)
-
     async def get_endpoint(
         self,
         endpoint_id: int,
@@ -754,7 +901,7 @@ class WebhookService:
             List of webhook endpoints
         """
         return list(
-            await self.endpoint_dao.get_by_org(org_id, include_inactive=include_inactive)
+            await self.endpoint_dao.get_endpoints_by_org(org_id, include_inactive=include_inactive)
         )
 
     async def update_endpoint(
@@ -832,6 +979,11 @@ class WebhookService:
         WHY: When platform events occur (ticket created, etc.),
         they need to be delivered to all relevant webhooks.
 
+        HOW: Requests go out concurrently (within the global and per-org
+        caps), so one slow subscriber no longer delays the others.
+        Endpoints whose circuit is open are recorded as failed without a
+        request and left for the retry job.
+
         Args:
             org_id: Organization where event occurred
             event_type: Type of event
@@ -861,18 +1013,199 @@ class WebhookService:
             metadata=metadata,
         )
 
-        # Deliver to each endpoint
-        deliveries = []
+        # WHY: The session can't be shared across concurrent tasks, so
+        # database work happens before and after the concurrent HTTP phase
+        prepared = []
         for endpoint in endpoints:
-            delivery = await self._deliver_to_endpoint(endpoint, payload)
-            deliveries.append(delivery)
+            payload_json, headers = self._build_request(endpoint, payload)
+            delivery = await self._create_delivery(endpoint, payload, payload_json, headers)
+            admitted = await self._admit(endpoint)
+            prepared.append((endpoint, delivery, payload_json, headers, admitted))
+
+        outcomes = await asyncio.gather(*[
+            self._send(org_id, endpoint, payload_json, headers)
+            if admitted
+            else _short_circuited()
+            for endpoint, _, payload_json, headers, admitted in prepared
+        ])
+
+        deliveries = []
+        for (endpoint, delivery, _, _, _), outcome in zip(prepared, outcomes):
+            deliveries.append(await self._record_outcome(endpoint, delivery, outcome))
 
         return deliveries
 
+    async def enqueue_event(
+        self,
+        org_id: int,
+        event_type: str,
+        data: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> WebhookOutboxEvent:
+        """
+        Record a webhook event in the outbox.
+
+        WHAT: Inserts an outbox row in the caller's session - no HTTP.
+
+        WHY: The event commits or rolls back together with the change that
+        caused it, and the request never waits on subscribers. The outbox
+        dispatcher delivers it shortly after commit.
+
+        Args:
+            org_id: Organization where event occurred
+            event_type: Type of event
+            data: Event-specific data
+            metadata: Additional metadata
+
+        Returns:
+            Outbox event (its event_id is what receivers see as X-Webhook-ID)
+        """
+        return await self.outbox_dao.create(
+            org_id=org_id,
+            event_type=event_type,
+            event_id=str(uuid.uuid4()),
+            data=data,
+            event_metadata=metadata,
+        )
+
+    async def dispatch_outbox(
+        self,
+        batch_size: int = settings.WEBHOOK_OUTBOX_BATCH_SIZE,
+    ) -> int:
+        """
+        Deliver one batch of outbox events.
+
+        WHAT: Turns pending outbox events into WebhookDelivery records and
+        sends them, preserving event order per endpoint.
+
+        WHY: Moves delivery out of request transactions while keeping the
+        guarantees subscribers rely on: each event reaches each endpoint,
+        and no event overtakes an earlier one on its first delivery.
+
+        HOW:
+        1. Claim pending events in id order and create their delivery
+           records, then mark the events dispatched and commit. Deliveries
+           start with next_retry_at set past the send window, so if this
+           process dies mid-send the retry job picks them up
+        2. Send with no transaction open: endpoints run concurrently, each
+           endpoint's events one after another. After a failure the rest of
+           that endpoint's batch is held back (recorded unattempted and
+           scheduled for retry) rather than sent out of order. An endpoint
+           that still has earlier deliveries waiting (from a previous
+           batch) gets its whole batch held back the same way
+        3. Record outcomes and commit
+
+        Commits the session - call with a dedicated session.
+
+        Args:
+            batch_size: Maximum events to claim
+
+        Returns:
+            Number of events dispatched
+        """
+        events = await self.outbox_dao.claim_pending(batch_size)
+        if not events:
+            return 0
+
+        # Group (endpoint, payload) pairs per endpoint, in event order
+        subscribers: Dict[tuple, List[WebhookEndpoint]] = {}
+        endpoints: Dict[int, WebhookEndpoint] = {}
+        chains: Dict[int, List[WebhookPayload]] = {}
+        for event in events:
+            key = (event.org_id, event.event_type)
+            if key not in subscribers:
+                subscribers[key] = list(
+                    await self.endpoint_dao.get_endpoints_for_event(*key)
+                )
+            payload = WebhookPayload(
+                event_type=event.event_type,
+                event_id=event.event_id,
+                timestamp=event.created_at,
+                org_id=event.org_id,
+                data=event.data,
+                metadata=event.event_metadata,
+            )
+            for endpoint in subscribers[key]:
+                endpoints[endpoint.id] = endpoint
+                chains.setdefault(endpoint.id, []).append(payload)
+
+        created: Dict[int, List[tuple]] = {}
+        for endpoint_id, payloads in chains.items():
+            endpoint = endpoints[endpoint_id]
+            send_window = self._send_window(len(payloads))
+            items = []
+            for payload in payloads:
+                payload_json, headers = self._build_request(endpoint, payload)
+                delivery = await self._create_delivery(
+                    endpoint,
+                    payload,
+                    payload_json,
+                    headers,
+                    next_retry_at=send_window,
+                )
+                items.append((delivery, payload_json, headers))
+            created[endpoint_id] = items
+
+        # WHY: Deliveries older than this batch's belong to earlier events;
+        # while one of them is still waiting, sending now would let later
+        # events overtake it
+        blocked = await self.delivery_dao.get_endpoints_with_pending(
+            list(created),
+            min((items[0][0].id for items in created.values()), default=0),
+        )
+        prepared: Dict[int, tuple] = {}
+        for endpoint_id, items in created.items():
+            if endpoint_id in blocked:
+                prepared[endpoint_id] = (items, True, True)
+            else:
+                prepared[endpoint_id] = (items, await self._admit(endpoints[endpoint_id]))
+
+        await self.outbox_dao.mark_dispatched([event.id for event in events])
+        await self.session.commit()
+
+        await self._send_prepared(endpoints, prepared)
+        return len(events)
+
+    async def _send_in_order(
+        self,
+        endpoint: WebhookEndpoint,
+        items: List[tuple],
+        admitted: bool,
+        held_back: bool = False,
+    ) -> List["_DeliveryOutcome"]:
+        """
+        Send an endpoint's outbox deliveries one at a time.
+
+        Args:
+            endpoint: Target endpoint
+            items: (delivery, payload JSON, headers) in event order
+            admitted: Whether the circuit let this batch through
+            held_back: Whether earlier deliveries to the endpoint are
+                still waiting, so nothing may be sent yet
+
+        Returns:
+            One outcome per item
+        """
+        if held_back:
+            return [_held_back() for _ in items]
+        if not admitted:
+            return [await _short_circuited() for _ in items]
+
+        outcomes: List[_DeliveryOutcome] = []
+        for _, payload_json, headers in items:
+            if outcomes and not outcomes[-1].delivered:
+                outcomes.append(_held_back())
+                continue
+            outcomes.append(
+                await self._send(endpoint.org_id, endpoint, payload_json, headers)
+            )
+        return outcomes
+
     async def _deliver_to_endpoint(
         self,
         endpoint: WebhookEndpoint,
         payload: WebhookPayload,
+        respect_circuit: bool = True,
     ) -> WebhookDelivery:
         """
         Deliver payload to a specific endpoint.
@@ -885,18 +1218,42 @@ class WebhookService:
         Args:
             endpoint: Target endpoint
             payload: Payload to deliver
+            respect_circuit: Skip the request while the endpoint's circuit
+                is open (test deliveries bypass it)
 
         Returns:
             Delivery record
         """
-        # Serialize payload
-        payload_json = payload.model_dump_json()
-        payload_dict = json.loads(payload_json)
+        payload_json, headers = self._build_request(endpoint, payload)
+        delivery = await self._create_delivery(endpoint, payload, payload_json, headers)
+
+        if respect_circuit and not await self._admit(endpoint):
+            outcome = await _short_circuited()
+        else:
+            outcome = await self._send(endpoint.org_id, endpoint, payload_json, headers)
+
+        return await self._record_outcome(endpoint, delivery, outcome)
+
+    def _build_request(
+        self,
+        endpoint: WebhookEndpoint,
+        payload: WebhookPayload,
+        retry_attempt: Optional[int] = None,
+    ) -> tuple[str, Dict[str, str]]:
+        """
+        Serialize, sign and build headers for a delivery.
+
+        Args:
+            endpoint: Target endpoint
+            payload: Payload to deliver
+            retry_attempt: Attempt number for retries
 
-        # Sign payload
+        Returns:
+            (payload JSON, request headers)
+        """
+        payload_json = payload.model_dump_json()
         signature = self._sign_payload(payload_json, endpoint.secret)
 
-        # Prepare headers
         headers = {
             "Content-Type": "application/json",
             "X-Webhook-Signature": signature,
@@ -904,189 +1261,280 @@ class WebhookService:
             "X-Webhook-ID": payload.event_id,
             "User-Agent": "AutomationPlatform-Webhook/1.0",
         }
+        if retry_attempt is not None:
+            headers["X-Webhook-Retry"] = str(retry_attempt)
         if endpoint.headers:
             headers.update(endpoint.headers)
 
-        # Create delivery record
-        delivery = WebhookDelivery(
+        return payload_json, headers
+
+    async def _create_delivery(
+        self,
+        endpoint: WebhookEndpoint,
+        payload: WebhookPayload,
+        payload_json: str,
+        headers: Dict[str, str],
+        next_retry_at: Optional[datetime] = None,
+    ) -> WebhookDelivery:
+        """Create the delivery record for a first attempt."""
+        return await self.delivery_dao.create(
             endpoint_id=endpoint.id,
             event_type=payload.event_type,
             event_id=payload.event_id,
             request_url=endpoint.url,
             request_headers={k: v for k, v in headers.items() if k != "Authorization"},
-            request_body=payload_dict,
+            request_body=json.loads(payload_json),
             delivered=False,
             attempt_count=0,
+            next_retry_at=next_retry_at,
         )
-        delivery = await self.delivery_dao.create(delivery)
 
-        # Attempt delivery
-        start_time = datetime.utcnow()
-        try:
-            async with httpx.AsyncClient(timeout=self.DELIVERY_TIMEOUT) as client:
+    async def _admit(self, endpoint: WebhookEndpoint) -> bool:
+        """
+        Decide whether the endpoint's circuit lets a request through.
+
+        WHAT: Closed circuits always admit; open circuits never do; a
+        half-open circuit admits one probe, claimed atomically.
+
+        Args:
+            endpoint: Target endpoint
+
+        Returns:
+            True if the request should be sent
+        """
+        state = get_circuit_state(endpoint)
+        if state == CIRCUIT_CLOSED:
+            return True
+        if state == CIRCUIT_HALF_OPEN and await self.endpoint_dao.claim_probe(
+            endpoint.id, endpoint.last_failure_at
+        ):
+            logger.info(f"Sending half-open probe to webhook endpoint {endpoint.id}")
+            return True
+        logger.info(f"Circuit open for webhook endpoint {endpoint.id}, skipping request")
+        return False
+
+    async def _send(
+        self,
+        org_id: int,
+        endpoint: WebhookEndpoint,
+        payload_json: str,
+        headers: Dict[str, str],
+    ) -> "_DeliveryOutcome":
+        """
+        POST a signed payload within the global and per-org caps.
+
+        WHY: Pure HTTP - no database access - so many sends can run
+        concurrently for one event.
+
+        Args:
+            org_id: Organization owning the endpoint
+            endpoint: Target endpoint
+            payload_json: Serialized payload
+            headers: Request headers
+
+        Returns:
+            Outcome of the request
+        """
+        async with get_webhook_dispatch_limits().slot(org_id):
+            start_time = datetime.utcnow()
+            try:
+                client = get_http_client("webhooks")
                 response = await client.post(
                     endpoint.url,
                     content=payload_json,
                     headers=headers,
+                    timeout=self.DELIVERY_TIMEOUT,
                 )
-
-                duration_ms = int(
-                    (datetime.utcnow() - start_time).total_seconds() * 1000
+                return _DeliveryOutcome(
+                    status_code=response.status_code,
+                    headers=dict(response.headers),
+                    body=response.text[:10000],
+                    duration_ms=_elapsed_ms(start_time),
                 )
-
-                # Consider 2xx successful
-                delivered = 200 <= response.status_code < 300
-
-                delivery = await self.delivery_dao.record_attempt(
-                    delivery_id=delivery.id,
-                    response_status=response.status_code,
-                    response_headers=dict(response.headers),
-                    response_body=response.text[:10000],
-                    delivered=delivered,
-                    duration_ms=duration_ms,
-                    error_message=None if delivered else f"HTTP {response.status_code}",
+            except httpx.TimeoutException:
+                logger.warning(f"Webhook delivery timeout: {endpoint.url}")
+                return _DeliveryOutcome(
+                    duration_ms=_elapsed_ms(start_time), error="Request timeout"
                 )
+            except Exception as e:
+                logger.error(f"Webhook delivery error: {endpoint.url} - {e}")
+                return _DeliveryOutcome(duration_ms=_elapsed_ms(start_time), error=str(e))
+
+    @staticmethod
+    def _max_attempts(endpoint: WebhookEndpoint) -> int:
+        """Attempts allowed by an endpoint's retry policy (first + retries)."""
+        if not endpoint.retry_enabled:
+            return 1
+        return 1 + endpoint.max_retries
+
+    async def _record_outcome(
+        self,
+        endpoint: WebhookEndpoint,
+        delivery: WebhookDelivery,
+        outcome: "_DeliveryOutcome",
+    ) -> WebhookDelivery:
+        """
+        Store an attempt's result and update endpoint stats.
 
-                # Update endpoint stats
-                await self.endpoint_dao.update_stats(endpoint.id, delivered)
-
-                if not delivered:
-                    logger.warning(
-                        f"Webhook delivery failed: {endpoint.url} "
-                        f"returned {response.status_code}"
-                    )
-
-        except httpx.TimeoutException as e:
-            duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
-            delivery = await self.delivery_dao.record_attempt(
-                delivery_id=delivery.id,
-                response_status=None,
-                response_headers=None,
-                response_body=None,
-                delivered=False,
-                duration_ms=duration_ms,
-                error_message="Request timeout",
-            )
-            await self.endpoint_dao.update_stats(endpoint.id, False)
-            logger.warning(f"Webhook delivery timeout: {endpoint.url}")
+        WHY: Short-circuited attempts are recorded (so the retry job picks
+        them up) but neither use up an attempt nor touch the stats that
+        drive the breaker.
 
-        except Exception as e:
-            duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
-            delivery = await self.delivery_dao.record_attempt(
-                delivery_id=delivery.id,
-                response_status=None,
-                response_headers=None,
-                response_body=None,
-                delivered=False,
-                duration_ms=duration_ms,
-                error_message=str(e),
-            )
-            await self.endpoint_dao.update_stats(endpoint.id, False)
-            logger.error(f"Webhook delivery error: {endpoint.url} - {e}")
+        Args:
+            endpoint: Target endpoint
+            delivery: Delivery record
+            outcome: Result of _send or _short_circuited
+
+        Returns:
+            Updated delivery record
+        """
+        delivered = outcome.delivered
+        error_message = outcome.error
+        if error_message is None and not delivered:
+            error_message = f"HTTP {outcome.status_code}"
+
+        delivery = await self.delivery_dao.record_attempt(
+            delivery_id=delivery.id,
+            response_status=outcome.status_code,
+            response_headers=outcome.headers,
+            response_body=outcome.body,
+            delivered=delivered,
+            duration_ms=outcome.duration_ms,
+            error_message=error_message,
+            max_attempts=self._max_attempts(endpoint),
+            count_attempt=outcome.attempted,
+        )
+
+        if outcome.attempted:
+            await self.endpoint_dao.update_stats(endpoint.id, delivered)
+            if not delivered and outcome.status_code is not None:
+                logger.warning(
+                    f"Webhook delivery failed: {endpoint.url} "
+                    f"returned {outcome.status_code}"
+                )
 
         return delivery
 
-    async def retry_failed_deliveries(self) -> int:
+    async def retry_failed_deliveries(
+        self,
+        batch_size: int = settings.WEBHOOK_RETRY_BATCH_SIZE,
+    ) -> int:
         """
-        Retry failed webhook deliveries.
+        Retry one batch of failed webhook deliveries.
 
-        WHAT: Processes pending retries from all endpoints.
+        WHAT: Claims deliveries whose next_retry_at has passed and sends
+        them again.
 
-        WHY: Background job calls this to handle retries
-        with exponential backoff timing.
+        WHY: Background job (retry_webhook_deliveries) calls this to work
+        through the retry queue in due-time order.
 
-        Returns:
-            Number of retries attempted
-        """
-        pending = await self.delivery_dao.get_pending_retries()
-        count = 0
+        HOW:
+        1. Claim due deliveries (SKIP LOCKED) and push their next_retry_at
+           past the send window, then commit - a crashed runner's claims
+           come due again on their own
+        2. Deliveries whose endpoint is gone, inactive or no longer retries
+           are dropped from the queue
+        3. Send per endpoint in due order (endpoints concurrently), record
+           outcomes - which schedules the next attempt with backoff and
+           jitter, or ends the retries once the endpoint's limit is reached
 
-        for delivery in pending:
-            endpoint = await self.endpoint_dao.get_by_id(delivery.endpoint_id)
-            if not endpoint or not endpoint.is_active:
-                continue
+        Commits the session - call with a dedicated session.
 
-            if not endpoint.retry_enabled:
-                continue
+        Args:
+            batch_size: Maximum deliveries to claim
+
+        Returns:
+            Number of deliveries claimed
+        """
+        claimed = await self.delivery_dao.claim_due_retries(batch_size)
+        if not claimed:
+            return 0
+
+        endpoint_ids = {delivery.endpoint_id for delivery in claimed}
+        endpoints = {
+            endpoint.id: endpoint
+            for endpoint in await self.endpoint_dao.get_by_ids(list(endpoint_ids))
+        }
 
-            if delivery.attempt_count >= endpoint.max_retries:
+        abandoned = []
+        chains: Dict[int, List[WebhookDelivery]] = {}
+        for delivery in claimed:
+            endpoint = endpoints.get(delivery.endpoint_id)
+            if endpoint is None or not endpoint.is_active or not endpoint.retry_enabled:
+                abandoned.append(delivery.id)
                 continue
+            chains.setdefault(endpoint.id, []).append(delivery)
+
+        prepared: Dict[int, tuple] = {}
+        for endpoint_id, deliveries in chains.items():
+            endpoint = endpoints[endpoint_id]
+            send_window = self._send_window(len(deliveries))
+            items = []
+            for delivery in deliveries:
+                # Recreate payload from stored data
+                payload = WebhookPayload(
+                    event_type=delivery.event_type,
+                    event_id=delivery.event_id,
+                    timestamp=delivery.triggered_at,
+                    org_id=endpoint.org_id,
+                    data=delivery.request_body.get("data", {}),
+                    metadata=delivery.request_body.get("metadata"),
+                )
+                payload_json, headers = self._build_request(
+                    endpoint, payload, retry_attempt=delivery.attempt_count
+                )
+                delivery.next_retry_at = send_window
+                items.append((delivery, payload_json, headers))
+            prepared[endpoint_id] = (items, await self._admit(endpoint))
 
-            # Recreate payload from stored data
-            payload = WebhookPayload(
-                event_type=delivery.event_type,
-                event_id=delivery.event_id,
-                timestamp=delivery.triggered_at,
-                org_id=endpoint.org_id,
-                data=delivery.request_body.get("data", {}),
-                metadata=delivery.request_body.get("metadata"),
-            )
+        await self.delivery_dao.abandon_retries(abandoned)
+        await self.session.commit()
 
-            await self._deliver_retry(endpoint, delivery, payload)
-            count += 1
+        await self._send_prepared(endpoints, prepared)
+        return len(claimed)
 
-        return count
+    def _send_window(self, count: int) -> datetime:
+        """
+        Time before which claimed deliveries must not be picked up again.
 
-    async def _deliver_retry(
-        self,
-        endpoint: WebhookEndpoint,
-        delivery: WebhookDelivery,
-        payload: WebhookPayload,
-    ) -> WebhookDelivery:
-        """Retry a failed delivery."""
-        payload_json = payload.model_dump_json()
-        signature = self._sign_payload(payload_json, endpoint.secret)
+        WHY: An endpoint's deliveries are sent one at a time, so the window
+        grows with the number queued for it.
 
-        headers = {
-            "Content-Type": "application/json",
-            "X-Webhook-Signature": signature,
-            "X-Webhook-Event": payload.event_type,
-            "X-Webhook-ID": payload.event_id,
-            "X-Webhook-Retry": str(delivery.attempt_count),
-            "User-Agent": "AutomationPlatform-Webhook/1.0",
-        }
-        if endpoint.headers:
-            headers.update(endpoint.headers)
+        Args:
+            count: Deliveries queued for one endpoint
 
-        start_time = datetime.utcnow()
-        try:
-            async with httpx.AsyncClient(timeout=self.DELIVERY_TIMEOUT) as client:
-                response = await client.post(
-                    endpoint.url,
-                    content=payload_json,
-                    headers=headers,
-                )
+        Returns:
+            Provisional next_retry_at
+        """
+        return datetime.utcnow() + timedelta(seconds=self.DELIVERY_TIMEOUT * (count + 1))
 
-                duration_ms = int(
-                    (datetime.utcnow() - start_time).total_seconds() * 1000
-                )
-                delivered = 200 <= response.status_code < 300
-
-                delivery = await self.delivery_dao.record_attempt(
-                    delivery_id=delivery.id,
-                    response_status=response.status_code,
-                    response_headers=dict(response.headers),
-                    response_body=response.text[:10000],
-                    delivered=delivered,
-                    duration_ms=duration_ms,
-                    error_message=None if delivered else f"HTTP {response.status_code}",
-                )
-                await self.endpoint_dao.update_stats(endpoint.id, delivered)
+    async def _send_prepared(
+        self,
+        endpoints: Dict[int, WebhookEndpoint],
+        prepared: Dict[int, tuple],
+    ) -> None:
+        """
+        Send prepared deliveries and record their outcomes.
 
-        except Exception as e:
-            duration_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
-            delivery = await self.delivery_dao.record_attempt(
-                delivery_id=delivery.id,
-                response_status=None,
-                response_headers=None,
-                response_body=None,
-                delivered=False,
-                duration_ms=duration_ms,
-                error_message=str(e),
-            )
-            await self.endpoint_dao.update_stats(endpoint.id, False)
+        WHAT: Endpoints concurrently, each endpoint's deliveries in order;
+        then outcomes are recorded and committed.
 
-        return delivery
+        Args:
+            endpoints: Endpoints by ID
+            prepared: endpoint ID -> ((delivery, payload JSON, headers) list,
+                circuit admitted[, held back]) - see _send_in_order
+        """
+        endpoint_ids = list(prepared)
+        results = await asyncio.gather(*[
+            self._send_in_order(endpoints[endpoint_id], *prepared[endpoint_id])
+            for endpoint_id in endpoint_ids
+        ])
+
+        for endpoint_id, outcomes in zip(endpoint_ids, results):
+            items = prepared[endpoint_id][0]
+            for (delivery, _, _), outcome in zip(items, outcomes):
+                await self._record_outcome(endpoints[endpoint_id], delivery, outcome)
+        await self.session.commit()
 
     async def test_endpoint(
         self,
@@ -1127,7 +1575,21 @@ class WebhookService:
             metadata={"triggered_by": "test"},
         )
 
-        return await self._deliver_to_endpoint(endpoint, payload)
+        # WHY: A manual test is an explicit probe - it always goes out, and
+        # a success closes the circuit
+        return await self._deliver_to_endpoint(endpoint, payload, respect_circuit=False)
+
+    async def get_retry_queue_stats(self, org_id: int) -> Dict[str, Any]:
+        """
+        Get retry queue depth and lag for an organization.
+
+        Args:
+            org_id: Organization ID
+
+        Returns:
+            Dict with depth, due, oldest_due_at and oldest_due_age_seconds
+        """
+        return await self.delivery_dao.get_retry_queue_stats(org_id=org_id)
 
     async def get_deliveries(
         self,
@@ -1217,10 +1679,10 @@ async def trigger_ticket_created(
     session: AsyncSession,
     org_id: int,
     ticket_data: Dict[str, Any],
-) -> List[WebhookDelivery]:
-    """Helper to trigger ticket.created event."""
+) -> WebhookOutboxEvent:
+    """Helper to queue a ticket.created event in the outbox."""
     service = WebhookService(session)
-    return await service.trigger_event(
+    return await service.enqueue_event(
         org_id=org_id,
         event_type=WebhookEventType.TICKET_CREATED.value,
         data=ticket_data,
@@ -1232,10 +1694,10 @@ async def trigger_ticket_updated(
     org_id: int,
     ticket_data: Dict[str, Any],
     changes: Dict[str, Any],
-) -> List[WebhookDelivery]:
-    """Helper to trigger ticket.updated event."""
+) -> WebhookOutboxEvent:
+    """Helper to queue a ticket.updated event in the outbox."""
     service = WebhookService(session)
-    return await service.trigger_event(
+    return await service.enqueue_event(
         org_id=org_id,
         event_type=WebhookEventType.TICKET_UPDATED.value,
         data=ticket_data,
@@ -1247,10 +1709,10 @@ async def trigger_project_created(
     session: AsyncSession,
     org_id: int,
     project_data: Dict[str, Any],
-) -> List[WebhookDelivery]:
-    """Helper to trigger project.created event."""
+) -> WebhookOutboxEvent:
+    """Helper to queue a project.created event in the outbox."""
     service = WebhookService(session)
-    return await service.trigger_event(
+    return await service.enqueue_event(
         org_id=org_id,
         event_type=WebhookEventType.PROJECT_CREATED.value,
         data=project_data,
@@ -1261,11 +1723,94 @@ async def trigger_invoice_paid(
     session: AsyncSession,
     org_id: int,
     invoice_data: Dict[str, Any],
-) -> List[WebhookDelivery]:
-    """Helper to trigger invoice.paid event."""
+) -> WebhookOutboxEvent:
+    """Helper to queue an invoice.paid event in the outbox."""
     service = WebhookService(session)
-    return await service.trigger_event(
+    return await service.enqueue_event(
         org_id=org_id,
         event_type=WebhookEventType.INVOICE_PAID.value,
         data=invoice_data,
     )
+
+
+# ============================================================================
+# Webhook Outbox Dispatcher
+# ============================================================================
+
+
+async def dispatch_webhook_outbox(
+    batch_size: int = settings.WEBHOOK_OUTBOX_BATCH_SIZE,
+) -> int:
+    """
+    Drain the webhook outbox.
+
+    WHAT: Dispatches batches until the outbox is empty, then purges
+    dispatched events past retention.
+
+    WHY: Scheduled job entry point (leader only, see app.services.scheduler).
+    Runs in its own session, never inside a request.
+
+    Args:
+        batch_size: Events per batch
+
+    Returns:
+        Number of events dispatched
+    """
+    total = 0
+    async with AsyncSessionLocal() as session:
+        service = WebhookService(session)
+        try:
+            while True:
+                dispatched = await service.dispatch_outbox(batch_size)
+                total += dispatched
+                if dispatched < batch_size:
+                    break
+
+            cutoff = datetime.utcnow() - timedelta(
+                hours=settings.WEBHOOK_OUTBOX_RETENTION_HOURS
+            )
+            purged = await service.outbox_dao.purge_dispatched(cutoff)
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            logger.exception("Webhook outbox dispatch failed")
+            raise
+
+    if total or purged:
+        logger.info(f"Webhook outbox: dispatched {total} events, purged {purged}")
+    return total
+
+
+async def retry_webhook_deliveries(
+    batch_size: int = settings.WEBHOOK_RETRY_BATCH_SIZE,
+) -> int:
+    """
+    Work through due webhook retries.
+
+    WHAT: Retries batches until nothing more is due.
+
+    WHY: Scheduled job entry point (leader only, see app.services.scheduler).
+
+    Args:
+        batch_size: Deliveries per batch
+
+    Returns:
+        Number of deliveries retried
+    """
+    total = 0
+    async with AsyncSessionLocal() as session:
+        service = WebhookService(session)
+        try:
+            while True:
+                claimed = await service.retry_failed_deliveries(batch_size)
+                total += claimed
+                if claimed < batch_size:
+                    break
+        except Exception:
+            await session.rollback()
+            logger.exception("Webhook retry run failed")
+            raise
+
+    if total:
+        logger.info(f"Webhook retries: attempted {total} deliveries")
+    return total
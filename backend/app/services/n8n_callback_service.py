@@ -0,0 +1,283 @@
+"""
+N8n Execution Callback Service.
+
+WHAT: Buffers execution-finished callbacks from n8n and writes them to
+execution logs in batches.
+
+WHY: Without callbacks, execution status only arrived through the polling
+sync, up to a sync interval late. Busy n8n instances can report thousands of
+executions per second, far too many for a transaction per callback.
+
+HOW:
+1. The callback endpoint verifies the signature, buffers the event in
+   process and answers immediately (no database access)
+2. A background task flushes every N8N_CALLBACK_FLUSH_INTERVAL_SECONDS, or
+   as soon as N8N_CALLBACK_BATCH_SIZE events are waiting
+3. Each flush resolves the whole batch with one query, then completes the
+   logs and advances last_execution_at with batched UPDATEs in one
+   transaction
+
+Events lost with a crashed process are still picked up by the polling
+sync, which remains the safety net.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import logging
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.dao.execution_log import ExecutionLogDAO
+from app.db.session import AsyncSessionLocal
+from app.models.workflow import ExecutionStatus
+from app.schemas.workflow import N8nWebhookPayload
+from app.services.n8n_sync_service import N8N_FINAL_STATUSES, apply_execution_results
+
+
+logger = logging.getLogger(__name__)
+
+# Header n8n sends the payload HMAC in
+CALLBACK_SIGNATURE_HEADER = "X-N8n-Signature"
+
+
+def n8n_callback_secret(environment_id: int) -> str:
+    """
+    Derive the callback signing secret for an environment.
+
+    WHY: A secret per environment means one customer's n8n instance can't
+    forge callbacks for another's executions. Deriving it (rather than
+    storing it) lets the endpoint verify signatures without a database
+    lookup.
+
+    Args:
+        environment_id: N8n environment ID
+
+    Returns:
+        Hex HMAC secret
+    """
+    return hmac.new(
+        settings.ENCRYPTION_KEY.encode(),
+        f"n8n-callback:{environment_id}".encode(),
+        hashlib.sha256,
+    ).hexdigest()
+
+
+def callback_outcome(payload: N8nWebhookPayload) -> Optional[Dict[str, Any]]:
+    """
+    Translate a callback into a result row (without its log ID).
+
+    Args:
+        payload: Validated callback payload
+
+    Returns:
+        Status, finish time, output and error, or None if the reported
+        status isn't final
+    """
+    status = N8N_FINAL_STATUSES.get(payload.status.lower())
+    if status is None:
+        return None
+
+    finished_at = payload.finished_at or datetime.utcnow()
+    if finished_at.tzinfo is not None:
+        finished_at = finished_at.astimezone(timezone.utc).replace(tzinfo=None)
+
+    error_message = payload.error
+    if status == ExecutionStatus.FAILED and not error_message:
+        error_message = f"n8n execution {payload.status}"
+
+    return {
+        "status": status,
+        "finished_at": finished_at,
+        "output_data": payload.data,
+        "error_message": error_message,
+    }
+
+
+class N8nCallbackBuffer:
+    """
+    In-process buffer of execution callbacks awaiting a batched write.
+
+    WHAT: Collects outcomes keyed by (environment ID, n8n execution ID) and
+    flushes them in batches.
+
+    WHY: See module docstring.
+
+    HOW: A dict keyed by execution keeps repeated callbacks for the same
+    execution down to one row. Unmatched events go back into the buffer
+    for a few more flushes, since a fast execution can report back before
+    the trigger request has committed n8n's execution ID.
+    """
+
+    def __init__(self, session_factory: Optional[Callable[[], AsyncSession]] = None):
+        """
+        Initialize an empty buffer.
+
+        Args:
+            session_factory: Optional factory for creating database sessions.
+                           If not provided, uses the application's session factory.
+        """
+        self._session_factory = session_factory
+        # (environment_id, n8n execution id) -> (outcome, flush attempts)
+        self._pending: Dict[Tuple[int, str], Tuple[Dict[str, Any], int]] = {}
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.completed_total = 0
+        self.dropped_total = 0
+
+    def _get_session(self) -> AsyncSession:
+        """Get a database session for a flush."""
+        if self._session_factory:
+            return self._session_factory()
+        return AsyncSessionLocal()
+
+    def add(self, environment_id: int, payload: N8nWebhookPayload) -> bool:
+        """
+        Buffer a callback.
+
+        Args:
+            environment_id: Environment the callback was signed for
+            payload: Validated callback payload
+
+        Returns:
+            False if the buffer is full (caller should ask n8n to retry)
+        """
+        outcome = callback_outcome(payload)
+        if outcome is None:
+            return True
+
+        key = (environment_id, payload.execution_id)
+        if key not in self._pending and len(self._pending) >= settings.N8N_CALLBACK_MAX_BUFFERED:
+            return False
+
+        self._pending[key] = (outcome, 0)
+        if len(self._pending) >= settings.N8N_CALLBACK_BATCH_SIZE:
+            self._wake.set()
+        return True
+
+    async def flush(self) -> int:
+        """
+        Write one batch of buffered callbacks.
+
+        Returns:
+            Number of execution logs completed
+        """
+        if not self._pending:
+            return 0
+
+        keys = list(self._pending)[: settings.N8N_CALLBACK_BATCH_SIZE]
+        batch = {key: self._pending.pop(key) for key in keys}
+
+        session = self._get_session()
+        try:
+            matches = await ExecutionLogDAO(session).get_running_by_n8n_ids(keys)
+            results: List[Dict[str, Any]] = [
+                {"log_id": matches[key], **outcome}
+                for key, (outcome, _) in batch.items()
+                if key in matches
+            ]
+            completed = await apply_execution_results(session, results)
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            # WHY: Put the batch back (newer callbacks win) for the next flush
+            for key, entry in batch.items():
+                self._pending.setdefault(key, entry)
+            raise
+        finally:
+            await session.close()
+
+        for key, (outcome, attempts) in batch.items():
+            if key in matches:
+                continue
+            if attempts + 1 < settings.N8N_CALLBACK_MATCH_ATTEMPTS:
+                self._pending.setdefault(key, (outcome, attempts + 1))
+            else:
+                # Not ours, already completed, or left to the status sync
+                self.dropped_total += 1
+
+        self.completed_total += completed
+        return completed
+
+    async def _flush_all(self) -> None:
+        """
+        Flush everything currently buffered, one batch at a time.
+
+        WHY: A fixed number of rounds visits each buffered event once;
+        unmatched events are re-queued at the back and wait for the next
+        interval instead of using up their attempts in a tight loop.
+        """
+        batch_size = settings.N8N_CALLBACK_BATCH_SIZE
+        for _ in range(-(-len(self._pending) // batch_size)):
+            await self.flush()
+
+    async def _run(self) -> None:
+        """Flush loop: runs until cancelled."""
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._wake.wait(), timeout=settings.N8N_CALLBACK_FLUSH_INTERVAL_SECONDS
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+            try:
+                await self._flush_all()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"n8n callback flush failed, will retry: {e}")
+
+    async def start(self) -> None:
+        """Start the background flush task (app startup)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush task and write what is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        try:
+            await self._flush_all()
+        except Exception as e:
+            logger.warning(f"n8n callback flush on shutdown failed: {e}")
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get buffer status for health checks.
+
+        Returns:
+            Dict with buffered, completed and dropped counts
+        """
+        return {
+            "buffered": len(self._pending),
+            "completed_total": self.completed_total,
+            "dropped_total": self.dropped_total,
+        }
+
+
+# Global callback buffer instance
+_n8n_callback_buffer: Optional[N8nCallbackBuffer] = None
+
+
+def get_n8n_callback_buffer() -> N8nCallbackBuffer:
+    """
+    Get global n8n callback buffer instance.
+
+    Returns:
+        N8nCallbackBuffer singleton
+    """
+    global _n8n_callback_buffer
+    if _n8n_callback_buffer is None:
+        _n8n_callback_buffer = N8nCallbackBuffer()
+    return _n8n_callback_buffer
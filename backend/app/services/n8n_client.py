@@ -16,20 +16,28 @@ Security Considerations (OWASP):
 
 HOW: Uses httpx for async HTTP with proper timeout handling.
 All API errors wrapped in N8nError for consistent handling.
+Clients for stored environments come from a per-environment cache
+(get_n8n_client), so URL validation and key decryption happen once per
+environment version rather than once per call.
 """
 
 import hashlib
 import hmac
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-from urllib.parse import urljoin, urlparse
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from urllib.parse import quote, urljoin, urlparse
 
 import httpx
 
 from app.core.config import settings
-from app.core.exceptions import N8nError, ValidationError
+from app.core.exceptions import EncryptionError, N8nError, ValidationError
+from app.core.http_client import get_http_client
 from app.services.encryption_service import get_encryption_service
 
+if TYPE_CHECKING:
+    from app.models.workflow import N8nEnvironment
+
 
 # ============================================================================
 # Constants
@@ -47,6 +55,9 @@ ALLOWED_SCHEMES = {"http", "https"}
 # Allowed ports for n8n connections
 ALLOWED_PORTS = {80, 443, 5678}  # 5678 is default n8n port
 
+# Upper bound on cached environment clients per process
+_CLIENT_CACHE_MAX_ENTRIES = 1000
+
 
 # ============================================================================
 # N8n API Client
@@ -98,6 +109,7 @@ class N8nClient:
         self._api_key_encrypted = api_key_encrypted
         self._timeout = timeout
         self._encryption_service = get_encryption_service()
+        self._headers: Optional[Dict[str, str]] = None
 
     def _validate_base_url(self, url: str) -> None:
         """
@@ -179,16 +191,20 @@ class N8nClient:
 
         WHAT: Constructs authentication headers.
 
-        WHY: n8n uses Bearer token authentication.
+        WHY: n8n uses Bearer token authentication. Built once per client:
+        a cached environment client would otherwise Fernet-decrypt the key
+        on every request.
 
         Returns:
             Dictionary of HTTP headers
         """
-        return {
-            "Authorization": f"Bearer {self._get_api_key()}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        if self._headers is None:
+            self._headers = {
+                "Authorization": f"Bearer {self._get_api_key()}",
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+            }
+        return self._headers
 
     async def _request(
         self,
@@ -231,32 +247,32 @@ class N8nClient:
         request_timeout = timeout or self._timeout
 
         try:
-            async with httpx.AsyncClient(
+            # WHY: Shared pooled client reuses warm connections; it never
+            # follows redirects, preventing redirect-based SSRF
+            client = get_http_client("n8n")
+            response = await client.request(
+                method=method,
+                url=url,
+                headers=self._get_headers(),
+                json=data,
                 timeout=request_timeout,
-                follow_redirects=False,  # Prevent redirect-based SSRF
-            ) as client:
-                response = await client.request(
+            )
+
+            # Check for error status codes
+            if response.status_code >= 400:
+                error_detail = self._parse_error_response(response)
+                raise N8nError(
+                    message=f"n8n API error: {error_detail}",
+                    status_code=response.status_code,
+                    endpoint=endpoint,
                     method=method,
-                    url=url,
-                    headers=self._get_headers(),
-                    json=data,
                 )
 
-                # Check for error status codes
-                if response.status_code >= 400:
-                    error_detail = self._parse_error_response(response)
-                    raise N8nError(
-                        message=f"n8n API error: {error_detail}",
-                        status_code=response.status_code,
-                        endpoint=endpoint,
-                        method=method,
-                    )
+            # Return empty dict for 204 No Content
+            if response.status_code == 204:
+                return {}
 
-                # Return empty dict for 204 No Content
-                if response.status_code == 204:
-                    return {}
-
-                return response.json()
+            return response.json()
 
         except httpx.TimeoutException:
             raise N8nError(
@@ -490,21 +506,23 @@ class N8nClient:
         workflow_id: Optional[str] = None,
         limit: int = 20,
         cursor: Optional[str] = None,
+        include_data: bool = False,
     ) -> Dict[str, Any]:
         """
         List workflow executions.
 
-        WHAT: Retrieves execution history.
+        WHAT: Retrieves execution history, newest first.
 
-        WHY: Needed for execution log display and monitoring.
+        WHY: Needed for execution log display, monitoring and status sync.
 
         Args:
             workflow_id: Filter by specific workflow (optional)
             limit: Maximum number of results
-            cursor: Pagination cursor
+            cursor: Pagination cursor (nextCursor of the previous page)
+            include_data: Include each execution's run data (large)
 
         Returns:
-            List of executions with pagination info
+            List of executions ("data") and "nextCursor"
         """
         endpoint = "/api/v1/executions"
         params = []
@@ -513,7 +531,9 @@ class N8nClient:
         if limit:
             params.append(f"limit={limit}")
         if cursor:
-            params.append(f"cursor={cursor}")
+            params.append(f"cursor={quote(cursor, safe='')}")
+        if include_data:
+            params.append("includeData=true")
 
         if params:
             endpoint += "?" + "&".join(params)
@@ -572,6 +592,10 @@ class N8nClient:
             return True
         except N8nError:
             return False
+        except EncryptionError:
+            # WHY: A key that no longer decrypts (e.g. after key rotation)
+            # makes the environment unhealthy, not the health check fail
+            return False
 
 
 # ============================================================================
@@ -644,3 +668,127 @@ def create_n8n_client(
         api_key_encrypted=api_key_encrypted,
         timeout=timeout,
     )
+
+
+# ============================================================================
+# Per-Environment Client Cache
+# ============================================================================
+
+
+class N8nClientCache:
+    """
+    Process-local cache of clients for stored n8n environments.
+
+    WHAT: Maps environment ID to a ready N8nClient holding the validated
+    base URL and the decrypted API key.
+
+    WHY: Execution triggers arrive in bursts, and each call used to build a
+    new client, re-validate the URL and Fernet-decrypt the key. Connection
+    reuse (and with it, DNS and TLS) already comes from the shared "n8n"
+    HTTP client that every N8nClient sends through.
+
+    HOW: Entries are keyed by the environment's updated_at together with
+    its URL and encrypted key. Any edit changes the key, so other worker
+    processes pick up new credentials on their next lookup. The worker
+    that made the edit also drops its entry through invalidate(). Beyond
+    max_entries the least recently used environment is dropped.
+    """
+
+    def __init__(self, max_entries: int = _CLIENT_CACHE_MAX_ENTRIES):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum cached environments
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, Tuple[Tuple[Any, ...], N8nClient]]" = OrderedDict()
+
+    def get(self, environment: "N8nEnvironment") -> N8nClient:
+        """
+        Get the client for an environment, building it on a miss.
+
+        Args:
+            environment: Loaded N8nEnvironment
+
+        Returns:
+            Cached N8nClient for the environment's current configuration
+
+        Raises:
+            ValidationError: If the environment's base URL is not allowed
+        """
+        version = (
+            environment.updated_at,
+            environment.base_url,
+            environment.api_key_encrypted,
+        )
+        entry = self._entries.get(environment.id)
+        if entry is not None and entry[0] == version:
+            self._entries.move_to_end(environment.id)
+            return entry[1]
+
+        # WHY: The key is decrypted on the client's first request (once,
+        # see _get_headers), where callers already handle n8n failures
+        client = N8nClient(
+            base_url=environment.base_url,
+            api_key_encrypted=environment.api_key_encrypted,
+        )
+
+        self._entries[environment.id] = (version, client)
+        self._entries.move_to_end(environment.id)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return client
+
+    def invalidate(self, environment_id: int) -> None:
+        """
+        Drop an environment's cached client.
+
+        WHY: Called when an environment is updated or deleted, so the old
+        decrypted key doesn't stay in memory.
+
+        Args:
+            environment_id: Environment ID
+        """
+        self._entries.pop(environment_id, None)
+
+    def clear(self) -> None:
+        """Drop every cached client (tests and shutdown)."""
+        self._entries.clear()
+
+
+# Global client cache instance
+_n8n_client_cache: Optional[N8nClientCache] = None
+
+
+def get_n8n_client_cache() -> N8nClientCache:
+    """
+    Get global n8n client cache instance.
+
+    Returns:
+        N8nClientCache singleton
+    """
+    global _n8n_client_cache
+    if _n8n_client_cache is None:
+        _n8n_client_cache = N8nClientCache()
+    return _n8n_client_cache
+
+
+def get_n8n_client(environment: "N8nEnvironment") -> N8nClient:
+    """
+    Get the cached client for a stored n8n environment.
+
+    Usage:
+        client = get_n8n_client(env)
+        await client.trigger_workflow(workflow_id, input_data)
+
+    Args:
+        environment: Loaded N8nEnvironment
+
+    Returns:
+        N8nClient for the environment
+
+    Raises:
+        ValidationError: If the environment's base URL is not allowed
+    """
+    return get_n8n_client_cache().get(environment)
@@ -0,0 +1,386 @@
+"""
+N8n Execution Status Sync Service.
+
+WHAT: Background service that reconciles RUNNING execution logs with the
+executions n8n reports.
+
+WHY: trigger_execution creates an ExecutionLog and hands the run to n8n;
+nothing told us when it finished, so dashboards accumulated thousands of
+stale RUNNING rows.
+
+HOW: Runs every N8N_SYNC_INTERVAL_SECONDS (scheduler leader only):
+1. One query collects every running execution, grouped by environment
+2. Environments sync concurrently. Each pages through n8n's execution
+   list (newest first) only until it has passed its oldest running
+   execution, spacing requests to N8N_SYNC_REQUESTS_PER_SECOND
+3. Executions still running but absent from the list are looked up one
+   by one (bounded); ones n8n no longer has are marked failed
+4. All finished executions are written back in bulk updates
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.exceptions import N8nError
+from app.core.request_spacer import RequestSpacer
+from app.dao.execution_log import ExecutionLogDAO
+from app.dao.n8n_environment import N8nEnvironmentDAO
+from app.dao.workflow_instance import WorkflowInstanceDAO
+from app.db.session import AsyncSessionLocal
+from app.models.workflow import ExecutionStatus, N8nEnvironment
+from app.services.n8n_client import N8nClient, get_n8n_client
+
+
+logger = logging.getLogger(__name__)
+
+
+# n8n execution status -> final ExecutionStatus (unlisted statuses such as
+# "running", "waiting" and "new" mean the execution hasn't finished)
+N8N_FINAL_STATUSES = {
+    "success": ExecutionStatus.SUCCESS,
+    "error": ExecutionStatus.FAILED,
+    "crashed": ExecutionStatus.FAILED,
+    "failed": ExecutionStatus.FAILED,
+    "canceled": ExecutionStatus.CANCELLED,
+    "cancelled": ExecutionStatus.CANCELLED,
+}
+
+
+def _parse_n8n_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse an n8n ISO timestamp into naive UTC (as stored in our tables)."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _numeric_id(execution_id: str) -> Optional[int]:
+    """n8n execution IDs are increasing integers; None if this one isn't."""
+    return int(execution_id) if execution_id.isdigit() else None
+
+
+def execution_result(log_id: int, execution: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Translate an n8n execution into an ExecutionLogDAO.complete_executions row.
+
+    WHAT: Maps status, stop time, output and error of a finished execution.
+
+    WHY: Shared by the polling sync and pushed execution callbacks so both
+    record executions identically.
+
+    Args:
+        log_id: Execution log to complete
+        execution: Execution object from the n8n API (data optional)
+
+    Returns:
+        Result row, or None while the execution is still running
+    """
+    status = N8N_FINAL_STATUSES.get(str(execution.get("status") or "").lower())
+    if status is None:
+        # WHY: Older n8n versions report only "finished"/"stoppedAt"
+        if execution.get("finished"):
+            status = ExecutionStatus.SUCCESS
+        elif execution.get("stoppedAt"):
+            status = ExecutionStatus.FAILED
+        else:
+            return None
+
+    result_data = (execution.get("data") or {}).get("resultData") or {}
+    error = result_data.get("error") or {}
+    error_message = error.get("message") if isinstance(error, dict) else None
+    if status == ExecutionStatus.FAILED and not error_message:
+        error_message = f"n8n execution {execution.get('status') or 'failed'}"
+
+    output_data = None
+    last_node = result_data.get("lastNodeExecuted")
+    if last_node:
+        try:
+            items = result_data["runData"][last_node][-1]["data"]["main"][0]
+            output_data = {
+                "last_node": last_node,
+                "items": [item.get("json") for item in items or []],
+            }
+        except (KeyError, IndexError, TypeError):
+            output_data = {"last_node": last_node}
+
+    return {
+        "log_id": log_id,
+        "status": status,
+        "finished_at": _parse_n8n_time(execution.get("stoppedAt")) or datetime.utcnow(),
+        "output_data": output_data,
+        "error_message": error_message,
+    }
+
+
+async def apply_execution_results(
+    session: AsyncSession, results: List[Dict[str, Any]]
+) -> int:
+    """
+    Write finished executions and their instances' last_execution_at.
+
+    WHAT: Bulk-completes execution logs, then advances each affected
+    workflow instance's last_execution_at.
+
+    WHY: Shared by the polling sync and execution callbacks; either may
+    report an execution first, and only the first write takes effect.
+
+    Args:
+        session: Database session (caller commits)
+        results: Result rows from execution_result()
+
+    Returns:
+        Number of execution logs completed
+    """
+    completed = await ExecutionLogDAO(session).complete_executions(results)
+    if not completed:
+        return 0
+
+    executed_at: Dict[int, datetime] = {}
+    for item in results:
+        instance_id = completed.get(item["log_id"])
+        if instance_id is None:
+            continue
+        current = executed_at.get(instance_id)
+        if current is None or item["finished_at"] > current:
+            executed_at[instance_id] = item["finished_at"]
+
+    await WorkflowInstanceDAO(session).record_executions(executed_at)
+    return len(completed)
+
+
+class N8nExecutionSyncService:
+    """
+    Background service for n8n execution status sync.
+
+    WHAT: Completes RUNNING execution logs from n8n's execution history.
+
+    WHY: See module docstring.
+
+    HOW: Database work happens before and after the concurrent HTTP phase,
+    so one session serves the whole run. When an environment runs out of
+    page budget before reaching its oldest running execution, the next run
+    resumes from the saved cursor instead of rescanning the newest pages.
+
+    Example:
+        service = get_n8n_sync_service()
+        await service.sync_all_executions()
+    """
+
+    def __init__(self, session_factory: Optional[Callable[[], AsyncSession]] = None):
+        """
+        Initialize sync service.
+
+        Args:
+            session_factory: Optional factory for creating database sessions.
+                           If not provided, uses the application's session factory.
+        """
+        self._session_factory = session_factory
+        self._spacers: Dict[int, RequestSpacer] = {}
+        self._resume_cursors: Dict[int, str] = {}
+
+    def _get_session(self) -> AsyncSession:
+        """Get a database session for the job."""
+        if self._session_factory:
+            return self._session_factory()
+        return AsyncSessionLocal()
+
+    def _spacer(self, environment_id: int) -> RequestSpacer:
+        """Get the request spacer for an environment."""
+        spacer = self._spacers.get(environment_id)
+        if spacer is None:
+            spacer = RequestSpacer(settings.N8N_SYNC_REQUESTS_PER_SECOND)
+            self._spacers[environment_id] = spacer
+        return spacer
+
+    async def sync_all_executions(self) -> Dict[str, int]:
+        """
+        Main job function: reconcile all running executions.
+
+        Returns:
+            Dict with environments synced, running executions checked,
+            executions completed and environments that failed
+        """
+        stats = {"environments": 0, "checked": 0, "completed": 0, "errors": 0}
+
+        session = self._get_session()
+        try:
+            running = await ExecutionLogDAO(session).get_running_by_environment()
+            if not running:
+                return stats
+
+            environments = await N8nEnvironmentDAO(session).get_active_by_ids(list(running))
+            # WHY: Release the connection while waiting on n8n
+            await session.commit()
+
+            semaphore = asyncio.Semaphore(settings.N8N_SYNC_MAX_CONCURRENT_ENVIRONMENTS)
+
+            async def sync_one(environment: N8nEnvironment):
+                async with semaphore:
+                    return await self._sync_environment(
+                        environment.id,
+                        get_n8n_client(environment),
+                        running[environment.id],
+                    )
+
+            outcomes = await asyncio.gather(
+                *[sync_one(environment) for environment in environments],
+                return_exceptions=True,
+            )
+
+            results: List[Dict[str, Any]] = []
+            for environment, outcome in zip(environments, outcomes):
+                stats["environments"] += 1
+                stats["checked"] += len(running[environment.id])
+                if isinstance(outcome, BaseException):
+                    stats["errors"] += 1
+                    logger.warning(
+                        f"n8n execution sync failed for environment {environment.id}: {outcome}"
+                    )
+                    continue
+                results.extend(outcome)
+
+            stats["completed"] = await apply_execution_results(session, results)
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+        if stats["completed"] or stats["errors"]:
+            logger.info(f"n8n execution sync: {stats}")
+        return stats
+
+    async def _sync_environment(
+        self,
+        environment_id: int,
+        client: N8nClient,
+        running: Dict[str, int],
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the finished executions among one environment's running ones.
+
+        WHAT: Pages the execution list, then looks up stragglers.
+
+        WHY: No database access, so environments can run concurrently.
+
+        Args:
+            environment_id: Environment ID
+            client: API client for the environment
+            running: {n8n execution ID: log ID} still running on our side
+
+        Returns:
+            Result rows for ExecutionLogDAO.complete_executions
+        """
+        spacer = self._spacer(environment_id)
+        remaining = dict(running)
+        results: List[Dict[str, Any]] = []
+
+        # WHY: Once the list has gone below the oldest running ID, every
+        # remaining execution should have appeared already
+        numeric_ids = [n for n in map(_numeric_id, remaining) if n is not None]
+        oldest = min(numeric_ids) if numeric_ids else None
+
+        cursor = self._resume_cursors.pop(environment_id, None)
+        lowest_seen: Optional[int] = None
+        exhausted = False
+        for _ in range(settings.N8N_SYNC_MAX_PAGES):
+            await spacer.wait()
+            page = await client.get_executions(
+                limit=settings.N8N_SYNC_PAGE_SIZE,
+                cursor=cursor,
+                include_data=settings.N8N_SYNC_INCLUDE_DATA,
+            )
+            for execution in page.get("data") or []:
+                execution_id = str(execution.get("id"))
+                numeric = _numeric_id(execution_id)
+                if numeric is not None:
+                    lowest_seen = numeric if lowest_seen is None else min(lowest_seen, numeric)
+                log_id = remaining.pop(execution_id, None)
+                if log_id is None:
+                    continue
+                result = execution_result(log_id, execution)
+                if result is not None:
+                    results.append(result)
+
+            cursor = page.get("nextCursor")
+            if not cursor:
+                exhausted = True
+                break
+            if not remaining or (
+                oldest is not None and lowest_seen is not None and lowest_seen < oldest
+            ):
+                break
+        else:
+            if remaining:
+                self._resume_cursors[environment_id] = cursor
+
+        # Executions the list skipped (some n8n versions omit running ones,
+        # and pruned history is gone): ask for each directly
+        passed = [
+            (execution_id, log_id)
+            for execution_id, log_id in remaining.items()
+            if exhausted or (
+                lowest_seen is not None
+                and _numeric_id(execution_id) is not None
+                and _numeric_id(execution_id) > lowest_seen
+            )
+        ]
+        for execution_id, log_id in passed[: settings.N8N_SYNC_MAX_LOOKUPS]:
+            result = await self._lookup(spacer, client, execution_id, log_id)
+            if result is not None:
+                results.append(result)
+
+        return results
+
+    async def _lookup(
+        self,
+        spacer: RequestSpacer,
+        client: N8nClient,
+        execution_id: str,
+        log_id: int,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Fetch one execution that the list didn't return.
+
+        Returns:
+            Result row, a FAILED row if n8n no longer has the execution,
+            or None if it is still running or the lookup failed
+        """
+        await spacer.wait()
+        try:
+            execution = await client.get_execution(execution_id)
+        except N8nError as e:
+            if e.status_code == 404:
+                return {
+                    "log_id": log_id,
+                    "status": ExecutionStatus.FAILED,
+                    "finished_at": datetime.utcnow(),
+                    "output_data": None,
+                    "error_message": "Execution no longer exists in n8n",
+                }
+            logger.debug(f"n8n execution lookup failed for {execution_id}: {e}")
+            return None
+        return execution_result(log_id, execution)
+
+
+# Global service instance
+_n8n_sync_service: Optional[N8nExecutionSyncService] = None
+
+
+def get_n8n_sync_service() -> N8nExecutionSyncService:
+    """Get or create n8n execution sync service instance."""
+    global _n8n_sync_service
+    if _n8n_sync_service is None:
+        _n8n_sync_service = N8nExecutionSyncService()
+    return _n8n_sync_service
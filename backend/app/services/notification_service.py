@@ -8,12 +8,12 @@ WHY: Centralizes notification logic to ensure consistent messaging and
 easy addition of new notification channels.
 
 HOW: Event-specific methods format data and delegate to channel services
-(SlackService, future EmailService). Uses fire-and-forget pattern to
-avoid blocking main operations.
+(SlackService, future EmailService). Slack messages are handed to the
+SlackDispatcher queue, so callers never wait on Slack.
 """
 
 import logging
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from app.core.config import settings
 from app.models.ticket import Ticket, TicketComment
@@ -25,6 +25,7 @@ from app.services.slack_service import (
     build_payment_received_message,
     build_proposal_status_message,
 )
+from app.services.slack_dispatcher import SlackDispatcher, get_slack_dispatcher
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +44,7 @@ class NotificationService:
 
     Attributes:
         slack_service: Service for Slack webhook notifications
+        dispatcher: Queue Slack messages are handed to (None sends inline)
         base_url: Base URL for generating action links
     """
 
@@ -50,6 +52,7 @@ class NotificationService:
         self,
         slack_service: Optional[SlackService] = None,
         base_url: Optional[str] = None,
+        dispatcher: Optional[SlackDispatcher] = None,
     ):
         """
         Initialize NotificationService.
@@ -62,10 +65,35 @@ class NotificationService:
         Args:
             slack_service: SlackService instance (defaults to new instance)
             base_url: Base URL for action links (defaults to settings)
+            dispatcher: SlackDispatcher to queue messages on (defaults to
+                       the global dispatcher, unless slack_service is
+                       injected, in which case messages are sent inline)
         """
+        if dispatcher is None and slack_service is None:
+            dispatcher = get_slack_dispatcher()
         self.slack_service = slack_service or SlackService()
+        self.dispatcher = dispatcher
         self.base_url = base_url or settings.FRONTEND_URL
 
+    async def _send(
+        self,
+        text: str,
+        blocks: Optional[List[Dict[str, Any]]] = None,
+    ) -> bool:
+        """
+        Send a Slack message through the dispatcher, or inline without one.
+
+        Args:
+            text: Plain text message
+            blocks: Optional Block Kit blocks
+
+        Returns:
+            True if the message was queued (or sent)
+        """
+        if self.dispatcher is not None:
+            return self.dispatcher.enqueue(text, blocks)
+        return await self.slack_service.send_message_safe(text, blocks)
+
     def _build_ticket_url(self, ticket_id: int) -> str:
         """
         Build URL to ticket detail page.
@@ -125,7 +153,7 @@ class NotificationService:
             created_by_name: Name of user who created the ticket
 
         Returns:
-            True if notification was sent successfully
+            True if notification was queued (or sent)
         """
         logger.info(f"Sending ticket created notification for ticket #{ticket.id}")
 
@@ -139,7 +167,7 @@ class NotificationService:
             ticket_url=self._build_ticket_url(ticket.id),
         )
 
-        return await self.slack_service.send_message_safe(text, blocks)
+        return await self._send(text, blocks)
 
     async def notify_sla_warning(
         self,
@@ -162,7 +190,7 @@ class NotificationService:
             assigned_to_name: Name of assigned user (if any)
 
         Returns:
-            True if notification was sent successfully
+            True if notification was queued (or sent)
         """
         logger.info(
             f"Sending SLA warning notification for ticket #{ticket.id} ({sla_type})"
@@ -178,7 +206,7 @@ class NotificationService:
             ticket_url=self._build_ticket_url(ticket.id),
         )
 
-        return await self.slack_service.send_message_safe(text, blocks)
+        return await self._send(text, blocks)
 
     async def notify_sla_breach(
         self,
@@ -199,7 +227,7 @@ class NotificationService:
             assigned_to_name: Name of assigned user (if any)
 
         Returns:
-            True if notification was sent successfully
+            True if notification was queued (or sent)
         """
         logger.warning(
             f"Sending SLA breach notification for ticket #{ticket.id} ({sla_type})"
@@ -214,7 +242,7 @@ class NotificationService:
             ticket_url=self._build_ticket_url(ticket.id),
         )
 
-        return await self.slack_service.send_message_safe(text, blocks)
+        return await self._send(text, blocks)
 
     async def notify_ticket_assigned(
         self,
@@ -235,7 +263,7 @@ class NotificationService:
             assigned_by_name: Name of user who made the assignment
 
         Returns:
-            True if notification was sent successfully
+            True if notification was queued (or sent)
         """
         logger.info(
             f"Sending ticket assignment notification for ticket #{ticket.id}"
@@ -275,7 +303,7 @@ class NotificationService:
             },
         ]
 
-        return await self.slack_service.send_message_safe(text, blocks)
+        return await self._send(text, blocks)
 
     async def notify_comment_added(
         self,
@@ -298,7 +326,7 @@ class NotificationService:
             is_internal: Whether this is an internal note
 
         Returns:
-            True if notification was sent successfully
+            True if notification was queued (or sent)
         """
         # Don't notify for internal notes to avoid spam
         if is_internal:
@@ -344,7 +372,7 @@ class NotificationService:
             },
         ]
 
-        return await self.slack_service.send_message_safe(text, blocks)
+        return await self._send(text, blocks)
 
     # =========================================================================
     # Payment Notifications
@@ -373,7 +401,7 @@ class NotificationService:
             payment_method: Payment method used
 
         Returns:
-            True if notification was sent successfully
+            True if notification was queued (or sent)
         """
         logger.info(f"Sending payment notification for invoice #{invoice_id}")
 
@@ -386,7 +414,7 @@ class NotificationService:
             invoice_url=self._build_invoice_url(invoice_id),
         )
 
-        return await self.slack_service.send_message_safe(text, blocks)
+        return await self._send(text, blocks)
 
     # =========================================================================
     # Proposal Notifications
@@ -413,7 +441,7 @@ class NotificationService:
             total_amount: Proposal total
 
         Returns:
-            True if notification was sent successfully
+            True if notification was queued (or sent)
         """
         logger.info(f"Sending proposal sent notification for proposal #{proposal_id}")
 
@@ -426,7 +454,7 @@ class NotificationService:
             proposal_url=self._build_proposal_url(proposal_id),
         )
 
-        return await self.slack_service.send_message_safe(text, blocks)
+        return await self._send(text, blocks)
 
     async def notify_proposal_approved(
         self,
@@ -449,7 +477,7 @@ class NotificationService:
             total_amount: Proposal total
 
         Returns:
-            True if notification was sent successfully
+            True if notification was queued (or sent)
         """
         logger.info(f"Sending proposal approved notification for proposal #{proposal_id}")
 
@@ -462,7 +490,7 @@ class NotificationService:
             proposal_url=self._build_proposal_url(proposal_id),
         )
 
-        return await self.slack_service.send_message_safe(text, blocks)
+        return await self._send(text, blocks)
 
     async def notify_proposal_rejected(
         self,
@@ -485,7 +513,7 @@ class NotificationService:
             total_amount: Proposal total
 
         Returns:
-            True if notification was sent successfully
+            True if notification was queued (or sent)
         """
         logger.info(f"Sending proposal rejected notification for proposal #{proposal_id}")
 
@@ -498,7 +526,7 @@ class NotificationService:
             proposal_url=self._build_proposal_url(proposal_id),
         )
 
-        return await self.slack_service.send_message_safe(text, blocks)
+        return await self._send(text, blocks)
 
     # =========================================================================
     # Organization Notifications
@@ -523,7 +551,7 @@ class NotificationService:
             plan_name: Subscription plan (if applicable)
 
         Returns:
-            True if notification was sent successfully
+            True if notification was queued (or sent)
         """
         logger.info(f"Sending new client notification for {org_name}")
 
@@ -544,4 +572,4 @@ class NotificationService:
             {"type": "section", "fields": fields},
         ]
 
-        return await self.slack_service.send_message_safe(text, blocks)
+        return await self._send(text, blocks)
@@ -30,7 +30,9 @@ import httpx
 import redis.asyncio as aioredis
 
 from app.core.config import settings
-from app.core.auth import create_access_token, get_redis
+from app.core.auth import create_access_token
+from app.core.redis_manager import get_redis_client
+from app.core.http_client import get_http_client
 from app.core.exceptions import (
     OAuthError,
     OAuthProviderError,
@@ -241,34 +243,34 @@ class OAuthService:
         Raises:
             OAuthTokenError: If exchange fails
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(
-                    GOOGLE_TOKEN_URL,
-                    data={
-                        "client_id": settings.GOOGLE_OAUTH_CLIENT_ID,
-                        "client_secret": settings.GOOGLE_OAUTH_CLIENT_SECRET,
-                        "code": code,
-                        "grant_type": "authorization_code",
-                        "redirect_uri": settings.GOOGLE_OAUTH_REDIRECT_URI,
-                    },
-                )
-
-                if response.status_code != 200:
-                    error_data = response.json() if response.content else {}
-                    raise OAuthTokenError(
-                        message="Failed to exchange authorization code",
-                        error=error_data.get("error_description", "Unknown error"),
-                    )
-
-                return response.json()
+        client = get_http_client("oauth")
+        try:
+            response = await client.post(
+                GOOGLE_TOKEN_URL,
+                data={
+                    "client_id": settings.GOOGLE_OAUTH_CLIENT_ID,
+                    "client_secret": settings.GOOGLE_OAUTH_CLIENT_SECRET,
+                    "code": code,
+                    "grant_type": "authorization_code",
+                    "redirect_uri": settings.GOOGLE_OAUTH_REDIRECT_URI,
+                },
+            )
 
-            except httpx.RequestError as e:
+            if response.status_code != 200:
+                error_data = response.json() if response.content else {}
                 raise OAuthTokenError(
-                    message="Failed to connect to Google OAuth",
-                    error=str(e),
+                    message="Failed to exchange authorization code",
+                    error=error_data.get("error_description", "Unknown error"),
                 )
 
+            return response.json()
+
+        except httpx.RequestError as e:
+            raise OAuthTokenError(
+                message="Failed to connect to Google OAuth",
+                error=str(e),
+            )
+
     async def _fetch_google_user_info(self, access_token: str) -> dict:
         """
         Fetch user info from Google using access token.
@@ -285,26 +287,26 @@ class OAuthService:
         Raises:
             OAuthProviderError: If fetch fails
         """
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(
-                    GOOGLE_USERINFO_URL,
-                    headers={"Authorization": f"Bearer {access_token}"},
-                )
-
-                if response.status_code != 200:
-                    raise OAuthProviderError(
-                        message="Failed to fetch user info from Google",
-                    )
-
-                return response.json()
+        client = get_http_client("oauth")
+        try:
+            response = await client.get(
+                GOOGLE_USERINFO_URL,
+                headers={"Authorization": f"Bearer {access_token}"},
+            )
 
-            except httpx.RequestError as e:
+            if response.status_code != 200:
                 raise OAuthProviderError(
-                    message="Failed to connect to Google",
-                    error=str(e),
+                    message="Failed to fetch user info from Google",
                 )
 
+            return response.json()
+
+        except httpx.RequestError as e:
+            raise OAuthProviderError(
+                message="Failed to connect to Google",
+                error=str(e),
+            )
+
     async def _login_or_register_google(
         self,
         user_info: dict,
@@ -588,7 +590,7 @@ class OAuthService:
         encrypted_state = self._encryption.encrypt(state_json)
 
         # Store in Redis with TTL
-        redis = await get_redis()
+        redis = get_redis_client("oauth_state")
         key = f"oauth:state:{encrypted_state}"
         await redis.setex(
             key,
@@ -615,7 +617,7 @@ class OAuthService:
             OAuthStateError: If state is invalid or expired
         """
         # Check if state exists in Redis
-        redis = await get_redis()
+        redis = get_redis_client("oauth_state")
         key = f"oauth:state:{state}"
         exists = await redis.exists(key)
 
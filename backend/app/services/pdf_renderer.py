@@ -0,0 +1,470 @@
+"""
+Off-loop PDF rendering with a content-addressed cache.
+
+WHAT: Async front end to PDFService for invoices and proposals.
+
+WHY: PDFService renders synchronously with ReportLab. Called from an async
+route, each download blocked the event loop for the whole render, so ten
+concurrent downloads froze every other request on the worker - and the
+same unchanged document was rendered again on every download.
+
+HOW:
+1. The document's inputs (the model fields the template reads, client
+   details, line items, company branding) are copied into plain values
+   and hashed; the hash is the cache key, so any change that would alter
+   the PDF produces a new key and nothing needs invalidating
+2. Cache lookups go to an in-memory LRU bounded by PDF_CACHE_MEMORY_BYTES,
+   then to PDF_CACHE_DIR, where entries evicted from memory are spilled
+   (bounded by PDF_CACHE_DISK_BYTES, shared by all processes on the host)
+3. Misses render in a pool of PDF_RENDER_WORKERS processes; concurrent
+   requests for the same document share one render
+"""
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Sequence, cast
+
+from app.core.config import settings
+from app.models.invoice import Invoice
+from app.models.proposal import Proposal
+from app.services.pdf_service import DEFAULT_COMPANY_INFO, CompanyInfo, PDFService
+
+
+logger = logging.getLogger(__name__)
+
+# WHY: Part of every cache key; bump it when a PDF layout changes so
+# documents cached on disk by the previous release aren't served
+_CACHE_VERSION = 1
+
+# Model fields read by the PDFService templates
+INVOICE_FIELDS = (
+    "invoice_number",
+    "status",
+    "issue_date",
+    "due_date",
+    "paid_at",
+    "subtotal",
+    "discount_amount",
+    "tax_amount",
+    "total",
+    "amount_paid",
+    "notes",
+)
+PROPOSAL_FIELDS = (
+    "id",
+    "version",
+    "title",
+    "created_at",
+    "valid_until",
+    "description",
+    "line_items",
+    "subtotal",
+    "discount_amount",
+    "tax_amount",
+    "total",
+    "client_notes",
+    "terms",
+)
+
+
+def _snapshot(obj: Any, fields: Sequence[str]) -> Dict[str, Any]:
+    """Copy the fields a template reads into a picklable dict."""
+    return {field: getattr(obj, field) for field in fields}
+
+
+def content_key(kind: str, *inputs: Any) -> str:
+    """
+    Hash a document's inputs into its cache key.
+
+    Args:
+        kind: Document kind ("invoice", "proposal")
+        *inputs: Everything the rendered output depends on
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    payload = json.dumps([_CACHE_VERSION, kind, *inputs], default=str, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# ============================================================================
+# Render functions (run in the worker processes)
+# ============================================================================
+
+
+def _render_invoice(
+    company: CompanyInfo,
+    invoice: Dict[str, Any],
+    client_name: str,
+    client_address: Optional[str],
+    line_items: Optional[List[dict]],
+) -> bytes:
+    """Render an invoice snapshot."""
+    # WHY: PDFService only reads attributes, which the snapshot provides
+    return PDFService(company).generate_invoice_pdf(
+        cast(Invoice, SimpleNamespace(**invoice)), client_name, client_address, line_items
+    )
+
+
+def _render_proposal(
+    company: CompanyInfo,
+    proposal: Dict[str, Any],
+    client_name: str,
+    client_address: Optional[str],
+) -> bytes:
+    """Render a proposal snapshot."""
+    return PDFService(company).generate_proposal_pdf(
+        cast(Proposal, SimpleNamespace(**proposal)), client_name, client_address
+    )
+
+
+# ============================================================================
+# Cache
+# ============================================================================
+
+
+class PDFCache:
+    """
+    Two-level cache of rendered PDFs.
+
+    WHAT: Memory LRU in front of a directory of spilled entries.
+
+    WHY: Memory serves the hot documents without I/O; the directory keeps
+    recently evicted ones across the processes of the host and restarts,
+    which memory alone can't afford to.
+
+    HOW: Keys are content hashes, so entries never go stale and files are
+    written once (to a temporary name, then renamed into place). Disk I/O
+    runs on a thread. The disk index is built from the directory's
+    modification times on first use and evicts oldest first.
+
+    Attributes:
+        hits: Lookups served from memory
+        disk_hits: Lookups served from disk
+        misses: Lookups that found nothing
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = settings.PDF_CACHE_MEMORY_BYTES,
+        directory: Optional[str] = settings.PDF_CACHE_DIR,
+        max_disk_bytes: int = settings.PDF_CACHE_DISK_BYTES,
+    ):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_memory_bytes: Memory budget for cached bytes
+            directory: Spill directory (None or empty disables the spill)
+            max_disk_bytes: Disk budget for spilled files
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self.directory = directory or None
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        # key -> file size, oldest first; None until the directory is scanned
+        self._disk: Optional["OrderedDict[str, int]"] = None
+        self._disk_bytes = 0
+        self._disk_lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> str:
+        assert self.directory is not None
+        return os.path.join(self.directory, f"{key}.pdf")
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up a document, promoting disk entries to memory.
+
+        Args:
+            key: Content key
+
+        Returns:
+            PDF bytes, or None on a miss
+        """
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return data
+
+        if self.directory:
+            data = await asyncio.to_thread(self._read_disk, key)
+            if data is not None:
+                self.disk_hits += 1
+                await self.put(key, data)
+                return data
+
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, data: bytes) -> None:
+        """
+        Store a document, spilling what memory evicts.
+
+        Args:
+            key: Content key
+            data: PDF bytes
+        """
+        evicted = []
+        if len(data) > self.max_memory_bytes:
+            evicted.append((key, data))
+        elif key not in self._memory:
+            self._memory[key] = data
+            self._memory_bytes += len(data)
+            while self._memory_bytes > self.max_memory_bytes:
+                old_key, old_data = self._memory.popitem(last=False)
+                self._memory_bytes -= len(old_data)
+                evicted.append((old_key, old_data))
+
+        if evicted and self.directory:
+            await asyncio.to_thread(self._spill, evicted)
+
+    def _load_disk_index(self) -> "OrderedDict[str, int]":
+        """Index existing spill files, oldest first (blocking, lock held)."""
+        assert self.directory is not None
+        os.makedirs(self.directory, exist_ok=True)
+        files = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".pdf") and entry.is_file():
+                    stat = entry.stat()
+                    files.append((stat.st_mtime, entry.name[:-4], stat.st_size))
+        self._disk = OrderedDict((key, size) for _, key, size in sorted(files))
+        self._disk_bytes = sum(self._disk.values())
+        return self._disk
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        """Read a spilled document (blocking)."""
+        try:
+            with open(self._path(key), "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        with self._disk_lock:
+            if self._disk is not None and key in self._disk:
+                self._disk.move_to_end(key)
+        return data
+
+    def _spill(self, items: List[tuple]) -> None:
+        """Write evicted documents to disk and enforce the budget (blocking)."""
+        try:
+            with self._disk_lock:
+                disk = self._disk if self._disk is not None else self._load_disk_index()
+                for key, data in items:
+                    if key in disk:
+                        disk.move_to_end(key)
+                        continue
+                    temp_path = f"{self._path(key)}.{os.getpid()}.tmp"
+                    with open(temp_path, "wb") as f:
+                        f.write(data)
+                    os.replace(temp_path, self._path(key))
+                    disk[key] = len(data)
+                    self._disk_bytes += len(data)
+
+                while self._disk_bytes > self.max_disk_bytes and disk:
+                    old_key, size = disk.popitem(last=False)
+                    self._disk_bytes -= size
+                    try:
+                        os.remove(self._path(old_key))
+                    except FileNotFoundError:
+                        pass
+        except OSError as e:
+            # WHY: The spill is an optimization; a full or read-only disk
+            # only means more renders
+            logger.warning(f"Failed to spill PDFs to {self.directory}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache occupancy and hit counts."""
+        return {
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "disk_entries": len(self._disk) if self._disk is not None else None,
+            "disk_bytes": self._disk_bytes if self._disk is not None else None,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+        }
+
+
+# ============================================================================
+# Renderer
+# ============================================================================
+
+
+class PDFRenderer:
+    """
+    Async, cached PDF renderer.
+
+    WHAT: Renders invoice and proposal PDFs off the event loop.
+
+    WHY: See module docstring.
+
+    HOW: A process pool (created on first render) runs the module-level
+    render functions on snapshots of the models; ORM instances never
+    cross the process boundary. With max_workers=0 renders run on a
+    single thread instead (no process start-up, but they hold the GIL).
+    """
+
+    def __init__(
+        self,
+        max_workers: int = settings.PDF_RENDER_WORKERS,
+        cache: Optional[PDFCache] = None,
+        company_info: Optional[CompanyInfo] = None,
+    ):
+        """
+        Initialize renderer.
+
+        Args:
+            max_workers: Render processes (0 renders on a thread)
+            cache: Rendered document cache (defaults to one from settings)
+            company_info: Company branding (defaults to DEFAULT_COMPANY_INFO)
+        """
+        self.max_workers = max_workers
+        self.cache = cache or PDFCache()
+        self.company = company_info or DEFAULT_COMPANY_INFO
+        self._executor: Optional[Executor] = None
+        self._in_flight: Dict[str, "asyncio.Task[bytes]"] = {}
+
+    def _get_executor(self) -> Executor:
+        """Create the render pool on first use."""
+        if self._executor is None:
+            if self.max_workers > 0:
+                # WHY: spawn, not fork - forking a process with a running
+                # event loop and live connection pools copies them into
+                # the child in an undefined state
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf")
+        return self._executor
+
+    async def _render_uncached(
+        self, key: str, fn: Callable[..., bytes], *args: Any
+    ) -> bytes:
+        """Render in the pool and cache the result."""
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        try:
+            data = await loop.run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            # WHY: A crashed worker breaks the whole pool; release its
+            # processes and start a new pool for the next render instead of
+            # failing every render from now on. Another render may already
+            # have replaced it.
+            executor.shutdown(wait=False, cancel_futures=True)
+            if self._executor is executor:
+                self._executor = None
+            raise
+        await self.cache.put(key, data)
+        return data
+
+    async def _render(self, key: str, fn: Callable[..., bytes], *args: Any) -> bytes:
+        """Serve from cache or render, sharing concurrent renders of a key."""
+        data = await self.cache.get(key)
+        if data is not None:
+            return data
+
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._render_uncached(key, fn, *args))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # WHY: A client disconnecting mustn't cancel a render others wait on
+        return await asyncio.shield(task)
+
+    async def render_invoice_pdf(
+        self,
+        invoice: Invoice,
+        client_name: str,
+        client_address: Optional[str] = None,
+        line_items: Optional[List[dict]] = None,
+    ) -> bytes:
+        """
+        Get an invoice PDF.
+
+        Args:
+            invoice: Invoice model instance
+            client_name: Client/organization name
+            client_address: Optional client address
+            line_items: Optional line items (if not stored on invoice)
+
+        Returns:
+            PDF file as bytes
+        """
+        company = dataclasses.asdict(self.company)
+        snapshot = _snapshot(invoice, INVOICE_FIELDS)
+        key = content_key("invoice", company, snapshot, client_name, client_address, line_items)
+        return await self._render(
+            key, _render_invoice, self.company, snapshot, client_name, client_address, line_items
+        )
+
+    async def render_proposal_pdf(
+        self,
+        proposal: Proposal,
+        client_name: str,
+        client_address: Optional[str] = None,
+    ) -> bytes:
+        """
+        Get a proposal PDF.
+
+        Args:
+            proposal: Proposal model instance
+            client_name: Client/organization name
+            client_address: Optional client address
+
+        Returns:
+            PDF file as bytes
+        """
+        company = dataclasses.asdict(self.company)
+        snapshot = _snapshot(proposal, PROPOSAL_FIELDS)
+        key = content_key("proposal", company, snapshot, client_name, client_address)
+        return await self._render(
+            key, _render_proposal, self.company, snapshot, client_name, client_address
+        )
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get cache statistics and renders in progress."""
+        return {
+            "workers": self.max_workers,
+            "rendering": len(self._in_flight),
+            "cache": self.cache.get_stats(),
+        }
+
+    def shutdown(self) -> None:
+        """Stop the render pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Global renderer instance
+_pdf_renderer: Optional[PDFRenderer] = None
+
+
+def get_pdf_renderer() -> PDFRenderer:
+    """
+    Get global PDF renderer instance.
+
+    Returns:
+        PDFRenderer singleton
+    """
+    global _pdf_renderer
+    if _pdf_renderer is None:
+        _pdf_renderer = PDFRenderer()
+    return _pdf_renderer
@@ -17,6 +17,8 @@ HOW: Uses ReportLab for pure Python PDF generation:
 
 Design decisions:
 - On-demand generation: PDFs generated when requested, not stored
+  (async callers go through app.services.pdf_renderer, which renders
+  off the event loop and caches the output by content)
 - Template approach: Reusable layouts for consistency
 - Company branding: Configurable header/footer
 - Currency formatting: Proper decimal handling
@@ -110,13 +112,12 @@ def get_styles():
         textColor=colors.HexColor('#2d3748'),
     ))
 
-    styles.add(ParagraphStyle(
-        name='BodyText',
-        parent=styles['Normal'],
-        fontSize=10,
-        spaceBefore=5,
-        spaceAfter=5,
-    ))
+    # WHY: The sample sheet already defines BodyText (add() raises on
+    # duplicates), so it is adjusted in place
+    body_text = styles['BodyText']
+    body_text.fontSize = 10
+    body_text.spaceBefore = 5
+    body_text.spaceAfter = 5
 
     styles.add(ParagraphStyle(
         name='SmallText',
@@ -9,11 +9,11 @@ WHY: Push notifications enable:
 3. Improved user engagement
 4. Timely SLA warnings
 
-HOW: Uses pywebpush library for Web Push Protocol:
-- VAPID authentication
-- End-to-end encryption
+HOW: Uses the Web Push engine (app.services.web_push) for delivery:
+- VAPID authentication, signed once per push service
+- End-to-end encryption off the event loop
 - Subscription management
-- Batched delivery
+- Concurrent fan-out with bulk outcome recording
 """
 
 import json
@@ -26,6 +26,7 @@ from app.core.config import settings
 from app.core.exceptions import AppException
 from app.dao.push_subscription import PushSubscriptionDAO
 from app.models.push_subscription import PushSubscription
+from app.services.web_push import GONE_STATUSES, get_web_push_sender
 
 logger = logging.getLogger(__name__)
 
@@ -60,27 +61,22 @@ class PushNotificationService:
     - Error handling and retry
     - Analytics tracking
 
-    HOW: Uses pywebpush for Web Push Protocol delivery.
+    HOW: Delivers through the shared WebPushSender.
     """
 
     def __init__(self, session: AsyncSession):
         """
         Initialize PushNotificationService.
 
-        WHAT: Sets up DAO and VAPID credentials.
+        WHAT: Sets up DAO and the push sender.
 
         Args:
             session: Database session
         """
         self.session = session
         self.subscription_dao = PushSubscriptionDAO(session)
-
-        # VAPID credentials for push authentication
-        self.vapid_private_key = getattr(settings, "VAPID_PRIVATE_KEY", "")
-        self.vapid_public_key = getattr(settings, "VAPID_PUBLIC_KEY", "")
-        self.vapid_claims = {
-            "sub": f"mailto:{getattr(settings, 'VAPID_MAILTO', 'admin@example.com')}",
-        }
+        self.sender = get_web_push_sender()
+        self.vapid_public_key = settings.VAPID_PUBLIC_KEY or ""
 
     # =========================================================================
     # Subscription Management
@@ -227,13 +223,7 @@ class PushNotificationService:
             require_interaction=require_interaction,
         )
 
-        success_count = 0
-        for sub in subscriptions:
-            success = await self._send_notification(sub, payload)
-            if success:
-                success_count += 1
-
-        return success_count
+        return await self._deliver(subscriptions, payload)
 
     async def send_to_org(
         self,
@@ -289,13 +279,7 @@ class PushNotificationService:
             data=data,
         )
 
-        success_count = 0
-        for sub in subscriptions:
-            success = await self._send_notification(sub, payload)
-            if success:
-                success_count += 1
-
-        return success_count
+        return await self._deliver(subscriptions, payload)
 
     async def send_to_users(
         self,
@@ -314,6 +298,9 @@ class PushNotificationService:
 
         WHY: Group notifications for specific users.
 
+        HOW: Loads every user's subscriptions in one query and sends to all
+        of them concurrently.
+
         Args:
             user_ids: List of target user IDs
             title: Notification title
@@ -326,21 +313,24 @@ class PushNotificationService:
         Returns:
             Number of successfully sent notifications
         """
-        total_success = 0
+        subscriptions = await self.subscription_dao.get_users_subscriptions(
+            user_ids=user_ids,
+            active_only=True,
+        )
 
-        for user_id in user_ids:
-            count = await self.send_to_user(
-                user_id=user_id,
-                title=title,
-                body=body,
-                url=url,
-                icon=icon,
-                tag=tag,
-                data=data,
-            )
-            total_success += count
+        if not subscriptions:
+            return 0
+
+        payload = self._build_payload(
+            title=title,
+            body=body,
+            url=url,
+            icon=icon,
+            tag=tag,
+            data=data,
+        )
 
-        return total_success
+        return await self._deliver(subscriptions, payload)
 
     # =========================================================================
     # Notification Types
@@ -558,65 +548,60 @@ class PushNotificationService:
 
         return json.dumps(payload)
 
-    async def _send_notification(
+    async def _deliver(
         self,
-        subscription: PushSubscription,
+        subscriptions: List[PushSubscription],
         payload: str,
-    ) -> bool:
+    ) -> int:
         """
-        Send notification to a subscription.
+        Send a payload to subscriptions and record the outcomes.
+
+        WHAT: Fans out concurrently, then updates subscriptions in bulk.
 
-        WHAT: Delivers push to single subscription.
+        WHY: Sending one subscription at a time, with a database write
+        after each, made org-wide pushes take as long as the sum of every
+        push service round trip.
 
-        HOW: Uses pywebpush library with VAPID auth.
+        HOW:
+        1. All sends run concurrently through the WebPushSender
+        2. Then, sequentially on this session: one UPDATE for successes,
+           one for failures, and deactivate_by_endpoint() for subscriptions
+           the push service reports gone (404/410)
 
         Args:
-            subscription: Target subscription
+            subscriptions: Target subscriptions
             payload: JSON payload string
 
         Returns:
-            Whether send succeeded
+            Number of successful sends
         """
-        # Check if webpush is available
-        try:
-            from pywebpush import webpush, WebPushException
-        except ImportError:
-            logger.warning("pywebpush not installed, using console mode")
+        if not self.sender.available:
+            logger.warning("Web push not configured (pywebpush or VAPID key missing)")
             logger.info(f"Push notification (console): {payload}")
-            return True
-
-        # Check VAPID credentials
-        if not self.vapid_private_key:
-            logger.warning("VAPID credentials not configured")
-            logger.info(f"Push notification (no credentials): {payload}")
-            return True
-
-        try:
-            webpush(
-                subscription_info=subscription.to_webpush_info(),
-                data=payload,
-                vapid_private_key=self.vapid_private_key,
-                vapid_claims=self.vapid_claims,
-            )
-
-            # Record success
-            await self.subscription_dao.record_success(subscription.id)
-            return True
-
-        except WebPushException as e:
-            logger.error(f"Push failed for subscription {subscription.id}: {e}")
-
-            # Record failure
-            failure_count = await self.subscription_dao.record_failure(subscription.id)
-
-            # Check if subscription is gone (410 Gone)
-            if e.response and e.response.status_code == 410:
-                await self.subscription_dao.deactivate_by_endpoint(subscription.endpoint)
-                logger.info(f"Deactivated expired subscription: {subscription.endpoint}")
+            return len(subscriptions)
 
-            return False
+        statuses = await self.sender.send_many(
+            [sub.to_webpush_info() for sub in subscriptions],
+            payload,
+        )
 
-        except Exception as e:
-            logger.error(f"Unexpected push error: {e}")
-            await self.subscription_dao.record_failure(subscription.id)
-            return False
+        succeeded: List[int] = []
+        failed: List[int] = []
+        gone: List[str] = []
+        for sub, status_code in zip(subscriptions, statuses):
+            if status_code is not None and status_code < 300:
+                succeeded.append(sub.id)
+            elif status_code in GONE_STATUSES:
+                gone.append(sub.endpoint)
+            else:
+                logger.error(f"Push failed for subscription {sub.id}: status {status_code}")
+                failed.append(sub.id)
+
+        await self.subscription_dao.record_successes(succeeded)
+        await self.subscription_dao.record_failures(failed)
+        for endpoint in gone:
+            await self.subscription_dao.deactivate_by_endpoint(endpoint)
+        if gone:
+            logger.info(f"Deactivated {len(gone)} expired push subscription(s)")
+
+        return len(succeeded)
@@ -0,0 +1,191 @@
+"""
+Scheduled Report Dispatcher.
+
+WHAT: Starts the runs of scheduled reports when they fall due.
+
+WHY: Scheduled reports recorded a next_run_at, but nothing ever looked at
+it, so they never ran.
+
+HOW (one tick, every REPORT_DISPATCH_INTERVAL_SECONDS in the scheduler
+leader):
+1. Fail executions left PENDING for REPORT_PENDING_TIMEOUT_SECONDS (their
+   job was lost), then count unfinished executions per organization
+2. Claim due reports (indexed next_run_at range, FOR UPDATE SKIP LOCKED)
+3. For each claimed report that fits REPORT_MAX_CONCURRENT and
+   REPORT_MAX_CONCURRENT_PER_ORG, advance next_run_at from its cron
+   schedule and create a PENDING execution; reports over a limit are left
+   due for a later tick
+4. Commit, then enqueue the executions on the "reports" queue, where the
+   worker generates them in parallel; an execution that can't be queued
+   is marked FAILED
+
+The tick's figures (dispatch lag, due backlog, executions in flight) are
+kept for get_scheduler_status().
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.exceptions import ReportGenerationError
+from app.db.session import AsyncSessionLocal
+from app.jobs.reports import enqueue_report_execution
+from app.services.report_service import ReportService
+
+
+logger = logging.getLogger(__name__)
+
+
+class ReportDispatcher:
+    """
+    Dispatches due scheduled reports to the report worker.
+
+    WHAT: Runs dispatch ticks and remembers the latest tick's figures.
+
+    WHY: See module docstring.
+
+    HOW: Claims and execution records are committed in one transaction
+    before anything is enqueued, so the worker always finds the execution
+    and a crash before the commit leaves the reports due.
+    """
+
+    def __init__(self, session_factory: Optional[Callable[[], AsyncSession]] = None):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            session_factory: Optional factory for creating database sessions.
+                           If not provided, uses the application's session factory.
+        """
+        self._session_factory = session_factory or AsyncSessionLocal
+        self._status: Dict[str, Any] = {"last_run_at": None}
+
+    async def dispatch_due_reports(self) -> Dict[str, Any]:
+        """
+        Main job function: start the runs of all due reports that fit.
+
+        Returns:
+            Tick figures: dispatched, queue_depth (reports still due),
+            in_flight (unfinished executions), lag_seconds (how late the
+            most delayed dispatched run started) and oldest_due_seconds
+            (how long the oldest waiting report has been due)
+        """
+        now = datetime.utcnow()
+        session = self._session_factory()
+        try:
+            dispatched, status = await self._claim(session, now)
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+        for execution_id in dispatched:
+            try:
+                await enqueue_report_execution(execution_id)
+            except ReportGenerationError:
+                # WHY: Already logged and marked FAILED; the remaining
+                # executions are still queued
+                continue
+            except Exception as e:
+                # WHY: Marking the execution FAILED can itself fail (e.g. the
+                # database is unreachable). The rest were committed and must
+                # still be queued; the stale-PENDING sweep fails this one later
+                logger.error(f"Failed to queue report execution {execution_id}: {e}")
+
+        if dispatched or status["queue_depth"]:
+            logger.info(
+                f"Dispatched {len(dispatched)} scheduled reports "
+                f"({status['queue_depth']} still due, {status['in_flight']} in flight)"
+            )
+        self._status = status
+        return status
+
+    async def _claim(
+        self, session: AsyncSession, now: datetime
+    ) -> Tuple[List[int], Dict[str, Any]]:
+        """
+        Claim due reports and create their executions (uncommitted).
+
+        Args:
+            session: Database session (the caller commits)
+            now: Tick time
+
+        Returns:
+            (IDs of the created executions, tick figures)
+        """
+        service = ReportService(session)
+        stale = await service.execution_dao.fail_stale_pending(
+            now - timedelta(seconds=settings.REPORT_PENDING_TIMEOUT_SECONDS),
+            "Report generation was never started",
+        )
+        if stale:
+            logger.warning(f"Failed {len(stale)} report executions stuck in PENDING: {stale}")
+
+        in_flight = await service.execution_dao.count_in_flight_by_org(
+            now - timedelta(seconds=settings.REPORT_TIME_LIMIT_SECONDS)
+        )
+        capacity = settings.REPORT_MAX_CONCURRENT - sum(in_flight.values())
+
+        dispatched: List[int] = []
+        lag_seconds = 0.0
+        if capacity > 0:
+            reports = await service.scheduled_report_dao.claim_due_reports(
+                now, settings.REPORT_DISPATCH_BATCH_SIZE
+            )
+            for report in reports:
+                if len(dispatched) >= capacity:
+                    break
+                if in_flight.get(report.org_id, 0) >= settings.REPORT_MAX_CONCURRENT_PER_ORG:
+                    continue
+
+                if report.next_run_at is not None:
+                    lag_seconds = max(lag_seconds, (now - report.next_run_at).total_seconds())
+                execution = await service.dispatch_scheduled_report(report, now)
+                in_flight[report.org_id] = in_flight.get(report.org_id, 0) + 1
+                dispatched.append(execution.id)
+
+        await session.flush()
+        queue_depth, oldest_due = await service.scheduled_report_dao.get_due_backlog(now)
+
+        return dispatched, {
+            "last_run_at": now.isoformat(),
+            "dispatched": len(dispatched),
+            "queue_depth": queue_depth,
+            "in_flight": sum(in_flight.values()),
+            "lag_seconds": lag_seconds,
+            "oldest_due_seconds": (
+                (now - oldest_due).total_seconds() if oldest_due else 0.0
+            ),
+        }
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get the figures of the latest tick in this process.
+
+        Returns:
+            Dict as returned by dispatch_due_reports ({"last_run_at": None}
+            before the first tick, and in processes that aren't the leader)
+        """
+        return dict(self._status)
+
+
+# Singleton instance
+_report_dispatcher: Optional[ReportDispatcher] = None
+
+
+def get_report_dispatcher() -> ReportDispatcher:
+    """
+    Get the report dispatcher singleton.
+
+    Returns:
+        ReportDispatcher instance
+    """
+    global _report_dispatcher
+    if _report_dispatcher is None:
+        _report_dispatcher = ReportDispatcher()
+    return _report_dispatcher
@@ -0,0 +1,546 @@
+"""
+Report Generation Engine.
+
+WHAT: Runs a ReportExecution: queries the report's rows, encodes them in
+the requested format and uploads the file to S3.
+
+WHY: Reports can cover hundreds of thousands of rows. Generating them in
+the request (or loading every row before writing) would tie up API
+workers and size their memory by the largest export.
+
+HOW:
+1. The API creates a PENDING execution and enqueues
+   app.jobs.reports.run_report_execution; this engine runs in the worker
+2. Each ReportType has a query builder producing (headings, SELECT) for
+   the org and parameters
+3. Rows are read through a server-side cursor (session.stream with
+   yield_per=REPORT_STREAM_BATCH_SIZE) on a read session
+4. Each batch goes to a streaming writer (app.services.report_writers)
+   whose output is uploaded to S3 in parts while the query continues
+5. The execution is completed via ReportService.complete_report_generation,
+   or failed with the error message
+"""
+
+import asyncio
+import enum
+import logging
+import re
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import boto3
+from sqlalchemy import DateTime, Select, select
+from sqlalchemy.orm import aliased
+
+from app.core.config import settings
+from app.core.exceptions import ReportGenerationError, ValidationError
+from app.db.session import AsyncSessionLocal, read_session
+from app.models.activity import ActivityEvent
+from app.models.invoice import Invoice, InvoiceStatus
+from app.models.project import Project
+from app.models.report import ReportType
+from app.models.ticket import Ticket
+from app.models.time_entry import TimeEntry
+from app.models.user import User
+from app.models.workflow import ExecutionLog, WorkflowInstance
+from app.services.report_service import ReportService
+from app.services.report_writers import FORMAT_FILE_TYPES, WRITERS, S3MultipartUpload
+
+
+logger = logging.getLogger(__name__)
+
+ReportQuery = Tuple[List[str], Select]
+
+
+# ============================================================================
+# Parameter Helpers
+# ============================================================================
+
+
+def _param_date(parameters: Dict[str, Any], name: str) -> Optional[date]:
+    """
+    Parse an ISO date parameter.
+
+    Raises:
+        ValidationError: If the value isn't an ISO date
+    """
+    value = parameters.get(name)
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError as e:
+        raise ValidationError(
+            message=f"Invalid {name}: expected YYYY-MM-DD",
+            details={name: value},
+        ) from e
+
+
+def _date_range(column: Any, parameters: Dict[str, Any]) -> List[Any]:
+    """
+    Build date_from/date_to conditions (both inclusive) for a column.
+
+    WHY: asyncpg needs datetimes for timestamp columns and dates for date
+    columns, so bounds are converted to the column's type.
+    """
+    bounds = [
+        (_param_date(parameters, "date_from"), lambda col, d: col >= d),
+        (_param_date(parameters, "date_to"), lambda col, d: col < d + timedelta(days=1)),
+    ]
+    conditions = []
+    for day, condition in bounds:
+        if day is None:
+            continue
+        if isinstance(column.type, DateTime):
+            day = datetime(day.year, day.month, day.day)
+        conditions.append(condition(column, day))
+    return conditions
+
+
+def _filter(column: Any, parameters: Dict[str, Any], name: str) -> List[Any]:
+    """
+    Build an equality condition when the parameter is set.
+
+    WHY: Parameters arrive as JSON (ids may be strings, enums are their
+    values), so the value is coerced to the column's Python type.
+
+    Raises:
+        ValidationError: If the value doesn't fit the column
+    """
+    value = parameters.get(name)
+    if value in (None, ""):
+        return []
+    python_type = column.type.python_type
+    if python_type is int or issubclass(python_type, enum.Enum):
+        try:
+            value = python_type(value)
+        except ValueError as e:
+            raise ValidationError(message=f"Invalid {name}", details={name: value}) from e
+    return [column == value]
+
+
+def _columns(*columns: Tuple[str, Any]) -> Tuple[List[str], List[Any]]:
+    """Split (heading, expression) pairs."""
+    return [heading for heading, _ in columns], [expression for _, expression in columns]
+
+
+# ============================================================================
+# Query Builders (one per ReportType)
+# ============================================================================
+
+
+def _revenue_query(org_id: int, parameters: Dict[str, Any]) -> ReportQuery:
+    headings, expressions = _columns(
+        ("Invoice", Invoice.invoice_number),
+        ("Paid At", Invoice.paid_at),
+        ("Amount Paid", Invoice.amount_paid),
+        ("Total", Invoice.total),
+        ("Payment Method", Invoice.payment_method),
+    )
+    stmt = (
+        select(*expressions)
+        .where(
+            Invoice.org_id == org_id,
+            Invoice.status == InvoiceStatus.PAID,
+            *_date_range(Invoice.paid_at, parameters),
+        )
+        .order_by(Invoice.paid_at, Invoice.id)
+    )
+    return headings, stmt
+
+
+def _invoice_query(org_id: int, parameters: Dict[str, Any]) -> ReportQuery:
+    headings, expressions = _columns(
+        ("Invoice", Invoice.invoice_number),
+        ("Status", Invoice.status),
+        ("Issue Date", Invoice.issue_date),
+        ("Due Date", Invoice.due_date),
+        ("Total", Invoice.total),
+        ("Amount Paid", Invoice.amount_paid),
+        ("Balance", Invoice.total - Invoice.amount_paid),
+        ("Paid At", Invoice.paid_at),
+    )
+    conditions = [
+        Invoice.org_id == org_id,
+        *_date_range(Invoice.issue_date, parameters),
+        *_filter(Invoice.status, parameters, "status"),
+    ]
+    if parameters.get("overdue_only"):
+        conditions.append(Invoice.status == InvoiceStatus.OVERDUE)
+    stmt = select(*expressions).where(*conditions).order_by(Invoice.issue_date, Invoice.id)
+    return headings, stmt
+
+
+def _project_query(org_id: int, parameters: Dict[str, Any]) -> ReportQuery:
+    headings, expressions = _columns(
+        ("ID", Project.id),
+        ("Name", Project.name),
+        ("Status", Project.status),
+        ("Priority", Project.priority),
+        ("Start Date", Project.start_date),
+        ("Due Date", Project.due_date),
+        ("Completed At", Project.completed_at),
+        ("Estimated Hours", Project.estimated_hours),
+        ("Actual Hours", Project.actual_hours),
+        ("Created At", Project.created_at),
+    )
+    stmt = (
+        select(*expressions)
+        .where(
+            Project.org_id == org_id,
+            *_date_range(Project.created_at, parameters),
+            *_filter(Project.status, parameters, "status"),
+            *_filter(Project.id, parameters, "project_id"),
+        )
+        .order_by(Project.created_at, Project.id)
+    )
+    return headings, stmt
+
+
+def _ticket_query(org_id: int, parameters: Dict[str, Any]) -> ReportQuery:
+    assignee = aliased(User)
+    headings, expressions = _columns(
+        ("ID", Ticket.id),
+        ("Subject", Ticket.subject),
+        ("Status", Ticket.status),
+        ("Priority", Ticket.priority),
+        ("Category", Ticket.category),
+        ("Assignee", assignee.name),
+        ("Created At", Ticket.created_at),
+        ("First Response At", Ticket.first_response_at),
+        ("Resolution Due At", Ticket.sla_resolution_due_at),
+        ("Resolved At", Ticket.resolved_at),
+    )
+    stmt = (
+        select(*expressions)
+        .outerjoin(assignee, assignee.id == Ticket.assigned_to_user_id)
+        .where(
+            Ticket.org_id == org_id,
+            *_date_range(Ticket.created_at, parameters),
+            *_filter(Ticket.status, parameters, "status"),
+            *_filter(Ticket.priority, parameters, "priority"),
+            *_filter(Ticket.category, parameters, "category"),
+            *_filter(Ticket.assigned_to_user_id, parameters, "assignee_id"),
+        )
+        .order_by(Ticket.created_at, Ticket.id)
+    )
+    return headings, stmt
+
+
+def _time_tracking_query(org_id: int, parameters: Dict[str, Any]) -> ReportQuery:
+    headings, expressions = _columns(
+        ("Date", TimeEntry.date),
+        ("User", User.name),
+        ("Project", Project.name),
+        ("Minutes", TimeEntry.duration_minutes),
+        ("Billable", TimeEntry.is_billable),
+        ("Hourly Rate", TimeEntry.hourly_rate),
+        ("Amount", TimeEntry.amount),
+        ("Status", TimeEntry.status),
+        ("Description", TimeEntry.description),
+    )
+    conditions = [
+        TimeEntry.org_id == org_id,
+        *_date_range(TimeEntry.date, parameters),
+        *_filter(TimeEntry.user_id, parameters, "user_id"),
+        *_filter(TimeEntry.project_id, parameters, "project_id"),
+    ]
+    if parameters.get("billable_only"):
+        conditions.append(TimeEntry.is_billable.is_(True))
+    stmt = (
+        select(*expressions)
+        .join(User, User.id == TimeEntry.user_id)
+        .outerjoin(Project, Project.id == TimeEntry.project_id)
+        .where(*conditions)
+        .order_by(TimeEntry.date, TimeEntry.id)
+    )
+    return headings, stmt
+
+
+def _activity_query(org_id: int, parameters: Dict[str, Any]) -> ReportQuery:
+    headings, expressions = _columns(
+        ("Time", ActivityEvent.created_at),
+        ("Actor", User.name),
+        ("Event", ActivityEvent.event_type),
+        ("Entity Type", ActivityEvent.entity_type),
+        ("Entity ID", ActivityEvent.entity_id),
+        ("Entity", ActivityEvent.entity_name),
+        ("Description", ActivityEvent.description),
+    )
+    stmt = (
+        select(*expressions)
+        .outerjoin(User, User.id == ActivityEvent.actor_id)
+        .where(
+            ActivityEvent.org_id == org_id,
+            *_date_range(ActivityEvent.created_at, parameters),
+            *_filter(ActivityEvent.actor_id, parameters, "user_id"),
+            *_filter(ActivityEvent.entity_type, parameters, "entity_type"),
+            *_filter(ActivityEvent.event_type, parameters, "event_type"),
+        )
+        .order_by(ActivityEvent.created_at, ActivityEvent.id)
+    )
+    return headings, stmt
+
+
+def _client_query(org_id: int, parameters: Dict[str, Any]) -> ReportQuery:
+    headings, expressions = _columns(
+        ("ID", User.id),
+        ("Name", User.name),
+        ("Email", User.email),
+        ("Role", User.role),
+        ("Active", User.is_active),
+        ("Email Verified", User.email_verified),
+        ("Registered At", User.created_at),
+    )
+    conditions = [
+        User.org_id == org_id,
+        *_date_range(User.created_at, parameters),
+        *_filter(User.id, parameters, "client_id"),
+    ]
+    if parameters.get("active_only"):
+        conditions.append(User.is_active.is_(True))
+    stmt = select(*expressions).where(*conditions).order_by(User.created_at, User.id)
+    return headings, stmt
+
+
+def _workflow_query(org_id: int, parameters: Dict[str, Any]) -> ReportQuery:
+    headings, expressions = _columns(
+        ("Execution ID", ExecutionLog.id),
+        ("Workflow", WorkflowInstance.name),
+        ("Status", ExecutionLog.status),
+        ("Started At", ExecutionLog.started_at),
+        ("Finished At", ExecutionLog.finished_at),
+        ("Error", ExecutionLog.error_message),
+    )
+    stmt = (
+        select(*expressions)
+        .join(WorkflowInstance, WorkflowInstance.id == ExecutionLog.workflow_instance_id)
+        .where(
+            WorkflowInstance.org_id == org_id,
+            *_date_range(ExecutionLog.started_at, parameters),
+            *_filter(WorkflowInstance.id, parameters, "workflow_id"),
+            *_filter(ExecutionLog.status, parameters, "status"),
+        )
+        .order_by(ExecutionLog.started_at, ExecutionLog.id)
+    )
+    return headings, stmt
+
+
+REPORT_QUERIES: Dict[str, Callable[[int, Dict[str, Any]], ReportQuery]] = {
+    ReportType.REVENUE.value: _revenue_query,
+    ReportType.INVOICE.value: _invoice_query,
+    ReportType.PROJECT.value: _project_query,
+    ReportType.TICKET.value: _ticket_query,
+    ReportType.TIME_TRACKING.value: _time_tracking_query,
+    ReportType.ACTIVITY.value: _activity_query,
+    ReportType.CLIENT.value: _client_query,
+    ReportType.WORKFLOW.value: _workflow_query,
+}
+
+
+def build_report_query(
+    report_type: str,
+    org_id: int,
+    parameters: Optional[Dict[str, Any]] = None,
+) -> ReportQuery:
+    """
+    Build the query for a report.
+
+    Args:
+        report_type: ReportType value
+        org_id: Organization the report is scoped to
+        parameters: Report parameters (date_from, date_to, filters)
+
+    Returns:
+        (column headings, SELECT statement)
+
+    Raises:
+        ReportGenerationError: If the report type can't be generated
+        ValidationError: If a parameter is malformed
+    """
+    builder = REPORT_QUERIES.get(report_type)
+    if builder is None:
+        # WHY: Custom reports carry a free-form query; running it would let
+        # tenants read outside their organization
+        raise ReportGenerationError(
+            message=f"Report type '{report_type}' cannot be generated",
+            details={"report_type": report_type},
+        )
+    return builder(org_id, parameters or {})
+
+
+# ============================================================================
+# Engine
+# ============================================================================
+
+
+class ReportEngine:
+    """
+    Generates report files for executions.
+
+    WHAT: Streams a report's rows into a writer and the writer into S3.
+
+    WHY: See module docstring.
+
+    HOW: Status changes are committed on short primary sessions; the data
+    is read on a separate read session whose cursor stays open for the
+    whole export. Blocking encoding and upload calls run in threads so
+    other jobs on the worker's event loop keep running.
+    """
+
+    def __init__(self, s3_client: Any = None, bucket: str = settings.S3_BUCKET_NAME):
+        """
+        Initialize engine.
+
+        Args:
+            s3_client: boto3 S3 client (created on first use if omitted)
+            bucket: Bucket receiving report files
+        """
+        self._s3_client = s3_client
+        self.bucket = bucket
+
+    @property
+    def s3_client(self) -> Any:
+        """S3 client, configured like DocumentService's."""
+        if self._s3_client is None:
+            self._s3_client = boto3.client(
+                "s3",
+                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                region_name=settings.AWS_REGION,
+            )
+        return self._s3_client
+
+    @staticmethod
+    def output_key(org_id: int, execution_id: int, report_name: str, extension: str) -> str:
+        """Build the S3 key for a report file."""
+        slug = re.sub(r"[^a-z0-9]+", "-", report_name.lower()).strip("-") or "report"
+        return f"reports/{org_id}/{execution_id}/{slug}.{extension}"
+
+    async def write_report(
+        self,
+        execution_id: int,
+        org_id: int,
+        report_type: str,
+        report_name: str,
+        output_format: str,
+        parameters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[str, int]:
+        """
+        Query, encode and upload one report.
+
+        Args:
+            execution_id: Execution the file belongs to
+            org_id: Organization the report is scoped to
+            report_type: ReportType value
+            report_name: Title used in the file and key
+            output_format: ReportFormat value
+            parameters: Report parameters
+
+        Returns:
+            (S3 key, size in bytes)
+
+        Raises:
+            ReportGenerationError: If the type or format is unsupported
+            ValidationError: If a parameter is malformed
+        """
+        if output_format not in WRITERS:
+            raise ReportGenerationError(
+                message=f"Unsupported report format '{output_format}'",
+                details={"output_format": output_format},
+            )
+        headings, stmt = build_report_query(report_type, org_id, parameters)
+        content_type, extension = FORMAT_FILE_TYPES[output_format]
+        key = self.output_key(org_id, execution_id, report_name, extension)
+
+        sink = S3MultipartUpload(self.s3_client, self.bucket, key, content_type)
+        try:
+            writer = await asyncio.to_thread(WRITERS[output_format], sink, report_name, headings)
+            async with read_session(settings.REPORT_MAX_STALENESS_SECONDS) as session:
+                result = await session.stream(
+                    stmt.execution_options(yield_per=settings.REPORT_STREAM_BATCH_SIZE)
+                )
+                try:
+                    async for rows in result.partitions():
+                        await asyncio.to_thread(writer.write_rows, rows)
+                        if writer.truncated:
+                            break
+                finally:
+                    await result.close()
+
+            await asyncio.to_thread(writer.close)
+            await asyncio.to_thread(sink.close)
+        except BaseException:
+            await asyncio.to_thread(sink.abort)
+            raise
+
+        logger.info(
+            f"Report execution {execution_id}: {writer.rows_written} rows, "
+            f"{sink.size} bytes -> s3://{self.bucket}/{key}"
+        )
+        return key, sink.size
+
+    async def run(self, execution_id: int) -> None:
+        """
+        Run an execution from PENDING to COMPLETED or FAILED.
+
+        WHY: Job delivery is at-least-once, so a completed or cancelled
+        execution is left alone; a RUNNING one was interrupted and runs
+        again.
+
+        Args:
+            execution_id: ReportExecution ID
+
+        Raises:
+            ReportNotFoundError: If the execution doesn't exist
+        """
+        async with AsyncSessionLocal() as session:
+            service = ReportService(session)
+            execution = await service.start_report_generation(execution_id)
+            if execution is None:
+                return
+            await session.commit()
+            job_org_id = execution.org_id
+            report_type = execution.report_type
+            report_name = execution.report_name
+            output_format = execution.output_format
+            parameters = execution.parameters
+
+        try:
+            key, size = await self.write_report(
+                execution_id=execution_id,
+                org_id=job_org_id,
+                report_type=report_type,
+                report_name=report_name,
+                output_format=output_format,
+                parameters=parameters,
+            )
+        except Exception as e:
+            logger.warning(f"Report execution {execution_id} failed: {e}", exc_info=True)
+            async with AsyncSessionLocal() as session:
+                await ReportService(session).fail_report_generation(
+                    execution_id, getattr(e, "message", None) or str(e) or type(e).__name__
+                )
+                await session.commit()
+            return
+
+        async with AsyncSessionLocal() as session:
+            await ReportService(session).complete_report_generation(execution_id, key, size)
+            await session.commit()
+
+
+# Global engine instance
+_report_engine: Optional[ReportEngine] = None
+
+
+def get_report_engine() -> ReportEngine:
+    """
+    Get global report engine instance.
+
+    Returns:
+        ReportEngine singleton
+    """
+    global _report_engine
+    if _report_engine is None:
+        _report_engine = ReportEngine()
+    return _report_engine
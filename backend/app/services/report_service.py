@@ -13,8 +13,11 @@ HOW: Orchestrates ScheduledReportDAO, ReportExecutionDAO, ReportTemplateDAO
 while validating operations against business rules.
 """
 
+import logging
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
+from zoneinfo import ZoneInfo
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from croniter import croniter
 
@@ -37,6 +40,45 @@ from app.core.exceptions import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+_UTC = ZoneInfo("UTC")
+
+
+def compute_next_run(
+    schedule: str,
+    timezone: str = "UTC",
+    after: Optional[datetime] = None,
+) -> datetime:
+    """
+    Compute the next run time of a report schedule.
+
+    WHY: Cron expressions are meant in the report's timezone ("0 8 * * 1"
+    is 8am local, before and after DST changes), while next_run_at is
+    stored as naive UTC like every other timestamp.
+
+    Args:
+        schedule: Cron expression
+        timezone: IANA timezone the expression is evaluated in
+        after: Naive UTC time to start from (default: now)
+
+    Returns:
+        Next run time after `after`, as naive UTC
+
+    Raises:
+        ReportScheduleError: If the expression or timezone is invalid
+    """
+    try:
+        start = (after or datetime.utcnow()).replace(tzinfo=_UTC).astimezone(ZoneInfo(timezone))
+        next_run = croniter(schedule, start).get_next(datetime)
+    except (KeyError, ValueError) as e:
+        raise ReportScheduleError(
+            message="Invalid cron expression",
+            details={"schedule": schedule, "timezone": timezone, "error": str(e)},
+        ) from e
+    return next_run.astimezone(_UTC).replace(tzinfo=None)
+
+
 # Report type metadata for API documentation
 REPORT_TYPE_INFO = {
     ReportType.REVENUE.value: {
@@ -168,15 +210,8 @@ class ReportService:
             ReportScheduleError: If schedule is invalid
             ValidationError: If validation fails
         """
-        # Validate cron expression
-        try:
-            cron = croniter(schedule)
-            next_run = cron.get_next(datetime)
-        except (KeyError, ValueError) as e:
-            raise ReportScheduleError(
-                message="Invalid cron expression",
-                details={"schedule": schedule, "error": str(e)},
-            )
+        # Validate cron expression and timezone
+        next_run = compute_next_run(schedule, timezone)
 
         # Validate report type
         if report_type not in [rt.value for rt in ReportType]:
@@ -268,15 +303,11 @@ class ReportService:
         report = await self.get_scheduled_report(report_id, org_id)
 
         # Validate schedule if being updated
-        if "schedule" in kwargs:
-            try:
-                cron = croniter(kwargs["schedule"])
-                kwargs["next_run_at"] = cron.get_next(datetime)
-            except (KeyError, ValueError) as e:
-                raise ReportScheduleError(
-                    message="Invalid cron expression",
-                    details={"schedule": kwargs["schedule"], "error": str(e)},
-                )
+        if "schedule" in kwargs or "timezone" in kwargs:
+            kwargs["next_run_at"] = compute_next_run(
+                kwargs.get("schedule", report.schedule),
+                kwargs.get("timezone", report.timezone),
+            )
 
         # Update fields
         for key, value in kwargs.items():
@@ -370,9 +401,12 @@ class ReportService:
         """
         Generate a report (ad-hoc or scheduled).
 
-        WHAT: Starts report generation process.
+        WHAT: Creates a PENDING execution for the report.
 
-        WHY: Generate reports on demand or from schedule.
+        WHY: Generate reports on demand or from schedule. The file is
+        produced by the report worker (app.services.report_engine); callers
+        enqueue app.jobs.reports.run_report_execution with the execution ID
+        once the transaction is committed, so the worker can see the row.
 
         Args:
             org_id: Organization ID
@@ -419,17 +453,41 @@ class ReportService:
             is_adhoc=scheduled_report_id is None,
         )
 
-        # In a real implementation, this would:
-        # 1. Start execution
-        # 2. Query data based on report_type and parameters
-        # 3. Generate output in requested format
-        # 4. Upload to S3
-        # 5. Update execution with results
+        return execution
 
-        # For now, mark as started
-        execution = await self.execution_dao.start_execution(execution.id)
+    async def start_report_generation(
+        self,
+        execution_id: int,
+    ) -> Optional[ReportExecution]:
+        """
+        Mark report generation as running.
 
-        return execution
+        WHAT: Moves a pending (or interrupted) execution to RUNNING.
+
+        WHY: Report jobs are delivered at least once; an execution that has
+        already completed or been cancelled must not be generated again.
+
+        Args:
+            execution_id: Execution ID
+
+        Returns:
+            Updated execution, or None if it has already finished
+
+        Raises:
+            ReportNotFoundError: If the execution doesn't exist
+        """
+        execution = await self.execution_dao.get_by_id(execution_id)
+        if not execution:
+            raise ReportNotFoundError(
+                message="Report execution not found",
+                details={"execution_id": execution_id},
+            )
+        if execution.status in (
+            ExecutionStatus.COMPLETED.value,
+            ExecutionStatus.CANCELLED.value,
+        ):
+            return None
+        return await self.execution_dao.start_execution(execution_id)
 
     async def complete_report_generation(
         self,
@@ -939,6 +997,7 @@ class ReportService:
         self,
         report_id: int,
         schedule: str,
+        timezone: str = "UTC",
     ) -> Optional[ScheduledReport]:
         """
         Calculate and update next run time.
@@ -950,16 +1009,59 @@ class ReportService:
         Args:
             report_id: Report ID
             schedule: Cron expression
+            timezone: Timezone of the schedule
 
         Returns:
             Updated report
         """
         try:
-            cron = croniter(schedule)
-            next_run = cron.get_next(datetime)
-        except (KeyError, ValueError):
+            next_run = compute_next_run(schedule, timezone)
+        except ReportScheduleError:
             return None
 
         return await self.scheduled_report_dao.update_next_run(
             report_id, next_run, datetime.utcnow()
         )
+
+    async def dispatch_scheduled_report(
+        self,
+        report: ScheduledReport,
+        now: datetime,
+    ) -> ReportExecution:
+        """
+        Start a run of a due scheduled report.
+
+        WHAT: Advances the report to its next run and creates a PENDING
+        execution for this one.
+
+        WHY: Both happen in the caller's transaction, together with the
+        row lock taken by claim_due_reports, so a run is claimed exactly
+        once. The next run is computed from `now`, so runs missed while
+        nothing was dispatching collapse into this one.
+
+        Args:
+            report: Claimed (locked) scheduled report
+            now: Dispatch time (naive UTC)
+
+        Returns:
+            Created ReportExecution
+        """
+        try:
+            report.next_run_at = compute_next_run(report.schedule, report.timezone, after=now)
+        except ReportScheduleError:
+            # WHY: Schedules are validated on save; one that no longer parses
+            # runs this time and then stops instead of being retried forever
+            logger.error(
+                f"Scheduled report {report.id} has an invalid schedule "
+                f"'{report.schedule}' ({report.timezone}); not rescheduling"
+            )
+            report.next_run_at = None
+        report.last_run_at = now
+
+        return await self.generate_report(
+            org_id=report.org_id,
+            report_type=report.report_type,
+            parameters=report.parameters,
+            output_format=report.output_format,
+            scheduled_report_id=report.id,
+        )
@@ -0,0 +1,411 @@
+"""
+Streaming report writers and upload sink.
+
+WHAT: Encoders that turn batches of report rows into CSV, JSON, XLSX or
+PDF bytes, and an S3 multipart upload that accepts those bytes as a file.
+
+WHY: Exports run to hundreds of thousands of rows. Building the file in
+memory (or a list of rows first) would size worker memory by the largest
+report instead of by the batch.
+
+HOW:
+1. A writer is opened on a binary sink, fed rows batch by batch with
+   write_rows(), and finished with close()
+2. CSV and JSON are encoded and handed to the sink per batch; XLSX uses
+   openpyxl's write-only mode (rows spool to a temp file until save);
+   PDF draws pages directly on a ReportLab canvas and stops after
+   REPORT_PDF_MAX_ROWS rows
+3. S3MultipartUpload buffers one part (REPORT_UPLOAD_PART_SIZE_BYTES) and
+   uploads it as soon as it is full; files smaller than a part go up with
+   a single put_object
+
+Everything here is blocking; the engine calls it from a worker thread.
+"""
+
+import csv
+import enum
+import io
+import json
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Protocol, Sequence, Type
+
+from app.core.config import settings
+from app.models.report import ReportFormat
+
+
+logger = logging.getLogger(__name__)
+
+# Content type and file extension per output format
+FORMAT_FILE_TYPES: Dict[str, tuple] = {
+    ReportFormat.CSV.value: ("text/csv", "csv"),
+    ReportFormat.JSON.value: ("application/json", "json"),
+    ReportFormat.EXCEL.value: (
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        "xlsx",
+    ),
+    ReportFormat.PDF.value: ("application/pdf", "pdf"),
+}
+
+
+def cell_value(value: Any) -> Any:
+    """
+    Normalize a database value for output.
+
+    Args:
+        value: Column value (enum, Decimal, datetime, ...)
+
+    Returns:
+        Enum values as their value, everything else unchanged
+    """
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def cell_text(value: Any) -> str:
+    """Render a value as text (CSV and PDF cells)."""
+    value = cell_value(value)
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+# ============================================================================
+# Upload sink
+# ============================================================================
+
+
+class ReportSink(Protocol):
+    """
+    Binary file object a writer writes to.
+
+    WHY: Writers only need write/tell/flush, which both io.BytesIO and
+    S3MultipartUpload provide; typing.BinaryIO would require the rest of the
+    file interface.
+    """
+
+    def write(self, data: bytes) -> int:
+        """Write bytes, returning how many were accepted."""
+        ...
+
+    def tell(self) -> int:
+        """Return the current position."""
+        ...
+
+    def flush(self) -> None:
+        """Flush buffered bytes."""
+        ...
+
+
+class S3MultipartUpload:
+    """
+    Write-only file object that uploads to S3 in parts.
+
+    WHAT: Collects written bytes and uploads every full part as it fills.
+
+    WHY: Keeps at most one part in memory per report, and lets uploading
+    overlap with querying instead of following it.
+
+    HOW: The multipart upload is only created once the first part is full;
+    close() sends the remainder (or the whole file with put_object if it
+    never reached a part) and completes the upload. abort() discards it.
+
+    Attributes:
+        size: Bytes written so far
+    """
+
+    def __init__(
+        self,
+        s3_client: Any,
+        bucket: str,
+        key: str,
+        content_type: str,
+        part_size: int = settings.REPORT_UPLOAD_PART_SIZE_BYTES,
+    ):
+        """
+        Initialize the sink (no request is made until a part is full).
+
+        Args:
+            s3_client: boto3 S3 client
+            bucket: Target bucket
+            key: Target object key
+            content_type: Content-Type of the object
+            part_size: Bytes per uploaded part (S3 minimum: 5 MiB)
+        """
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.content_type = content_type
+        self.part_size = part_size
+        self.size = 0
+        self._buffer = bytearray()
+        self._upload_id: Optional[str] = None
+        self._parts: List[Dict[str, Any]] = []
+
+    def write(self, data: bytes) -> int:
+        """Buffer bytes, uploading each part as it fills."""
+        self._buffer += data
+        self.size += len(data)
+        while len(self._buffer) >= self.part_size:
+            self._upload_part(bytes(self._buffer[: self.part_size]))
+            del self._buffer[: self.part_size]
+        return len(data)
+
+    def tell(self) -> int:
+        """Bytes written so far (zipfile needs this for XLSX)."""
+        return self.size
+
+    def flush(self) -> None:
+        """No-op: parts are only uploaded when full."""
+
+    def _upload_part(self, body: bytes) -> None:
+        """Upload one part, starting the multipart upload if needed."""
+        if self._upload_id is None:
+            response = self.s3_client.create_multipart_upload(
+                Bucket=self.bucket, Key=self.key, ContentType=self.content_type
+            )
+            self._upload_id = response["UploadId"]
+
+        part_number = len(self._parts) + 1
+        response = self.s3_client.upload_part(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        self._parts.append({"PartNumber": part_number, "ETag": response["ETag"]})
+
+    def close(self) -> None:
+        """Upload what is buffered and finish the object."""
+        if self._upload_id is None:
+            self.s3_client.put_object(
+                Bucket=self.bucket,
+                Key=self.key,
+                Body=bytes(self._buffer),
+                ContentType=self.content_type,
+            )
+        else:
+            if self._buffer:
+                self._upload_part(bytes(self._buffer))
+            self.s3_client.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self._upload_id,
+                MultipartUpload={"Parts": self._parts},
+            )
+        self._buffer = bytearray()
+
+    def abort(self) -> None:
+        """Discard uploaded parts after a failure."""
+        self._buffer = bytearray()
+        if self._upload_id is None:
+            return
+        try:
+            self.s3_client.abort_multipart_upload(
+                Bucket=self.bucket, Key=self.key, UploadId=self._upload_id
+            )
+        except Exception as e:
+            # WHY: A bucket lifecycle rule cleans up whatever this misses
+            logger.warning(f"Failed to abort multipart upload of {self.key}: {e}")
+
+
+# ============================================================================
+# Writers
+# ============================================================================
+
+
+class ReportWriter:
+    """
+    Base class for streaming report writers.
+
+    WHAT: Writes a header, then row batches, then finishes the file.
+
+    Attributes:
+        rows_written: Rows accepted so far
+        truncated: True once the writer stopped accepting rows
+    """
+
+    truncated = False
+
+    def __init__(self, sink: ReportSink, title: str, headers: Sequence[str]):
+        """
+        Initialize the writer and write the header.
+
+        Args:
+            sink: Binary file object receiving the output
+            title: Report title (PDF heading, XLSX sheet name)
+            headers: Column headings
+        """
+        self.sink = sink
+        self.title = title
+        self.headers = list(headers)
+        self.rows_written = 0
+
+    def write_rows(self, rows: Sequence[Sequence[Any]]) -> None:
+        """Encode a batch of rows."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Finish the file (the sink itself is closed by the caller)."""
+
+
+class CsvReportWriter(ReportWriter):
+    """CSV writer: each batch is encoded and passed to the sink at once."""
+
+    def __init__(self, sink: ReportSink, title: str, headers: Sequence[str]):
+        super().__init__(sink, title, headers)
+        self._write([self.headers])
+
+    def _write(self, rows: Sequence[Sequence[Any]]) -> None:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        self.sink.write(buffer.getvalue().encode("utf-8"))
+
+    def write_rows(self, rows: Sequence[Sequence[Any]]) -> None:
+        self._write([[cell_text(value) for value in row] for row in rows])
+        self.rows_written += len(rows)
+
+
+class JsonReportWriter(ReportWriter):
+    """JSON writer: one array of objects keyed by heading, written incrementally."""
+
+    def __init__(self, sink: ReportSink, title: str, headers: Sequence[str]):
+        super().__init__(sink, title, headers)
+        self.sink.write(b"[")
+
+    def write_rows(self, rows: Sequence[Sequence[Any]]) -> None:
+        chunk = ",".join(
+            json.dumps(
+                {header: cell_value(value) for header, value in zip(self.headers, row)},
+                default=str,
+            )
+            for row in rows
+        )
+        if chunk:
+            self.sink.write(("," if self.rows_written else "").encode() + chunk.encode("utf-8"))
+        self.rows_written += len(rows)
+
+    def close(self) -> None:
+        self.sink.write(b"]")
+
+
+class XlsxReportWriter(ReportWriter):
+    """
+    XLSX writer on openpyxl's write-only workbook.
+
+    WHY: Write-only worksheets serialize each appended row to a temporary
+    file, so memory doesn't grow with the row count; save() then streams
+    the zip into the sink.
+    """
+
+    # Excel's hard limit on sheet names
+    _MAX_SHEET_TITLE = 31
+
+    def __init__(self, sink: ReportSink, title: str, headers: Sequence[str]):
+        from openpyxl import Workbook
+
+        super().__init__(sink, title, headers)
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet(title=title[: self._MAX_SHEET_TITLE])
+        self._sheet.append(self.headers)
+
+    def write_rows(self, rows: Sequence[Sequence[Any]]) -> None:
+        for row in rows:
+            self._sheet.append([cell_value(value) for value in row])
+        self.rows_written += len(rows)
+
+    def close(self) -> None:
+        self._workbook.save(self.sink)
+
+
+class PdfReportWriter(ReportWriter):
+    """
+    PDF writer drawing table pages directly on a ReportLab canvas.
+
+    WHY: Platypus tables lay out the whole story in memory first; drawing
+    rows onto pages as they arrive keeps only the finished pages. ReportLab
+    still holds those until save(), hence REPORT_PDF_MAX_ROWS.
+    """
+
+    _FONT_SIZE = 7
+    _ROW_HEIGHT = 11
+    _MARGIN = 36
+
+    def __init__(
+        self,
+        sink: ReportSink,
+        title: str,
+        headers: Sequence[str],
+        max_rows: int = settings.REPORT_PDF_MAX_ROWS,
+    ):
+        from reportlab.lib.pagesizes import landscape, letter
+        from reportlab.pdfgen.canvas import Canvas
+
+        super().__init__(sink, title, headers)
+        self.max_rows = max_rows
+        self._page_width, self._page_height = landscape(letter)
+        self._canvas = Canvas(sink, pagesize=landscape(letter))
+        self._canvas.setTitle(title)
+        self._column_width = (self._page_width - 2 * self._MARGIN) / max(len(self.headers), 1)
+        # Characters that fit a column at the table font size
+        self._max_chars = max(int(self._column_width / (self._FONT_SIZE * 0.5)), 4)
+        self._page = 0
+        self._start_page()
+
+    def _draw_cells(self, values: Sequence[str], font: str) -> None:
+        self._canvas.setFont(font, self._FONT_SIZE)
+        for index, text in enumerate(values):
+            if len(text) > self._max_chars:
+                text = text[: self._max_chars - 1] + "…"
+            self._canvas.drawString(self._MARGIN + index * self._column_width, self._y, text)
+        self._y -= self._ROW_HEIGHT
+
+    def _start_page(self) -> None:
+        if self._page:
+            self._canvas.showPage()
+        self._page += 1
+        self._y = self._page_height - self._MARGIN
+
+        self._canvas.setFont("Helvetica-Bold", 12)
+        self._canvas.drawString(self._MARGIN, self._y, self.title)
+        self._canvas.setFont("Helvetica", self._FONT_SIZE)
+        self._canvas.drawRightString(
+            self._page_width - self._MARGIN, self._y, f"Page {self._page}"
+        )
+        self._y -= 2 * self._ROW_HEIGHT
+        self._draw_cells(self.headers, "Helvetica-Bold")
+
+    def write_rows(self, rows: Sequence[Sequence[Any]]) -> None:
+        for row in rows:
+            if self.rows_written >= self.max_rows:
+                self.truncated = True
+                return
+            if self._y < self._MARGIN:
+                self._start_page()
+            self._draw_cells([cell_text(value) for value in row], "Helvetica")
+            self.rows_written += 1
+
+    def close(self) -> None:
+        if self.truncated:
+            if self._y < self._MARGIN + self._ROW_HEIGHT:
+                self._start_page()
+            self._canvas.setFont("Helvetica-Oblique", self._FONT_SIZE + 1)
+            self._canvas.drawString(
+                self._MARGIN,
+                self._y - self._ROW_HEIGHT,
+                f"Truncated after {self.max_rows} rows. "
+                "Export as CSV or Excel for the complete report.",
+            )
+        self._canvas.save()
+
+
+WRITERS: Dict[str, Type[ReportWriter]] = {
+    ReportFormat.CSV.value: CsvReportWriter,
+    ReportFormat.JSON.value: JsonReportWriter,
+    ReportFormat.EXCEL.value: XlsxReportWriter,
+    ReportFormat.PDF.value: PdfReportWriter,
+}
@@ -11,6 +11,10 @@ WHY: Background jobs enable:
 HOW: Uses APScheduler with AsyncIOScheduler for async job support.
 Redis job store can be enabled for persistence across restarts.
 
+Every app process runs the scheduler, but jobs only execute in the process
+holding the "scheduler" Redis lease (see app.core.leader_lease), so each
+job runs once cluster-wide however many workers and pods are deployed.
+
 Example:
     # In main.py startup:
     from app.services.scheduler import start_scheduler, shutdown_scheduler
@@ -26,7 +30,8 @@ Example:
 
 import logging
 import asyncio
-from typing import Optional
+import functools
+from typing import Any, Awaitable, Callable, Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.jobstores.memory import MemoryJobStore
@@ -34,6 +39,13 @@ from apscheduler.executors.asyncio import AsyncIOExecutor
 from apscheduler.triggers.interval import IntervalTrigger
 
 from app.core.config import settings
+from app.core.leader_lease import LeaderLease
+from app.services.integration_service import (
+    dispatch_webhook_outbox,
+    retry_webhook_deliveries,
+)
+from app.services.n8n_sync_service import get_n8n_sync_service
+from app.services.report_dispatcher import get_report_dispatcher
 from app.services.sla_background_service import (
     get_sla_service,
     SLA_CHECK_INTERVAL_SECONDS,
@@ -46,12 +58,59 @@ logger = logging.getLogger(__name__)
 # Global scheduler instance
 _scheduler: Optional[AsyncIOScheduler] = None
 
+# Global scheduler lease instance
+_scheduler_lease: Optional[LeaderLease] = None
+
 
 def get_scheduler() -> Optional[AsyncIOScheduler]:
     """Get the global scheduler instance."""
     return _scheduler
 
 
+def get_scheduler_lease() -> LeaderLease:
+    """
+    Get the lease that decides which process runs scheduled jobs.
+
+    Returns:
+        LeaderLease singleton
+    """
+    global _scheduler_lease
+    if _scheduler_lease is None:
+        _scheduler_lease = LeaderLease(
+            "scheduler",
+            ttl_seconds=settings.SCHEDULER_LEASE_TTL_SECONDS,
+            renew_interval_seconds=settings.SCHEDULER_LEASE_RENEW_INTERVAL_SECONDS,
+        )
+    return _scheduler_lease
+
+
+def leader_only(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """
+    Wrap a job so it only runs in the leader process.
+
+    WHAT: Skips the run (returning None) unless this process holds the
+    scheduler lease.
+
+    WHY: Keeps the schedule itself local and simple - every process keeps
+    ticking, so a follower that takes over the lease runs the next
+    occurrence without any rescheduling.
+
+    Args:
+        func: Async job function
+
+    Returns:
+        Wrapped job function
+    """
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if settings.SCHEDULER_LEADER_ELECTION_ENABLED and not get_scheduler_lease().is_leader:
+            logger.debug(f"Skipping {func.__name__}: not the scheduler leader")
+            return None
+        return await func(*args, **kwargs)
+
+    return wrapper
+
+
 async def start_scheduler() -> None:
     """
     Start the background job scheduler.
@@ -60,12 +119,16 @@ async def start_scheduler() -> None:
 
     WHY: Enables background processing for:
     - SLA breach monitoring (every 5 minutes)
+    - Webhook outbox delivery (every few seconds)
+    - Webhook delivery retries
+    - Scheduled report dispatch
     - Future: email digests, cleanup tasks
 
     HOW:
-    1. Creates AsyncIOScheduler with memory job store
-    2. Registers SLA check job
-    3. Starts the scheduler
+    1. Starts contending for the scheduler lease
+    2. Creates AsyncIOScheduler with memory job store
+    3. Registers SLA check, webhook, n8n sync and report dispatch jobs
+    4. Starts the scheduler
 
     Note: Call this from FastAPI startup event.
     """
@@ -75,6 +138,13 @@ async def start_scheduler() -> None:
         logger.warning("Scheduler already running")
         return
 
+    if settings.SCHEDULER_LEADER_ELECTION_ENABLED:
+        lease = get_scheduler_lease()
+        # WHY: Try once up front so a single instance runs its first jobs
+        # on schedule rather than after the first renew interval
+        await lease.try_acquire()
+        await lease.start()
+
     # Configure job stores
     jobstores = {
         "default": MemoryJobStore()
@@ -102,6 +172,10 @@ async def start_scheduler() -> None:
 
     # Register SLA check job
     _register_sla_check_job()
+    _register_webhook_outbox_job()
+    _register_webhook_retry_job()
+    _register_n8n_sync_job()
+    _register_report_dispatch_job()
 
     # Start scheduler
     _scheduler.start()
@@ -129,7 +203,7 @@ def _register_sla_check_job() -> None:
     sla_service = get_sla_service()
 
     _scheduler.add_job(
-        func=sla_service.check_all_sla_breaches,
+        func=leader_only(sla_service.check_all_sla_breaches),
         trigger=IntervalTrigger(seconds=SLA_CHECK_INTERVAL_SECONDS),
         id="sla_breach_check",
         name="SLA Breach Check",
@@ -141,6 +215,123 @@ def _register_sla_check_job() -> None:
     )
 
 
+def _register_webhook_outbox_job() -> None:
+    """
+    Register the webhook outbox dispatcher job.
+
+    WHAT: Schedules frequent outbox drains.
+
+    WHY: Webhook events are committed to the outbox by request handlers;
+    this job delivers them. Running only in the leader keeps a single
+    dispatcher, which is what preserves per-endpoint event order.
+
+    HOW: Runs dispatch_webhook_outbox every WEBHOOK_OUTBOX_POLL_INTERVAL_SECONDS.
+    """
+    global _scheduler
+
+    if _scheduler is None:
+        logger.error("Cannot register job: scheduler not initialized")
+        return
+
+    interval = settings.WEBHOOK_OUTBOX_POLL_INTERVAL_SECONDS
+    _scheduler.add_job(
+        func=leader_only(dispatch_webhook_outbox),
+        trigger=IntervalTrigger(seconds=interval),
+        id="webhook_outbox_dispatch",
+        name="Webhook Outbox Dispatch",
+        replace_existing=True,
+    )
+
+    logger.info(f"Registered webhook outbox job (interval: {interval}s)")
+
+
+def _register_webhook_retry_job() -> None:
+    """
+    Register the webhook retry job.
+
+    WHAT: Schedules pickup of failed deliveries whose retry is due.
+
+    WHY: Without it, failed deliveries were scheduled for retry but
+    never retried.
+
+    HOW: Runs retry_webhook_deliveries every WEBHOOK_RETRY_POLL_INTERVAL_SECONDS.
+    """
+    global _scheduler
+
+    if _scheduler is None:
+        logger.error("Cannot register job: scheduler not initialized")
+        return
+
+    interval = settings.WEBHOOK_RETRY_POLL_INTERVAL_SECONDS
+    _scheduler.add_job(
+        func=leader_only(retry_webhook_deliveries),
+        trigger=IntervalTrigger(seconds=interval),
+        id="webhook_retry",
+        name="Webhook Delivery Retry",
+        replace_existing=True,
+    )
+
+    logger.info(f"Registered webhook retry job (interval: {interval}s)")
+
+
+def _register_n8n_sync_job() -> None:
+    """
+    Register the n8n execution status sync job.
+
+    WHAT: Schedules reconciliation of running executions with n8n.
+
+    WHY: Executions are started through n8n but nothing else reports
+    their outcome, so logs stayed RUNNING indefinitely.
+
+    HOW: Runs sync_all_executions every N8N_SYNC_INTERVAL_SECONDS.
+    """
+    global _scheduler
+
+    if _scheduler is None:
+        logger.error("Cannot register job: scheduler not initialized")
+        return
+
+    interval = settings.N8N_SYNC_INTERVAL_SECONDS
+    _scheduler.add_job(
+        func=leader_only(get_n8n_sync_service().sync_all_executions),
+        trigger=IntervalTrigger(seconds=interval),
+        id="n8n_execution_sync",
+        name="n8n Execution Status Sync",
+        replace_existing=True,
+    )
+
+    logger.info(f"Registered n8n execution sync job (interval: {interval}s)")
+
+
+def _register_report_dispatch_job() -> None:
+    """
+    Register the scheduled report dispatcher job.
+
+    WHAT: Schedules polling for due scheduled reports.
+
+    WHY: Scheduled reports only record their next run time; this job
+    starts the runs.
+
+    HOW: Runs dispatch_due_reports every REPORT_DISPATCH_INTERVAL_SECONDS.
+    """
+    global _scheduler
+
+    if _scheduler is None:
+        logger.error("Cannot register job: scheduler not initialized")
+        return
+
+    interval = settings.REPORT_DISPATCH_INTERVAL_SECONDS
+    _scheduler.add_job(
+        func=leader_only(get_report_dispatcher().dispatch_due_reports),
+        trigger=IntervalTrigger(seconds=interval),
+        id="scheduled_report_dispatch",
+        name="Scheduled Report Dispatch",
+        replace_existing=True,
+    )
+
+    logger.info(f"Registered scheduled report dispatch job (interval: {interval}s)")
+
+
 async def shutdown_scheduler() -> None:
     """
     Shut down the background job scheduler.
@@ -155,6 +346,11 @@ async def shutdown_scheduler() -> None:
     """
     global _scheduler
 
+    # WHY: Release first so another process takes over without waiting
+    # for the lease to expire
+    if _scheduler_lease is not None:
+        await _scheduler_lease.stop()
+
     if _scheduler is None:
         logger.info("Scheduler not running")
         return
@@ -191,7 +387,9 @@ def get_scheduler_status() -> dict:
     """
     Get scheduler status information.
 
-    WHAT: Returns scheduler state and job info.
+    WHAT: Returns scheduler state, job info, the scheduler lease (this
+    process's identity, whether it leads, and the last seen leader) and
+    the latest scheduled report dispatch (lag, queue depth, in flight).
 
     WHY: Enables health checks and monitoring.
 
@@ -200,10 +398,18 @@ def get_scheduler_status() -> dict:
     """
     global _scheduler
 
+    leader = (
+        get_scheduler_lease().get_status()
+        if settings.SCHEDULER_LEADER_ELECTION_ENABLED
+        else None
+    )
+
     if _scheduler is None:
         return {
             "running": False,
             "jobs": [],
+            "leader": leader,
+            "scheduled_reports": get_report_dispatcher().get_status(),
             "message": "Scheduler not initialized",
         }
 
@@ -219,5 +425,7 @@ def get_scheduler_status() -> dict:
     return {
         "running": _scheduler.running,
         "jobs": jobs,
+        "leader": leader,
+        "scheduled_reports": get_report_dispatcher().get_status(),
         "message": "Scheduler is running" if _scheduler.running else "Scheduler is paused",
     }
@@ -11,25 +11,29 @@ WHY: Proactive SLA monitoring ensures:
 4. All SLA events are logged for auditing
 
 HOW: Uses APScheduler to run every 5 minutes:
-1. Query tickets in warning zone or breached
-2. Check if notification was already sent
-3. Send notifications to assignee and org admins
-4. Update notification tracking fields
-5. Log all actions for audit trail
+1. Claim due tickets with set-based UPDATEs that stamp the *_sent_at
+   markers, one per (response|resolution, warning|breach) threshold.
+   Predicates are on the indexed due-at columns, so only tickets whose
+   threshold falls in the current window are touched
+2. Load the claimed tickets and all recipients in a few batched queries
+3. Send notifications in one bulk email send
+4. Write audit log rows in one batch
 """
 
 import logging
-from datetime import datetime
-from typing import List, Optional, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Callable
 
-from sqlalchemy import select, and_, or_
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import select, update, insert, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.core.config import settings
-from app.models.ticket import Ticket, TicketStatus
+from app.db.session import AsyncSessionLocal
+from app.models.audit_log import AuditLog, AuditAction
+from app.models.ticket import Ticket, TicketStatus, SLA_CONFIG
 from app.services.email import get_email_service
-from app.services.audit import AuditService
-from app.dao.user import UserDAO
 from app.models.user import User, UserRole
 
 
@@ -39,6 +43,99 @@ logger = logging.getLogger(__name__)
 # SLA check interval in seconds (5 minutes default)
 SLA_CHECK_INTERVAL_SECONDS = getattr(settings, "SLA_CHECK_INTERVAL_SECONDS", 300)
 
+# Fraction of the SLA window after which a warning is sent
+SLA_WARNING_FRACTION = 0.75
+
+# WHY: A ticket can only be in its warning zone when its due-at is within
+# (1 - fraction) of the longest configured SLA. Bounding due_at by this
+# lookahead keeps the warning scan on the due-at index instead of
+# evaluating the elapsed-percent expression for every open ticket.
+SLA_WARNING_LOOKAHEAD = timedelta(
+    hours=(1 - SLA_WARNING_FRACTION)
+    * max(max(hours.values()) for hours in SLA_CONFIG.values())
+)
+
+# Statuses whose SLA timers have stopped
+_FINISHED_STATUSES = [TicketStatus.RESOLVED, TicketStatus.CLOSED]
+
+
+@dataclass
+class SLAEvent:
+    """
+    One claimed SLA notification.
+
+    Attributes:
+        ticket_id: Ticket that crossed a threshold
+        sla_type: "response" or "resolution"
+        sla_status: "warning" or "breached"
+    """
+
+    ticket_id: int
+    sla_type: str
+    sla_status: str
+
+
+def _sla_columns(sla_type: str):
+    """Return (due_at, warning_sent_at, breach_sent_at) columns for an SLA type."""
+    if sla_type == "response":
+        return (
+            Ticket.sla_response_due_at,
+            Ticket.sla_response_warning_sent_at,
+            Ticket.sla_response_breach_sent_at,
+        )
+    return (
+        Ticket.sla_resolution_due_at,
+        Ticket.sla_resolution_warning_sent_at,
+        Ticket.sla_resolution_breach_sent_at,
+    )
+
+
+def _sla_threshold_conditions(sla_type: str, sla_status: str, now: datetime) -> list:
+    """
+    Build the WHERE conditions for tickets that crossed a threshold.
+
+    WHAT: Mirrors Ticket.is_sla_*_breached / is_sla_*_warning_zone in SQL.
+
+    WHY: Evaluating thresholds in the database means only matching tickets
+    are ever loaded. The leading due-at range predicate is what the partial
+    indexes from migration 026 serve.
+
+    Args:
+        sla_type: "response" or "resolution"
+        sla_status: "warning" or "breached"
+        now: Evaluation time
+
+    Returns:
+        List of SQLAlchemy conditions
+    """
+    due_at, warning_sent_at, breach_sent_at = _sla_columns(sla_type)
+
+    conditions = [
+        due_at.is_not(None),
+        breach_sent_at.is_(None),
+        Ticket.status.notin_(_FINISHED_STATUSES),
+    ]
+    if sla_type == "response":
+        conditions.append(Ticket.first_response_at.is_(None))
+
+    if sla_status == "breached":
+        conditions.append(due_at < now)
+    else:
+        conditions.extend([
+            warning_sent_at.is_(None),
+            due_at >= now,
+            due_at <= now + SLA_WARNING_LOOKAHEAD,
+            Ticket.created_at + (due_at - Ticket.created_at) * SLA_WARNING_FRACTION <= now,
+        ])
+    return conditions
+
+
+def _format_duration(minutes: int) -> str:
+    """Format minutes as "Xh Ym" or "Ym" for display."""
+    if minutes >= 60:
+        return f"{minutes // 60}h {minutes % 60}m"
+    return f"{minutes}m"
+
 
 class SLABackgroundService:
     """
@@ -54,7 +151,9 @@ class SLABackgroundService:
     - Duplicate prevention via tracking fields
 
     HOW: Scheduled job runs every 5 minutes using APScheduler.
-    Uses Redis-backed job store for persistence across restarts.
+    Each threshold is claimed by stamping its *_sent_at marker before any
+    email goes out, so overlapping runs (or several app instances) never
+    notify the same ticket twice.
 
     Example:
         service = SLABackgroundService()
@@ -67,29 +166,21 @@ class SLABackgroundService:
 
         Args:
             session_factory: Optional factory for creating database sessions.
-                           If not provided, creates sessions from settings.
+                           If not provided, uses the application's session factory.
         """
         self._session_factory = session_factory
         self._email_service = None
 
     async def _get_session(self) -> AsyncSession:
-        """Get a database session for the job."""
+        """
+        Get a database session for the job.
+
+        WHY: Reuses the application engine's pool. Creating an engine per
+        run leaked a connection pool on every tick.
+        """
         if self._session_factory:
             return self._session_factory()
-
-        # Create engine and session on demand
-        # WHY: Using async_database_url property which converts the sync URL to async format
-        engine = create_async_engine(
-            settings.async_database_url,
-            echo=False,
-            pool_pre_ping=True,
-        )
-        async_session = async_sessionmaker(
-            engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
-        return async_session()
+        return AsyncSessionLocal()
 
     def _get_email_service(self):
         """Get email service instance."""
@@ -101,17 +192,17 @@ class SLABackgroundService:
         """
         Main job function: Check all active tickets for SLA status.
 
-        WHAT: Scans all open/in-progress tickets and sends notifications
-        for those in warning zone or breached.
+        WHAT: Claims tickets that crossed a warning or breach threshold
+        and notifies their assignee and org admins.
 
         WHY: Centralized SLA checking ensures no tickets are missed
         and notifications are consistent.
 
         HOW:
-        1. Query tickets not in resolved/closed status
-        2. Check each for warning zone and breach status
-        3. Send notifications where needed
-        4. Track sent notifications to prevent duplicates
+        1. Claim each threshold with one set-based UPDATE ... RETURNING
+        2. Commit the claims before sending (at-most-once delivery)
+        3. Batch-load tickets and recipients, send all emails in bulk
+        4. Insert SentEmail and audit rows, one statement each
 
         Returns:
             Dict with counts of warnings and breaches processed
@@ -129,31 +220,27 @@ class SLABackgroundService:
 
         session = await self._get_session()
         try:
-            # Get all active tickets (not resolved or closed)
-            tickets = await self._get_active_tickets(session)
-            logger.info(f"Checking SLA status for {len(tickets)} active tickets")
-
-            for ticket in tickets:
-                try:
-                    # Check response SLA
-                    response_result = await self._check_response_sla(session, ticket)
-                    if response_result == "warning":
-                        stats["response_warnings"] += 1
-                    elif response_result == "breach":
-                        stats["response_breaches"] += 1
-
-                    # Check resolution SLA
-                    resolution_result = await self._check_resolution_sla(session, ticket)
-                    if resolution_result == "warning":
-                        stats["resolution_warnings"] += 1
-                    elif resolution_result == "breach":
-                        stats["resolution_breaches"] += 1
+            now = datetime.utcnow()
+            events = await self._claim_sla_events(session, now)
+            await session.commit()
 
-                except Exception as e:
-                    logger.error(f"Error checking SLA for ticket {ticket.id}: {e}")
-                    stats["errors"] += 1
+            for event in events:
+                suffix = "warnings" if event.sla_status == "warning" else "breaches"
+                stats[f"{event.sla_type}_{suffix}"] += 1
 
-            await session.commit()
+            if events:
+                logger.info(f"Sending {len(events)} SLA notifications")
+                tickets = await self._load_tickets(
+                    session, {event.ticket_id for event in events}
+                )
+                recipients = await self._get_recipients_by_ticket(
+                    session, list(tickets.values())
+                )
+                stats["errors"] = await self._send_notifications(
+                    session, events, tickets, recipients, now
+                )
+                await self._log_sla_events(session, events, tickets, recipients, now)
+                await session.commit()
 
         except Exception as e:
             logger.error(f"Error in SLA breach check job: {e}")
@@ -173,339 +260,290 @@ class SLABackgroundService:
 
         return stats
 
-    async def _get_active_tickets(self, session: AsyncSession) -> List[Ticket]:
+    async def _claim_sla_events(
+        self, session: AsyncSession, now: datetime
+    ) -> List[SLAEvent]:
         """
-        Get all active tickets that need SLA checking.
+        Stamp *_sent_at markers for every ticket that crossed a threshold.
 
-        WHAT: Queries tickets that are not resolved or closed.
+        WHAT: Runs one UPDATE ... RETURNING id per (SLA type, status).
 
-        WHY: Only active tickets need SLA monitoring.
-        Resolved/closed tickets have completed their lifecycle.
+        WHY: Set-based stamping replaces a flush per ticket. Rows are picked
+        with FOR UPDATE SKIP LOCKED in batches of SLA_CHECK_BATCH_SIZE, so a
+        backlog after downtime is spread over several runs and concurrent
+        runners never claim the same ticket.
+
+        Breaches are claimed first so a ticket that went straight past its
+        warning window gets only the breach notification.
 
         Args:
             session: Database session
+            now: Evaluation time
 
         Returns:
-            List of active Ticket objects
+            Claimed events
         """
-        query = select(Ticket).where(
-            Ticket.status.notin_([TicketStatus.RESOLVED, TicketStatus.CLOSED])
-        )
-        result = await session.execute(query)
-        return list(result.scalars().all())
+        events: List[SLAEvent] = []
+
+        for sla_status in ("breached", "warning"):
+            for sla_type in ("response", "resolution"):
+                _, warning_sent_at, breach_sent_at = _sla_columns(sla_type)
+                marker = breach_sent_at if sla_status == "breached" else warning_sent_at
+                conditions = _sla_threshold_conditions(sla_type, sla_status, now)
+
+                candidates = (
+                    select(Ticket.id)
+                    .where(and_(*conditions))
+                    .limit(settings.SLA_CHECK_BATCH_SIZE)
+                    .with_for_update(skip_locked=True)
+                    .scalar_subquery()
+                )
+                result = await session.execute(
+                    update(Ticket)
+                    .where(Ticket.id.in_(candidates), marker.is_(None))
+                    .values({marker.key: now})
+                    .returning(Ticket.id)
+                    .execution_options(synchronize_session=False)
+                )
+                events.extend(
+                    SLAEvent(ticket_id=ticket_id, sla_type=sla_type, sla_status=sla_status)
+                    for ticket_id in result.scalars().all()
+                )
+
+        return events
 
-    async def _check_response_sla(
-        self, session: AsyncSession, ticket: Ticket
-    ) -> Optional[str]:
+    async def _load_tickets(
+        self, session: AsyncSession, ticket_ids: set[int]
+    ) -> Dict[int, Ticket]:
         """
-        Check response SLA status and send notifications if needed.
+        Load claimed tickets with the users shown in notifications.
 
         Args:
             session: Database session
-            ticket: Ticket to check
+            ticket_ids: Claimed ticket IDs
 
         Returns:
-            "warning", "breach", or None if no action needed
+            Ticket ID -> Ticket
         """
-        # Skip if already responded
-        if ticket.first_response_at is not None:
-            return None
-
-        # Skip if no SLA set
-        if ticket.sla_response_due_at is None:
-            return None
-
-        now = datetime.utcnow()
+        result = await session.execute(
+            select(Ticket)
+            .where(Ticket.id.in_(ticket_ids))
+            .options(selectinload(Ticket.created_by), selectinload(Ticket.assigned_to))
+        )
+        return {ticket.id: ticket for ticket in result.scalars().all()}
 
-        # Check for breach first (more severe)
-        if ticket.is_sla_response_breached:
-            if ticket.sla_response_breach_sent_at is None:
-                await self._send_sla_breach_notification(
-                    session, ticket, "response"
-                )
-                ticket.sla_response_breach_sent_at = now
-                await session.flush()
-                return "breach"
-
-        # Check for warning (75% elapsed)
-        elif ticket.is_sla_response_warning_zone:
-            if ticket.sla_response_warning_sent_at is None:
-                await self._send_sla_warning_notification(
-                    session, ticket, "response"
-                )
-                ticket.sla_response_warning_sent_at = now
-                await session.flush()
-                return "warning"
+    async def _get_recipients_by_ticket(
+        self, session: AsyncSession, tickets: List[Ticket]
+    ) -> Dict[int, List[User]]:
+        """
+        Get notification recipients for many tickets at once.
 
-        return None
+        WHAT: Determines notification recipients for each ticket.
 
-    async def _check_resolution_sla(
-        self, session: AsyncSession, ticket: Ticket
-    ) -> Optional[str]:
-        """
-        Check resolution SLA status and send notifications if needed.
+        WHY: Ensures right people are notified:
+        - Assigned user (if any)
+        - All admins in the organization
+        Two queries cover every ticket instead of two per ticket.
 
         Args:
             session: Database session
-            ticket: Ticket to check
+            tickets: Tickets to get recipients for
 
         Returns:
-            "warning", "breach", or None if no action needed
+            Ticket ID -> list of User objects to notify
         """
-        # Skip if already resolved
-        if ticket.status in [TicketStatus.RESOLVED, TicketStatus.CLOSED]:
-            return None
-
-        # Skip if no SLA set
-        if ticket.sla_resolution_due_at is None:
-            return None
-
-        now = datetime.utcnow()
-
-        # Check for breach first (more severe)
-        if ticket.is_sla_resolution_breached:
-            if ticket.sla_resolution_breach_sent_at is None:
-                await self._send_sla_breach_notification(
-                    session, ticket, "resolution"
-                )
-                ticket.sla_resolution_breach_sent_at = now
-                await session.flush()
-                return "breach"
-
-        # Check for warning (75% elapsed)
-        elif ticket.is_sla_resolution_warning_zone:
-            if ticket.sla_resolution_warning_sent_at is None:
-                await self._send_sla_warning_notification(
-                    session, ticket, "resolution"
+        assignee_ids = {t.assigned_to_user_id for t in tickets if t.assigned_to_user_id}
+        org_ids = {t.org_id for t in tickets}
+
+        users_by_id: Dict[int, User] = {}
+        if assignee_ids or org_ids:
+            result = await session.execute(
+                select(User).where(
+                    User.is_active == True,
+                    or_(
+                        User.id.in_(assignee_ids),
+                        and_(User.org_id.in_(org_ids), User.role == UserRole.ADMIN),
+                    ),
                 )
-                ticket.sla_resolution_warning_sent_at = now
-                await session.flush()
-                return "warning"
+            )
+            users_by_id = {user.id: user for user in result.scalars().all()}
+
+        admins_by_org: Dict[int, List[User]] = {}
+        for user in users_by_id.values():
+            if user.role == UserRole.ADMIN and user.org_id in org_ids:
+                admins_by_org.setdefault(user.org_id, []).append(user)
+
+        recipients: Dict[int, List[User]] = {}
+        for ticket in tickets:
+            ticket_recipients = []
+            assignee = users_by_id.get(ticket.assigned_to_user_id)
+            if assignee is not None:
+                ticket_recipients.append(assignee)
+            ticket_recipients.extend(
+                admin
+                for admin in admins_by_org.get(ticket.org_id, [])
+                if assignee is None or admin.id != assignee.id
+            )
+            recipients[ticket.id] = ticket_recipients
 
-        return None
+        return recipients
 
-    async def _send_sla_warning_notification(
-        self, session: AsyncSession, ticket: Ticket, sla_type: str
-    ) -> None:
+    def _build_email_kwargs(
+        self, ticket: Ticket, sla_type: str, sla_status: str, now: datetime
+    ) -> Dict[str, Any]:
         """
-        Send SLA warning notification.
-
-        WHAT: Sends notification when SLA is 75% elapsed.
-
-        WHY: Gives team time to act before breach occurs.
+        Build the recipient-independent arguments for send_sla_warning_email.
 
         Args:
-            session: Database session
-            ticket: Ticket with approaching SLA
+            ticket: Ticket that crossed a threshold
             sla_type: "response" or "resolution"
-        """
-        email_service = self._get_email_service()
-        audit = AuditService(session)
+            sla_status: "warning" or "breached"
+            now: Evaluation time
 
-        # Get recipients (assignee + org admins)
-        recipients = await self._get_notification_recipients(session, ticket)
-
-        # Calculate remaining time
-        if sla_type == "response":
-            remaining_seconds = ticket.sla_response_remaining_seconds
-            due_at = ticket.sla_response_due_at
-        else:
-            remaining_seconds = ticket.sla_resolution_remaining_seconds
-            due_at = ticket.sla_resolution_due_at
-
-        remaining_minutes = int(remaining_seconds / 60) if remaining_seconds else 0
+        Returns:
+            Keyword arguments (without to_email/user_name)
+        """
+        due_at, _, _ = _sla_columns(sla_type)
+        due_at = getattr(ticket, due_at.key)
 
-        # Format time remaining for display
-        if remaining_minutes >= 60:
-            hours = remaining_minutes // 60
-            mins = remaining_minutes % 60
-            time_remaining = f"{hours}h {mins}m"
+        if sla_status == "breached":
+            minutes = int((now - due_at).total_seconds() / 60) if due_at else 0
+            time_remaining = f"{_format_duration(minutes)} overdue"
         else:
-            time_remaining = f"{remaining_minutes}m"
-
-        # Get customer info
-        customer_name = "Unknown"
-        if ticket.created_by:
-            customer_name = ticket.created_by.name
-
-        # Get assigned to name
-        assigned_to = None
-        if ticket.assigned_to:
-            assigned_to = ticket.assigned_to.name
-
-        for recipient in recipients:
-            try:
-                await email_service.send_sla_warning_email(
-                    to_email=recipient.email,
-                    user_name=recipient.name,
-                    ticket_id=ticket.id,
-                    ticket_subject=ticket.subject,
-                    ticket_priority=ticket.priority.value,
-                    sla_type=sla_type,
-                    sla_status="warning",
-                    due_at=due_at.strftime("%Y-%m-%d %H:%M UTC") if due_at else "N/A",
-                    customer_name=customer_name,
-                    assigned_to=assigned_to,
-                    time_remaining=time_remaining,
-                )
-                logger.info(
-                    f"Sent {sla_type} SLA warning for ticket {ticket.id} to {recipient.email}"
-                )
-            except Exception as e:
-                logger.error(
-                    f"Failed to send SLA warning email for ticket {ticket.id} to {recipient.email}: {e}"
-                )
-
-        # Audit log
-        await audit.log(
-            action="sla_warning_sent",
-            user_id=None,  # System action
-            org_id=ticket.org_id,
-            resource_type="ticket",
-            resource_id=str(ticket.id),
-            extra_data={
-                "sla_type": sla_type,
-                "remaining_minutes": remaining_minutes,
-                "recipients_count": len(recipients),
-            },
-        )
+            minutes = int((due_at - now).total_seconds() / 60) if due_at else 0
+            time_remaining = _format_duration(max(minutes, 0))
+
+        return {
+            "ticket_id": ticket.id,
+            "ticket_subject": ticket.subject,
+            "ticket_priority": ticket.priority.value,
+            "sla_type": sla_type,
+            "sla_status": sla_status,
+            "due_at": due_at.strftime("%Y-%m-%d %H:%M UTC") if due_at else "N/A",
+            "customer_name": ticket.created_by.name if ticket.created_by else "Unknown",
+            "assigned_to": ticket.assigned_to.name if ticket.assigned_to else None,
+            "time_remaining": time_remaining,
+        }
 
-    async def _send_sla_breach_notification(
-        self, session: AsyncSession, ticket: Ticket, sla_type: str
-    ) -> None:
+    async def _send_notifications(
+        self,
+        session: AsyncSession,
+        events: List[SLAEvent],
+        tickets: Dict[int, Ticket],
+        recipients: Dict[int, List[User]],
+        now: datetime,
+    ) -> int:
         """
-        Send SLA breach notification.
-
-        WHAT: Sends notification when SLA is breached.
+        Send every notification of the run as one bulk send.
 
-        WHY: Escalates breached tickets for immediate attention.
+        WHY: Sending one email at a time made the job slower than its own
+        interval under load. send_bulk uses the provider's batch endpoint
+        (or rate-limited concurrent sends) and logs the SentEmail rows in
+        one INSERT.
 
         Args:
-            session: Database session
-            ticket: Ticket with breached SLA
-            sla_type: "response" or "resolution"
+            session: Database session (SentEmail logging, after the sends)
+            events: Claimed events
+            tickets: Ticket ID -> Ticket
+            recipients: Ticket ID -> recipients
+            now: Evaluation time
+
+        Returns:
+            Number of failed sends
         """
         email_service = self._get_email_service()
-        audit = AuditService(session)
 
-        # Get recipients (assignee + org admins)
-        recipients = await self._get_notification_recipients(session, ticket)
+        # WHY: Claims are already committed, so one failing message must not
+        # abort the loop and silently drop the rest of the run
+        errors = 0
+        messages = []
+        for event in events:
+            ticket = tickets.get(event.ticket_id)
+            if ticket is None:
+                continue
+            email_kwargs = self._build_email_kwargs(
+                ticket, event.sla_type, event.sla_status, now
+            )
+            for recipient in recipients.get(event.ticket_id, []):
+                try:
+                    messages.append(
+                        email_service.build_sla_warning_email(
+                            to_email=recipient.email,
+                            user_name=recipient.name,
+                            org_id=ticket.org_id,
+                            **email_kwargs,
+                        )
+                    )
+                except Exception as e:
+                    errors += 1
+                    logger.error(
+                        f"Failed to build SLA {event.sla_status} email for ticket "
+                        f"{event.ticket_id} to {recipient.email}: {e}"
+                    )
 
-        # Get breach time
-        if sla_type == "response":
-            due_at = ticket.sla_response_due_at
-        else:
-            due_at = ticket.sla_resolution_due_at
+        if not messages:
+            return errors
 
-        breach_minutes = 0
-        if due_at:
-            breach_minutes = int((datetime.utcnow() - due_at).total_seconds() / 60)
+        try:
+            results = await email_service.send_bulk(messages, session=session)
+        except Exception as e:
+            logger.error(f"Failed to send {len(messages)} SLA emails: {e}")
+            return errors + len(messages)
 
-        # Format overdue time for display
-        if breach_minutes >= 60:
-            hours = breach_minutes // 60
-            mins = breach_minutes % 60
-            time_remaining = f"{hours}h {mins}m overdue"
-        else:
-            time_remaining = f"{breach_minutes}m overdue"
-
-        # Get customer info
-        customer_name = "Unknown"
-        if ticket.created_by:
-            customer_name = ticket.created_by.name
-
-        # Get assigned to name
-        assigned_to = None
-        if ticket.assigned_to:
-            assigned_to = ticket.assigned_to.name
-
-        for recipient in recipients:
-            try:
-                # Use same method as warning, with status="breached"
-                await email_service.send_sla_warning_email(
-                    to_email=recipient.email,
-                    user_name=recipient.name,
-                    ticket_id=ticket.id,
-                    ticket_subject=ticket.subject,
-                    ticket_priority=ticket.priority.value,
-                    sla_type=sla_type,
-                    sla_status="breached",
-                    due_at=due_at.strftime("%Y-%m-%d %H:%M UTC") if due_at else "N/A",
-                    customer_name=customer_name,
-                    assigned_to=assigned_to,
-                    time_remaining=time_remaining,
-                )
-                logger.info(
-                    f"Sent {sla_type} SLA breach for ticket {ticket.id} to {recipient.email}"
-                )
-            except Exception as e:
+        for message, result in zip(messages, results):
+            if not result.success:
+                errors += 1
                 logger.error(
-                    f"Failed to send SLA breach email for ticket {ticket.id} to {recipient.email}: {e}"
+                    f"Failed to send SLA {message.metadata['sla_status']} email for ticket "
+                    f"{message.metadata['ticket_id']} to {message.to_email}: {result.error}"
                 )
-
-        # Audit log
-        await audit.log(
-            action="sla_breach_sent",
-            user_id=None,  # System action
-            org_id=ticket.org_id,
-            resource_type="ticket",
-            resource_id=str(ticket.id),
-            extra_data={
-                "sla_type": sla_type,
-                "breach_minutes": breach_minutes,
-                "recipients_count": len(recipients),
-            },
-        )
-
-    async def _get_notification_recipients(
-        self, session: AsyncSession, ticket: Ticket
-    ) -> List[User]:
+        return errors
+
+    async def _log_sla_events(
+        self,
+        session: AsyncSession,
+        events: List[SLAEvent],
+        tickets: Dict[int, Ticket],
+        recipients: Dict[int, List[User]],
+        now: datetime,
+    ) -> None:
         """
-        Get users who should receive SLA notifications.
-
-        WHAT: Determines notification recipients for a ticket.
-
-        WHY: Ensures right people are notified:
-        - Assigned user (if any)
-        - All admins in the organization
+        Record every SLA notification in the audit log with one INSERT.
 
         Args:
             session: Database session
-            ticket: Ticket to get recipients for
-
-        Returns:
-            List of User objects to notify
+            events: Claimed events
+            tickets: Ticket ID -> Ticket
+            recipients: Ticket ID -> recipients
+            now: Evaluation time
         """
-        recipients = []
-        user_ids_added = set()
-
-        user_dao = UserDAO(User, session)
-
-        # Add assignee if exists
-        if ticket.assigned_to_user_id:
-            assignee = await user_dao.get_by_id(ticket.assigned_to_user_id)
-            if assignee and assignee.is_active:
-                recipients.append(assignee)
-                user_ids_added.add(assignee.id)
-
-        # Add org admins
-        query = select(User).where(
-            and_(
-                User.org_id == ticket.org_id,
-                User.role == UserRole.ADMIN,
-                User.is_active == True,
-            )
-        )
-        result = await session.execute(query)
-        admins = result.scalars().all()
-
-        for admin in admins:
-            if admin.id not in user_ids_added:
-                recipients.append(admin)
-                user_ids_added.add(admin.id)
-
-        return recipients
-
+        rows = []
+        for event in events:
+            ticket = tickets.get(event.ticket_id)
+            if ticket is None:
+                continue
+            status_key = "warning" if event.sla_status == "warning" else "breach"
+            rows.append({
+                "actor_user_id": None,  # System action
+                "action": AuditAction.UPDATE,
+                "resource_type": "ticket",
+                "resource_id": ticket.id,
+                "org_id": ticket.org_id,
+                "changes": {
+                    f"sla_{event.sla_type}_{status_key}_sent_at": {
+                        "old": None,
+                        "new": now.isoformat(),
+                    }
+                },
+                "extra_data": {
+                    "event": f"sla_{status_key}_sent",
+                    "sla_type": event.sla_type,
+                    "recipients_count": len(recipients.get(ticket.id, [])),
+                },
+            })
+
+        if rows:
+            await session.execute(insert(AuditLog), rows)
 
 # Singleton instance for the scheduler
 _sla_service: Optional[SLABackgroundService] = None
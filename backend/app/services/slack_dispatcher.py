@@ -0,0 +1,308 @@
+"""
+Slack Dispatch Queue.
+
+WHAT: Queues Slack notifications and posts them in the background,
+coalescing bursts into digest messages.
+
+WHY: NotificationService used to await one webhook POST per event inside
+the request that caused it. A bulk ticket import or an SLA storm produced
+hundreds of posts, Slack rate-limited us (dropping notifications), and
+every request paid Slack's latency.
+
+HOW:
+1. enqueue() appends the message to its channel's (webhook URL's) queue
+   and returns immediately
+2. The first message on an idle channel opens a
+   SLACK_DISPATCH_WINDOW_SECONDS window; everything queued on the channel
+   by the time it closes goes out as one message (a digest when there is
+   more than one)
+3. Posts to a channel are spaced at least
+   SLACK_DISPATCH_MIN_INTERVAL_SECONDS apart (Slack allows about one
+   message per second per webhook)
+4. On 429 the batch goes back to the front of the queue and the channel
+   waits for Slack's Retry-After; other failures back off exponentially
+   and the batch is dropped after SLACK_DISPATCH_MAX_ATTEMPTS
+
+Notifications are best-effort: whatever is queued when the process dies
+is lost, and shutdown posts what it can.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.slack_service import (
+    SLACK_MAX_BLOCKS,
+    SlackService,
+    build_digest_message,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# One digest block per event plus the header block
+_DIGEST_MAX_EVENTS = SLACK_MAX_BLOCKS - 1
+
+# Cap on the exponential backoff after failed posts
+_MAX_BACKOFF_SECONDS = 60.0
+
+Message = Tuple[str, Optional[List[Dict[str, Any]]]]
+
+
+class SlackDispatcher:
+    """
+    Background, per-channel coalescing Slack sender.
+
+    WHAT: Owns the per-channel queues and the task that drains them.
+
+    WHY: See module docstring.
+
+    HOW: One deque of (text, blocks) per webhook URL, plus the monotonic
+    time each channel may post next. That single due time covers the
+    coalescing window, spacing between posts, Retry-After and backoff.
+
+    Attributes:
+        slack_service: Service used to post to the default channel
+    """
+
+    def __init__(self, slack_service: Optional[SlackService] = None):
+        """
+        Initialize an empty dispatcher.
+
+        Args:
+            slack_service: SlackService for the default channel (defaults
+                         to a service configured from settings)
+        """
+        self.slack_service = slack_service or SlackService()
+        self._queues: Dict[str, Deque[Message]] = {}
+        # webhook URL -> monotonic time the channel may post next
+        self._due: Dict[str, float] = {}
+        # webhook URL -> consecutive failed posts
+        self._failures: Dict[str, int] = {}
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.sent_total = 0
+        self.dropped_total = 0
+        self.rate_limited_total = 0
+
+    def _queued(self) -> int:
+        """Count messages waiting across all channels."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    def _service_for(self, webhook_url: str) -> SlackService:
+        """Get the SlackService that posts to a channel."""
+        if webhook_url == self.slack_service.webhook_url:
+            return self.slack_service
+        return SlackService(
+            webhook_url=webhook_url, enabled=True, timeout=self.slack_service.timeout
+        )
+
+    def _ensure_running(self) -> None:
+        """
+        Start the dispatch task on first use.
+
+        WHY: Any process that enqueues (API worker, job worker, script)
+        must also drain, whether or not it ran the app startup hooks.
+        """
+        if self._task is not None and not self._task.done():
+            return
+        try:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        except RuntimeError:
+            # No running loop; messages wait for the next async enqueue
+            pass
+
+    def enqueue(
+        self,
+        text: str,
+        blocks: Optional[List[Dict[str, Any]]] = None,
+        webhook_url: Optional[str] = None,
+    ) -> bool:
+        """
+        Queue a message for a channel.
+
+        Args:
+            text: Plain text message (fallback for blocks)
+            blocks: Optional Block Kit blocks
+            webhook_url: Channel webhook (defaults to the configured one)
+
+        Returns:
+            False if Slack is disabled or the queue is full
+        """
+        url = webhook_url or self.slack_service.webhook_url
+        if not self.slack_service.enabled:
+            logger.debug("Slack notifications disabled, skipping message")
+            return False
+        if not url:
+            logger.warning("Slack webhook URL not configured")
+            return False
+
+        if self._queued() >= settings.SLACK_DISPATCH_MAX_QUEUED:
+            self.dropped_total += 1
+            logger.warning("Slack dispatch queue full, dropping notification")
+            return False
+
+        queue = self._queues.setdefault(url, deque())
+        if not queue:
+            # First message on an idle channel opens the coalescing window
+            window_end = time.monotonic() + settings.SLACK_DISPATCH_WINDOW_SECONDS
+            self._due[url] = max(self._due.get(url, 0.0), window_end)
+            self._wake.set()
+        queue.append((text, blocks))
+
+        self._ensure_running()
+        return True
+
+    async def _post(self, webhook_url: str) -> int:
+        """
+        Post the next batch queued for a channel.
+
+        Args:
+            webhook_url: Channel to post to
+
+        Returns:
+            Number of queued messages delivered
+        """
+        queue = self._queues[webhook_url]
+        batch = [queue.popleft() for _ in range(min(len(queue), _DIGEST_MAX_EVENTS))]
+        text, blocks = batch[0] if len(batch) == 1 else build_digest_message(batch)
+
+        try:
+            await self._service_for(webhook_url).send_message(text, blocks)
+        except Exception as e:
+            context = getattr(e, "context", {})
+            if context.get("retry_after") is not None:
+                # Rate limited: nothing was posted, so no attempt is used up
+                self.rate_limited_total += 1
+                queue.extendleft(reversed(batch))
+                self._due[webhook_url] = time.monotonic() + context["retry_after"]
+                return 0
+
+            failures = self._failures.get(webhook_url, 0) + 1
+            if failures >= settings.SLACK_DISPATCH_MAX_ATTEMPTS:
+                logger.error(
+                    f"Dropping {len(batch)} Slack notification(s) after "
+                    f"{failures} failed posts: {e}"
+                )
+                self.dropped_total += len(batch)
+                self._failures.pop(webhook_url, None)
+                self._due[webhook_url] = (
+                    time.monotonic() + settings.SLACK_DISPATCH_MIN_INTERVAL_SECONDS
+                )
+            else:
+                logger.warning(f"Slack post failed, will retry: {e}")
+                queue.extendleft(reversed(batch))
+                self._failures[webhook_url] = failures
+                self._due[webhook_url] = time.monotonic() + min(
+                    2.0 ** failures, _MAX_BACKOFF_SECONDS
+                )
+            return 0
+
+        self._failures.pop(webhook_url, None)
+        self._due[webhook_url] = time.monotonic() + settings.SLACK_DISPATCH_MIN_INTERVAL_SECONDS
+        self.sent_total += len(batch)
+        return len(batch)
+
+    async def dispatch_due(self, force: bool = False) -> int:
+        """
+        Post one batch on every channel that is due.
+
+        Args:
+            force: Ignore windows, spacing and backoff (shutdown)
+
+        Returns:
+            Number of queued messages delivered
+        """
+        now = time.monotonic()
+        due = [
+            url
+            for url, queue in self._queues.items()
+            if queue and (force or self._due.get(url, 0.0) <= now)
+        ]
+        if not due:
+            return 0
+
+        # WHY: Channels are independent; a slow one mustn't hold up the rest
+        delivered = await asyncio.gather(*[self._post(url) for url in due])
+        return sum(delivered)
+
+    def _next_wait(self) -> Optional[float]:
+        """Seconds until the next channel is due, or None when idle."""
+        pending = [self._due.get(url, 0.0) for url, queue in self._queues.items() if queue]
+        if not pending:
+            return None
+        return max(min(pending) - time.monotonic(), 0.0)
+
+    async def _run(self) -> None:
+        """Dispatch loop: runs until cancelled."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self._next_wait())
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+            try:
+                await self.dispatch_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Slack dispatch failed: {e}")
+
+    async def start(self) -> None:
+        """Start the background dispatch task (app startup)."""
+        self._ensure_running()
+
+    async def stop(self) -> None:
+        """Stop the dispatch task and post what is still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        try:
+            while self._queued() and await self.dispatch_due(force=True):
+                pass
+        except Exception as e:
+            logger.warning(f"Slack dispatch on shutdown failed: {e}")
+
+        remaining = self._queued()
+        if remaining:
+            logger.warning(f"Discarding {remaining} undelivered Slack notification(s)")
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get dispatcher status for health checks.
+
+        Returns:
+            Dict with queued, sent, dropped and rate-limited counts
+        """
+        return {
+            "queued": self._queued(),
+            "sent_total": self.sent_total,
+            "dropped_total": self.dropped_total,
+            "rate_limited_total": self.rate_limited_total,
+        }
+
+
+# Global dispatcher instance
+_slack_dispatcher: Optional[SlackDispatcher] = None
+
+
+def get_slack_dispatcher() -> SlackDispatcher:
+    """
+    Get global Slack dispatcher instance.
+
+    Returns:
+        SlackDispatcher singleton
+    """
+    global _slack_dispatcher
+    if _slack_dispatcher is None:
+        _slack_dispatcher = SlackDispatcher()
+    return _slack_dispatcher
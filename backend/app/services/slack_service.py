@@ -16,10 +16,25 @@ from typing import Any, Dict, List, Optional
 import httpx
 
 from app.core.config import settings
+from app.core.http_client import get_http_client
 from app.core.exceptions import SlackNotificationError
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait after a 429 without a usable Retry-After header
+_DEFAULT_RETRY_AFTER_SECONDS = 30.0
+
+# Slack rejects messages with more than 50 blocks
+SLACK_MAX_BLOCKS = 50
+
+
+def _parse_retry_after(value: Optional[str]) -> float:
+    """Parse a Retry-After header (delay in seconds) with a safe default."""
+    try:
+        return max(float(value), 1.0)
+    except (TypeError, ValueError):
+        return _DEFAULT_RETRY_AFTER_SECONDS
+
 
 class SlackService:
     """
@@ -107,27 +122,39 @@ class SlackService:
             payload["attachments"] = attachments
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    self.webhook_url,
-                    json=payload,
-                )
-
-                # Slack returns "ok" for successful messages
-                if response.status_code == 200 and response.text == "ok":
-                    logger.info("Slack message sent successfully")
-                    return True
-
-                # Handle error responses
-                logger.error(
-                    f"Slack webhook returned error: {response.status_code} - {response.text}"
-                )
+            client = get_http_client("slack")
+            response = await client.post(
+                self.webhook_url,
+                json=payload,
+                timeout=self.timeout,
+            )
+
+            # Slack returns "ok" for successful messages
+            if response.status_code == 200 and response.text == "ok":
+                logger.info("Slack message sent successfully")
+                return True
+
+            # WHY: Slack answers 429 with Retry-After when we post too fast;
+            # callers that queue (SlackDispatcher) wait that long before retrying
+            if response.status_code == 429:
+                retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                logger.warning(f"Slack webhook rate limited, retry after {retry_after}s")
                 raise SlackNotificationError(
-                    message="Slack webhook returned an error",
-                    status_code=response.status_code,
-                    response_text=response.text,
+                    message="Slack webhook rate limited",
+                    status_code=429,
+                    retry_after=retry_after,
                 )
 
+            # Handle error responses
+            logger.error(
+                f"Slack webhook returned error: {response.status_code} - {response.text}"
+            )
+            raise SlackNotificationError(
+                message="Slack webhook returned an error",
+                status_code=response.status_code,
+                response_text=response.text,
+            )
+
         except httpx.TimeoutException as e:
             logger.error(f"Slack webhook timeout: {e}")
             raise SlackNotificationError(
@@ -583,3 +610,44 @@ def build_proposal_status_message(
     ]
 
     return text, blocks
+
+
+def build_digest_message(
+    messages: List[tuple[str, Optional[List[Dict[str, Any]]]]],
+) -> tuple[str, List[Dict[str, Any]]]:
+    """
+    Build one Slack message summarizing several notifications.
+
+    WHAT: Collapses queued notifications into a single digest.
+
+    WHY: Bursts (bulk ticket imports, SLA storms) would otherwise post one
+    webhook message per event and hit Slack's rate limits.
+
+    HOW: One section per notification using its fallback text, with the
+    notification's first button (if any) kept as the section accessory.
+    Callers must pass at most SLACK_MAX_BLOCKS - 1 messages.
+
+    Args:
+        messages: (fallback text, blocks) per notification, oldest first
+
+    Returns:
+        Tuple of (fallback text, Block Kit blocks)
+    """
+    text = f"{len(messages)} notifications: " + "; ".join(t for t, _ in messages)
+
+    blocks = [build_header_block(f"{len(messages)} Notifications")]
+    for i, (message_text, message_blocks) in enumerate(messages):
+        section = build_section_block(message_text[:3000])  # Slack section limit
+        button = next(
+            (
+                block["elements"][0]
+                for block in message_blocks or []
+                if block.get("type") == "actions" and block.get("elements")
+            ),
+            None,
+        )
+        if button is not None:
+            section["accessory"] = {**button, "action_id": f"button_{i}"}
+        blocks.append(section)
+
+    return text[:3000], blocks
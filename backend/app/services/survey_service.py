@@ -672,16 +672,11 @@ class SurveyService:
         """
         await self.get_survey(survey_id, org_id)
 
-        invitations = []
-        for user_id in user_ids:
-            invitation = await self.invitation_dao.create_invitation(
-                org_id=org_id,
-                survey_id=survey_id,
-                user_id=user_id,
-            )
-            invitations.append(invitation)
-
-        return invitations
+        return await self.invitation_dao.create_invitations(
+            org_id=org_id,
+            survey_id=survey_id,
+            user_ids=user_ids,
+        )
 
     async def get_invitation_by_token(
         self,
@@ -566,15 +566,28 @@ class TimeEntryService:
         Returns:
             Results dict
         """
-        approved = []
-        failed = []
+        # WHY: One UPDATE for the whole batch; only the leftovers are
+        # looked up to explain why they weren't approved.
+        approved_ids = set(
+            await self.entry_dao.bulk_approve_entries(entry_ids, org_id, approver_id)
+        )
+        approved = [entry_id for entry_id in entry_ids if entry_id in approved_ids]
 
-        for entry_id in entry_ids:
-            try:
-                entry = await self.approve_entry(entry_id, org_id, approver_id)
-                approved.append(entry_id)
-            except Exception as e:
-                failed.append({"id": entry_id, "error": str(e)})
+        failed = []
+        remaining = [entry_id for entry_id in entry_ids if entry_id not in approved_ids]
+        if remaining:
+            existing = {
+                entry.id: entry
+                for entry in await self.entry_dao.get_by_ids_and_org(remaining, org_id)
+            }
+            for entry_id in remaining:
+                if entry_id not in existing:
+                    failed.append({"id": entry_id, "error": "Time entry not found"})
+                else:
+                    failed.append({
+                        "id": entry_id,
+                        "error": "Entry must be submitted before approval",
+                    })
 
         return {
             "approved_count": len(approved),
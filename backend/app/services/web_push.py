@@ -0,0 +1,232 @@
+"""
+Web Push delivery engine.
+
+WHAT: Encrypts and sends Web Push messages without blocking the event loop.
+
+WHY: pywebpush.webpush() encrypts, signs a VAPID JWT and POSTs with
+requests, all synchronously. Called from async code, every push stalled
+every other request on the worker, and org-wide pushes went out one
+subscription at a time.
+
+HOW:
+1. Payload encryption (ECDH + AES-GCM, CPU-bound) runs on a small bounded
+   thread pool
+2. VAPID headers are signed once per push service origin and reused until
+   shortly before the token expires
+3. The encrypted message is POSTed through the shared pooled "push" HTTP
+   client, so many sends are in flight at once on warm connections
+4. Callers fan out with send_many(), bounded by PUSH_MAX_CONCURRENCY
+
+Without pywebpush or VAPID credentials the engine is unavailable and
+callers fall back to logging notifications (console mode).
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+from app.core.config import settings
+from app.core.http_client import get_http_client
+
+
+logger = logging.getLogger(__name__)
+
+# Push service statuses meaning the subscription no longer exists
+GONE_STATUSES = {404, 410}
+
+# Re-sign VAPID headers this long before the token expires
+_VAPID_REFRESH_MARGIN_SECONDS = 300
+
+
+def _push_origin(endpoint: str) -> str:
+    """Get the push service origin (the VAPID audience) of an endpoint."""
+    parsed = urlparse(endpoint)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+class WebPushSender:
+    """
+    Async Web Push sender.
+
+    WHAT: Sends encrypted messages to push subscriptions.
+
+    WHY: See module docstring.
+
+    HOW: One instance per process owns the thread pool, the parsed VAPID
+    key and the per-origin header cache.
+    """
+
+    def __init__(
+        self,
+        vapid_private_key: Optional[str] = settings.VAPID_PRIVATE_KEY,
+        vapid_mailto: str = settings.VAPID_MAILTO,
+        max_workers: int = settings.PUSH_MAX_WORKERS,
+        token_ttl_seconds: int = settings.PUSH_VAPID_TOKEN_TTL_SECONDS,
+    ):
+        """
+        Initialize sender (the VAPID key is parsed on first use).
+
+        Args:
+            vapid_private_key: VAPID private key (base64url or PEM)
+            vapid_mailto: Contact address for the VAPID "sub" claim
+            max_workers: Threads for encryption and signing
+            token_ttl_seconds: VAPID JWT lifetime (push services allow up to 24h)
+        """
+        self.vapid_private_key = vapid_private_key
+        self.vapid_mailto = vapid_mailto
+        self.max_workers = max_workers
+        self.token_ttl_seconds = token_ttl_seconds
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._vapid = None
+        # origin -> (refresh_at, headers)
+        self._vapid_headers: Dict[str, Tuple[float, Dict[str, str]]] = {}
+        self._sign_lock = asyncio.Lock()
+
+    @property
+    def available(self) -> bool:
+        """Whether pywebpush is installed and VAPID credentials are set."""
+        if not self.vapid_private_key:
+            return False
+        try:
+            import pywebpush  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    async def _run(self, fn, *args):
+        """Run a CPU-bound call on the bounded pool."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="webpush"
+            )
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    def _sign(self, origin: str) -> Dict[str, str]:
+        """Sign VAPID headers for a push service origin (blocking)."""
+        if self._vapid is None:
+            from py_vapid import Vapid
+
+            self._vapid = Vapid.from_string(private_key=self.vapid_private_key)
+        claims = {
+            "sub": f"mailto:{self.vapid_mailto}",
+            "aud": origin,
+            "exp": int(time.time()) + self.token_ttl_seconds,
+        }
+        return self._vapid.sign(claims)
+
+    async def _get_vapid_headers(self, origin: str) -> Dict[str, str]:
+        """
+        Get VAPID headers for an origin, signing only when expired.
+
+        WHY: A VAPID JWT depends only on the audience (push service origin)
+        and expiry, so one signature serves every subscription on that
+        push service for hours.
+        """
+        cached = self._vapid_headers.get(origin)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        # WHY: A fan-out starts many sends at once; only one should sign
+        async with self._sign_lock:
+            cached = self._vapid_headers.get(origin)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
+            headers = await self._run(self._sign, origin)
+            refresh_in = max(self.token_ttl_seconds - _VAPID_REFRESH_MARGIN_SECONDS, 0)
+            self._vapid_headers[origin] = (time.monotonic() + refresh_in, headers)
+            return headers
+
+    @staticmethod
+    def _encrypt(subscription_info: Dict[str, Any], payload: bytes) -> bytes:
+        """Encrypt a payload for one subscription (aes128gcm, blocking)."""
+        from pywebpush import WebPusher
+
+        return WebPusher(subscription_info).encode(payload, "aes128gcm")["body"]
+
+    async def send(self, subscription_info: Dict[str, Any], payload: str) -> int:
+        """
+        Send one push message.
+
+        Args:
+            subscription_info: Subscription dict (endpoint and keys)
+            payload: JSON payload string
+
+        Returns:
+            HTTP status from the push service
+
+        Raises:
+            httpx.HTTPError: If the push service can't be reached
+        """
+        endpoint = subscription_info["endpoint"]
+        body = await self._run(self._encrypt, subscription_info, payload.encode())
+        vapid_headers = await self._get_vapid_headers(_push_origin(endpoint))
+
+        response = await get_http_client("push").post(
+            endpoint,
+            content=body,
+            headers={
+                **vapid_headers,
+                "Content-Encoding": "aes128gcm",
+                "Content-Type": "application/octet-stream",
+                "TTL": "0",
+            },
+            timeout=settings.PUSH_TIMEOUT_SECONDS,
+        )
+        return response.status_code
+
+    async def send_many(
+        self,
+        subscription_infos: Sequence[Dict[str, Any]],
+        payload: str,
+    ) -> List[Optional[int]]:
+        """
+        Send one payload to many subscriptions concurrently.
+
+        Args:
+            subscription_infos: Subscription dicts
+            payload: JSON payload string
+
+        Returns:
+            Push service status per subscription (same order), or None
+            where the send failed before a response
+        """
+        semaphore = asyncio.Semaphore(settings.PUSH_MAX_CONCURRENCY)
+
+        async def send_one(info: Dict[str, Any]) -> Optional[int]:
+            async with semaphore:
+                try:
+                    return await self.send(info, payload)
+                except Exception as e:
+                    # WHY: Network errors and undecodable subscription keys
+                    # fail this subscription only, not the whole fan-out
+                    logger.warning(f"Push send to {_push_origin(info['endpoint'])} failed: {e}")
+                    return None
+
+        return list(await asyncio.gather(*[send_one(info) for info in subscription_infos]))
+
+    def shutdown(self) -> None:
+        """Stop the worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+# Global sender instance
+_web_push_sender: Optional[WebPushSender] = None
+
+
+def get_web_push_sender() -> WebPushSender:
+    """
+    Get global Web Push sender instance.
+
+    Returns:
+        WebPushSender singleton
+    """
+    global _web_push_sender
+    if _web_push_sender is None:
+        _web_push_sender = WebPushSender()
+    return _web_push_sender
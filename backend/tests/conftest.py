@@ -5,6 +5,12 @@ WHY: Fixtures provide reusable test setup/teardown logic, reducing
 duplication and ensuring consistent test environments.
 """
 
+import os
+
+# WHY: Jobs enqueued during tests stay in memory instead of needing Redis.
+# Must be set before app settings are loaded.
+os.environ.setdefault("JOB_BROKER", "stub")
+
 import pytest
 import pytest_asyncio
 from typing import AsyncGenerator
@@ -13,8 +19,8 @@ from httpx import AsyncClient
 
 from app.main import app
 from app.models.base import Base
-from app.db.session import get_db
-from app.core import auth as auth_module
+from app.db.session import get_db, get_read_db
+from app.core import redis_manager as redis_manager_module
 from app.middleware import rate_limiter as rate_limiter_module
 from app.services import email as email_module
 
@@ -112,6 +118,7 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
 
     # Use ASGI transport for httpx 0.26+
     # WHY: httpx 0.26+ uses ASGITransport instead of the app parameter
@@ -221,17 +228,39 @@ async def test_admin(db_session: AsyncSession, test_org):
 @pytest.fixture(autouse=True)
 def reset_redis_client():
     """
-    Reset the global Redis client before each test.
+    Reset the global Redis manager before each test.
 
-    WHY: The auth module uses a global _redis_client singleton that can
+    WHY: The Redis manager owns a process-wide pool whose connections can
     persist between tests, causing test isolation issues. This fixture
-    ensures each test starts with a fresh Redis connection.
+    ensures each test starts with a fresh Redis connection pool.
     """
-    # Reset the cached Redis client before test
-    auth_module._redis_client = None
+    # Reset the shared Redis pool before test
+    redis_manager_module._redis_manager = None
     yield
     # Reset again after test to clean up
-    auth_module._redis_client = None
+    redis_manager_module._redis_manager = None
+
+
+@pytest.fixture(autouse=True)
+def isolate_principal_cache(monkeypatch):
+    """
+    Give each test its own principal cache.
+
+    WHY: Tables are recreated per test, so user IDs repeat across tests.
+    A principal cached in Redis by one test would authorize a different
+    user in the next. A fresh instance and a per-test key prefix keep
+    entries from leaking while requests still run through the cache.
+    """
+    import uuid
+    from app.core import principal_cache as principal_cache_module
+
+    monkeypatch.setattr(principal_cache_module, "_principal_cache", None)
+    monkeypatch.setattr(
+        principal_cache_module,
+        "PRINCIPAL_KEY_PREFIX",
+        f"test:{uuid.uuid4().hex}:{principal_cache_module.PRINCIPAL_KEY_PREFIX}",
+    )
+    yield
 
 
 @pytest.fixture(autouse=True)
@@ -1376,7 +1376,7 @@ class CalendarIntegrationFactory:
             provider_email = f"calendar-{user_id}@{provider}.com"
 
         dao = CalendarIntegrationDAO(session)
-        integration = CalendarIntegration(
+        return await dao.create(
             user_id=user_id,
             org_id=org_id,
             provider=provider,
@@ -1392,7 +1392,6 @@ class CalendarIntegrationFactory:
             sync_invoices=sync_invoices,
             is_active=is_active,
         )
-        return await dao.create(integration)
 
     @staticmethod
     async def create_expired(
@@ -1499,7 +1498,7 @@ class WebhookEndpointFactory:
             events = [WebhookEventType.TICKET_CREATED.value]
 
         dao = WebhookEndpointDAO(session)
-        endpoint = WebhookEndpoint(
+        return await dao.create(
             org_id=org_id,
             name=name,
             description=description or f"Description for {name}",
@@ -1512,7 +1511,6 @@ class WebhookEndpointFactory:
             max_retries=max_retries,
             created_by_id=created_by_id,
         )
-        return await dao.create(endpoint)
 
     @staticmethod
     async def create_all_events(
@@ -1601,7 +1599,7 @@ class WebhookDeliveryFactory:
             }
 
         dao = WebhookDeliveryDAO(session)
-        delivery = WebhookDelivery(
+        return await dao.create(
             endpoint_id=endpoint.id,
             event_type=event_type,
             event_id=event_id,
@@ -1615,7 +1613,6 @@ class WebhookDeliveryFactory:
             duration_ms=duration_ms,
             error_message=error_message,
         )
-        return await dao.create(delivery)
 
     @staticmethod
     async def create_successful(
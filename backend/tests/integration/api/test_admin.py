@@ -328,6 +328,49 @@ class TestAdminUserManagement:
         assert data["name"] == "Updated Name"
         assert data["role"] == "ADMIN"
 
+    @pytest.mark.asyncio
+    async def test_update_user_role_reaches_cached_principal(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        """
+        Test that a role change applies on the user's next request.
+
+        WHY: The user's principal is cached by their first request; the
+        update must invalidate it rather than wait for the TTL.
+        """
+        org = await OrganizationFactory.create(db_session)
+        await UserFactory.create_admin(
+            db_session, email="role-admin@test.com", password="Password123!", organization=org
+        )
+        target_user = await UserFactory.create_client(
+            db_session, email="role-target@test.com", password="Password123!", organization=org
+        )
+
+        admin_login = await client.post(
+            "/api/auth/login",
+            json={"email": "role-admin@test.com", "password": "Password123!"},
+        )
+        admin_headers = {"Authorization": f"Bearer {admin_login.json()['access_token']}"}
+        target_login = await client.post(
+            "/api/auth/login",
+            json={"email": "role-target@test.com", "password": "Password123!"},
+        )
+        target_headers = {"Authorization": f"Bearer {target_login.json()['access_token']}"}
+
+        # Caches the target's CLIENT principal
+        response = await client.get("/api/admin/users", headers=target_headers)
+        assert response.status_code == 403
+
+        response = await client.put(
+            f"/api/admin/users/{target_user.id}",
+            headers=admin_headers,
+            json={"role": "ADMIN"},
+        )
+        assert response.status_code == 200
+
+        response = await client.get("/api/admin/users", headers=target_headers)
+        assert response.status_code == 200
+
     @pytest.mark.asyncio
     async def test_deactivate_user(
         self, client: AsyncClient, db_session: AsyncSession
@@ -26,6 +26,15 @@ from tests.factories import (
 )
 from app.models.project import ProjectStatus
 from app.models.invoice import InvoiceStatus
+from app.services.analytics_service import get_analytics_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_analytics_cache():
+    """Each test creates its own data, so start without cached snapshots."""
+    get_analytics_cache().clear()
+    yield
+    get_analytics_cache().clear()
 
 
 class TestProjectMetrics:
@@ -6,9 +6,11 @@ testing the full request-response cycle including database operations.
 """
 
 import pytest
+from unittest.mock import AsyncMock, patch
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.dao.user import UserDAO
 from tests.factories import UserFactory, OrganizationFactory
 
 
@@ -141,6 +143,43 @@ class TestAuthenticationIntegration:
         assert "id" in data
         assert "hashed_password" not in data  # Should not leak password hash
 
+    @pytest.mark.asyncio
+    async def test_get_current_user_served_from_principal_cache(
+        self, client: AsyncClient, db_session: AsyncSession
+    ):
+        """
+        Test that repeat requests authorize from the principal cache.
+
+        WHY: The first request loads the user and caches the principal;
+        later requests must not need the database lookup.
+        """
+        org = await OrganizationFactory.create(db_session)
+        await UserFactory.create(
+            db_session,
+            email="cached@test.com",
+            password="Password123!",
+            name="Cached User",
+            organization=org,
+        )
+
+        login_response = await client.post(
+            "/api/auth/login",
+            json={"email": "cached@test.com", "password": "Password123!"},
+        )
+        headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+        first = await client.get("/api/auth/me", headers=headers)
+        assert first.status_code == 200
+
+        with patch.object(
+            UserDAO, "get_by_id", AsyncMock(side_effect=AssertionError("cache miss"))
+        ):
+            second = await client.get("/api/auth/me", headers=headers)
+
+        assert second.status_code == 200
+        assert second.json()["email"] == "cached@test.com"
+        assert second.json()["name"] == "Cached User"
+
     @pytest.mark.asyncio
     async def test_get_current_user_without_token(self, client: AsyncClient):
         """
@@ -500,12 +500,12 @@ class TestWebhookEndpointTestAPI:
             db_session, organization=test_org
         )
 
-        with patch("app.services.integration_service.httpx.AsyncClient") as mock_client:
+        with patch("app.services.integration_service.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.headers = {"Content-Type": "application/json"}
             mock_response.text = '{"received": true}'
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
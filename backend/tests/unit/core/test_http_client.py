@@ -0,0 +1,116 @@
+"""
+Tests for the shared outbound HTTP client registry.
+
+WHY: Verifies that:
+1. Each upstream gets one reused client
+2. Concurrent requests to one host are capped, other hosts are not blocked
+3. Host slots are released once responses are read, and idle hosts are
+   forgotten
+4. Waiting for a host slot is bounded by the pool timeout
+5. Shutdown closes clients, and the next use opens a fresh one
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.core.http_client import HttpClientRegistry, _HostLimitedTransport
+
+
+def _counting_transport(delay: float = 0.02):
+    """Mock transport recording peak concurrency per host."""
+    state = {"in_flight": {}, "peak": {}}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        state["in_flight"][host] = state["in_flight"].get(host, 0) + 1
+        state["peak"][host] = max(state["peak"].get(host, 0), state["in_flight"][host])
+        await asyncio.sleep(delay)
+        state["in_flight"][host] -= 1
+        # WHY: A streamed body behaves like a real transport response
+        return httpx.Response(200, stream=httpx.ByteStream(b"ok"))
+
+    return httpx.MockTransport(handler), state
+
+
+class TestHttpClientRegistry:
+    """Tests for named pooled clients."""
+
+    @pytest.mark.asyncio
+    async def test_same_client_per_upstream(self):
+        """Test callers share one client per name."""
+        registry = HttpClientRegistry()
+
+        assert registry.client("n8n") is registry.client("n8n")
+        assert registry.client("n8n") is not registry.client("slack")
+        assert registry.get_stats()["clients"] == ["n8n", "slack"]
+
+        await registry.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_closes_and_recreates(self):
+        """Test shutdown closes clients; later use gets a new one."""
+        registry = HttpClientRegistry()
+        client = registry.client("email")
+
+        await registry.shutdown()
+
+        assert client.is_closed
+        assert registry.client("email") is not client
+        await registry.shutdown()
+
+    def test_http2_requires_h2(self, monkeypatch):
+        """Test HTTP/2 falls back to HTTP/1.1 without the h2 package."""
+        monkeypatch.setattr("app.core.http_client._http2_available", lambda: False)
+
+        assert HttpClientRegistry(http2=True).http2 is False
+
+
+class TestHostLimitedTransport:
+    """Tests for per-host concurrency limits."""
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit(self):
+        """Test one host never exceeds its slots while others proceed."""
+        inner, state = _counting_transport()
+        client = httpx.AsyncClient(transport=_HostLimitedTransport(inner, max_per_host=2))
+
+        await asyncio.gather(
+            *[client.get("https://slow.example/") for _ in range(6)],
+            *[client.get("https://other.example/") for _ in range(2)],
+        )
+
+        assert state["peak"]["slow.example"] == 2
+        assert state["peak"]["other.example"] == 2
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_slots_released_after_response(self):
+        """Test sequential requests don't leak host slots."""
+        inner, _ = _counting_transport(delay=0)
+        transport = _HostLimitedTransport(inner, max_per_host=1)
+        client = httpx.AsyncClient(transport=transport)
+
+        for _ in range(3):
+            response = await asyncio.wait_for(client.get("https://one.example/"), 1)
+            assert response.text == "ok"
+
+        assert transport._hosts == {}
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_slot_wait_times_out(self):
+        """Test a request waiting longer than the pool timeout fails."""
+        inner, _ = _counting_transport(delay=0.2)
+        transport = _HostLimitedTransport(inner, max_per_host=1)
+        client = httpx.AsyncClient(transport=transport, timeout=httpx.Timeout(5.0, pool=0.05))
+
+        first = asyncio.create_task(client.get("https://busy.example/"))
+        await asyncio.sleep(0.01)
+        with pytest.raises(httpx.PoolTimeout):
+            await client.get("https://busy.example/")
+
+        assert (await first).text == "ok"
+        assert transport._hosts == {}
+        await client.aclose()
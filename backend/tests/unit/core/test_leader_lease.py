@@ -0,0 +1,117 @@
+"""
+Tests for Redis lease-based leader election.
+
+WHY: Scheduled jobs must run once cluster-wide, so the lease must:
+1. Be held by at most one contender at a time
+2. Be renewed by its holder
+3. Fail over once the holder stops renewing or releases it
+4. Stop claiming leadership when Redis is unreachable
+"""
+
+import time
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.core import leader_lease as lease_module
+from app.core.leader_lease import LeaderLease
+
+
+class FakeLeaseRedis:
+    """Minimal Redis stand-in that executes the lease scripts."""
+
+    def __init__(self):
+        self.values = {}
+        self.expires = {}
+
+    def _get(self, key):
+        if key in self.expires and self.expires[key] <= time.monotonic():
+            self.values.pop(key, None)
+            self.expires.pop(key, None)
+        return self.values.get(key)
+
+    async def eval(self, script, numkeys, key, identity, *args):
+        holder = self._get(key)
+        if script == lease_module._ACQUIRE_SCRIPT:
+            ttl = int(args[0]) / 1000
+            if holder is None or holder == identity:
+                self.values[key] = identity
+                self.expires[key] = time.monotonic() + ttl
+                return identity
+            return holder
+        if holder == identity:
+            self.values.pop(key)
+            return 1
+        return 0
+
+
+@pytest.fixture
+def fake_redis():
+    redis = FakeLeaseRedis()
+    with patch("app.core.leader_lease.get_redis_client", return_value=redis):
+        yield redis
+
+
+def make_lease(identity: str, ttl: float = 15.0) -> LeaderLease:
+    return LeaderLease("test", ttl_seconds=ttl, renew_interval_seconds=ttl / 3, identity=identity)
+
+
+class TestLeaderLease:
+    """Tests for acquiring, renewing and failing over."""
+
+    @pytest.mark.asyncio
+    async def test_only_one_contender_leads(self, fake_redis):
+        """Test a held lease can't be taken by another contender."""
+        a, b = make_lease("a"), make_lease("b")
+
+        assert await a.try_acquire() is True
+        assert await b.try_acquire() is False
+        assert a.is_leader and not b.is_leader
+        assert b.get_status()["leader"] == "a"
+
+    @pytest.mark.asyncio
+    async def test_holder_renews(self, fake_redis):
+        """Test the holder keeps the lease across renewals."""
+        a = make_lease("a")
+        await a.try_acquire()
+
+        assert await a.try_acquire() is True
+        assert a.get_status()["last_renewed_seconds_ago"] is not None
+
+    @pytest.mark.asyncio
+    async def test_release_allows_immediate_failover(self, fake_redis):
+        """Test a clean shutdown hands the lease over at once."""
+        a, b = make_lease("a"), make_lease("b")
+        await a.try_acquire()
+
+        await a.stop()
+
+        assert a.is_leader is False
+        assert await b.try_acquire() is True
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_fails_over(self, fake_redis):
+        """Test a leader that stops renewing is replaced after the TTL."""
+        a, b = make_lease("a", ttl=0.01), make_lease("b", ttl=0.01)
+        await a.try_acquire()
+
+        time.sleep(0.02)
+
+        assert a.is_leader is False
+        assert await b.try_acquire() is True
+        assert await a.try_acquire() is False
+
+    @pytest.mark.asyncio
+    async def test_redis_error_keeps_lease_only_until_ttl(self):
+        """Test leadership lapses locally when renewals can't reach Redis."""
+        failing = AsyncMock()
+        failing.eval.side_effect = ConnectionError("redis down")
+        a = make_lease("a", ttl=0.01)
+
+        with patch("app.core.leader_lease.get_redis_client", return_value=failing):
+            assert await a.try_acquire() is False
+
+        a._valid_until = time.monotonic() + 0.01
+        with patch("app.core.leader_lease.get_redis_client", return_value=failing):
+            assert await a.try_acquire() is True
+            time.sleep(0.02)
+            assert await a.try_acquire() is False
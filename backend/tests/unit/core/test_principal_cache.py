@@ -0,0 +1,162 @@
+"""
+Tests for the principal cache used by get_current_user.
+
+WHY: The cache sits on the authorization path, so it must:
+1. Serve hits without touching the database
+2. Never re-cache a principal right after it was invalidated
+3. Never store credentials
+4. Degrade to a database load when Redis is unavailable
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core import principal_cache as principal_cache_module
+from app.core.principal_cache import PrincipalCache, _deserialize_user, _serialize_user
+from app.models.user import User, UserRole
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the Redis commands the cache uses."""
+
+    def __init__(self):
+        self.store = {}
+        self.get_calls = 0
+
+    async def get(self, key):
+        self.get_calls += 1
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    def pipeline(self, transaction=True):
+        redis = self
+        ops = []
+
+        class Pipe:
+            def set(self, key, value, ex=None):
+                ops.append((key, value))
+
+            async def execute(self):
+                for key, value in ops:
+                    redis.store[key] = value
+
+        return Pipe()
+
+
+@pytest.fixture
+def fake_redis():
+    """Patch the cache's Redis accessor with an in-memory fake."""
+    redis = FakeRedis()
+    with patch.object(principal_cache_module, "get_redis_client", MagicMock(return_value=redis)):
+        yield redis
+
+
+def make_user(**overrides) -> User:
+    """Build an unsaved User with every column populated."""
+    values = dict(
+        id=7,
+        name="Ada",
+        email="ada@example.com",
+        hashed_password="$2b$12$secret",
+        role=UserRole.ADMIN,
+        org_id=3,
+        is_active=True,
+        email_verified=True,
+        created_at=datetime(2025, 1, 1, 12, 0, 0),
+        updated_at=datetime(2025, 1, 2, 12, 0, 0),
+    )
+    values.update(overrides)
+    return User(**values)
+
+
+class TestSerialization:
+    """Tests for principal snapshots."""
+
+    def test_credentials_are_not_cached(self):
+        """Test hashed_password never leaves the database."""
+        snapshot = _serialize_user(make_user())
+
+        assert "hashed_password" not in snapshot
+        assert snapshot["role"] == "ADMIN"
+
+    def test_round_trip_restores_types(self):
+        """Test enums and datetimes survive a snapshot round trip."""
+        user = _deserialize_user(_serialize_user(make_user()))
+
+        assert user.id == 7
+        assert user.role == UserRole.ADMIN
+        assert user.created_at == datetime(2025, 1, 1, 12, 0, 0)
+
+
+class TestPrincipalCache:
+    """Tests for the two-level cache."""
+
+    @pytest.mark.asyncio
+    async def test_miss_returns_none(self, fake_redis):
+        """Test an empty cache reports a miss."""
+        assert await PrincipalCache().get(7) is None
+
+    @pytest.mark.asyncio
+    async def test_set_then_get_is_served_locally(self, fake_redis):
+        """Test a filled entry is served without another Redis call."""
+        cache = PrincipalCache()
+        await cache.set(make_user())
+
+        snapshot = await cache.get(7)
+
+        assert snapshot["email"] == "ada@example.com"
+        assert fake_redis.get_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_redis_hit_from_another_worker(self, fake_redis):
+        """Test a principal cached by another process is found in Redis."""
+        await PrincipalCache().set(make_user())
+
+        snapshot = await PrincipalCache().get(7)
+
+        assert snapshot["org_id"] == 3
+        assert fake_redis.get_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_blocks_stale_refill(self, fake_redis):
+        """Test a fill racing an invalidation cannot restore the old principal."""
+        cache = PrincipalCache()
+        await cache.set(make_user())
+
+        await cache.invalidate(7)
+        await cache.set(make_user())  # stale row read before the update
+        other_worker = PrincipalCache()
+
+        assert await cache.get(7) is None
+        assert await other_worker.get(7) is None
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_degrades_to_miss(self):
+        """Test Redis errors fall back to a database load."""
+        with patch.object(
+            principal_cache_module,
+            "get_redis_client",
+            MagicMock(side_effect=ConnectionError("redis down")),
+        ):
+            cache = PrincipalCache()
+            await cache.set(make_user())
+            assert await cache.get(7) is None
+
+    @pytest.mark.asyncio
+    async def test_resolve_attaches_without_loading(self, fake_redis):
+        """Test a hit is attached to the session with merge(load=False)."""
+        cache = PrincipalCache()
+        await cache.set(make_user())
+        db = MagicMock()
+        db.merge = AsyncMock(side_effect=lambda user, load: user)
+
+        user = await cache.resolve(7, db)
+
+        assert user.id == 7
+        assert db.merge.await_args.kwargs == {"load": False}
@@ -0,0 +1,84 @@
+"""
+Tests for the shared Redis connection manager.
+
+WHY: Every Redis consumer goes through one pool, so the manager must:
+1. Hand each subsystem a stable client over the same pool
+2. Attribute in-use and waiting connections to the right subsystem
+3. Release everything on shutdown
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core.redis_manager import RedisManager, _ClientStats, _CountingPool
+
+
+class TestRedisManagerClients:
+    """Tests for named clients."""
+
+    def test_named_clients_share_one_pool(self):
+        """Test subsystems reuse their client and share the pool."""
+        manager = RedisManager(url="redis://localhost:6379/0")
+
+        auth = manager.client("auth")
+
+        assert manager.client("auth") is auth
+        assert manager.client("rate_limiter") is not auth
+        assert manager.client("rate_limiter").connection_pool._pool is auth.connection_pool._pool
+
+    @pytest.mark.asyncio
+    async def test_shutdown_disconnects_pool(self):
+        """Test shutdown drops clients and the pool."""
+        manager = RedisManager(url="redis://localhost:6379/0")
+        manager.client("auth")
+
+        await manager.shutdown()
+
+        assert manager._pool is None
+        assert manager._clients == {}
+
+
+class TestCountingPool:
+    """Tests for per-client connection accounting."""
+
+    @pytest.mark.asyncio
+    async def test_counts_in_use_and_waiting(self):
+        """Test waiting and in-use counters track the connection lifecycle."""
+        gate = asyncio.Event()
+        shared = MagicMock()
+
+        async def get_connection(*args, **kwargs):
+            await gate.wait()
+            return "conn"
+
+        shared.get_connection = get_connection
+        shared.release = AsyncMock()
+        stats = _ClientStats()
+        pool = _CountingPool(shared, stats)
+
+        pending = asyncio.create_task(pool.get_connection("GET"))
+        await asyncio.sleep(0)
+        assert stats.waiting == 1
+
+        gate.set()
+        connection = await pending
+        assert (stats.waiting, stats.in_use, stats.acquired_total) == (0, 1, 1)
+
+        await pool.release(connection)
+        assert stats.in_use == 0
+        shared.release.assert_awaited_once_with("conn")
+
+    def test_pool_stats_aggregate_clients(self):
+        """Test totals sum the per-client counters."""
+        manager = RedisManager(url="redis://localhost:6379/0", max_connections=7)
+        manager.client("auth")
+        manager.client("oauth_state")
+        manager._stats["auth"].in_use = 2
+        manager._stats["oauth_state"].waiting = 1
+
+        stats = manager.get_pool_stats()
+
+        assert stats["max_connections"] == 7
+        assert (stats["in_use"], stats["waiting"]) == (2, 1)
+        assert set(stats["clients"]) == {"auth", "oauth_state"}
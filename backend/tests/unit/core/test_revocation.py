@@ -0,0 +1,127 @@
+"""
+Tests for the local token revocation filter.
+
+WHY: The filter decides whether a blacklist check may skip Redis, so it must:
+1. Never answer "not revoked" before it has synced
+2. Catch revoked tokens and user-wide revocations
+3. Let never-revoked tokens through without a Redis call
+4. Apply events published by other processes
+"""
+
+import json
+import time
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.core import auth as auth_module
+from app.core.auth import blacklist_user_tokens, create_access_token, is_token_blacklisted
+from app.core.revocation import RevocationFilter, token_fingerprint
+
+
+def synced_filter() -> RevocationFilter:
+    """Build a filter that behaves as if its listener had synced."""
+    revocations = RevocationFilter()
+    revocations._synced = True
+    return revocations
+
+
+class TestRevocationFilter:
+    """Tests for local revocation decisions."""
+
+    def test_unsynced_filter_defers_to_redis(self):
+        """Test an unsynced filter never claims a token is clean."""
+        assert RevocationFilter().might_be_revoked("any-token") is True
+
+    def test_revoked_token_is_probable_hit(self):
+        """Test a revoked token must be confirmed in Redis."""
+        revocations = synced_filter()
+        revocations.add_token("revoked", time.time() + 60)
+
+        assert revocations.might_be_revoked("revoked") is True
+        assert revocations.might_be_revoked("other") is False
+
+    def test_expired_entries_are_ignored_and_pruned(self):
+        """Test entries past the token lifetime stop matching."""
+        revocations = synced_filter()
+        revocations.add_token("old", time.time() - 1)
+
+        assert revocations.might_be_revoked("old") is False
+        revocations.prune()
+        assert revocations.get_status()["revoked_tokens"] == 0
+
+    def test_user_revocation_covers_earlier_tokens_only(self):
+        """Test a user cutoff revokes tokens issued at or before it."""
+        revocations = synced_filter()
+        now = int(time.time())
+        revocations.add_user(5, now, now + 60)
+
+        assert revocations.might_be_revoked("t1", {"user_id": 5, "iat": now - 10}) is True
+        assert revocations.might_be_revoked("t2", {"user_id": 5, "iat": now + 1}) is False
+        assert revocations.might_be_revoked("t3", {"user_id": 6, "iat": now - 10}) is False
+
+    def test_apply_published_events(self):
+        """Test events from other processes update the filter."""
+        revocations = synced_filter()
+        now = time.time()
+
+        revocations.apply_event(
+            json.dumps({"type": "token", "fp": token_fingerprint("tok").hex(), "exp": now + 60})
+        )
+        revocations.apply_event(
+            json.dumps({"type": "user", "user_id": 9, "revoked_at": int(now), "exp": now + 60})
+        )
+        revocations.apply_event("not json")
+
+        assert revocations.might_be_revoked("tok") is True
+        assert revocations.might_be_revoked("x", {"user_id": 9, "iat": int(now) - 1}) is True
+
+
+class TestIsTokenBlacklisted:
+    """Tests for blacklist checks backed by the filter."""
+
+    @pytest.mark.asyncio
+    async def test_clean_token_skips_redis(self):
+        """Test a synced filter answers negatives without Redis."""
+        token = create_access_token({"user_id": 1})
+        get_redis = AsyncMock(side_effect=AssertionError("Redis should not be called"))
+
+        with patch.object(auth_module, "get_revocation_filter", return_value=synced_filter()), \
+                patch.object(auth_module, "get_redis", get_redis):
+            assert await is_token_blacklisted(token) is False
+
+        get_redis.assert_not_called()
+
+
+class TestBlacklistUserTokens:
+    """Tests for user-wide revocation."""
+
+    @pytest.mark.asyncio
+    async def test_cutoff_is_utc_epoch(self, monkeypatch):
+        """Test the cutoff matches iat on hosts not running in UTC."""
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        redis = AsyncMock()
+        try:
+            with patch.object(auth_module, "get_redis", AsyncMock(return_value=redis)), \
+                    patch.object(auth_module, "publish_user_revocation", AsyncMock()), \
+                    patch("app.core.principal_cache.get_principal_cache") as get_cache:
+                get_cache.return_value.invalidate = AsyncMock()
+                await blacklist_user_tokens(5)
+        finally:
+            monkeypatch.delenv("TZ")
+            time.tzset()
+
+        revoked_at = int(redis.setex.await_args.args[2])
+        assert abs(revoked_at - time.time()) < 5
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_is_logged_not_raised(self):
+        """Test a Redis outage doesn't fail the password reset or deactivation."""
+        get_redis = AsyncMock(side_effect=ConnectionError("redis down"))
+
+        with patch.object(auth_module, "get_redis", get_redis), \
+                patch("app.core.principal_cache.get_principal_cache") as get_cache:
+            get_cache.return_value.invalidate = AsyncMock()
+            await blacklist_user_tokens(5)
+
+        get_cache.return_value.invalidate.assert_awaited_once_with(5)
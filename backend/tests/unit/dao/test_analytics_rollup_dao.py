@@ -0,0 +1,123 @@
+"""
+Unit tests for the analytics rollups.
+
+WHAT: Tests for incremental rollup maintenance and AnalyticsRollupDAO.
+
+WHY: Verifies that:
+1. Paying and refunding invoices moves revenue in and out of the
+   paid_at month
+2. Creating and deleting projects adjusts their creation month
+3. rebuild() restores rollups from the source tables
+4. Series combine closed months from the rollups with the live current month
+
+HOW: Uses pytest-asyncio with PostgreSQL test database for isolation.
+"""
+
+import pytest
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import select, update
+
+from app.dao.analytics_rollup import AnalyticsRollupDAO
+from app.dao.invoice import InvoiceDAO
+from app.dao.project import ProjectDAO
+from app.models.analytics_rollup import (
+    AnalyticsMonthlyRollup,
+    AnalyticsRollupMetric,
+    rollup_period,
+)
+from app.models.invoice import InvoiceStatus
+from tests.factories import ProjectFactory
+
+
+async def _rollup_value(session, org_id, metric, period):
+    """Read one rollup value (0 when the row doesn't exist)."""
+    result = await session.execute(
+        select(AnalyticsMonthlyRollup.value).where(
+            AnalyticsMonthlyRollup.org_id == org_id,
+            AnalyticsMonthlyRollup.metric == metric.value,
+            AnalyticsMonthlyRollup.period == period,
+        )
+    )
+    return result.scalar_one_or_none() or Decimal(0)
+
+
+class TestIncrementalRollups:
+    """Tests for the after_flush rollup hook."""
+
+    @pytest.mark.asyncio
+    async def test_payment_and_refund(self, db_session, test_org):
+        """Revenue is added when an invoice is paid and removed on refund."""
+        invoice_dao = InvoiceDAO(db_session)
+        invoice = await invoice_dao.create(
+            invoice_number="INV-2026-0001",
+            org_id=test_org.id,
+            subtotal=Decimal("250.00"),
+            total=Decimal("250.00"),
+            status=InvoiceStatus.SENT,
+        )
+        period = rollup_period(datetime.utcnow())
+        metric = AnalyticsRollupMetric.REVENUE
+
+        await invoice_dao.mark_paid(invoice.id, test_org.id)
+        assert await _rollup_value(db_session, test_org.id, metric, period) == Decimal("250.00")
+
+        await invoice_dao.mark_refunded(invoice.id, test_org.id)
+        assert await _rollup_value(db_session, test_org.id, metric, period) == Decimal("0")
+
+    @pytest.mark.asyncio
+    async def test_project_create_and_delete(self, db_session, test_org):
+        """Projects count in their creation month until deleted."""
+        project = await ProjectFactory.create(db_session, organization=test_org)
+        await ProjectFactory.create(db_session, organization=test_org)
+        period = rollup_period(project.created_at)
+        metric = AnalyticsRollupMetric.PROJECTS_CREATED
+
+        assert await _rollup_value(db_session, test_org.id, metric, period) == 2
+
+        assert await ProjectDAO(db_session).delete(project.id)
+        assert await _rollup_value(db_session, test_org.id, metric, period) == 1
+
+
+class TestAnalyticsRollupDAO:
+    """Tests for AnalyticsRollupDAO."""
+
+    @pytest.mark.asyncio
+    async def test_rebuild_repairs_drift(self, db_session, test_org):
+        """rebuild() recomputes rollups from the source tables."""
+        project = await ProjectFactory.create(db_session, organization=test_org)
+        period = rollup_period(project.created_at)
+        metric = AnalyticsRollupMetric.PROJECTS_CREATED
+        await db_session.execute(
+            update(AnalyticsMonthlyRollup)
+            .where(AnalyticsMonthlyRollup.metric == metric.value)
+            .values(value=99)
+        )
+
+        await AnalyticsRollupDAO(db_session).rebuild([metric])
+
+        assert await _rollup_value(db_session, test_org.id, metric, period) == 1
+
+    @pytest.mark.asyncio
+    async def test_series_uses_rollups_for_closed_months(self, db_session, test_org):
+        """Past months come from the rollups, the current month from the source."""
+        await ProjectFactory.create(db_session, organization=test_org)
+        db_session.add(
+            AnalyticsMonthlyRollup(
+                org_id=test_org.id,
+                metric=AnalyticsRollupMetric.PROJECTS_CREATED.value,
+                period=date(2020, 1, 1),
+                value=5,
+            )
+        )
+        await db_session.flush()
+
+        series = await AnalyticsRollupDAO(db_session).monthly_series(
+            AnalyticsRollupMetric.PROJECTS_CREATED, date(2019, 1, 1)
+        )
+
+        assert series == [
+            (date(2020, 1, 1), Decimal(5)),
+            (rollup_period(datetime.utcnow()), Decimal(1)),
+        ]
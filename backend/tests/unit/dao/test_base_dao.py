@@ -0,0 +1,220 @@
+"""
+Unit tests for BaseDAO generic operations.
+
+WHAT: Tests for counting and pagination helpers shared by every DAO.
+
+WHY: Verifies that:
+1. count() runs in SQL with the same filter semantics as get_all()
+2. count_estimated() falls back to exact counts on small tables
+3. Unknown filter fields are ignored consistently
+4. Keyset cursors round-trip and page through every row exactly once,
+   continuing from offset pages
+5. Bulk create/update/delete enforce org-scoping
+
+HOW: Uses pytest-asyncio with the shared test database session.
+"""
+
+import pytest
+from datetime import datetime
+
+from app.core.exceptions import ValidationError
+from app.dao.base import BaseDAO, clear_count_cache, encode_cursor, decode_cursor
+from app.models.project import Project, ProjectPriority, ProjectStatus
+from tests.factories import OrganizationFactory, ProjectFactory
+
+
+class TestBaseDAOCount:
+    """Tests for exact and estimated counts."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        """Ensure cached estimates don't leak between tests."""
+        clear_count_cache()
+        yield
+        clear_count_cache()
+
+    @pytest.mark.asyncio
+    async def test_count_matches_filters(self, db_session):
+        """Test count() applies the same filters as get_all()."""
+        org = await OrganizationFactory.create(db_session, name="Count Org")
+        other = await OrganizationFactory.create(db_session, name="Other Org")
+        await ProjectFactory.create(db_session, org_id=org.id, priority=ProjectPriority.HIGH)
+        await ProjectFactory.create(db_session, org_id=org.id)
+        await ProjectFactory.create(db_session, org_id=other.id)
+
+        dao = BaseDAO(Project, db_session)
+
+        assert await dao.count(org_id=org.id) == 2
+        assert await dao.count(org_id=org.id, priority=ProjectPriority.HIGH) == 1
+        assert await dao.count(org_id=other.id) == 1
+        assert await dao.count() == 3
+        assert await dao.count(org_id=org.id) == len(await dao.get_all(org_id=org.id))
+
+    @pytest.mark.asyncio
+    async def test_count_ignores_unknown_fields(self, db_session):
+        """Test unknown filter names are ignored, like get_all()."""
+        org = await OrganizationFactory.create(db_session)
+        await ProjectFactory.create(db_session, org_id=org.id)
+
+        dao = BaseDAO(Project, db_session)
+
+        assert await dao.count(org_id=org.id, not_a_column="x") == 1
+
+    @pytest.mark.asyncio
+    async def test_count_estimated_small_table_is_exact(self, db_session):
+        """Test small tables fall back to an exact count."""
+        org = await OrganizationFactory.create(db_session)
+        for i in range(3):
+            await ProjectFactory.create(db_session, name=f"Project {i}", org_id=org.id)
+
+        dao = BaseDAO(Project, db_session)
+
+        assert await dao.count_estimated(org_id=org.id) == 3
+        assert await dao.count_estimated() == 3
+
+
+class TestCursorEncoding:
+    """Tests for opaque cursor encoding."""
+
+    def test_round_trip_with_datetime(self):
+        """Test datetimes and ids survive encode/decode."""
+        created = datetime(2025, 1, 2, 3, 4, 5, 678000)
+
+        cursor = encode_cursor([created, 42])
+
+        assert decode_cursor(cursor, 2) == [created, 42]
+
+    def test_malformed_cursor_raises_validation_error(self):
+        """Test garbage cursors surface as 400s, not 500s."""
+        with pytest.raises(ValidationError):
+            decode_cursor("not-a-cursor!!", 2)
+
+    def test_wrong_key_count_raises_validation_error(self):
+        """Test a cursor for a different key shape is rejected."""
+        with pytest.raises(ValidationError):
+            decode_cursor(encode_cursor([1]), 2)
+
+
+class TestBaseDAOKeysetPagination:
+    """Tests for cursor pagination."""
+
+    @pytest.mark.asyncio
+    async def test_get_page_walks_all_rows_once(self, db_session):
+        """Test following next_cursor visits every row exactly once, newest first."""
+        org = await OrganizationFactory.create(db_session)
+        created = [
+            await ProjectFactory.create(db_session, name=f"Project {i}", org_id=org.id)
+            for i in range(5)
+        ]
+
+        dao = BaseDAO(Project, db_session)
+
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = await dao.get_page(cursor=cursor, limit=2, org_id=org.id)
+            seen.extend(p.id for p in page)
+            if cursor is None:
+                break
+
+        assert sorted(seen) == sorted(p.id for p in created)
+        assert len(seen) == len(set(seen))
+
+    @pytest.mark.asyncio
+    async def test_offset_page_continues_with_cursor(self, db_session):
+        """Test get_all's first page and cursor pages share one order."""
+        org = await OrganizationFactory.create(db_session)
+        for i in range(4):
+            await ProjectFactory.create(db_session, name=f"Project {i}", org_id=org.id)
+
+        dao = BaseDAO(Project, db_session)
+        everything = await dao.get_all(org_id=org.id)
+        first = await dao.get_all(limit=2, org_id=org.id)
+        rest = await dao.get_all(
+            limit=2, cursor=dao.next_cursor(first, 2), org_id=org.id
+        )
+
+        assert [p.id for p in first + rest] == [p.id for p in everything]
+
+    @pytest.mark.asyncio
+    async def test_get_page_last_page_has_no_cursor(self, db_session):
+        """Test next_cursor is None when the page is not full."""
+        org = await OrganizationFactory.create(db_session)
+        await ProjectFactory.create(db_session, org_id=org.id)
+
+        dao = BaseDAO(Project, db_session)
+        page, cursor = await dao.get_page(limit=10, org_id=org.id)
+
+        assert len(page) == 1
+        assert cursor is None
+
+
+class TestBaseDAOBulkOperations:
+    """Tests for set-based bulk operations."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_returns_rows_in_order(self, db_session):
+        """Test bulk_create inserts every row and stamps org_id."""
+        org = await OrganizationFactory.create(db_session)
+        dao = BaseDAO(Project, db_session)
+
+        projects = await dao.bulk_create(
+            [{"name": f"Bulk {i}"} for i in range(3)],
+            org_id=org.id,
+        )
+
+        assert [p.name for p in projects] == ["Bulk 0", "Bulk 1", "Bulk 2"]
+        assert all(p.id is not None for p in projects)
+        assert all(p.org_id == org.id for p in projects)
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_rejects_foreign_org_rows(self, db_session):
+        """Test rows naming another org are rejected."""
+        org = await OrganizationFactory.create(db_session)
+        dao = BaseDAO(Project, db_session)
+
+        with pytest.raises(ValidationError):
+            await dao.bulk_create([{"name": "Sneaky", "org_id": org.id + 1}], org_id=org.id)
+
+    @pytest.mark.asyncio
+    async def test_bulk_ops_require_org_id(self, db_session):
+        """Test multi-tenant bulk operations refuse to run unscoped."""
+        dao = BaseDAO(Project, db_session)
+
+        with pytest.raises(ValidationError):
+            await dao.bulk_create([{"name": "No org"}])
+        with pytest.raises(ValidationError):
+            await dao.bulk_update_where({"name": "x"}, Project.id > 0)
+        with pytest.raises(ValidationError):
+            await dao.bulk_delete_where(Project.id > 0)
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_where_is_org_scoped(self, db_session):
+        """Test bulk_update_where only touches the scoped org's rows."""
+        org = await OrganizationFactory.create(db_session, name="Mine")
+        other = await OrganizationFactory.create(db_session, name="Theirs")
+        mine = await ProjectFactory.create(db_session, org_id=org.id)
+        theirs = await ProjectFactory.create(db_session, org_id=other.id)
+
+        dao = BaseDAO(Project, db_session)
+        updated = await dao.bulk_update_where(
+            {"status": ProjectStatus.CANCELLED},
+            Project.id.in_([mine.id, theirs.id]),
+            org_id=org.id,
+        )
+
+        assert updated == [mine.id]
+        assert await dao.count(org_id=other.id, status=ProjectStatus.CANCELLED) == 0
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_where_counts_rows(self, db_session):
+        """Test bulk_delete_where deletes matching rows and reports the count."""
+        org = await OrganizationFactory.create(db_session)
+        for i in range(3):
+            await ProjectFactory.create(db_session, name=f"Doomed {i}", org_id=org.id)
+
+        dao = BaseDAO(Project, db_session)
+        deleted = await dao.bulk_delete_where(org_id=org.id)
+
+        assert deleted == 3
+        assert await dao.count(org_id=org.id) == 0
@@ -20,11 +20,10 @@ from app.dao.integration import (
     CalendarIntegrationDAO,
     WebhookEndpointDAO,
     WebhookDeliveryDAO,
+    webhook_retry_delay,
 )
+from app.core.config import settings
 from app.models.integration import (
-    CalendarIntegration,
-    WebhookEndpoint,
-    WebhookDelivery,
     CalendarProvider,
     WebhookEventType,
 )
@@ -50,7 +49,7 @@ class TestCalendarIntegrationDAOCreate:
         """Test creating a calendar integration with all fields."""
         dao = CalendarIntegrationDAO(db_session)
 
-        integration = CalendarIntegration(
+        created = await dao.create(
             user_id=test_user.id,
             org_id=test_org.id,
             provider=CalendarProvider.GOOGLE.value,
@@ -63,7 +62,6 @@ class TestCalendarIntegrationDAOCreate:
             sync_projects=True,
             is_active=True,
         )
-        created = await dao.create(integration)
 
         assert created.id is not None
         assert created.user_id == test_user.id
@@ -79,24 +77,22 @@ class TestCalendarIntegrationDAOCreate:
         dao = CalendarIntegrationDAO(db_session)
 
         # Create Google integration
-        google = CalendarIntegration(
+        google = await dao.create(
             user_id=test_user.id,
             org_id=test_org.id,
             provider=CalendarProvider.GOOGLE.value,
             access_token="google_token",
             is_active=True,
         )
-        google = await dao.create(google)
 
         # Create Outlook integration
-        outlook = CalendarIntegration(
+        outlook = await dao.create(
             user_id=test_user.id,
             org_id=test_org.id,
             provider=CalendarProvider.OUTLOOK.value,
             access_token="outlook_token",
             is_active=True,
         )
-        outlook = await dao.create(outlook)
 
         assert google.id != outlook.id
         assert google.provider == CalendarProvider.GOOGLE.value
@@ -343,7 +339,7 @@ class TestWebhookEndpointDAOCreate:
         """Test creating a webhook endpoint."""
         dao = WebhookEndpointDAO(db_session)
 
-        endpoint = WebhookEndpoint(
+        created = await dao.create(
             org_id=test_org.id,
             name="Slack Notifications",
             description="Send notifications to Slack",
@@ -353,7 +349,6 @@ class TestWebhookEndpointDAOCreate:
             is_active=True,
             created_by_id=test_admin.id,
         )
-        created = await dao.create(endpoint)
 
         assert created.id is not None
         assert created.name == "Slack Notifications"
@@ -366,7 +361,7 @@ class TestWebhookEndpointDAOCreate:
         """Test creating endpoint with custom headers."""
         dao = WebhookEndpointDAO(db_session)
 
-        endpoint = WebhookEndpoint(
+        created = await dao.create(
             org_id=test_org.id,
             name="Custom API",
             url="https://api.example.com/webhook",
@@ -375,7 +370,6 @@ class TestWebhookEndpointDAOCreate:
             headers={"X-Custom-Header": "value"},
             is_active=True,
         )
-        created = await dao.create(endpoint)
 
         assert created.headers == {"X-Custom-Header": "value"}
 
@@ -397,7 +391,7 @@ class TestWebhookEndpointDAORead:
         assert found.id == endpoint.id
 
     @pytest.mark.asyncio
-    async def test_get_by_org(self, db_session, test_org):
+    async def test_get_endpoints_by_org(self, db_session, test_org):
         """Test listing endpoints by organization."""
         await WebhookEndpointFactory.create(
             db_session, name="Webhook 1", organization=test_org
@@ -412,11 +406,11 @@ class TestWebhookEndpointDAORead:
         dao = WebhookEndpointDAO(db_session)
 
         # Active only
-        active = await dao.get_by_org(test_org.id, include_inactive=False)
+        active = await dao.get_endpoints_by_org(test_org.id, include_inactive=False)
         assert len(active) == 2
 
         # Include inactive
-        all_endpoints = await dao.get_by_org(test_org.id, include_inactive=True)
+        all_endpoints = await dao.get_endpoints_by_org(test_org.id, include_inactive=True)
         assert len(all_endpoints) == 3
 
 
@@ -567,8 +561,8 @@ class TestWebhookEndpointDAOMultiTenancy:
 
         dao = WebhookEndpointDAO(db_session)
 
-        org1_endpoints = await dao.get_by_org(org1.id)
-        org2_endpoints = await dao.get_by_org(org2.id)
+        org1_endpoints = await dao.get_endpoints_by_org(org1.id)
+        org2_endpoints = await dao.get_endpoints_by_org(org2.id)
 
         assert len(org1_endpoints) == 1
         assert len(org2_endpoints) == 1
@@ -592,14 +586,13 @@ class TestWebhookDeliveryDAOCreate:
         )
 
         dao = WebhookDeliveryDAO(db_session)
-        delivery = WebhookDelivery(
+        created = await dao.create(
             endpoint_id=endpoint.id,
             event_type=WebhookEventType.TICKET_CREATED.value,
             event_id="evt_12345",
             request_url=endpoint.url,
             request_body={"test": "data"},
         )
-        created = await dao.create(delivery)
 
         assert created.id is not None
         assert created.event_type == WebhookEventType.TICKET_CREATED.value
@@ -720,6 +713,107 @@ class TestWebhookDeliveryDAORetry:
         assert updated.attempt_count == 1
         assert updated.next_retry_at is not None
 
+    @pytest.mark.asyncio
+    async def test_record_attempt_stops_at_max_attempts(self, db_session, test_org):
+        """Test the last allowed failure clears next_retry_at."""
+        endpoint = await WebhookEndpointFactory.create(
+            db_session, organization=test_org
+        )
+        delivery = await WebhookDeliveryFactory.create(
+            db_session, endpoint=endpoint, attempt_count=1
+        )
+
+        dao = WebhookDeliveryDAO(db_session)
+        updated = await dao.record_attempt(
+            delivery_id=delivery.id,
+            response_status=500,
+            response_headers={},
+            response_body="",
+            delivered=False,
+            duration_ms=10,
+            max_attempts=2,
+        )
+
+        assert updated.attempt_count == 2
+        assert updated.next_retry_at is None
+
+    @pytest.mark.asyncio
+    async def test_unattempted_delivery_keeps_attempt_count(self, db_session, test_org):
+        """Test skipped sends are rescheduled without using up an attempt."""
+        endpoint = await WebhookEndpointFactory.create(
+            db_session, organization=test_org
+        )
+        delivery = await WebhookDeliveryFactory.create(
+            db_session, endpoint=endpoint, attempt_count=1
+        )
+
+        dao = WebhookDeliveryDAO(db_session)
+        updated = await dao.record_attempt(
+            delivery_id=delivery.id,
+            response_status=None,
+            response_headers=None,
+            response_body=None,
+            delivered=False,
+            duration_ms=0,
+            error_message="Circuit open - endpoint failing",
+            count_attempt=False,
+        )
+
+        assert updated.attempt_count == 1
+        assert updated.next_retry_at is not None
+
+    @pytest.mark.asyncio
+    async def test_retry_queue_stats(self, db_session, test_org):
+        """Test queue depth, due count and oldest-due age."""
+        endpoint = await WebhookEndpointFactory.create(
+            db_session, organization=test_org
+        )
+        await WebhookDeliveryFactory.create_pending_retry(db_session, endpoint=endpoint)
+        scheduled = await WebhookDeliveryFactory.create(db_session, endpoint=endpoint)
+        scheduled.next_retry_at = datetime.utcnow() + timedelta(hours=1)
+        await db_session.flush()
+
+        dao = WebhookDeliveryDAO(db_session)
+        stats = await dao.get_retry_queue_stats(org_id=test_org.id)
+
+        assert stats["depth"] == 2
+        assert stats["due"] == 1
+        assert stats["oldest_due_age_seconds"] >= 59
+
+    @pytest.mark.asyncio
+    async def test_claim_due_retries_oldest_first(self, db_session, test_org):
+        """Test batch pickup returns only due deliveries, oldest first."""
+        endpoint = await WebhookEndpointFactory.create(
+            db_session, organization=test_org
+        )
+        newer = await WebhookDeliveryFactory.create(db_session, endpoint=endpoint)
+        older = await WebhookDeliveryFactory.create(db_session, endpoint=endpoint)
+        future = await WebhookDeliveryFactory.create(db_session, endpoint=endpoint)
+        newer.next_retry_at = datetime.utcnow() - timedelta(minutes=1)
+        older.next_retry_at = datetime.utcnow() - timedelta(minutes=5)
+        future.next_retry_at = datetime.utcnow() + timedelta(minutes=5)
+        await db_session.flush()
+
+        dao = WebhookDeliveryDAO(db_session)
+        claimed = await dao.claim_due_retries(limit=100)
+        ours = {newer.id, older.id, future.id}
+
+        assert [d.id for d in claimed if d.id in ours] == [older.id, newer.id]
+
+
+class TestWebhookRetryDelay:
+    """Tests for retry backoff."""
+
+    def test_delay_grows_and_is_capped(self):
+        """Test delays double per attempt, stay jittered, and respect the cap."""
+        base = settings.WEBHOOK_RETRY_BASE_DELAY_SECONDS
+        cap = settings.WEBHOOK_RETRY_MAX_DELAY_SECONDS
+
+        for attempts in range(1, 20):
+            window = min(cap, base * 2 ** (attempts - 1))
+            delay = webhook_retry_delay(attempts)
+            assert window / 2 <= delay <= window
+
 
 class TestWebhookDeliveryDAOStats:
     """Tests for delivery statistics."""
@@ -636,3 +636,57 @@ class TestExecutionLogDAOMetrics:
         rate = await log_dao.get_success_rate(instance.id)
 
         assert rate == 0.75  # 3 out of 4
+
+
+class TestExecutionLogDAOBulkComplete:
+    """Tests for batched execution completion."""
+
+    @pytest.mark.asyncio
+    async def test_complete_by_n8n_ids(self, db_session, test_org):
+        """Running logs resolve by n8n ID and complete in bulk."""
+        env = await N8nEnvironmentFactory.create(db_session, organization=test_org)
+        instance = await WorkflowInstanceFactory.create_active(
+            db_session, name="Test WF", organization=test_org, n8n_environment_id=env.id
+        )
+        running = await ExecutionLogFactory.create(
+            db_session, workflow_instance_id=instance.id, n8n_execution_id="101"
+        )
+        done = await ExecutionLogFactory.create(
+            db_session,
+            workflow_instance_id=instance.id,
+            n8n_execution_id="102",
+            status=ExecutionStatus.SUCCESS,
+        )
+
+        log_dao = ExecutionLogDAO(db_session)
+        matches = await log_dao.get_running_by_n8n_ids(
+            [(env.id, "101"), (env.id, "102"), (env.id + 1, "101")]
+        )
+        assert matches == {(env.id, "101"): running.id}
+
+        finished_at = datetime.utcnow().replace(microsecond=0)
+        completed = await log_dao.complete_executions([
+            {
+                "log_id": running.id,
+                "status": ExecutionStatus.FAILED,
+                "finished_at": finished_at,
+                "output_data": None,
+                "error_message": "Boom",
+            },
+            {
+                "log_id": done.id,
+                "status": ExecutionStatus.FAILED,
+                "finished_at": finished_at,
+            },
+        ])
+        assert completed == {running.id: instance.id}
+
+        await WorkflowInstanceDAO(db_session).record_executions({instance.id: finished_at})
+        db_session.expire_all()
+
+        refreshed = await log_dao.get_by_id(running.id)
+        assert refreshed.status == ExecutionStatus.FAILED
+        assert refreshed.error_message == "Boom"
+        assert (await log_dao.get_by_id(done.id)).status == ExecutionStatus.SUCCESS
+        instance = await WorkflowInstanceDAO(db_session).get_by_id(instance.id)
+        assert instance.last_execution_at == finished_at
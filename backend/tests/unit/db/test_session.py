@@ -0,0 +1,98 @@
+"""
+Unit tests for read-replica session routing.
+
+WHY: Read routing must never serve data staler than a route tolerates,
+and must degrade to the primary when the replica is absent or down.
+
+Test scenarios:
+- No replica configured routes reads to the primary session
+- Replica within tolerance is used
+- Replica beyond tolerance or unreachable falls back to the primary
+- Lag samples are reused within the check interval
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.db import session as session_module
+from app.db.session import read_db, get_replica_lag_seconds
+
+
+@pytest.fixture(autouse=True)
+def reset_lag_sample():
+    """Ensure cached lag samples don't leak between tests."""
+    session_module._replica_lag_sample = None
+    yield
+    session_module._replica_lag_sample = None
+
+
+class TestReadDbRouting:
+    """Tests for the read_db() dependency factory."""
+
+    @pytest.mark.asyncio
+    async def test_no_replica_uses_primary(self):
+        """Test reads fall back to the primary without a replica URL."""
+        replica, primary = MagicMock(), MagicMock()
+
+        with patch.object(session_module, "replica_engine", None):
+            chosen = await read_db(60)(read_session=replica, primary_session=primary)
+
+        assert chosen is primary
+
+    @pytest.mark.asyncio
+    async def test_fresh_replica_is_used(self):
+        """Test a replica within tolerance serves the read."""
+        replica, primary = MagicMock(), MagicMock()
+
+        with patch.object(session_module, "replica_engine", MagicMock()), patch.object(
+            session_module, "get_replica_lag_seconds", AsyncMock(return_value=3.0)
+        ):
+            chosen = await read_db(5)(read_session=replica, primary_session=primary)
+
+        assert chosen is replica
+
+    @pytest.mark.asyncio
+    async def test_lagging_replica_falls_back(self):
+        """Test a replica beyond the route's tolerance is skipped."""
+        replica, primary = MagicMock(), MagicMock()
+
+        with patch.object(session_module, "replica_engine", MagicMock()), patch.object(
+            session_module, "get_replica_lag_seconds", AsyncMock(return_value=30.0)
+        ):
+            chosen = await read_db(5)(read_session=replica, primary_session=primary)
+
+        assert chosen is primary
+
+    @pytest.mark.asyncio
+    async def test_unreachable_replica_falls_back(self):
+        """Test an unreachable replica (lag None) routes to the primary."""
+        replica, primary = MagicMock(), MagicMock()
+
+        with patch.object(session_module, "replica_engine", MagicMock()), patch.object(
+            session_module, "get_replica_lag_seconds", AsyncMock(return_value=None)
+        ):
+            chosen = await read_db(60)(read_session=replica, primary_session=primary)
+
+        assert chosen is primary
+
+
+class TestReplicaLagSampling:
+    """Tests for cached replica lag sampling."""
+
+    @pytest.mark.asyncio
+    async def test_no_replica_reports_zero_lag(self):
+        """Test lag is zero when reads already go to the primary."""
+        with patch.object(session_module, "replica_engine", None):
+            assert await get_replica_lag_seconds() == 0.0
+
+    @pytest.mark.asyncio
+    async def test_connection_error_is_cached(self):
+        """Test an unreachable replica is probed once per interval, not per request."""
+        fake_engine = MagicMock()
+        fake_engine.connect.side_effect = OSError("connection refused")
+
+        with patch.object(session_module, "replica_engine", fake_engine):
+            assert await get_replica_lag_seconds() is None
+            assert await get_replica_lag_seconds() is None
+
+        assert fake_engine.connect.call_count == 1
@@ -0,0 +1,109 @@
+"""
+Tests for the background job runtime.
+
+WHY: Verifies that:
+1. Enqueued async jobs run in the worker on their named queue
+2. Jobs that exhaust their retries are dead-lettered
+3. Each queue's concurrency is limited by its own thread budget
+4. Queued emails go through the email job
+
+HOW: Runs real Dramatiq workers against the in-memory StubBroker
+(JOB_BROKER="stub" in conftest).
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from app.jobs.broker import get_broker
+from app.jobs.queue import enqueue, job
+from app.jobs.worker import start_workers
+from app.services.email import EmailMessage, EmailType, MockEmailProvider, get_email_service
+
+
+results = []
+in_flight = 0
+peak_in_flight = 0
+_lock = threading.Lock()
+
+
+@job(queue="test_ok")
+async def record(value: int) -> None:
+    results.append(value)
+
+
+@job(queue="test_fail", max_retries=0)
+async def always_fails() -> None:
+    raise RuntimeError("boom")
+
+
+@job(queue="test_limited")
+async def slow() -> None:
+    global in_flight, peak_in_flight
+    with _lock:
+        in_flight += 1
+        peak_in_flight = max(peak_in_flight, in_flight)
+    await asyncio.sleep(0.05)
+    with _lock:
+        in_flight -= 1
+
+
+@pytest.fixture(scope="module")
+def workers():
+    """Run workers for the test queues plus email, then stop them."""
+    broker = get_broker()
+    broker.flush_all()
+    started = start_workers({"test_ok": 2, "test_fail": 1, "test_limited": 2, "email": 2})
+    yield broker
+    for worker in started:
+        worker.stop(timeout=5000)
+    broker.flush_all()
+
+
+class TestJobRuntime:
+    """Tests for enqueue, retries and concurrency."""
+
+    @pytest.mark.asyncio
+    async def test_enqueued_job_runs(self, workers):
+        """Test an enqueued job runs and returns a message id."""
+        results.clear()
+
+        message_id = await enqueue(record, 42)
+        await asyncio.to_thread(workers.join, "test_ok")
+
+        assert message_id
+        assert results == [42]
+
+    @pytest.mark.asyncio
+    async def test_failed_job_is_dead_lettered(self, workers):
+        """Test a job out of retries lands in the dead-letter queue."""
+        await enqueue(always_fails)
+        await asyncio.to_thread(workers.join, "test_fail", fail_fast=False)
+
+        assert len(workers.dead_letters_by_queue["test_fail"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_queue_concurrency_is_bounded(self, workers):
+        """Test a queue never runs more jobs at once than its threads."""
+        for _ in range(6):
+            await enqueue(slow)
+        await asyncio.to_thread(workers.join, "test_limited")
+
+        assert peak_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_queue_email_sends_in_worker(self, workers):
+        """Test EmailService.queue_email delivers through the worker."""
+        MockEmailProvider.clear_sent_emails()
+        await get_email_service().queue_email(
+            EmailMessage(
+                to_email="queued@example.com",
+                subject="Queued",
+                html_content="<p>Hi</p>",
+                email_type=EmailType.WELCOME,
+            )
+        )
+        await asyncio.to_thread(workers.join, "email")
+
+        assert [m.to_email for m in MockEmailProvider.sent_emails] == ["queued@example.com"]
@@ -0,0 +1,110 @@
+"""
+Unit tests for Analytics Service.
+
+WHAT: Tests for the analytics snapshot cache and aggregate queries.
+
+WHY: Verifies that:
+1. Fresh snapshots are served without querying
+2. Stale snapshots are served while exactly one background refresh runs
+3. The dashboard summary is a single statement of FILTER aggregates
+
+HOW: Uses pytest-asyncio; loaders and sessions are mocked, and statements
+are compiled against the PostgreSQL dialect.
+"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.analytics_service import (
+    AnalyticsSnapshotCache,
+    load_dashboard_summary,
+)
+
+
+@pytest.fixture
+def refresh_session(monkeypatch):
+    """Session handed to background refreshes."""
+    session = MagicMock(name="refresh_session")
+
+    class _ReadSession:
+        def __init__(self, *args):
+            pass
+
+        async def __aenter__(self):
+            return session
+
+        async def __aexit__(self, *args):
+            return False
+
+    monkeypatch.setattr("app.services.analytics_service.read_session", _ReadSession)
+    return session
+
+
+class TestAnalyticsSnapshotCache:
+    """Tests for AnalyticsSnapshotCache."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_snapshot_is_reused(self):
+        """Within the TTL the loader runs once."""
+        cache = AnalyticsSnapshotCache(ttl_seconds=60, stale_seconds=600)
+        loader = AsyncMock(return_value={"total_users": 1})
+
+        assert await cache.get("dashboard", loader, "request_session") == {"total_users": 1}
+        assert await cache.get("dashboard", loader, "request_session") == {"total_users": 1}
+
+        loader.assert_awaited_once_with("request_session")
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_served_while_refreshing(self, refresh_session):
+        """Past the TTL, callers get the old snapshot and one refresh runs."""
+        cache = AnalyticsSnapshotCache(ttl_seconds=0, stale_seconds=600)
+        loader = AsyncMock(side_effect=[{"value": 1}, {"value": 2}])
+        await cache.get("k", loader, "request_session")
+
+        first = await cache.get("k", loader, "request_session")
+        second = await cache.get("k", loader, "request_session")
+        await asyncio.gather(*list(cache._refreshing.values()))
+
+        assert first == second == {"value": 1}
+        assert loader.await_count == 2
+        assert loader.await_args.args[0] is refresh_session
+        assert cache._snapshots["k"][1] == {"value": 2}
+
+    @pytest.mark.asyncio
+    async def test_expired_snapshot_recomputed_inline(self):
+        """Past the stale window, the caller waits for a fresh snapshot."""
+        cache = AnalyticsSnapshotCache(ttl_seconds=0, stale_seconds=0)
+        loader = AsyncMock(side_effect=[{"value": 1}, {"value": 2}])
+
+        await cache.get("k", loader, "request_session")
+
+        assert await cache.get("k", loader, "request_session") == {"value": 2}
+        assert cache._refreshing == {}
+
+
+class TestDashboardSummary:
+    """Tests for load_dashboard_summary."""
+
+    @pytest.mark.asyncio
+    async def test_single_statement(self):
+        """All dashboard figures come from one FILTER-aggregate statement."""
+        row = SimpleNamespace(
+            total_users=5, total_organizations=2, active_organizations=1,
+            total_projects=4, active_projects=3, total_revenue=None,
+            revenue_mtd=None, open_tickets=2, overdue_tickets=1,
+        )
+        session = MagicMock()
+        session.execute = AsyncMock(return_value=MagicMock(one=lambda: row))
+
+        summary = await load_dashboard_summary(session)
+
+        session.execute.assert_awaited_once()
+        sql = str(session.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.count("FILTER (WHERE") == 6
+        assert "WITH user_totals AS" in sql
+        assert summary["total_revenue"] == 0.0
+        assert summary["overdue_tickets"] == 1
@@ -0,0 +1,127 @@
+"""
+Unit tests for bulk email sending.
+
+WHAT: Tests for EmailService.send_bulk and provider batch sends.
+
+WHY: Verifies that:
+1. Resend fan-outs use the batch endpoint in chunks of 100
+2. Providers without a batch endpoint send concurrently, bounded, and one
+   failure doesn't fail the rest
+3. Outcomes are logged as SentEmail rows in one batch
+
+HOW: Uses pytest-asyncio; the HTTP client and DAO are mocked, and the
+mock provider records batches.
+"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.email import (
+    EmailMessage,
+    EmailProvider,
+    EmailResult,
+    EmailService,
+    MockEmailProvider,
+    ResendProvider,
+)
+
+
+def _messages(count: int, org_id=None):
+    return [
+        EmailMessage(
+            to_email=f"user{i}@example.com",
+            subject="Hello",
+            html_content="<p>Hi</p>",
+            org_id=org_id,
+        )
+        for i in range(count)
+    ]
+
+
+class _FlakyProvider(EmailProvider):
+    """Provider without a batch endpoint that fails one recipient."""
+
+    name = "flaky"
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+
+    def is_configured(self) -> bool:
+        return True
+
+    async def send(self, message: EmailMessage) -> EmailResult:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        if message.to_email == "user1@example.com":
+            raise RuntimeError("connection reset")
+        return EmailResult(success=True, message_id=message.to_email, provider="flaky")
+
+
+class TestProviderBatchSend:
+    """Tests for EmailProvider.send_batch implementations."""
+
+    @pytest.mark.asyncio
+    async def test_resend_uses_batch_endpoint(self, monkeypatch):
+        """250 emails go out as three batch requests, results in order."""
+        client = MagicMock()
+
+        async def post(url, json, **kwargs):
+            return SimpleNamespace(
+                status_code=200,
+                json=lambda: {"data": [{"id": item["to"][0]} for item in json]},
+            )
+
+        client.post = AsyncMock(side_effect=post)
+        monkeypatch.setattr("app.services.email.get_http_client", lambda name: client)
+        provider = ResendProvider(api_key="re_test")
+        provider.requests_per_second = 0
+
+        results = await provider.send_batch(_messages(250))
+
+        assert client.post.await_count == 3
+        assert all(
+            call.args[0] == "https://api.resend.com/emails/batch"
+            for call in client.post.await_args_list
+        )
+        assert [r.message_id for r in results] == [f"user{i}@example.com" for i in range(250)]
+
+    @pytest.mark.asyncio
+    async def test_fallback_is_concurrent_and_isolated(self, monkeypatch):
+        """Without a batch endpoint, sends run concurrently up to the limit."""
+        monkeypatch.setattr("app.services.email.settings.EMAIL_BULK_CONCURRENCY", 3)
+        provider = _FlakyProvider()
+
+        results = await provider.send_batch(_messages(10))
+
+        assert provider.peak == 3
+        assert [r.success for r in results] == [True, False] + [True] * 8
+        assert results[1].error == "connection reset"
+
+
+class TestSendBulk:
+    """Tests for EmailService.send_bulk."""
+
+    @pytest.mark.asyncio
+    async def test_mock_provider_logs_in_one_batch(self, monkeypatch):
+        """The mock provider records one batch and rows are logged once."""
+        MockEmailProvider.clear_sent_emails()
+        dao = MagicMock(log_emails=AsyncMock())
+        monkeypatch.setattr("app.services.email.SentEmailDAO", lambda session: dao)
+        service = EmailService(provider=MockEmailProvider(), template_service=MagicMock())
+        messages = _messages(2, org_id=7) + _messages(1)
+
+        results = await service.send_bulk(messages, session=MagicMock())
+
+        assert all(result.success for result in results)
+        assert MockEmailProvider.batch_sizes == [3]
+        rows = dao.log_emails.await_args.args[0]
+        assert [row["to_email"] for row in rows] == ["user0@example.com", "user1@example.com"]
+        assert rows[0]["org_id"] == 7
+        assert rows[0]["status"] == "sent"
+        assert rows[0]["from_email"] == "noreply@localhost"
+        MockEmailProvider.clear_sent_emails()
@@ -9,10 +9,13 @@ WHY: Verifies that:
 3. Webhook payload signing works correctly
 4. Webhook delivery and retry logic work
 5. Event triggering sends to correct endpoints
+6. Outbox events are delivered in order, outside the caller's transaction,
+   also across dispatch batches
 
 HOW: Uses pytest-asyncio with mocked external dependencies.
 """
 
+import asyncio
 import pytest
 import hmac
 import hashlib
@@ -26,9 +29,16 @@ from app.services.integration_service import (
     CalendarIntegrationError,
     OAuthError,
     WebhookDeliveryError,
+    WebhookDispatchLimits,
+    get_circuit_state,
+    trigger_ticket_created,
+    CIRCUIT_CLOSED,
+    CIRCUIT_OPEN,
+    CIRCUIT_HALF_OPEN,
 )
 from app.models.integration import (
     CalendarProvider,
+    WebhookEndpoint,
     WebhookEventType,
 )
 from tests.factories import (
@@ -298,12 +308,12 @@ class TestWebhookServiceDelivery:
         service = WebhookService(db_session)
 
         # Mock HTTP client
-        with patch("app.services.integration_service.httpx.AsyncClient") as mock_client:
+        with patch("app.services.integration_service.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.headers = {}
             mock_response.text = '{"ok": true}'
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -316,6 +326,30 @@ class TestWebhookServiceDelivery:
         # Should only deliver to ticket webhook
         assert len(deliveries) == 1
 
+    @pytest.mark.asyncio
+    async def test_trigger_event_stores_delivery(self, db_session, test_org):
+        """Test the delivery record is persisted through the real DAO."""
+        endpoint = await WebhookEndpointFactory.create(
+            db_session,
+            organization=test_org,
+            events=[WebhookEventType.TICKET_CREATED.value],
+        )
+        service = WebhookService(db_session)
+
+        with patch("app.services.integration_service.get_http_client") as mock_client:
+            mock_response = MagicMock(status_code=200, headers={}, text="")
+            mock_client.return_value.post = AsyncMock(return_value=mock_response)
+            await service.trigger_event(
+                org_id=test_org.id,
+                event_type=WebhookEventType.TICKET_CREATED.value,
+                data={"ticket_id": 7},
+            )
+
+        stored = await service.delivery_dao.get_by_endpoint(endpoint.id)
+        assert len(stored) == 1
+        assert stored[0].delivered
+        assert stored[0].request_body["data"] == {"ticket_id": 7}
+
     @pytest.mark.asyncio
     async def test_trigger_event_no_subscribers(self, db_session, test_org):
         """Test triggering event with no subscribers."""
@@ -343,12 +377,12 @@ class TestWebhookServiceDelivery:
 
         service = WebhookService(db_session)
 
-        with patch("app.services.integration_service.httpx.AsyncClient") as mock_client:
+        with patch("app.services.integration_service.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.headers = {"Content-Type": "application/json"}
             mock_response.text = '{"received": true}'
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -362,6 +396,214 @@ class TestWebhookServiceDelivery:
         assert delivery.response_status == 200
 
 
+class TestWebhookCircuitBreaker:
+    """Tests for the per-endpoint circuit breaker."""
+
+    def test_closed_below_failure_threshold(self):
+        """Test a few failures don't open the circuit."""
+        endpoint = WebhookEndpoint(consecutive_failures=2, last_failure_at=datetime.utcnow())
+
+        assert get_circuit_state(endpoint) == CIRCUIT_CLOSED
+
+    def test_open_after_threshold_then_half_open_after_cooldown(self):
+        """Test a failing endpoint opens, then allows a probe after cooldown."""
+        now = datetime.utcnow()
+        endpoint = WebhookEndpoint(consecutive_failures=5, last_failure_at=now)
+
+        assert get_circuit_state(endpoint, now=now) == CIRCUIT_OPEN
+        assert (
+            get_circuit_state(endpoint, now=now + timedelta(minutes=5))
+            == CIRCUIT_HALF_OPEN
+        )
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_request(self, db_session, test_org):
+        """Test deliveries to an open circuit are recorded without a request."""
+        endpoint = await WebhookEndpointFactory.create(
+            db_session,
+            organization=test_org,
+            events=[WebhookEventType.TICKET_CREATED.value],
+        )
+        endpoint.consecutive_failures = 5
+        endpoint.last_failure_at = datetime.utcnow()
+        await db_session.flush()
+
+        service = WebhookService(db_session)
+
+        with patch("app.services.integration_service.get_http_client") as mock_client:
+            mock_client.return_value.post = AsyncMock()
+
+            deliveries = await service.trigger_event(
+                org_id=test_org.id,
+                event_type=WebhookEventType.TICKET_CREATED.value,
+                data={"ticket_id": 123},
+            )
+
+            mock_client.return_value.post.assert_not_called()
+
+        assert len(deliveries) == 1
+        assert deliveries[0].delivered is False
+        assert "Circuit open" in deliveries[0].error_message
+
+    @pytest.mark.asyncio
+    async def test_success_resets_failure_streak(self, db_session, test_org):
+        """Test a successful delivery closes the circuit."""
+        endpoint = await WebhookEndpointFactory.create(db_session, organization=test_org)
+        service = WebhookService(db_session)
+
+        await service.endpoint_dao.update_stats(endpoint.id, False)
+        await service.endpoint_dao.update_stats(endpoint.id, False)
+        updated = await service.endpoint_dao.update_stats(endpoint.id, True)
+
+        assert updated.consecutive_failures == 0
+        assert updated.failure_count == 2
+        assert updated.success_count == 1
+
+
+class TestWebhookDispatchLimits:
+    """Tests for global and per-org concurrency caps."""
+
+    @pytest.mark.asyncio
+    async def test_per_org_and_global_caps(self):
+        """Test neither cap is exceeded under concurrent fan-out."""
+        limits = WebhookDispatchLimits(max_concurrency=3, max_concurrency_per_org=2)
+        in_flight = {"total": 0, 1: 0, 2: 0}
+        peak = {"total": 0, 1: 0, 2: 0}
+
+        async def request(org_id):
+            async with limits.slot(org_id):
+                for key in ("total", org_id):
+                    in_flight[key] += 1
+                    peak[key] = max(peak[key], in_flight[key])
+                await asyncio.sleep(0.01)
+                for key in ("total", org_id):
+                    in_flight[key] -= 1
+
+        await asyncio.gather(*[request(1) for _ in range(5)], *[request(2) for _ in range(5)])
+
+        assert peak[1] == 2
+        assert peak[2] == 2
+        assert peak["total"] == 3
+
+
+class TestWebhookOutbox:
+    """Tests for the transactional webhook outbox."""
+
+    @pytest.fixture(autouse=True)
+    def _keep_test_transaction(self, db_session, monkeypatch):
+        """Turn the dispatcher's commits into flushes so tests still roll back."""
+        monkeypatch.setattr(db_session, "commit", db_session.flush)
+
+    @staticmethod
+    def _mock_post(statuses):
+        """Mock client.post returning the given statuses and recording event IDs."""
+        sent = []
+
+        async def post(url, content, headers, timeout):
+            sent.append(headers["X-Webhook-ID"])
+            response = MagicMock()
+            response.status_code = statuses[min(len(sent), len(statuses)) - 1]
+            response.headers = {}
+            response.text = ""
+            return response
+
+        return post, sent
+
+    @pytest.mark.asyncio
+    async def test_trigger_helper_writes_outbox_without_http(self, db_session, test_org):
+        """Test event helpers only insert an outbox row."""
+        await WebhookEndpointFactory.create(
+            db_session,
+            organization=test_org,
+            events=[WebhookEventType.TICKET_CREATED.value],
+        )
+
+        with patch("app.services.integration_service.get_http_client") as mock_client:
+            event = await trigger_ticket_created(db_session, test_org.id, {"ticket_id": 1})
+
+            mock_client.assert_not_called()
+
+        assert event.id is not None
+        assert event.dispatched_at is None
+        assert event.event_type == WebhookEventType.TICKET_CREATED.value
+
+    @pytest.mark.asyncio
+    async def test_dispatch_delivers_in_event_order(self, db_session, test_org):
+        """Test outbox events reach an endpoint in creation order."""
+        await WebhookEndpointFactory.create(
+            db_session,
+            organization=test_org,
+            events=[WebhookEventType.TICKET_CREATED.value],
+        )
+        events = [
+            await trigger_ticket_created(db_session, test_org.id, {"ticket_id": i})
+            for i in range(3)
+        ]
+
+        service = WebhookService(db_session)
+        post, sent = self._mock_post([200])
+
+        with patch("app.services.integration_service.get_http_client") as mock_client:
+            mock_client.return_value.post = post
+            dispatched = await service.dispatch_outbox(batch_size=10)
+
+        assert dispatched == 3
+        assert sent == [event.event_id for event in events]
+        assert await service.outbox_dao.count_pending() == 0
+
+    @pytest.mark.asyncio
+    async def test_failure_holds_back_later_events(self, db_session, test_org):
+        """Test events behind a failed delivery are not sent out of order."""
+        endpoint = await WebhookEndpointFactory.create(
+            db_session,
+            organization=test_org,
+            events=[WebhookEventType.TICKET_CREATED.value],
+        )
+        for i in range(3):
+            await trigger_ticket_created(db_session, test_org.id, {"ticket_id": i})
+
+        service = WebhookService(db_session)
+        post, sent = self._mock_post([500])
+
+        with patch("app.services.integration_service.get_http_client") as mock_client:
+            mock_client.return_value.post = post
+            await service.dispatch_outbox(batch_size=10)
+
+        deliveries = await service.delivery_dao.get_by_endpoint(endpoint.id)
+
+        assert len(sent) == 1
+        assert len(deliveries) == 3
+        assert not any(d.delivered for d in deliveries)
+        assert all(d.next_retry_at is not None for d in deliveries)
+        assert sum("Held behind" in (d.error_message or "") for d in deliveries) == 2
+
+    @pytest.mark.asyncio
+    async def test_later_batch_waits_for_held_back_events(self, db_session, test_org):
+        """Test a new batch isn't sent while an earlier event still waits."""
+        endpoint = await WebhookEndpointFactory.create(
+            db_session,
+            organization=test_org,
+            events=[WebhookEventType.TICKET_CREATED.value],
+        )
+        service = WebhookService(db_session)
+        post, sent = self._mock_post([500, 200])
+
+        with patch("app.services.integration_service.get_http_client") as mock_client:
+            mock_client.return_value.post = post
+            await trigger_ticket_created(db_session, test_org.id, {"ticket_id": 1})
+            await service.dispatch_outbox(batch_size=10)
+            await trigger_ticket_created(db_session, test_org.id, {"ticket_id": 2})
+            dispatched = await service.dispatch_outbox(batch_size=10)
+
+        deliveries = await service.delivery_dao.get_by_endpoint(endpoint.id)
+
+        assert dispatched == 1
+        assert len(sent) == 1
+        assert len(deliveries) == 2
+        assert not any(d.delivered for d in deliveries)
+        assert sum("Held behind" in (d.error_message or "") for d in deliveries) == 1
+
+
 class TestWebhookServiceRetry:
     """Tests for retry logic."""
 
@@ -377,12 +619,12 @@ class TestWebhookServiceRetry:
 
         service = WebhookService(db_session)
 
-        with patch("app.services.integration_service.httpx.AsyncClient") as mock_client:
+        with patch("app.services.integration_service.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.headers = {}
             mock_response.text = '{"ok": true}'
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -390,6 +632,28 @@ class TestWebhookServiceRetry:
 
         assert retry_count == 1
 
+    @pytest.mark.asyncio
+    async def test_retries_dropped_when_endpoint_stops_retrying(self, db_session, test_org):
+        """Test due retries for a retry-disabled endpoint leave the queue unsent."""
+        endpoint = await WebhookEndpointFactory.create(
+            db_session, organization=test_org, retry_enabled=False
+        )
+        delivery = await WebhookDeliveryFactory.create_pending_retry(
+            db_session, endpoint=endpoint
+        )
+
+        service = WebhookService(db_session)
+
+        with patch("app.services.integration_service.get_http_client") as mock_client:
+            mock_client.return_value.post = AsyncMock()
+            await service.retry_failed_deliveries()
+
+            mock_client.return_value.post.assert_not_called()
+
+        await db_session.refresh(delivery)
+        assert delivery.next_retry_at is None
+        assert (await service.get_retry_queue_stats(test_org.id))["depth"] == 0
+
 
 class TestWebhookServiceDeliveryHistory:
     """Tests for delivery history."""
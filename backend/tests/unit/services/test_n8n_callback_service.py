@@ -0,0 +1,141 @@
+"""
+Unit tests for n8n Execution Callback Service.
+
+WHAT: Tests for callback signing and the callback buffer.
+
+WHY: Verifies that:
+1. Secrets differ per environment and verify with validate_webhook_signature
+2. Only final statuses are buffered, and a full buffer refuses new events
+3. Flushes write matched events and retry unmatched ones a bounded number
+   of times
+
+HOW: Uses pytest-asyncio; the DAO lookup and result writer are mocked.
+"""
+
+import pytest
+import hashlib
+import hmac
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+from app.models.workflow import ExecutionStatus
+from app.schemas.workflow import N8nWebhookPayload
+from app.services.n8n_callback_service import (
+    N8nCallbackBuffer,
+    callback_outcome,
+    n8n_callback_secret,
+)
+from app.services.n8n_client import validate_webhook_signature
+
+
+def _payload(execution_id: str = "101", status: str = "success", **overrides):
+    values = {"execution_id": execution_id, "workflow_id": "wf", "status": status}
+    values.update(overrides)
+    return N8nWebhookPayload(**values)
+
+
+@pytest.fixture
+def buffer(monkeypatch):
+    """Buffer with a mocked session and DAO lookup."""
+    session = MagicMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    session.close = AsyncMock()
+
+    lookup = AsyncMock(return_value={})
+    dao = MagicMock(get_running_by_n8n_ids=lookup)
+    monkeypatch.setattr(
+        "app.services.n8n_callback_service.ExecutionLogDAO", lambda _session: dao
+    )
+    writer = AsyncMock(side_effect=lambda _session, results: len(results))
+    monkeypatch.setattr(
+        "app.services.n8n_callback_service.apply_execution_results", writer
+    )
+
+    callback_buffer = N8nCallbackBuffer(session_factory=lambda: session)
+    callback_buffer.lookup = lookup
+    callback_buffer.writer = writer
+    return callback_buffer
+
+
+class TestCallbackSigning:
+    """Tests for n8n_callback_secret."""
+
+    def test_secret_per_environment(self):
+        """Each environment signs with its own secret."""
+        body = b'{"execution_id": "1"}'
+        signature = hmac.new(
+            n8n_callback_secret(1).encode(), body, hashlib.sha256
+        ).hexdigest()
+
+        assert n8n_callback_secret(1) != n8n_callback_secret(2)
+        assert validate_webhook_signature(body, signature, n8n_callback_secret(1))
+        assert not validate_webhook_signature(body, signature, n8n_callback_secret(2))
+
+
+class TestCallbackOutcome:
+    """Tests for callback_outcome."""
+
+    def test_final_status(self):
+        """Finish time is stored as naive UTC."""
+        finished = datetime(2026, 1, 2, 5, 0, tzinfo=timezone(timedelta(hours=2)))
+
+        outcome = callback_outcome(_payload(status="error", finished_at=finished))
+
+        assert outcome["status"] == ExecutionStatus.FAILED
+        assert outcome["finished_at"] == datetime(2026, 1, 2, 3, 0)
+        assert outcome["error_message"] == "n8n execution error"
+
+    def test_running_is_ignored(self):
+        """Non-final statuses produce no outcome."""
+        assert callback_outcome(_payload(status="running")) is None
+
+
+class TestN8nCallbackBuffer:
+    """Tests for N8nCallbackBuffer."""
+
+    def test_full_buffer_refuses(self, buffer, monkeypatch):
+        """Past the buffer limit, new executions are refused."""
+        monkeypatch.setattr(
+            "app.services.n8n_callback_service.settings.N8N_CALLBACK_MAX_BUFFERED", 1
+        )
+
+        assert buffer.add(1, _payload("101"))
+        assert buffer.add(1, _payload("101", status="error"))
+        assert not buffer.add(1, _payload("102"))
+        assert buffer.add(1, _payload("103", status="running"))
+        assert buffer.get_status()["buffered"] == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_matched(self, buffer):
+        """Matched events are written in one batch and leave the buffer."""
+        buffer.add(1, _payload("101"))
+        buffer.add(1, _payload("102", status="canceled"))
+        buffer.lookup.return_value = {(1, "101"): 11, (1, "102"): 12}
+
+        assert await buffer.flush() == 2
+
+        results = buffer.writer.await_args.args[1]
+        assert {r["log_id"]: r["status"] for r in results} == {
+            11: ExecutionStatus.SUCCESS,
+            12: ExecutionStatus.CANCELLED,
+        }
+        assert buffer.get_status()["buffered"] == 0
+
+    @pytest.mark.asyncio
+    async def test_unmatched_retried_then_dropped(self, buffer, monkeypatch):
+        """Unmatched events wait for a later flush, up to the attempt limit."""
+        monkeypatch.setattr(
+            "app.services.n8n_callback_service.settings.N8N_CALLBACK_MATCH_ATTEMPTS", 2
+        )
+        buffer.add(1, _payload("101"))
+
+        await buffer.flush()
+        assert buffer.get_status()["buffered"] == 1
+
+        await buffer.flush()
+        assert buffer.get_status() == {
+            "buffered": 0,
+            "completed_total": 0,
+            "dropped_total": 1,
+        }
@@ -0,0 +1,102 @@
+"""
+Unit tests for the n8n client cache.
+
+WHAT: Tests for N8nClientCache.
+
+WHY: Verifies that:
+1. Repeated lookups reuse one client and decrypt the API key once
+2. Editing an environment (new updated_at) builds a fresh client
+3. Invalidation and the entry bound drop cached clients, least recently
+   used first
+4. A key that doesn't decrypt makes the health check fail, not raise
+
+HOW: Environments are simple stand-ins; the encryption service is mocked.
+"""
+
+import pytest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from app.core.exceptions import EncryptionError, ValidationError
+from app.services.n8n_client import N8nClientCache
+
+
+@pytest.fixture
+def encryption(monkeypatch):
+    """Mocked encryption service that 'decrypts' by prefixing."""
+    service = MagicMock()
+    service.decrypt.side_effect = lambda value: f"plain-{value}"
+    monkeypatch.setattr(
+        "app.services.n8n_client.get_encryption_service", lambda: service
+    )
+    return service
+
+
+def _env(env_id: int = 1, updated_at: datetime = datetime(2026, 1, 1), **overrides):
+    values = {
+        "id": env_id,
+        "updated_at": updated_at,
+        "base_url": "https://n8n.example.com",
+        "api_key_encrypted": "secret",
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class TestN8nClientCache:
+    """Tests for N8nClientCache."""
+
+    def test_reuses_client_and_decrypts_once(self, encryption):
+        """Same environment version returns the same client."""
+        cache = N8nClientCache()
+
+        first = cache.get(_env())
+        second = cache.get(_env())
+
+        assert first is second
+        assert first._get_headers()["Authorization"] == "Bearer plain-secret"
+        encryption.decrypt.assert_called_once_with("secret")
+
+    def test_updated_environment_rebuilds(self, encryption):
+        """A newer updated_at replaces the cached client."""
+        cache = N8nClientCache()
+        first = cache.get(_env())
+
+        second = cache.get(
+            _env(updated_at=datetime(2026, 1, 2), api_key_encrypted="rotated")
+        )
+
+        assert second is not first
+        assert second._get_headers()["Authorization"] == "Bearer plain-rotated"
+
+    def test_invalidate_and_bound(self, encryption):
+        """Invalidated and oldest entries are dropped."""
+        cache = N8nClientCache(max_entries=2)
+        first = cache.get(_env(1))
+        cache.invalidate(1)
+        assert cache.get(_env(1)) is not first
+
+        cache.get(_env(2))
+        cache.get(_env(1))
+        cache.get(_env(3))
+        assert set(cache._entries) == {1, 3}
+
+    def test_invalid_url_not_cached(self, encryption):
+        """SSRF validation still applies and failures aren't cached."""
+        cache = N8nClientCache()
+
+        with pytest.raises(ValidationError):
+            cache.get(_env(base_url="ftp://n8n.example.com"))
+
+        assert cache._entries == {}
+
+    @pytest.mark.asyncio
+    async def test_undecryptable_key_unhealthy(self, encryption):
+        """Decryption is deferred; a bad key reports the environment unhealthy."""
+        encryption.decrypt.side_effect = EncryptionError(message="Failed to decrypt data")
+        cache = N8nClientCache()
+
+        client = cache.get(_env())
+
+        assert await client.health_check() is False
@@ -0,0 +1,131 @@
+"""
+Unit tests for n8n Execution Sync Service.
+
+WHAT: Tests for the running-execution status sync.
+
+WHY: Verifies that:
+1. n8n statuses map to final execution statuses (and running ones are skipped)
+2. Output and errors are extracted from execution data
+3. Paging stops once the oldest running execution has been passed
+4. Executions missing from the list are looked up, and 404s marked failed
+
+HOW: Uses pytest-asyncio with a mocked N8nClient; no database access.
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core.exceptions import N8nError
+from app.models.workflow import ExecutionStatus
+from app.services.n8n_sync_service import (
+    N8nExecutionSyncService,
+    execution_result,
+)
+
+
+def _client(pages, executions=None):
+    """Mock client returning list pages in order and single executions by ID."""
+    client = MagicMock()
+    client.get_executions = AsyncMock(side_effect=pages)
+
+    async def get_execution(execution_id):
+        found = (executions or {}).get(execution_id)
+        if found is None:
+            raise N8nError(message="Not found", status_code=404)
+        return found
+
+    client.get_execution = AsyncMock(side_effect=get_execution)
+    return client
+
+
+class TestExecutionResult:
+    """Tests for execution_result."""
+
+    def test_success_with_output(self):
+        """Successful execution records stop time and last node output."""
+        result = execution_result(7, {
+            "id": "12",
+            "status": "success",
+            "stoppedAt": "2026-01-02T03:04:05.000Z",
+            "data": {"resultData": {
+                "lastNodeExecuted": "Done",
+                "runData": {"Done": [{"data": {"main": [[{"json": {"ok": True}}]]}}]},
+            }},
+        })
+
+        assert result["log_id"] == 7
+        assert result["status"] == ExecutionStatus.SUCCESS
+        assert result["finished_at"] == datetime(2026, 1, 2, 3, 4, 5)
+        assert result["output_data"] == {"last_node": "Done", "items": [{"ok": True}]}
+        assert result["error_message"] is None
+
+    def test_error_message(self):
+        """Failed execution carries n8n's error message."""
+        result = execution_result(7, {
+            "status": "error",
+            "stoppedAt": "2026-01-02T03:04:05Z",
+            "data": {"resultData": {"error": {"message": "Boom"}}},
+        })
+
+        assert result["status"] == ExecutionStatus.FAILED
+        assert result["error_message"] == "Boom"
+
+    @pytest.mark.parametrize("status", ["running", "waiting", "new"])
+    def test_unfinished_is_skipped(self, status):
+        """Executions n8n still runs are left alone."""
+        assert execution_result(7, {"status": status}) is None
+
+    def test_legacy_finished_flag(self):
+        """Executions without a status fall back to the finished flag."""
+        result = execution_result(7, {"finished": True, "stoppedAt": "2026-01-02T03:04:05Z"})
+
+        assert result["status"] == ExecutionStatus.SUCCESS
+
+
+class TestSyncEnvironment:
+    """Tests for N8nExecutionSyncService._sync_environment."""
+
+    @pytest.mark.asyncio
+    async def test_stops_after_passing_oldest_running(self, monkeypatch):
+        """Paging ends once the list goes below the oldest running ID."""
+        monkeypatch.setattr(
+            "app.services.n8n_sync_service.settings.N8N_SYNC_REQUESTS_PER_SECOND", 0
+        )
+        client = _client([
+            {"data": [{"id": "30", "status": "success"}], "nextCursor": "a"},
+            {"data": [{"id": "19", "status": "error"}], "nextCursor": "b"},
+            {"data": [{"id": "5", "status": "success"}], "nextCursor": "c"},
+        ])
+        service = N8nExecutionSyncService()
+
+        results = await service._sync_environment(1, client, {"30": 300, "20": 200})
+
+        assert client.get_executions.await_count == 2
+        assert [r["log_id"] for r in results] == [300, 200]
+        # 20 was passed without appearing, so n8n no longer has it
+        assert results[1]["status"] == ExecutionStatus.FAILED
+        client.get_execution.assert_awaited_once_with("20")
+
+    @pytest.mark.asyncio
+    async def test_capped_paging_resumes_from_cursor(self, monkeypatch):
+        """Hitting the page cap saves the cursor for the next run."""
+        monkeypatch.setattr(
+            "app.services.n8n_sync_service.settings.N8N_SYNC_REQUESTS_PER_SECOND", 0
+        )
+        monkeypatch.setattr("app.services.n8n_sync_service.settings.N8N_SYNC_MAX_PAGES", 1)
+        client = _client([{"data": [{"id": "50", "status": "running"}], "nextCursor": "next"}])
+        service = N8nExecutionSyncService()
+
+        results = await service._sync_environment(1, client, {"50": 500, "10": 100})
+
+        assert results == []
+        assert service._resume_cursors == {1: "next"}
+        client.get_execution.assert_not_awaited()
+
+        client = _client([{"data": [], "nextCursor": None}], {"10": {"status": "success"}})
+        results = await service._sync_environment(1, client, {"10": 100})
+
+        assert client.get_executions.await_args.kwargs["cursor"] == "next"
+        assert [r["log_id"] for r in results] == [100]
+        assert service._resume_cursors == {}
@@ -0,0 +1,148 @@
+"""
+Unit tests for the PDF renderer.
+
+WHAT: Tests for PDFCache and PDFRenderer.
+
+WHY: Verifies that:
+1. The memory cache evicts least recently used entries to disk and
+   serves them back from there
+2. The disk spill stays within its budget
+3. Unchanged documents are rendered once; changes produce a new render
+4. Concurrent requests for the same document share one render
+5. Renders produce real invoice and proposal PDFs, on a thread and in
+   the default process pool
+
+HOW: Uses pytest-asyncio; most tests run the renderer on a thread
+(max_workers=0) with tmp_path as the spill directory.
+"""
+
+import asyncio
+import pytest
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+from app.models.invoice import Invoice, InvoiceStatus
+from app.models.proposal import Proposal
+from app.services import pdf_renderer
+from app.services.pdf_renderer import PDFCache, PDFRenderer
+
+
+def _invoice(**overrides):
+    """Build an unsaved invoice."""
+    fields = dict(
+        invoice_number="INV-2026-0001",
+        status=InvoiceStatus.SENT,
+        issue_date=date(2026, 3, 1),
+        due_date=date(2026, 3, 31),
+        subtotal=Decimal("100.00"),
+        discount_amount=Decimal("0"),
+        tax_amount=Decimal("8.00"),
+        total=Decimal("108.00"),
+        amount_paid=Decimal("0"),
+    )
+    fields.update(overrides)
+    return Invoice(**fields)
+
+
+@pytest.fixture
+def renderer(tmp_path):
+    """Thread-backed renderer with a small cache."""
+    renderer = PDFRenderer(
+        max_workers=0,
+        cache=PDFCache(max_memory_bytes=1024 * 1024, directory=str(tmp_path)),
+    )
+    yield renderer
+    renderer.shutdown()
+
+
+class TestPDFCache:
+    """Tests for PDFCache."""
+
+    @pytest.mark.asyncio
+    async def test_evicted_entries_served_from_disk(self, tmp_path):
+        """LRU entries spill to disk and come back from there."""
+        cache = PDFCache(max_memory_bytes=10, directory=str(tmp_path))
+        await cache.put("a", b"aaaaaa")
+        await cache.put("b", b"bbbbbb")
+
+        assert (tmp_path / "a.pdf").read_bytes() == b"aaaaaa"
+        assert await cache.get("a") == b"aaaaaa"
+        assert cache.disk_hits == 1
+        assert await cache.get("a") == b"aaaaaa"
+        assert cache.hits == 1
+        assert await cache.get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_disk_budget(self, tmp_path):
+        """The oldest spilled files are removed beyond the disk budget."""
+        cache = PDFCache(max_memory_bytes=0, directory=str(tmp_path), max_disk_bytes=10)
+        for key in ("a", "b", "c"):
+            await cache.put(key, b"xxxx")
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["b.pdf", "c.pdf"]
+
+
+class TestPDFRenderer:
+    """Tests for PDFRenderer."""
+
+    @pytest.mark.asyncio
+    async def test_invoice_rendered_once_until_changed(self, renderer):
+        """Repeat downloads hit the cache; a changed invoice re-renders."""
+        with patch.object(
+            pdf_renderer, "_render_invoice", wraps=pdf_renderer._render_invoice
+        ) as render:
+            first = await renderer.render_invoice_pdf(_invoice(), "Acme")
+            second = await renderer.render_invoice_pdf(_invoice(), "Acme")
+            await renderer.render_invoice_pdf(_invoice(status=InvoiceStatus.PAID), "Acme")
+
+        assert first.startswith(b"%PDF")
+        assert second == first
+        assert render.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_render(self, renderer):
+        """Simultaneous requests for one document render it once."""
+        with patch.object(
+            pdf_renderer, "_render_invoice", wraps=pdf_renderer._render_invoice
+        ) as render:
+            results = await asyncio.gather(
+                *[renderer.render_invoice_pdf(_invoice(), "Acme") for _ in range(5)]
+            )
+
+        assert render.call_count == 1
+        assert len(set(results)) == 1
+
+    @pytest.mark.asyncio
+    async def test_proposal(self, renderer):
+        """Proposals render through the same path."""
+        proposal = Proposal(
+            id=7,
+            version=2,
+            title="Automation Rollout",
+            created_at=datetime(2026, 3, 1),
+            line_items=[{"description": "Setup", "quantity": 1, "unit_price": 500, "amount": 500}],
+            subtotal=Decimal("500"),
+            discount_amount=Decimal("0"),
+            tax_amount=Decimal("0"),
+            total=Decimal("500"),
+        )
+
+        pdf = await renderer.render_proposal_pdf(proposal, "Acme")
+
+        assert pdf.startswith(b"%PDF")
+
+    @pytest.mark.asyncio
+    async def test_process_pool(self, tmp_path):
+        """The default process pool renders snapshots in a spawned worker."""
+        renderer = PDFRenderer(
+            max_workers=1,
+            cache=PDFCache(max_memory_bytes=1024 * 1024, directory=str(tmp_path)),
+        )
+        try:
+            pdf = await renderer.render_invoice_pdf(_invoice(), "Acme")
+        finally:
+            renderer.shutdown()
+
+        assert pdf.startswith(b"%PDF")
+        assert renderer.cache.misses == 1
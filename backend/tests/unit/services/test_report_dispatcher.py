@@ -0,0 +1,160 @@
+"""
+Unit tests for scheduled report dispatch.
+
+WHAT: Tests for compute_next_run and ReportDispatcher.
+
+WHY: Verifies that:
+1. Cron schedules are evaluated in the report's timezone
+2. Due reports are claimed, advanced and given a PENDING execution
+3. The per-organization limit leaves excess reports due
+4. Executions are enqueued only after the claim is committed
+5. Executions stuck in PENDING are failed, and a failed enqueue doesn't
+   stop the rest of the tick
+
+HOW: Uses pytest-asyncio with PostgreSQL test database for the claim and
+a mocked session for the tick.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+from app.core.config import settings
+from app.core.exceptions import ReportGenerationError, ReportScheduleError
+from app.models.report import ExecutionStatus, ReportExecution, ScheduledReport
+from app.services.report_dispatcher import ReportDispatcher
+from app.services.report_service import compute_next_run
+
+
+class TestComputeNextRun:
+    """Tests for compute_next_run."""
+
+    def test_uses_report_timezone(self):
+        """8am in New York is 12:00 UTC in summer and 13:00 UTC in winter."""
+        summer = compute_next_run("0 8 * * *", "America/New_York", datetime(2026, 7, 1))
+        winter = compute_next_run("0 8 * * *", "America/New_York", datetime(2026, 1, 1))
+
+        assert summer == datetime(2026, 7, 1, 12, 0)
+        assert winter == datetime(2026, 1, 1, 13, 0)
+
+    def test_invalid_timezone(self):
+        """Unknown timezones are rejected like invalid expressions."""
+        with pytest.raises(ReportScheduleError):
+            compute_next_run("0 8 * * *", "Mars/Olympus_Mons")
+
+
+class TestReportDispatcher:
+    """Tests for ReportDispatcher."""
+
+    @pytest.mark.asyncio
+    async def test_claim_respects_org_limit(
+        self, db_session, test_org, test_admin, monkeypatch
+    ):
+        """Reports over the per-org limit stay due for a later tick."""
+        monkeypatch.setattr(settings, "REPORT_MAX_CONCURRENT_PER_ORG", 2)
+        now = datetime.utcnow()
+        reports = [
+            ScheduledReport(
+                org_id=test_org.id,
+                created_by=test_admin.id,
+                name=f"Weekly {i}",
+                report_type="invoice",
+                schedule="0 8 * * 1",
+                output_format="csv",
+                next_run_at=now - timedelta(minutes=10 - i),
+            )
+            for i in range(3)
+        ]
+        db_session.add_all(reports)
+        await db_session.flush()
+
+        dispatched, status = await ReportDispatcher()._claim(db_session, now)
+
+        assert len(dispatched) == 2
+        assert status["queue_depth"] == 1
+        assert status["in_flight"] == 2
+        assert status["lag_seconds"] == pytest.approx(600, abs=1)
+        assert all(report.next_run_at > now for report in reports[:2])
+        assert reports[2].next_run_at < now
+        assert all(report.last_run_at == now for report in reports[:2])
+        for execution_id in dispatched:
+            execution = await db_session.get(ReportExecution, execution_id)
+            assert execution.status == ExecutionStatus.PENDING.value
+
+    @pytest.mark.asyncio
+    async def test_enqueues_after_commit(self):
+        """Executions are enqueued once the claim transaction is committed."""
+        session = AsyncMock()
+        dispatcher = ReportDispatcher(session_factory=lambda: session)
+        status = {"queue_depth": 0, "in_flight": 1}
+
+        with patch.object(dispatcher, "_claim", AsyncMock(return_value=([7], status))), \
+             patch(
+                 "app.services.report_dispatcher.enqueue_report_execution", AsyncMock()
+             ) as enqueue:
+            enqueue.side_effect = lambda *args: session.commit.assert_awaited_once()
+            result = await dispatcher.dispatch_due_reports()
+
+        assert result == status
+        assert enqueue.await_args.args[0] == 7
+        assert dispatcher.get_status() == status
+        session.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_enqueue_failure_continues(self):
+        """An execution that can't be queued doesn't stop the others."""
+        dispatcher = ReportDispatcher(session_factory=AsyncMock)
+        status = {"queue_depth": 0, "in_flight": 2}
+
+        with patch.object(dispatcher, "_claim", AsyncMock(return_value=([7, 8], status))), \
+             patch(
+                 "app.services.report_dispatcher.enqueue_report_execution",
+                 AsyncMock(side_effect=[ReportGenerationError(message="down"), None]),
+             ) as enqueue:
+            result = await dispatcher.dispatch_due_reports()
+
+        assert result == status
+        assert [call.args[0] for call in enqueue.await_args_list] == [7, 8]
+
+    @pytest.mark.asyncio
+    async def test_unexpected_enqueue_error_continues(self):
+        """A failure outside the queueing fallback doesn't stop the others."""
+        dispatcher = ReportDispatcher(session_factory=AsyncMock)
+        status = {"queue_depth": 0, "in_flight": 3}
+
+        with patch.object(dispatcher, "_claim", AsyncMock(return_value=([7, 8, 9], status))), \
+             patch(
+                 "app.services.report_dispatcher.enqueue_report_execution",
+                 AsyncMock(side_effect=[RuntimeError("database unreachable"), None, None]),
+             ) as enqueue:
+            result = await dispatcher.dispatch_due_reports()
+
+        assert result == status
+        assert [call.args[0] for call in enqueue.await_args_list] == [7, 8, 9]
+
+    @pytest.mark.asyncio
+    async def test_stale_pending_failed(self, db_session, test_org, monkeypatch):
+        """Executions PENDING past the timeout are failed and stop counting."""
+        monkeypatch.setattr(settings, "REPORT_PENDING_TIMEOUT_SECONDS", 600)
+        now = datetime.utcnow()
+        stale, fresh = [
+            ReportExecution(
+                org_id=test_org.id,
+                report_type="invoice",
+                report_name="Invoices",
+                output_format="csv",
+                status=ExecutionStatus.PENDING.value,
+                created_at=created_at,
+            )
+            for created_at in (now - timedelta(hours=1), now - timedelta(minutes=1))
+        ]
+        db_session.add_all([stale, fresh])
+        await db_session.flush()
+
+        _, status = await ReportDispatcher()._claim(db_session, now)
+
+        await db_session.refresh(stale)
+        await db_session.refresh(fresh)
+        assert stale.status == ExecutionStatus.FAILED.value
+        assert fresh.status == ExecutionStatus.PENDING.value
+        assert status["in_flight"] == 1
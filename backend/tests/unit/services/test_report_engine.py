@@ -0,0 +1,165 @@
+"""
+Unit tests for the report generation engine.
+
+WHAT: Tests for the report writers, the S3 upload sink and report queries.
+
+WHY: Verifies that:
+1. CSV and JSON writers produce complete files from row batches
+2. Small files are uploaded with one request and large ones in parts
+3. Failed uploads are aborted
+4. Report queries are scoped to the organization and custom reports are
+   rejected
+5. An execution that can't be queued is marked FAILED
+
+HOW: Writers run against an in-memory sink; S3 is a MagicMock; queries
+are compiled without a database.
+"""
+
+import csv
+import io
+import json
+import pytest
+from datetime import date
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core.exceptions import ReportGenerationError, ValidationError
+from app.jobs import reports as report_jobs
+from app.models.ticket import TicketStatus
+from app.services.report_engine import build_report_query
+from app.services.report_writers import CsvReportWriter, JsonReportWriter, S3MultipartUpload
+
+
+HEADERS = ["Invoice", "Status", "Total", "Issue Date"]
+ROWS = [
+    ["INV-1", TicketStatus.OPEN, Decimal("10.50"), date(2026, 1, 2)],
+    ["INV-2", None, Decimal("3"), date(2026, 1, 3)],
+]
+
+
+@pytest.fixture
+def s3_client():
+    """Mocked boto3 S3 client."""
+    client = MagicMock()
+    client.create_multipart_upload.return_value = {"UploadId": "upload-1"}
+    client.upload_part.side_effect = lambda **kwargs: {"ETag": f"etag-{kwargs['PartNumber']}"}
+    return client
+
+
+class TestReportWriters:
+    """Tests for the streaming writers."""
+
+    def test_csv_writer(self):
+        """Batches are appended below a single header row."""
+        sink = io.BytesIO()
+        writer = CsvReportWriter(sink, "Invoices", HEADERS)
+        writer.write_rows(ROWS[:1])
+        writer.write_rows(ROWS[1:])
+        writer.close()
+
+        rows = list(csv.reader(io.StringIO(sink.getvalue().decode("utf-8"))))
+        assert rows == [
+            HEADERS,
+            ["INV-1", "open", "10.50", "2026-01-02"],
+            ["INV-2", "", "3", "2026-01-03"],
+        ]
+        assert writer.rows_written == 2
+
+    def test_json_writer(self):
+        """Batches form one array of objects, including empty batches."""
+        sink = io.BytesIO()
+        writer = JsonReportWriter(sink, "Invoices", HEADERS)
+        writer.write_rows([])
+        writer.write_rows(ROWS[:1])
+        writer.write_rows(ROWS[1:])
+        writer.close()
+
+        data = json.loads(sink.getvalue())
+        assert [row["Invoice"] for row in data] == ["INV-1", "INV-2"]
+        assert data[0]["Status"] == "open"
+        assert data[1]["Issue Date"] == "2026-01-03"
+
+
+class TestS3MultipartUpload:
+    """Tests for the S3 upload sink."""
+
+    def test_small_file_uses_put_object(self, s3_client):
+        """Files smaller than a part are uploaded in one request."""
+        sink = S3MultipartUpload(s3_client, "bucket", "key.csv", "text/csv", part_size=10)
+        sink.write(b"abc")
+        sink.close()
+
+        s3_client.put_object.assert_called_once_with(
+            Bucket="bucket", Key="key.csv", Body=b"abc", ContentType="text/csv"
+        )
+        s3_client.create_multipart_upload.assert_not_called()
+
+    def test_large_file_uses_parts(self, s3_client):
+        """Full parts go up while writing; close() sends the rest."""
+        sink = S3MultipartUpload(s3_client, "bucket", "key.csv", "text/csv", part_size=4)
+        sink.write(b"abcdefghij")
+        assert s3_client.upload_part.call_count == 2
+        sink.close()
+
+        bodies = [call.kwargs["Body"] for call in s3_client.upload_part.call_args_list]
+        assert bodies == [b"abcd", b"efgh", b"ij"]
+        parts = s3_client.complete_multipart_upload.call_args.kwargs["MultipartUpload"]["Parts"]
+        assert [part["PartNumber"] for part in parts] == [1, 2, 3]
+        assert sink.size == 10
+
+    def test_abort(self, s3_client):
+        """Aborting discards a started multipart upload."""
+        sink = S3MultipartUpload(s3_client, "bucket", "key.csv", "text/csv", part_size=4)
+        sink.write(b"abcdef")
+        sink.abort()
+
+        s3_client.abort_multipart_upload.assert_called_once_with(
+            Bucket="bucket", Key="key.csv", UploadId="upload-1"
+        )
+        s3_client.complete_multipart_upload.assert_not_called()
+
+
+class TestReportQueries:
+    """Tests for build_report_query."""
+
+    def test_scoped_to_organization(self):
+        """Every report filters on the requesting organization."""
+        headings, stmt = build_report_query("ticket", 42, {"status": "open"})
+
+        params = stmt.compile().params
+        assert "Assignee" in headings
+        assert 42 in params.values()
+        assert TicketStatus.OPEN in params.values()
+
+    def test_custom_report_rejected(self):
+        """Free-form custom reports are not executed."""
+        with pytest.raises(ReportGenerationError):
+            build_report_query("custom", 42, {"query": "SELECT * FROM users"})
+
+    def test_invalid_parameters_rejected(self):
+        """Malformed dates and enum values raise ValidationError."""
+        with pytest.raises(ValidationError):
+            build_report_query("invoice", 42, {"date_from": "yesterday"})
+        with pytest.raises(ValidationError):
+            build_report_query("ticket", 42, {"status": "nope"})
+
+
+class TestEnqueueReportExecution:
+    """Tests for enqueue_report_execution."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_failure_fails_execution(self):
+        """A broker error marks the execution FAILED and is surfaced."""
+        session = AsyncMock()
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__.return_value = session
+        service = MagicMock(fail_report_generation=AsyncMock())
+
+        with patch.object(report_jobs, "enqueue", AsyncMock(side_effect=ConnectionError())), \
+             patch.object(report_jobs, "AsyncSessionLocal", session_factory), \
+             patch.object(report_jobs, "ReportService", return_value=service):
+            with pytest.raises(ReportGenerationError):
+                await report_jobs.enqueue_report_execution(7)
+
+        assert service.fail_report_generation.await_args.args[0] == 7
+        session.commit.assert_awaited_once()
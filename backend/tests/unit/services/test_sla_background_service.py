@@ -4,328 +4,317 @@ Unit tests for SLA Background Service.
 WHAT: Tests for the SLA breach check job.
 
 WHY: Verifies that:
-1. Tickets in warning zone trigger warnings
-2. Breached tickets trigger breach notifications
+1. Threshold predicates select only tickets that crossed a threshold
+2. Claimed events are counted and notified
 3. Notifications are not duplicated
-4. Only active tickets are checked
-5. Correct recipients receive notifications
+4. Correct recipients receive notifications
+5. Emails go out in one bulk send and failures are counted, not raised
 
-HOW: Uses pytest-asyncio with mocked dependencies.
+HOW: Uses pytest-asyncio with mocked dependencies; claim statements are
+compiled against the PostgreSQL dialect.
 """
 
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from app.services.sla_background_service import SLABackgroundService
-from app.models.ticket import Ticket, TicketStatus, TicketPriority, TicketCategory
+from sqlalchemy import and_
+from sqlalchemy.dialects import postgresql
+
+from app.services.email import EmailResult
+from app.services.sla_background_service import (
+    SLABackgroundService,
+    SLAEvent,
+    SLA_WARNING_LOOKAHEAD,
+    _sla_threshold_conditions,
+)
+from app.models.ticket import Ticket, TicketPriority
 from app.models.user import User, UserRole
 
 
-class TestSLABackgroundServiceCheckLogic:
-    """Tests for SLA check logic."""
+def _compile(conditions) -> str:
+    """Render conditions as PostgreSQL SQL."""
+    return str(and_(*conditions).compile(dialect=postgresql.dialect()))
 
-    @pytest.fixture
-    def service(self):
-        """Create service instance."""
-        return SLABackgroundService()
 
-    @pytest.fixture
-    def mock_ticket_open(self):
-        """Create a mock open ticket."""
-        ticket = MagicMock(spec=Ticket)
-        ticket.id = 1
-        ticket.org_id = 100
-        ticket.status = TicketStatus.OPEN
-        ticket.priority = TicketPriority.HIGH
-        ticket.subject = "Test Ticket"
-        ticket.first_response_at = None
-        ticket.created_at = datetime.utcnow() - timedelta(hours=3)
-        ticket.sla_response_due_at = datetime.utcnow() + timedelta(hours=1)
-        ticket.sla_resolution_due_at = datetime.utcnow() + timedelta(hours=21)
-        ticket.sla_response_warning_sent_at = None
-        ticket.sla_response_breach_sent_at = None
-        ticket.sla_resolution_warning_sent_at = None
-        ticket.sla_resolution_breach_sent_at = None
-        ticket.is_sla_response_breached = False
-        ticket.is_sla_resolution_breached = False
-        ticket.is_sla_response_warning_zone = True  # 75% elapsed
-        ticket.is_sla_resolution_warning_zone = False
-        ticket.sla_response_remaining_seconds = 3600  # 1 hour
-        ticket.sla_resolution_remaining_seconds = 75600  # 21 hours
-        ticket.created_by = MagicMock()
-        ticket.created_by.name = "Test Customer"
-        ticket.assigned_to = None
-        ticket.assigned_to_user_id = None
-        return ticket
+def _make_user(user_id: int, org_id: int = 100, role: UserRole = UserRole.ADMIN):
+    """Create a mock user."""
+    user = MagicMock(spec=User)
+    user.id = user_id
+    user.org_id = org_id
+    user.role = role
+    user.email = f"user{user_id}@test.com"
+    user.name = f"User {user_id}"
+    return user
 
-    @pytest.fixture
-    def mock_breached_ticket(self):
-        """Create a mock breached ticket."""
-        ticket = MagicMock(spec=Ticket)
-        ticket.id = 2
-        ticket.org_id = 100
-        ticket.status = TicketStatus.OPEN
-        ticket.priority = TicketPriority.URGENT
-        ticket.subject = "Urgent Breached Ticket"
-        ticket.first_response_at = None
-        ticket.created_at = datetime.utcnow() - timedelta(hours=2)
-        ticket.sla_response_due_at = datetime.utcnow() - timedelta(minutes=30)
-        ticket.sla_resolution_due_at = datetime.utcnow() + timedelta(hours=2)
-        ticket.sla_response_warning_sent_at = datetime.utcnow() - timedelta(hours=1)
-        ticket.sla_response_breach_sent_at = None
-        ticket.sla_resolution_warning_sent_at = None
-        ticket.sla_resolution_breach_sent_at = None
-        ticket.is_sla_response_breached = True
-        ticket.is_sla_resolution_breached = False
-        ticket.is_sla_response_warning_zone = False
-        ticket.is_sla_resolution_warning_zone = False
-        ticket.sla_response_remaining_seconds = 0
-        ticket.sla_resolution_remaining_seconds = 7200
-        ticket.created_by = MagicMock()
-        ticket.created_by.name = "Urgent Customer"
-        ticket.assigned_to = MagicMock()
-        ticket.assigned_to.name = "Agent Smith"
-        ticket.assigned_to_user_id = 5
-        return ticket
 
-    @pytest.fixture
-    def mock_user(self):
-        """Create mock user recipient."""
-        user = MagicMock(spec=User)
-        user.id = 10
-        user.email = "admin@test.com"
-        user.name = "Test Admin"
-        user.role = UserRole.ADMIN
-        user.is_active = True
-        return user
+def _make_ticket(ticket_id: int = 1, org_id: int = 100, assigned_to_user_id=None):
+    """Create a mock ticket with response SLA due in one hour."""
+    now = datetime.utcnow()
+    ticket = MagicMock(spec=Ticket)
+    ticket.id = ticket_id
+    ticket.org_id = org_id
+    ticket.subject = "Test Ticket"
+    ticket.priority = TicketPriority.HIGH
+    ticket.sla_response_due_at = now + timedelta(hours=1)
+    ticket.sla_resolution_due_at = now - timedelta(hours=2)
+    ticket.created_by = MagicMock()
+    ticket.created_by.name = "Test Customer"
+    ticket.assigned_to = None
+    ticket.assigned_to_user_id = assigned_to_user_id
+    return ticket
 
-    @pytest.mark.asyncio
-    async def test_check_response_sla_warning(self, service, mock_ticket_open):
-        """Test that warning is sent when in warning zone."""
-        mock_session = AsyncMock()
 
-        with patch.object(
-            service, "_send_sla_warning_notification", new_callable=AsyncMock
-        ) as mock_send:
-            result = await service._check_response_sla(mock_session, mock_ticket_open)
+class TestSLAThresholdConditions:
+    """Tests for the SQL threshold predicates."""
 
-            assert result == "warning"
-            mock_send.assert_called_once_with(mock_session, mock_ticket_open, "response")
+    def test_warning_lookahead_covers_longest_sla(self):
+        """Test lookahead is 25% of the longest configured SLA (168h)."""
+        assert SLA_WARNING_LOOKAHEAD == timedelta(hours=42)
 
-    @pytest.mark.asyncio
-    async def test_check_response_sla_breach(self, service, mock_breached_ticket):
-        """Test that breach is sent when SLA is breached."""
-        mock_session = AsyncMock()
+    def test_response_breach_requires_no_first_response(self):
+        """Test response breaches skip tickets that were answered."""
+        sql = _compile(_sla_threshold_conditions("response", "breached", datetime.utcnow()))
 
-        with patch.object(
-            service, "_send_sla_breach_notification", new_callable=AsyncMock
-        ) as mock_send:
-            result = await service._check_response_sla(mock_session, mock_breached_ticket)
+        assert "tickets.first_response_at IS NULL" in sql
+        assert "tickets.sla_response_breach_sent_at IS NULL" in sql
+        assert "tickets.sla_response_due_at <" in sql
 
-            assert result == "breach"
-            mock_send.assert_called_once_with(mock_session, mock_breached_ticket, "response")
+    def test_resolution_breach_ignores_first_response(self):
+        """Test resolution SLA applies whether or not the ticket was answered."""
+        sql = _compile(_sla_threshold_conditions("resolution", "breached", datetime.utcnow()))
 
-    @pytest.mark.asyncio
-    async def test_no_duplicate_warning(self, service, mock_ticket_open):
-        """Test that warning is not sent twice."""
-        mock_session = AsyncMock()
-        # Already sent warning
-        mock_ticket_open.sla_response_warning_sent_at = datetime.utcnow() - timedelta(minutes=30)
+        assert "first_response_at" not in sql
+        assert "tickets.sla_resolution_due_at <" in sql
 
-        with patch.object(
-            service, "_send_sla_warning_notification", new_callable=AsyncMock
-        ) as mock_send:
-            result = await service._check_response_sla(mock_session, mock_ticket_open)
+    def test_warning_is_bounded_by_due_at_range(self):
+        """Test warnings use an indexable due-at range plus the 75% check."""
+        sql = _compile(_sla_threshold_conditions("response", "warning", datetime.utcnow()))
 
-            assert result is None
-            mock_send.assert_not_called()
+        assert "tickets.sla_response_warning_sent_at IS NULL" in sql
+        assert "tickets.sla_response_due_at >=" in sql
+        assert "tickets.sla_response_due_at <=" in sql
+        assert "tickets.created_at +" in sql
 
-    @pytest.mark.asyncio
-    async def test_no_duplicate_breach(self, service, mock_breached_ticket):
-        """Test that breach is not sent twice."""
-        mock_session = AsyncMock()
-        # Already sent breach
-        mock_breached_ticket.sla_response_breach_sent_at = datetime.utcnow() - timedelta(minutes=30)
+    def test_finished_tickets_excluded(self):
+        """Test resolved and closed tickets are never selected."""
+        sql = _compile(_sla_threshold_conditions("resolution", "warning", datetime.utcnow()))
 
-        with patch.object(
-            service, "_send_sla_breach_notification", new_callable=AsyncMock
-        ) as mock_send:
-            result = await service._check_response_sla(mock_session, mock_breached_ticket)
+        assert "tickets.status NOT IN" in sql
 
-            assert result is None
-            mock_send.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_skip_responded_ticket(self, service, mock_ticket_open):
-        """Test that tickets with first response are skipped."""
-        mock_session = AsyncMock()
-        mock_ticket_open.first_response_at = datetime.utcnow()
+class TestSLARecipients:
+    """Tests for batched recipient resolution."""
 
-        with patch.object(
-            service, "_send_sla_warning_notification", new_callable=AsyncMock
-        ) as mock_send:
-            result = await service._check_response_sla(mock_session, mock_ticket_open)
+    @pytest.fixture
+    def service(self):
+        """Create service instance."""
+        return SLABackgroundService()
 
-            assert result is None
-            mock_send.assert_not_called()
+    def _session_returning(self, users):
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = users
+        session.execute.return_value = result
+        return session
 
     @pytest.mark.asyncio
-    async def test_check_resolution_sla_warning(self, service):
-        """Test resolution SLA warning check."""
-        mock_session = AsyncMock()
-        ticket = MagicMock()
-        ticket.status = TicketStatus.IN_PROGRESS
-        ticket.sla_resolution_due_at = datetime.utcnow() + timedelta(hours=1)
-        ticket.is_sla_resolution_breached = False
-        ticket.is_sla_resolution_warning_zone = True
-        ticket.sla_resolution_warning_sent_at = None
-        ticket.sla_resolution_remaining_seconds = 3600
-
-        with patch.object(
-            service, "_send_sla_warning_notification", new_callable=AsyncMock
-        ) as mock_send:
-            result = await service._check_resolution_sla(mock_session, ticket)
-
-            assert result == "warning"
-            mock_send.assert_called_once_with(mock_session, ticket, "resolution")
+    async def test_assignee_first_then_admins_without_duplicates(self, service):
+        """Test assignee is listed once even if they are also an admin."""
+        assignee = _make_user(5)
+        admin = _make_user(6)
+        ticket = _make_ticket(assigned_to_user_id=5)
+        session = self._session_returning([assignee, admin])
 
-    @pytest.mark.asyncio
-    async def test_skip_resolved_ticket_for_resolution_sla(self, service):
-        """Test that resolved tickets are skipped for resolution SLA."""
-        mock_session = AsyncMock()
-        ticket = MagicMock()
-        ticket.status = TicketStatus.RESOLVED
+        recipients = await service._get_recipients_by_ticket(session, [ticket])
 
-        result = await service._check_resolution_sla(mock_session, ticket)
+        assert recipients[ticket.id] == [assignee, admin]
+        session.execute.assert_awaited_once()
 
-        assert result is None
+    @pytest.mark.asyncio
+    async def test_admins_are_scoped_to_ticket_org(self, service):
+        """Test each ticket only gets its own org's admins."""
+        admin_a = _make_user(1, org_id=100)
+        admin_b = _make_user(2, org_id=200)
+        ticket_a = _make_ticket(1, org_id=100)
+        ticket_b = _make_ticket(2, org_id=200)
+        session = self._session_returning([admin_a, admin_b])
 
+        recipients = await service._get_recipients_by_ticket(session, [ticket_a, ticket_b])
 
-class TestSLABackgroundServiceRecipients:
-    """Tests for notification recipient logic."""
-
-    @pytest.fixture
-    def service(self):
-        """Create service instance."""
-        return SLABackgroundService()
+        assert recipients[1] == [admin_a]
+        assert recipients[2] == [admin_b]
 
     @pytest.mark.asyncio
-    async def test_get_recipients_includes_assignee(self, service):
-        """Test that assigned user is included in recipients."""
-        mock_session = AsyncMock()
-
-        # Mock assignee
-        assignee = MagicMock()
-        assignee.id = 5
-        assignee.email = "assignee@test.com"
-        assignee.is_active = True
+    async def test_non_admin_from_other_org_is_not_an_admin_recipient(self, service):
+        """Test a client assignee doesn't leak into other tickets' recipients."""
+        assignee = _make_user(7, org_id=100, role=UserRole.CLIENT)
+        ticket_a = _make_ticket(1, assigned_to_user_id=7)
+        ticket_b = _make_ticket(2)
+        session = self._session_returning([assignee])
 
-        # Mock ticket
-        ticket = MagicMock()
-        ticket.org_id = 100
-        ticket.assigned_to_user_id = 5
+        recipients = await service._get_recipients_by_ticket(session, [ticket_a, ticket_b])
 
-        # Mock user_dao.get_by_id
-        mock_user_dao = MagicMock()
-        mock_user_dao.get_by_id = AsyncMock(return_value=assignee)
+        assert recipients[1] == [assignee]
+        assert recipients[2] == []
 
-        # Mock admin query
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
-        mock_session.execute = AsyncMock(return_value=mock_result)
 
-        with patch("app.services.sla_background_service.UserDAO", return_value=mock_user_dao):
-            recipients = await service._get_notification_recipients(mock_session, ticket)
-
-            assert len(recipients) == 1
-            assert recipients[0].email == "assignee@test.com"
+class TestSLANotifications:
+    """Tests for concurrent notification fan-out."""
 
     @pytest.mark.asyncio
-    async def test_get_recipients_includes_admins(self, service):
-        """Test that org admins are included in recipients."""
-        mock_session = AsyncMock()
-
-        # Mock admin users
-        admin1 = MagicMock()
-        admin1.id = 10
-        admin1.email = "admin1@test.com"
-        admin1.is_active = True
+    async def test_breach_email_reports_overdue_time(self):
+        """Test breach emails carry the overdue duration."""
+        service = SLABackgroundService()
+        ticket = _make_ticket()
 
-        admin2 = MagicMock()
-        admin2.id = 11
-        admin2.email = "admin2@test.com"
-        admin2.is_active = True
+        kwargs = service._build_email_kwargs(
+            ticket, "resolution", "breached", datetime.utcnow()
+        )
 
-        # Mock ticket without assignee
-        ticket = MagicMock()
-        ticket.org_id = 100
-        ticket.assigned_to_user_id = None
+        assert kwargs["sla_status"] == "breached"
+        assert kwargs["time_remaining"].endswith("overdue")
+        assert kwargs["ticket_priority"] == TicketPriority.HIGH.value
 
-        # Mock user_dao
-        mock_user_dao = MagicMock()
-        mock_user_dao.get_by_id = AsyncMock(return_value=None)
-
-        # Mock admin query
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [admin1, admin2]
-        mock_session.execute = AsyncMock(return_value=mock_result)
+    @pytest.mark.asyncio
+    async def test_failures_are_counted_not_raised(self):
+        """Test one failing recipient doesn't stop the others."""
+        service = SLABackgroundService()
+        email_service = MagicMock()
+        email_service.build_sla_warning_email = MagicMock(
+            side_effect=lambda **kwargs: MagicMock(
+                to_email=kwargs["to_email"],
+                metadata={"ticket_id": kwargs["ticket_id"], "sla_status": kwargs["sla_status"]},
+            )
+        )
+        email_service.send_bulk = AsyncMock(
+            return_value=[
+                EmailResult(success=False, error="SMTP down"),
+                EmailResult(success=True),
+            ]
+        )
+        service._email_service = email_service
+        ticket = _make_ticket()
+
+        errors = await service._send_notifications(
+            "session",
+            [SLAEvent(ticket.id, "response", "warning")],
+            {ticket.id: ticket},
+            {ticket.id: [_make_user(1), _make_user(2)]},
+            datetime.utcnow(),
+        )
+
+        assert errors == 1
+        assert email_service.send_bulk.await_count == 1
+        assert email_service.send_bulk.await_args.kwargs["session"] == "session"
 
-        with patch("app.services.sla_background_service.UserDAO", return_value=mock_user_dao):
-            recipients = await service._get_notification_recipients(mock_session, ticket)
+    @pytest.mark.asyncio
+    async def test_render_failure_skips_only_that_recipient(self):
+        """Test a template error for one recipient doesn't drop the run."""
+        service = SLABackgroundService()
+        email_service = MagicMock()
+
+        def build(**kwargs):
+            if kwargs["to_email"] == "user1@test.com":
+                raise ValueError("template error")
+            return MagicMock(to_email=kwargs["to_email"])
+
+        email_service.build_sla_warning_email = MagicMock(side_effect=build)
+        email_service.send_bulk = AsyncMock(
+            side_effect=lambda messages, session: [EmailResult(success=True)] * len(messages)
+        )
+        service._email_service = email_service
+        ticket = _make_ticket()
+
+        errors = await service._send_notifications(
+            None,
+            [SLAEvent(ticket.id, "response", "warning")],
+            {ticket.id: ticket},
+            {ticket.id: [_make_user(1), _make_user(2)]},
+            datetime.utcnow(),
+        )
+
+        assert errors == 1
+        sent = email_service.send_bulk.await_args.args[0]
+        assert [message.to_email for message in sent] == ["user2@test.com"]
 
-            assert len(recipients) == 2
-            emails = [r.email for r in recipients]
-            assert "admin1@test.com" in emails
-            assert "admin2@test.com" in emails
+    @pytest.mark.asyncio
+    async def test_all_recipients_sent_in_one_bulk_send(self):
+        """Test every event and recipient of a run goes out in one send_bulk."""
+        service = SLABackgroundService()
+        email_service = MagicMock()
+        email_service.send_bulk = AsyncMock(
+            side_effect=lambda messages, session: [EmailResult(success=True)] * len(messages)
+        )
+        service._email_service = email_service
+        tickets = {i: _make_ticket(i) for i in range(1, 6)}
+        users = [_make_user(u) for u in range(1, 5)]
+
+        errors = await service._send_notifications(
+            None,
+            [SLAEvent(i, "response", "breached") for i in tickets],
+            tickets,
+            {i: users for i in tickets},
+            datetime.utcnow(),
+        )
+
+        assert errors == 0
+        email_service.send_bulk.assert_awaited_once()
+        assert len(email_service.send_bulk.await_args.args[0]) == 20
+        assert email_service.build_sla_warning_email.call_args.kwargs["org_id"] == 100
 
 
 class TestSLABackgroundServiceIntegration:
-    """Integration-style tests with mocked database."""
+    """Integration-style tests for the full job."""
 
-    @pytest.fixture
-    def service(self):
-        """Create service instance with mocked session factory."""
-        mock_session = AsyncMock()
-        service = SLABackgroundService(session_factory=lambda: mock_session)
-        service._mock_session = mock_session
-        return service
+    @pytest.mark.asyncio
+    async def test_check_all_sla_breaches_counts_claimed_events(self):
+        """Test stats reflect claimed events and claims are committed first."""
+        session = AsyncMock()
+        service = SLABackgroundService(session_factory=lambda: session)
+        ticket = _make_ticket()
+        events = [
+            SLAEvent(ticket.id, "response", "warning"),
+            SLAEvent(ticket.id, "resolution", "breached"),
+        ]
+
+        with patch.object(service, "_claim_sla_events", AsyncMock(return_value=events)), \
+             patch.object(service, "_load_tickets", AsyncMock(return_value={ticket.id: ticket})), \
+             patch.object(service, "_get_recipients_by_ticket", AsyncMock(return_value={ticket.id: [_make_user(1)]})), \
+             patch.object(service, "_send_notifications", AsyncMock(return_value=0)) as send, \
+             patch.object(service, "_log_sla_events", AsyncMock()) as log:
+            result = await service.check_all_sla_breaches()
+
+        assert result["response_warnings"] == 1
+        assert result["resolution_breaches"] == 1
+        assert result["errors"] == 0
+        send.assert_awaited_once()
+        log.assert_awaited_once()
+        assert session.commit.await_count == 2
+        session.close.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_check_all_returns_stats(self, service):
-        """Test that check_all_sla_breaches returns statistics."""
-        # Mock _get_active_tickets to return empty list
-        with patch.object(
-            service, "_get_active_tickets", new_callable=AsyncMock, return_value=[]
-        ):
-            stats = await service.check_all_sla_breaches()
-
-            assert isinstance(stats, dict)
-            assert "response_warnings" in stats
-            assert "response_breaches" in stats
-            assert "resolution_warnings" in stats
-            assert "resolution_breaches" in stats
-            assert "errors" in stats
+    async def test_nothing_claimed_sends_nothing(self):
+        """Test already-notified tickets (nothing claimed) send no email."""
+        session = AsyncMock()
+        service = SLABackgroundService(session_factory=lambda: session)
+
+        with patch.object(service, "_claim_sla_events", AsyncMock(return_value=[])), \
+             patch.object(service, "_send_notifications", AsyncMock()) as send:
+            result = await service.check_all_sla_breaches()
+
+        send.assert_not_awaited()
+        assert sum(v for k, v in result.items() if k != "errors") == 0
 
     @pytest.mark.asyncio
-    async def test_check_all_processes_tickets(self, service):
-        """Test that all active tickets are processed."""
-        # Create mock tickets
-        ticket1 = MagicMock()
-        ticket1.id = 1
-        ticket2 = MagicMock()
-        ticket2.id = 2
-
-        with patch.object(
-            service, "_get_active_tickets", new_callable=AsyncMock, return_value=[ticket1, ticket2]
-        ), patch.object(
-            service, "_check_response_sla", new_callable=AsyncMock, return_value="warning"
-        ) as mock_response, patch.object(
-            service, "_check_resolution_sla", new_callable=AsyncMock, return_value=None
-        ) as mock_resolution:
-            stats = await service.check_all_sla_breaches()
-
-            # Both tickets should be checked
-            assert mock_response.call_count == 2
-            assert mock_resolution.call_count == 2
-            assert stats["response_warnings"] == 2
+    async def test_claim_failure_rolls_back(self):
+        """Test errors roll back the claims and close the session."""
+        session = AsyncMock()
+        service = SLABackgroundService(session_factory=lambda: session)
+
+        with patch.object(service, "_claim_sla_events", AsyncMock(side_effect=RuntimeError("db"))):
+            with pytest.raises(RuntimeError):
+                await service.check_all_sla_breaches()
+
+        session.rollback.assert_awaited_once()
+        session.close.assert_awaited_once()
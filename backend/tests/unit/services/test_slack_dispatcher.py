@@ -0,0 +1,119 @@
+"""
+Unit tests for the Slack dispatch queue.
+
+WHAT: Tests for SlackDispatcher and NotificationService queueing.
+
+WHY: Verifies that:
+1. Notifications return without posting, and a burst goes out as one digest
+2. A 429 requeues the batch and waits for Retry-After
+3. Other failures are retried, then dropped after the attempt limit
+
+HOW: Uses pytest-asyncio with a mocked SlackService; windows are set to
+zero so batches are due immediately.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.core.exceptions import SlackNotificationError
+from app.services.notification_service import NotificationService
+from app.services.slack_dispatcher import SlackDispatcher
+from app.services.slack_service import SlackService, build_actions_block
+
+
+@pytest.fixture
+def slack_service():
+    """Mocked, enabled SlackService."""
+    service = MagicMock(spec=SlackService)
+    service.webhook_url = "https://hooks.slack.com/services/T/B/x"
+    service.enabled = True
+    service.timeout = 10.0
+    service.send_message = AsyncMock(return_value=True)
+    return service
+
+
+@pytest.fixture
+def dispatcher(slack_service, monkeypatch):
+    """Dispatcher without a background task and with no coalescing delay."""
+    monkeypatch.setattr(
+        "app.services.slack_dispatcher.settings.SLACK_DISPATCH_WINDOW_SECONDS", 0.0
+    )
+    monkeypatch.setattr(
+        "app.services.slack_dispatcher.settings.SLACK_DISPATCH_MIN_INTERVAL_SECONDS", 0.0
+    )
+    slack_dispatcher = SlackDispatcher(slack_service)
+    slack_dispatcher._ensure_running = lambda: None
+    return slack_dispatcher
+
+
+class TestSlackDispatcher:
+    """Tests for SlackDispatcher."""
+
+    @pytest.mark.asyncio
+    async def test_notification_is_queued(self, dispatcher, slack_service):
+        """NotificationService hands messages to the queue without posting."""
+        service = NotificationService(
+            slack_service=slack_service, dispatcher=dispatcher
+        )
+
+        assert await service.notify_new_client_signup("Acme", "a@acme.test")
+        slack_service.send_message.assert_not_called()
+        assert dispatcher.get_status()["queued"] == 1
+
+    @pytest.mark.asyncio
+    async def test_burst_sent_as_digest(self, dispatcher, slack_service):
+        """Messages queued together go out as one digest."""
+        dispatcher.enqueue(
+            "Ticket #1", [build_actions_block([{"text": "View", "url": "https://x/1"}])]
+        )
+        dispatcher.enqueue("Ticket #2")
+
+        assert await dispatcher.dispatch_due() == 2
+
+        slack_service.send_message.assert_awaited_once()
+        text, blocks = slack_service.send_message.await_args.args
+        assert text.startswith("2 notifications")
+        assert blocks[0]["type"] == "header"
+        assert blocks[1]["accessory"]["url"] == "https://x/1"
+        assert "accessory" not in blocks[2]
+        assert dispatcher.get_status()["queued"] == 0
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_waits_for_retry_after(self, dispatcher, slack_service):
+        """A 429 keeps the batch queued until Retry-After has passed."""
+        slack_service.send_message.side_effect = SlackNotificationError(
+            status_code=429, retry_after=30.0
+        )
+        dispatcher.enqueue("Ticket #1")
+
+        assert await dispatcher.dispatch_due() == 0
+        assert await dispatcher.dispatch_due() == 0
+
+        slack_service.send_message.assert_awaited_once()
+        assert dispatcher._next_wait() > 29
+        assert dispatcher.get_status() == {
+            "queued": 1,
+            "sent_total": 0,
+            "dropped_total": 0,
+            "rate_limited_total": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_failures_dropped_after_attempts(
+        self, dispatcher, slack_service, monkeypatch
+    ):
+        """Failed posts are retried, then dropped."""
+        monkeypatch.setattr(
+            "app.services.slack_dispatcher.settings.SLACK_DISPATCH_MAX_ATTEMPTS", 2
+        )
+        slack_service.send_message.side_effect = SlackNotificationError(
+            status_code=500
+        )
+        dispatcher.enqueue("Ticket #1")
+
+        await dispatcher.dispatch_due(force=True)
+        assert dispatcher.get_status()["queued"] == 1
+
+        await dispatcher.dispatch_due(force=True)
+        assert dispatcher.get_status()["queued"] == 0
+        assert dispatcher.get_status()["dropped_total"] == 1
@@ -51,11 +51,11 @@ class TestSlackService:
     @pytest.mark.asyncio
     async def test_send_message_success(self, slack_service):
         """Test successful message sending."""
-        with patch("app.services.slack_service.httpx.AsyncClient") as mock_client:
+        with patch("app.services.slack_service.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.text = "ok"
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -84,12 +84,12 @@ class TestSlackService:
             build_section_block("Test content"),
         ]
 
-        with patch("app.services.slack_service.httpx.AsyncClient") as mock_client:
+        with patch("app.services.slack_service.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.text = "ok"
             mock_post = AsyncMock(return_value=mock_response)
-            mock_client.return_value.__aenter__.return_value.post = mock_post
+            mock_client.return_value.post = mock_post
 
             result = await slack_service.send_message("Test", blocks=blocks)
 
@@ -102,11 +102,11 @@ class TestSlackService:
     @pytest.mark.asyncio
     async def test_send_message_error_response(self, slack_service):
         """Test error handling for non-200 response."""
-        with patch("app.services.slack_service.httpx.AsyncClient") as mock_client:
+        with patch("app.services.slack_service.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 400
             mock_response.text = "invalid_payload"
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -118,8 +118,8 @@ class TestSlackService:
         """Test error handling for timeout."""
         import httpx
 
-        with patch("app.services.slack_service.httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        with patch("app.services.slack_service.get_http_client") as mock_client:
+            mock_client.return_value.post = AsyncMock(
                 side_effect=httpx.TimeoutException("Timeout")
             )
 
@@ -133,8 +133,8 @@ class TestSlackService:
         """Test error handling for connection error."""
         import httpx
 
-        with patch("app.services.slack_service.httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        with patch("app.services.slack_service.get_http_client") as mock_client:
+            mock_client.return_value.post = AsyncMock(
                 side_effect=httpx.RequestError("Connection failed")
             )
 
@@ -146,11 +146,11 @@ class TestSlackService:
     @pytest.mark.asyncio
     async def test_send_message_safe_success(self, slack_service):
         """Test safe message sending succeeds."""
-        with patch("app.services.slack_service.httpx.AsyncClient") as mock_client:
+        with patch("app.services.slack_service.get_http_client") as mock_client:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.text = "ok"
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -163,8 +163,8 @@ class TestSlackService:
         """Test safe message sending catches errors."""
         import httpx
 
-        with patch("app.services.slack_service.httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+        with patch("app.services.slack_service.get_http_client") as mock_client:
+            mock_client.return_value.post = AsyncMock(
                 side_effect=httpx.TimeoutException("Timeout")
             )
 
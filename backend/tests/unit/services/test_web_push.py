@@ -0,0 +1,129 @@
+"""
+Unit tests for the Web Push engine and push delivery.
+
+WHAT: Tests for WebPushSender and PushNotificationService._deliver.
+
+WHY: Verifies that:
+1. Messages are encrypted and POSTed with VAPID headers signed once per
+   push service origin
+2. A failed send doesn't fail the rest of a fan-out
+3. Outcomes are recorded in bulk, and gone (404/410) subscriptions are
+   deactivated by endpoint
+
+HOW: Real pywebpush/py_vapid crypto with generated keys; the HTTP client
+and DAO are mocked.
+"""
+
+import base64
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from app.services.push_notification_service import PushNotificationService
+from app.services.web_push import WebPushSender
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).strip(b"=").decode()
+
+
+def _vapid_key() -> str:
+    """Generate a VAPID private key (base64url DER)."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    return _b64(key.private_bytes(
+        serialization.Encoding.DER,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ))
+
+
+def _subscription_info(endpoint: str) -> dict:
+    """Build subscription info with a freshly generated browser key."""
+    receiver = ec.generate_private_key(ec.SECP256R1()).public_key()
+    p256dh = receiver.public_bytes(
+        serialization.Encoding.X962, serialization.PublicFormat.UncompressedPoint
+    )
+    return {"endpoint": endpoint, "keys": {"p256dh": _b64(p256dh), "auth": _b64(b"0" * 16)}}
+
+
+@pytest.fixture
+def http_client(monkeypatch):
+    """Mocked shared push HTTP client."""
+    client = MagicMock()
+    client.post = AsyncMock(return_value=SimpleNamespace(status_code=201))
+    monkeypatch.setattr("app.services.web_push.get_http_client", lambda name: client)
+    return client
+
+
+class TestWebPushSender:
+    """Tests for WebPushSender."""
+
+    @pytest.mark.asyncio
+    async def test_vapid_signed_once_per_origin(self, http_client):
+        """Sends to one push service reuse the VAPID headers."""
+        sender = WebPushSender(vapid_private_key=_vapid_key(), max_workers=2)
+        sign = MagicMock(wraps=sender._sign)
+        sender._sign = sign
+
+        statuses = await sender.send_many(
+            [
+                _subscription_info("https://push.example.com/a"),
+                _subscription_info("https://push.example.com/b"),
+                _subscription_info("https://other.example.net/c"),
+            ],
+            '{"title": "Hi"}',
+        )
+        sender.shutdown()
+
+        assert statuses == [201, 201, 201]
+        assert sorted(call.args[0] for call in sign.call_args_list) == [
+            "https://other.example.net",
+            "https://push.example.com",
+        ]
+        headers = http_client.post.await_args.kwargs["headers"]
+        assert headers["Authorization"].startswith("vapid ")
+        assert headers["Content-Encoding"] == "aes128gcm"
+        assert http_client.post.await_args.kwargs["content"] != b'{"title": "Hi"}'
+
+    @pytest.mark.asyncio
+    async def test_failed_send_is_isolated(self, http_client):
+        """A broken subscription yields None without failing the others."""
+        sender = WebPushSender(vapid_private_key=_vapid_key(), max_workers=2)
+        broken = {"endpoint": "https://push.example.com/x", "keys": {"p256dh": "bad", "auth": "bad"}}
+
+        statuses = await sender.send_many(
+            [broken, _subscription_info("https://push.example.com/ok")], "{}"
+        )
+        sender.shutdown()
+
+        assert statuses == [None, 201]
+
+
+class TestPushDelivery:
+    """Tests for PushNotificationService._deliver."""
+
+    @pytest.mark.asyncio
+    async def test_outcomes_recorded_in_bulk(self):
+        """Successes, failures and gone endpoints are each handled once."""
+        service = PushNotificationService(MagicMock())
+        service.sender = MagicMock(available=True)
+        service.sender.send_many = AsyncMock(return_value=[201, 500, 410, None])
+        dao = MagicMock()
+        dao.record_successes = AsyncMock()
+        dao.record_failures = AsyncMock()
+        dao.deactivate_by_endpoint = AsyncMock()
+        service.subscription_dao = dao
+
+        subscriptions = [
+            SimpleNamespace(id=i, endpoint=f"https://push.example.com/{i}", to_webpush_info=dict)
+            for i in range(1, 5)
+        ]
+
+        assert await service._deliver(subscriptions, "{}") == 1
+        dao.record_successes.assert_awaited_once_with([1])
+        dao.record_failures.assert_awaited_once_with([2, 4])
+        dao.deactivate_by_endpoint.assert_awaited_once_with("https://push.example.com/3")